@@ -0,0 +1,195 @@
+""" Benchmark for euronextimport.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import io
+import sys
+import os.path
+import cProfile
+import pstats
+import random
+import tempfile
+import time
+
+from mintracker.sindexes import euronextimport
+from mintracker.sindexes import pricehist
+from mintracker.sindexes.euronextimport import Importer, MKT_MAP
+from mintracker.sindexes.isin import ISIN_checksum
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test"))
+from synthetic import MARKET_DATA, write_equities	# pylint: disable=wrong-import-position
+
+LIST_ROWS = 2000
+ROUNDS = 5
+
+
+def main_bench() -> bool:
+    """ Ingest of the same list, as xlsx, csv and txt """
+    rows = synthetic_rows(LIST_ROWS)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = os.path.join(tmpdir, "Euronext_Equities_2022-01-03")
+        write_equities(base + ".xlsx", rows)
+        write_equities(base + ".csv", rows, ";")
+        write_equities(base + ".txt", rows, "\t")
+        ref = None
+        for ext in ("xlsx", "csv", "txt"):
+            fname = f"{base}.{ext}"
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                imp = Importer(fname)
+            elapsed = (time.perf_counter() - start) / ROUNDS
+            ref = imp.content if ref is None else ref
+            assert imp.content == ref, ext
+            print(f"{ext:<5} {len(imp.content)} stocks: {elapsed * 1000:8.1f} ms")
+        if euronextimport.numpy is not None:
+            start = time.perf_counter()
+            num = sum(len(chunk) for chunk in euronextimport.read_text_chunks(base + ".csv"))
+            elapsed = time.perf_counter() - start
+            print(f"csv, numpy chunks, {num} stocks: {elapsed * 1000:8.1f} ms")
+    return True
+
+
+def batch_bench(num_files:int=20) -> bool:
+    """ import_many(): one worker vs. one worker per cpu """
+    rows = synthetic_rows(LIST_ROWS)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = []
+        for idx in range(num_files):
+            fname = os.path.join(tmpdir, f"Euronext_Equities_2022-01-{idx + 1:02d}.xlsx")
+            write_equities(fname, rows)
+            fnames.append(fname)
+        cpus = os.cpu_count() or 1
+        ref = None
+        for workers in sorted({1, cpus}):
+            start = time.perf_counter()
+            snaps = euronextimport.import_many(fnames, workers)
+            elapsed = time.perf_counter() - start
+            busy = sum(snap.elapsed for snap in snaps)
+            contents = [snap.content for snap in snaps]
+            ref = contents if ref is None else ref
+            assert contents == ref
+            print(f"import_many, {num_files} files, {workers:2d} worker(s): "
+                  f"{elapsed * 1000:8.1f} ms (per file: {busy * 1000 / num_files:6.1f} ms)")
+    return True
+
+
+def history_bench(num_files:int=20) -> bool:
+    """ Typed market data capture, and a time series from the price history
+    vs. re-reading the snapshots.
+    """
+    rows = synthetic_rows(LIST_ROWS)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = []
+        for idx in range(num_files):
+            fname = os.path.join(tmpdir, f"Euronext_Equities_2022-01-{idx + 1:02d}.xlsx")
+            write_equities(fname, rows)
+            fnames.append(fname)
+        for market_data in (False, True):
+            start = time.perf_counter()
+            Importer(fnames[0], market_data)
+            elapsed = time.perf_counter() - start
+            print(f"Importer, market_data={market_data!s:<5}: {elapsed * 1000:8.1f} ms")
+        isin = rows[LIST_ROWS // 2][1]
+        start = time.perf_counter()
+        ref = []
+        for fname in fnames:
+            data = Importer(fname, True).market_data
+            ref.append((data.date, data.columns["last"][data.isins.index(isin)]))
+        rereading = time.perf_counter() - start
+        snaps = euronextimport.import_many(fnames, 1, market_data=True)
+        store = os.path.join(tmpdir, "history")
+        euronextimport.store_history(snaps, store)
+        start = time.perf_counter()
+        with pricehist.PriceHistory(store) as hist:
+            res = hist.series(isin)
+        elapsed = time.perf_counter() - start
+        assert res == ref
+        print(f"Series of one ISIN, {num_files} snapshots: re-reading {rereading * 1000:8.1f} ms, "
+              f"price history {elapsed * 1000:6.2f} ms")
+    return True
+
+
+def markets_bench(size:int=LIST_ROWS * 10) -> bool:
+    """ Profile of dump_import(): linear market name lookup vs. MarketRegistry """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "Euronext_Equities.csv")
+        write_equities(fname, synthetic_rows(size), ";")
+        imp = Importer(fname)
+    opts = {"filter": None, "pre": ""}
+    registry = euronextimport.MARKETS
+    for what, markets in (("linear scan", LinearMarkets()), ("MarketRegistry", registry)):
+        euronextimport.MARKETS = markets
+        prof = cProfile.Profile()
+        try:
+            prof.runcall(euronextimport.dump_import, imp, opts, None)
+        finally:
+            euronextimport.MARKETS = registry
+        stats = pstats.Stats(prof, stream=io.StringIO())
+        total = stats.total_tt
+        lookup = sum(
+            tup[3] for func, tup in stats.stats.items() if func[2] == "short_name"
+        )
+        print(f"dump_import, {what:<15} {total * 1000:8.1f} ms; short_name(): "
+              f"{lookup * 1000:7.1f} ms, {lookup * 1e6 / size:5.2f} us/stock")
+    return True
+
+
+def folding_bench(size:int=LIST_ROWS * 10) -> bool:
+    """ dump_import(): simpler_ascii() per row vs. the memoized AsciiFolder """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "Euronext_Equities.csv")
+        write_equities(fname, synthetic_rows(size), ";")
+        imp = Importer(fname)
+    ref = None
+    for what, folder in (("per row", RowFolder()), ("AsciiFolder", euronextimport.AsciiFolder())):
+        opts = {"filter": None, "pre": "", "folder": folder}
+        start = time.perf_counter()
+        res = euronextimport.dump_import(imp, opts, None)
+        elapsed = time.perf_counter() - start
+        ref = res if ref is None else ref
+        assert res == ref
+        print(f"dump_import, folding {what:<12} {elapsed * 1000:8.1f} ms")
+    shown = ", ".join(f"{hits / (hits + misses):.0%}" for hits, misses in folder.stats())
+    print(f"AsciiFolder hit rate: {folder.hit_rate():.1%}; per column: {shown}")
+    return True
+
+
+class RowFolder():
+    """ Former folding: char_map.simpler_ascii() on every row """
+    def fold_row(self, row):
+        return euronextimport.char_map.simpler_ascii(row)
+
+
+class LinearMarkets():
+    """ Former short_market_name(): scans MKT_MAP for every stock """
+    def short_name(self, market, not_found="?"):
+        for key, fullname in MKT_MAP.items():
+            if fullname == market:
+                return key
+        return not_found
+
+
+def synthetic_rows(size:int, seed:int=1) -> list:
+    rnd = random.Random(seed)
+    markets = list(MKT_MAP.values()) + ["Oslo B\u00f8rs"] * 4
+    res = []
+    for idx in range(size):
+        res.append([
+            f"STOCK {idx}" if idx % 9 else f"SOCI\u00c9T\u00c9 {idx}", ISIN_checksum(f"FR{idx:09d}"), f"S{idx:04d}",
+            rnd.choice(markets), rnd.choice(("EUR", "NOK")),
+        ] + list(MARKET_DATA))
+    return res
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
+    assert markets_bench()
+    assert folding_bench()
+    assert batch_bench()
+    assert history_bench()
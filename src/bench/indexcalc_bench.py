@@ -0,0 +1,77 @@
+""" Benchmark for indexcalc.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import time
+import numpy
+
+from mintracker import indexcalc
+from mintracker.snamings import StockWeight
+from mintracker.sindexes.stockspt import STK_W_PSI20
+
+NUM_DATES = 5000
+NUM_INDEXES = 50
+ROUNDS = 5	# best of
+
+
+def main_bench(num_dates:int=NUM_DATES, num_indexes:int=NUM_INDEXES) -> bool:
+    """ Levels of 'num_indexes' PSI-20 like indexes over 'num_dates' dates:
+    a Python loop per date and constituent, versus index_levels()
+    """
+    stk = StockWeight(*STK_W_PSI20)
+    num = len(stk.abbrev_list())
+    rnd = numpy.random.default_rng(1)
+    universe = num_indexes + num
+    prices = numpy.cumprod(1 + rnd.normal(0, 0.01, (num_dates, universe)), axis=0) * 10
+    prices[rnd.random(prices.shape) < 0.01] = numpy.nan
+    prices[0] = 10.0
+    calcs = [
+        indexcalc.IndexCalculator(stk, columns=range(row, row + num)) for row in range(num_indexes)
+    ]
+    loop = best_of(lambda: python_levels(calcs, prices.tolist()))
+    vect = best_of(lambda: indexcalc.index_levels(calcs, prices))
+    assert numpy.allclose(python_levels(calcs, prices.tolist()), indexcalc.index_levels(calcs, prices))
+    print(f"{num_indexes} indexes x {num_dates} dates, python loop: {loop * 1000:9.2f} ms")
+    print(f"{num_indexes} indexes x {num_dates} dates, index_levels(): {vect * 1000:6.2f} ms")
+    return True
+
+
+def python_levels(calcs, prices) -> list:
+    """ Reference: one level per date and index, carrying missing prices """
+    res = [[0.0] * len(calcs) for _ in prices]
+    for col, calc in enumerate(calcs):
+        cols = calc.columns.tolist()
+        weights = calc.weights.tolist()
+        last = [prices[0][idx] for idx in cols]
+        shares = [weight * calc.base_level / price for weight, price in zip(weights, last)]
+        for row, day in enumerate(prices):
+            level = 0.0
+            for pos, idx in enumerate(cols):
+                price = day[idx]
+                if price != price:
+                    price = last[pos]
+                else:
+                    last[pos] = price
+                level += shares[pos] * price
+            res[row][col] = level
+    return res
+
+
+def best_of(func) -> float:
+    elapsed = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        took = time.perf_counter() - start
+        elapsed = took if elapsed is None else min(elapsed, took)
+    return elapsed
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
@@ -0,0 +1,117 @@
+""" Benchmark for isin.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import string
+import time
+
+from mintracker.sindexes.isin import \
+     ISIN_checksum_digit, \
+     checksum_many, validate_many, checksum_array, numpy, \
+     StockDB, normal_name
+from mintracker.sindexes import euronext
+
+ROUNDS = 20
+
+
+def main_bench() -> bool:
+    """ ISINs/second, before (legacy) and after the table-driven checksum """
+    isins = all_isins() * ROUNDS
+    print(f"ISINs: {len(isins)} ({ROUNDS} rounds over Euronext universe)")
+    ref = [legacy_checksum_digit(isin) for isin in isins]
+    show("legacy ISIN_checksum_digit", isins,
+         lambda alist: [legacy_checksum_digit(isin) for isin in alist])
+    res = show("ISIN_checksum_digit", isins,
+               lambda alist: [ISIN_checksum_digit(isin) for isin in alist])
+    assert res == ref
+    res = show("checksum_many", isins, checksum_many)
+    assert res == ref
+    show("validate_many", isins, validate_many)
+    if numpy is None:
+        print("numpy not available, skipped checksum_array")
+        return True
+    arr = numpy.array(isins, dtype="S12")
+    res = show("checksum_array", arr, checksum_array)
+    assert res.tolist() == ref
+    return True
+
+
+def stockdb_bench() -> bool:
+    """ StockDB lookup latency, all Euronext markets loaded """
+    start = time.perf_counter()
+    stock_db = StockDB()
+    for mkt in euronext.EURONEXT_STOCKS_LIST:
+        varname = "EURONEXT_STOCKS_" + mkt.replace(".", "_")
+        stock_db.add_market(mkt, getattr(euronext, varname, ()))
+    elapsed = time.perf_counter() - start
+    print(f"StockDB: {len(stock_db.markets)} markets loaded in {elapsed * 1000:.1f} ms")
+    stocks = [fourplet for mkt in stock_db.markets for fourplet in stock_db.markets[mkt]]
+    symbols = [fourplet[2] for fourplet in stocks]
+    names = [fourplet[3] for fourplet in stocks]
+    latency("get_from_symbol", symbols, stock_db.get_from_symbol)
+    latency("scan by symbol", symbols[:200], lambda symb: scan(stock_db, 2, symb))
+    latency("get_from_name", names, stock_db.get_from_name)
+    latency("scan by name", names[:200], lambda name: scan(stock_db, 3, normal_name(name), normal_name))
+    pairs = [("EN.PAR", "EN.AP"), ("EN.PAR", "EN.PA", "EN.PAB"), ("EN.LIS", "EG.LIS")]
+    latency("isins_in_any", pairs, lambda pair: stock_db.isins_in_any(*pair))
+    latency("isins_in", pairs, lambda pair: stock_db.isins_in(*pair))
+    return True
+
+
+def latency(what, keys, func):
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    elapsed = time.perf_counter() - start
+    print(f"{what:<28} {elapsed * 1e6 / len(keys):10.2f} us/lookup ({len(keys)} lookups)")
+
+
+def scan(stock_db, pos, key, conv=None) -> list:
+    """ Linear scan over all market tuples, as before the indexes """
+    res = []
+    for stocks in stock_db.markets.values():
+        for fourplet in stocks:
+            value = fourplet[pos] if conv is None else conv(fourplet[pos])
+            if value == key:
+                res.append(fourplet[1])
+    return res
+
+
+def show(what, isins, func):
+    start = time.perf_counter()
+    res = func(isins)
+    elapsed = time.perf_counter() - start
+    print(f"{what:<28} {len(isins) / elapsed:14.0f} ISINs/s")
+    return res
+
+
+def all_isins() -> list:
+    res = []
+    for mkt in euronext.EURONEXT_STOCKS_LIST:
+        varname = "EURONEXT_STOCKS_" + mkt.replace(".", "_")
+        res += [fourplet[1] for fourplet in getattr(euronext, varname, ())]
+    return res
+
+
+def legacy_checksum_digit(isin):
+    """ Former ISIN_checksum_digit(), kept for comparison """
+    def digit_sum(n):
+        return (n // 10) + (n % 10)
+
+    alphabet = {letter: value for (value, letter) in
+                enumerate(''.join(str(n) for n in range(10)) + string.ascii_uppercase)}
+    val = - sum(digit_sum(2 * int(c))
+                if i % 2 == 1
+                else int(c) for (i, c) in enumerate(reversed(''.join(str(d) for d in (alphabet[v] for v in isin[:-1]))), 1)) % 10
+    return abs(val)
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
+    assert stockdb_bench()
@@ -0,0 +1,123 @@
+""" Benchmark for IsinCache (netstocked/isin.py)
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import random
+import tempfile
+import time
+import tracemalloc
+
+from netstocked.isin import IsinCache, euronext_stock_db
+
+CALLS = 1000000
+NUM_STOCKS = 2000
+
+
+def main_bench(size:int=CALLS) -> bool:
+    """ Memory after 'size' update_cache() calls: unbounded vs. ring buffers vs. counters """
+    calls = synthetic_calls(size)
+    for what, sizes in (
+            ("unbounded", (None, None)),
+            ("ring buffers", (1000, 1000)),
+            ("counters only", (0, 0)),
+    ):
+        start = time.perf_counter()
+        run_calls(IsinCache(*sizes), calls)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        cache = run_calls(IsinCache(*sizes), calls)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        stats = cache.stats()
+        assert stats["calls"] == size
+        print(f"{what:<14} {size} calls: {used / 1024 / 1024:7.1f} MiB, {elapsed * 1000:8.1f} ms; "
+              f"hits={stats['hits']}, conflicts={stats['conflicts']}, logged={stats['logged']}")
+        del cache
+    return True
+
+
+def names_bench(inserts:int=20000, listings:int=200) -> bool:
+    """ 'inserts' new stocks, interleaved with 'listings' of stock_names() """
+    nums = list(range(inserts))
+    random.Random(1).shuffle(nums)
+    every = inserts // listings
+    ref = None
+    for what, cache in (("sort per listing", LegacyNames()), ("sorted index", IsinCache(0, 0))):
+        start = time.perf_counter()
+        for idx, num in enumerate(nums, 1):
+            cache.update_cache(f"STOCK {num}", f"PT{num:010d}")
+            if idx % every == 0:
+                names = cache.stock_names()
+        elapsed = time.perf_counter() - start
+        ref = names if ref is None else ref
+        assert names == ref
+        print(f"{what:<18} {inserts} inserts, {listings} listings: {elapsed * 1000:8.1f} ms")
+    start = time.perf_counter()
+    for page in range(inserts // 50):
+        cache.names_page(page)
+    elapsed = time.perf_counter() - start
+    print(f"names_page(), {inserts // 50} pages of 50: {elapsed * 1000:8.1f} ms")
+    return True
+
+
+def warm_bench() -> bool:
+    """ Resolving names (rows without ISIN): cold seeding vs. a saved snapshot """
+    start = time.perf_counter()
+    cache = IsinCache(0, 0)
+    num = cache.seed(euronext_stock_db())
+    cold = time.perf_counter() - start
+    names = []
+    for stocks in euronext_stock_db(["EN.LIS", "EN.PAR"]).markets.values():
+        names += [name for _, _, _, name in stocks]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "isincache.json")
+        assert cache.save(fname)
+        size = os.path.getsize(fname)
+        start = time.perf_counter()
+        warm = IsinCache(0, 0)
+        warm.load(fname)
+        loaded = time.perf_counter() - start
+    start = time.perf_counter()
+    found = sum(1 for name in names if warm.update_cache(name, "")[1])
+    elapsed = time.perf_counter() - start
+    print(f"Seeds: {num}; cold (Euronext tables): {cold * 1000:8.1f} ms, "
+          f"warm (snapshot, {size // 1024} KiB): {loaded * 1000:8.1f} ms")
+    print(f"Resolved {found}/{len(names)} names: {elapsed * 1e6 / len(names):6.2f} us/name")
+    return True
+
+
+class LegacyNames(IsinCache):
+    """ Former stock_names(): sorts all names on each call """
+    def stock_names(self) -> list:
+        by_name = self._stocks["by-name"]
+        return [(name, by_name[name]) for name in sorted(by_name)]
+
+
+def run_calls(cache, calls):
+    update = cache.update_cache
+    for name, isin in calls:
+        update(name, isin)
+    return cache
+
+
+def synthetic_calls(size:int) -> list:
+    """ Ledger-like calls: few stocks, repeated; 1% with a wrong name """
+    res = []
+    for idx in range(size):
+        num = (idx * 7919) % NUM_STOCKS
+        name = f"STOCK {num}" if idx % 100 else f"STOCK {num + 1}"
+        res.append((name, f"PT{num:010d}"))
+    return res
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
+    assert names_bench()
+    assert warm_bench()
@@ -0,0 +1,63 @@
+""" Benchmark for positions.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import datetime
+import random
+import time
+
+from netstocked import positions
+from netstocked.transtable import TransactionTable
+
+NUM_ROWS = 100000
+DAY_ROWS = 100
+ACCOUNTS = ("m", "H", "p")
+NUM_STOCKS = 200
+
+
+def main_bench(size:int=NUM_ROWS) -> bool:
+    """ Appending one day of trades: full rebuild vs. incremental update() """
+    rnd = random.Random(1)
+    table = TransactionTable()
+    day = datetime.date(2010, 1, 4).toordinal()
+    append_rows(table, rnd, size, day)
+    start = time.perf_counter()
+    book = positions.from_table(table)
+    elapsed = time.perf_counter() - start
+    print(f"from_table(), {size} rows: {elapsed * 1000:8.1f} ms; {len(book)} positions")
+    day += size // DAY_ROWS
+    append_rows(table, rnd, DAY_ROWS, day)
+    start = time.perf_counter()
+    full = positions.from_table(table)
+    rebuild = time.perf_counter() - start
+    start = time.perf_counter()
+    num = book.update(table)
+    incremental = time.perf_counter() - start
+    assert num == DAY_ROWS
+    assert book.holdings() == full.holdings()
+    assert book.realized() == full.realized()
+    print(f"+{DAY_ROWS} rows: rebuild {rebuild * 1000:8.1f} ms, "
+          f"update() {incremental * 1000:8.3f} ms")
+    return True
+
+
+def append_rows(table, rnd, size:int, first_day:int):
+    """ Mostly buys, some sells, DAY_ROWS per day """
+    for idx in range(size):
+        num = rnd.randrange(NUM_STOCKS)
+        quant = rnd.randint(1, 100) * (-1 if rnd.random() < 0.4 else 1)
+        price = round(10 + num / 10 + rnd.random(), 2)
+        table.append(
+            rnd.choice(ACCOUNTS), first_day + idx // DAY_ROWS, f"STOCK {num}", f"PT{num:010d}",
+            quant, price, round(quant * price, 2), 1.0, len(table) + 2,
+        )
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
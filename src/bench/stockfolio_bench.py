@@ -0,0 +1,301 @@
+""" Benchmark for stockfolio.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import sys
+import os.path
+import copy
+import datetime
+import random
+import resource
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import openpyxl
+
+from netstocked import stockfolio
+from netstocked import wbcache
+from netstocked import dates
+from netstocked.common import money_string
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test"))
+from synthetic import transaction_row, write_transactions	# pylint: disable=wrong-import-position
+
+SIZES = (1000, 10000, 100000)
+LEGACY_MAX = 10000	# quadratic: do not go beyond
+RSS_ROWS = 50000
+TABLE_ROWS = 100000
+CACHE_ROWS = 20000
+DATE_ROWS = 100000
+QUERIES = 10000
+
+
+def main_bench() -> bool:
+    """ Scaling of process_brute_content() """
+    for size in SIZES:
+        tail = synthetic_brutes(size)
+        content = new_content()
+        elapsed = timed(stockfolio.process_brute_content, content, tail)
+        shown = f"{size:>7} rows: {elapsed * 1000:9.1f} ms, {elapsed * 1e6 / size:6.2f} us/row"
+        if size <= LEGACY_MAX:
+            ref = new_content()
+            old = timed(legacy_process_brute_content, ref, copy.deepcopy(tail))
+            assert ref["by-id"] == content["by-id"]
+            assert ref["from-to"] == content["from-to"]
+            shown += f"; legacy {old * 1000:9.1f} ms"
+        print(shown)
+    return True
+
+
+def timed(func, content, tail) -> float:
+    start = time.perf_counter()
+    func(content, tail)
+    return time.perf_counter() - start
+
+
+def new_content() -> dict:
+    return {
+        "from-to": [],
+        "by-id": {},
+    }
+
+
+def synthetic_brutes(size:int, seed:int=1) -> list:
+    """ Returns 'size' rows, as parse_input() makes them """
+    rnd = random.Random(seed)
+    day = datetime.date(2010, 1, 4)
+    res = []
+    for idx in range(size):
+        quant = rnd.choice((1, -1)) * rnd.randint(1, 500)
+        when = day + datetime.timedelta(days=idx // 4)
+        brute = {
+            "@data_types": "sd" + "n" * 16,
+            "ID": ("s", rnd.choice(stockfolio.VALID_IDS)),
+            "Data": ("s", when.strftime("%d-%m-%Y")),
+            "Produto": ("s", f"STOCK{idx % 97}"),
+            "ISIN": ("s", ""),
+            "Quantidade": ("n", quant),
+            "Per": ("n", round(rnd.uniform(0.5, 90.0), 3)),
+            "Valor_local": ("n", None),
+            "Taxa": ("n", rnd.choice((None, 1.5, 3.25))),
+        }
+        res.append(brute)
+    return res
+
+
+def legacy_process_brute_content(content:dict, tail, idx:int=2) -> dict:
+    """ Former process_brute_content(), prepending to lists """
+    alist, taxlist = [], []
+    from_to = []
+    for acronym in stockfolio.VALID_IDS:
+        content["by-id"][acronym] = []
+    line = idx
+    for brute in tail:
+        quant, per = brute["Quantidade"][1], brute["Per"][1]
+        adate = stockfolio.date_from_cell_tup(brute["Data"])
+        value = round(quant * per, 2)
+        elem = [
+            idx, brute["ID"][1], adate, money_string(value), brute["Produto"][1],
+            "buy" if quant > 0 else "sell", quant, value,
+            brute["ISIN"][1] if brute["ISIN"][1] else "", f"line={line}",
+        ]
+        alist = [elem] + alist
+        taxa = brute["Taxa"][1]
+        if taxa is None:
+            taxa, taxval = "-", 0.0
+        else:
+            taxa = money_string(taxa)
+            taxval = float(taxa)
+        taxlist = [(taxa, taxval, stockfolio.TAX_COIN)] + taxlist
+        idx += 1
+        line += 1
+    row_id = 1000
+    for idx, elem in enumerate(alist):
+        row_id += 1
+        elem[0] = row_id
+        acronym = elem[1]
+        from_to.append(tuple(elem))
+        elem[0] = len(content["by-id"][acronym]) + stockfolio.LOW_IDX + 1
+        elem[1] = taxlist[idx]
+        content["by-id"][acronym].append(elem)
+    content["from-to"] = from_to
+    return content["by-id"]
+
+
+def dates_bench(size:int=DATE_ROWS) -> bool:
+    """ Per-row strptime() vs. the batch date paths """
+    tups = [brute["Data"] for brute in synthetic_brutes(size)]
+    tups[::7] = [("d", datetime.datetime(2015, 3, 1 + idx % 28)) for idx in range(len(tups[::7]))]
+    ref = [legacy_date_from_cell_tup(tup) for tup in tups]
+    paths = (
+        ("per-row strptime", lambda: [legacy_date_from_cell_tup(tup) for tup in tups]),
+        ("date_of() per row", lambda: [dates.date_of(tup).isoformat() for tup in tups]),
+        ("DateNormalizer.iso_column", lambda: dates.DateNormalizer().iso_column(tups)),
+    )
+    for what, func in paths:
+        start = time.perf_counter()
+        res = func()
+        elapsed = time.perf_counter() - start
+        assert res == ref, what
+        print(f"{what:<26} {size} dates: {elapsed * 1000:8.1f} ms")
+    return True
+
+
+def legacy_date_from_cell_tup(tup:tuple) -> str:
+    """ Former date_from_cell_tup() """
+    atype, aval = tup
+    if atype == "s":
+        obj = datetime.datetime.strptime(aval, "%d-%m-%Y")
+    else:
+        obj = aval
+    return obj.strftime("%Y-%m-%d")
+
+
+def table_bench(size:int=TABLE_ROWS) -> bool:
+    """ Memory per transaction and load time: dict/list content vs. TransactionTable """
+    tail = synthetic_brutes(size)
+
+    def build(what):
+        if what == "table":
+            return stockfolio.table_from_brutes(tail)
+        res = new_content()
+        stockfolio.process_brute_content(res, tail)
+        return res
+
+    for what in ("dict/list", "table"):
+        start = time.perf_counter()
+        build(what)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        res = build(what)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{what:<10} {size} rows: {used / size:7.1f} bytes/row, {elapsed * 1000:8.1f} ms")
+        del res
+    return True
+
+
+def cache_bench(size:int=CACHE_ROWS) -> bool:
+    """ Cold (openpyxl) vs. warm (sidecar cache) Transactions() """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        write_workbook(fname, size)
+        for columnar in (False, True):
+            times = []
+            for _ in range(2):
+                start = time.perf_counter()
+                trans = stockfolio.Transactions(fname, columnar=columnar)
+                times.append(time.perf_counter() - start)
+                assert len(trans.by_account("p")) > 0
+            shown = "table" if columnar else "content"
+            print(f"{shown:<8} {size} rows: cold {times[0] * 1000:8.1f} ms, warm {times[1] * 1000:8.1f} ms")
+            assert wbcache.invalidate_cache(fname)
+    return True
+
+
+def as_of_bench(size:int=CACHE_ROWS, queries:int=QUERIES) -> bool:
+    """ Random as-of holdings queries: linear replay vs. the date index """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        write_workbook(fname, size)
+        trans = stockfolio.Transactions(fname, columnar=True, use_cache=False)
+    table = trans.table()
+    first, last = min(table.column("date")), max(table.column("date"))
+    rnd = random.Random(3)
+    asks = [(rnd.choice(stockfolio.VALID_IDS), rnd.randint(first, last)) for _ in range(queries)]
+    start = time.perf_counter()
+    trans.date_index()
+    built = time.perf_counter() - start
+    linear_asks = asks[:queries // 100]
+    start = time.perf_counter()
+    ref = [linear_as_of(table, account, day) for account, day in linear_asks]
+    linear = (time.perf_counter() - start) / len(linear_asks)
+    start = time.perf_counter()
+    res = [trans.holdings_as_of(account, day) for account, day in asks]
+    indexed = (time.perf_counter() - start) / queries
+    assert res[:len(ref)] == ref
+    print(f"as-of, {size} rows: linear {linear * 1e6:9.1f} us/query, "
+          f"date index {indexed * 1e6:7.1f} us/query ({queries} queries; index built in {built * 1000:.1f} ms)")
+    return True
+
+
+def linear_as_of(table, account:str, day:int) -> dict:
+    """ Filters by_account() and replays all rows up to 'day' """
+    held = {}
+    for row in table.by_account(account):
+        if row[1] <= day:
+            key = row[3] if row[3] else row[2]
+            held[key] = held.get(key, 0) + row[4]
+    return {key: quant for key, quant in held.items() if quant}
+
+
+def rss_bench(size:int=RSS_ROWS) -> bool:
+    """ Peak RSS reading a 'size' rows workbook: full mode vs. streaming """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        write_workbook(fname, size)
+        print(f"Workbook with {size} rows: {os.path.getsize(fname) // 1024} KiB")
+        for mode in ("legacy", "stream"):
+            cmd = [sys.executable, __file__, "--rss", mode, fname]
+            shown = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            print(f"{mode:<8} {shown.strip()}")
+    return True
+
+
+def rss_child(mode:str, fname:str) -> str:
+    start = time.perf_counter()
+    if mode == "legacy":
+        nrows = legacy_read(fname)
+    else:
+        _, content = stockfolio.read_rows(stockfolio.iter_transactions(fname), fname)
+        nrows = len(content["data"]["from-to"])
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return f"rows={nrows} peak RSS: {peak / 1024:8.1f} MiB, {elapsed:6.2f} s"
+
+
+def legacy_read(fname:str) -> int:
+    """ Former reader(): full workbook, all cells held in a list """
+    wbk = openpyxl.load_workbook(fname)
+    sheet = wbk[stockfolio.DEFAULT_SHEET_NAME]
+    rows = [row for row in sheet]
+    hletter = stockfolio.columns()["head-letters"]
+    tail = []
+    for row in rows[1:]:
+        brute = {"@data_types": ""}
+        for cell in row:
+            brute["@data_types"] += cell.data_type
+            field = hletter.get(cell.column_letter)
+            if field:
+                brute[field] = (cell.data_type, cell.value)
+        tail.append(brute)
+    content = new_content()
+    stockfolio.process_brute_content(content, tail)
+    return len(content["from-to"])
+
+
+def write_workbook(fname:str, size:int):
+    rows = [
+        transaction_row(**{name: tup[1] for name, tup in brute.items() if not name.startswith("@")})
+        for brute in synthetic_brutes(size)
+    ]
+    write_transactions(fname, rows)
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--rss"]:
+        print(rss_child(sys.argv[2], sys.argv[3]))
+        sys.exit(0)
+    assert main_bench()
+    assert dates_bench()
+    assert table_bench()
+    assert cache_bench()
+    assert as_of_bench()
+    assert rss_bench()
@@ -0,0 +1,88 @@
+""" Benchmark for stocktrans.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import time
+import tracemalloc
+
+from netstocked.isin import IsinCache
+from netstocked.stocktrans import AsTransaction
+
+NUM_ROWS = 100000
+NUM_STOCKS = 300
+ROUNDS = 5	# best of
+
+
+def main_bench(size:int=NUM_ROWS) -> bool:
+    """ Construction time and memory: former class, __slots__, from_rows() """
+    rows, isins = synthetic_rows(size)
+    builds = (
+        ("former class", lambda: legacy_one_by_one(rows, isins, IsinCache(0, 0))),
+        ("__slots__", lambda: one_by_one(rows, isins, IsinCache(0, 0))),
+        ("from_rows()", lambda: AsTransaction.from_rows(rows, isins, IsinCache(0, 0))),
+    )
+    for what, build in builds:
+        elapsed = None
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            build()
+            took = time.perf_counter() - start
+            elapsed = took if elapsed is None else min(elapsed, took)
+        tracemalloc.start()
+        res = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(res) == size
+        print(f"{what:<13} {size} transactions: {elapsed * 1000:8.1f} ms, {used / size:6.1f} bytes/transaction")
+        del res
+    return True
+
+
+def one_by_one(rows, isins, cache) -> list:
+    return [AsTransaction(tup, isin, cache) for tup, isin in zip(rows, isins)]
+
+
+def legacy_one_by_one(rows, isins, cache) -> list:
+    return [LegacyTransaction(tup, isin, cache) for tup, isin in zip(rows, isins)]
+
+
+class LegacyTransaction():
+    """ Former AsTransaction: per-instance __dict__ """
+    def __init__(self, tup, isin, cache):
+        assert isinstance(tup, (list, tuple))
+        t_id, star, date, s_val, s_name, buy, quant, t_val = tup
+        if isinstance(t_val, int):
+            t_val = float(t_val)
+        else:
+            assert isinstance(t_val, float)
+            t_val = round(t_val, 2)
+        assert s_val
+        assert isinstance(s_val, str)
+        assert s_name
+        assert buy in ("buy", "sell",)
+        assert isinstance(quant, int)
+        if quant < 0:
+            t_val = -1.0 * t_val
+        self.t_id, self.date = t_id, date
+        self.buy, self.quant, self.t_val = buy, quant, t_val
+        assert star == "*"
+        self._name, self._isin = cache.update_cache(s_name, isin)
+
+
+def synthetic_rows(size:int) -> tuple:
+    rows, isins = [], []
+    for idx in range(size):
+        num = idx % NUM_STOCKS
+        rows.append((idx, "*", "2022-01-03", "10.00", f"STOCK {num}", "buy", 10, idx * 1.5))
+        isins.append(f"PT{num:010d}")
+    return rows, isins
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
@@ -0,0 +1,66 @@
+""" Benchmark for universe.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring, import-outside-toplevel
+
+import sys
+import os
+import os.path
+import subprocess
+import tempfile
+import time
+
+MODES = ("module", "universe", "module-lis", "universe-lis")
+
+
+def main_bench() -> bool:
+    """ Load time and peak RSS: euronext.py tables vs. compiled universe file """
+    from mintracker.sindexes import universe
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "euronext.bin")
+        num = universe.write_universe(fname, universe.markets_from_tables())
+        print(f"Universe: {num} stocks, {os.path.getsize(fname)} bytes")
+        for mode in MODES:
+            cmd = [sys.executable, __file__, "--child", mode, fname]
+            shown = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            print(f"{mode:<14} {shown.strip()}")
+    return True
+
+
+def child(mode:str, fname:str) -> str:
+    base = rss_kib()
+    start = time.perf_counter()
+    mkts = ("EN.LIS",) if mode.endswith("-lis") else None
+    if mode.startswith("module"):
+        from mintracker.sindexes import euronext
+        for mkt in (euronext.EURONEXT_STOCKS_LIST if mkts is None else mkts):
+            stocks = euronext.stock_names_by_market(mkt)
+            num = len(list(stocks))
+    else:
+        from mintracker.sindexes.universe import Universe
+        there = Universe(fname)
+        for mkt in (there.markets() if mkts is None else mkts):
+            stocks = there.stock_names_by_market(mkt)
+            num = len(list(stocks))
+    assert num >= 0
+    elapsed = time.perf_counter() - start
+    return f"load {elapsed * 1000:7.2f} ms, RSS +{rss_kib() - base:6d} KiB"
+
+
+def rss_kib() -> int:
+    """ Current resident set size (Linux) """
+    with open("/proc/self/statm", "r", encoding="ascii") as fdin:
+        pages = int(fdin.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        print(child(sys.argv[2], sys.argv[3]))
+        sys.exit(0)
+    assert main_bench()
@@ -0,0 +1,59 @@
+""" Benchmark for valuation.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import random
+import time
+
+from netstocked import valuation
+from mintracker.sindexes.isin import StockDB, ISIN_checksum
+
+NUM_POSITIONS = 5000
+NUM_STOCKS = 10000
+ACCOUNTS = ("m", "H", "p")
+ROUNDS = 5	# best of
+
+
+def main_bench(size:int=NUM_POSITIONS) -> bool:
+    """ Valuing a book of 'size' positions (5% without ISIN), with and without NumPy """
+    rnd = random.Random(1)
+    stocks = [("EUR", ISIN_checksum(f"PT{num:09d}"), f"S{num:05d}", f"STOCK {num}") for num in range(NUM_STOCKS)]
+    stock_db = StockDB()
+    stock_db.add_market("EN.LIS", stocks)
+    prices = {isin: round(rnd.uniform(0.5, 90.0), 3) for _, isin, _, _ in stocks}
+    holdings = {}
+    for num in rnd.sample(range(NUM_STOCKS), size):
+        _, isin, _, name = stocks[num]
+        key = name if num % 20 == 0 else isin
+        holdings[(rnd.choice(ACCOUNTS), key)] = (rnd.randint(1, 500), round(rnd.uniform(10, 9000), 2))
+    numpy = valuation.numpy
+    ref = None
+    for what, there in (("lists", None), ("numpy", numpy)):
+        if what == "numpy" and numpy is None:
+            print("numpy not available, skipped")
+            continue
+        valuation.numpy = there
+        try:
+            elapsed = None
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                res = valuation.value_book(holdings, prices, stock_db)
+                took = time.perf_counter() - start
+                elapsed = took if elapsed is None else min(elapsed, took)
+        finally:
+            valuation.numpy = numpy
+        assert not res.missing()
+        ref = res.totals() if ref is None else ref
+        assert res.totals() == ref
+        print(f"value_book(), {size} positions, {what}: {elapsed * 1000:7.2f} ms")
+    return True
+
+
+#
+# Benchmark
+#
+if __name__ == "__main__":
+    assert main_bench()
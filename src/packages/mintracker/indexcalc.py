@@ -0,0 +1,126 @@
+"""
+Index level computation for StockWeight constituents (NumPy).
+
+(c)2022  Henrique Moreira (part of 'mintracker')
+
+Prices are matrices of dates x constituents (in the order of
+StockWeight.abbrev_list()); missing prices (NaN) carry the last known one.
+The index holds, from the base date on, the shares implied by the stored
+weights: level = sum(shares * price).
+"""
+
+# pylint: disable=missing-function-docstring
+
+import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BASE_LEVEL = 1000.0
+
+
+class IndexCalculator():
+    """ Index levels, contributions and weight drift of one StockWeight """
+    def __init__(self, stock_weight, base_level:float=BASE_LEVEL, columns=None):
+        """ 'columns' are the column numbers of the constituents at a wider
+        prices universe (see index_levels()); by default the first columns.
+        """
+        assert numpy is not None, "numpy not available"
+        self.name = stock_weight.name
+        self.abbrevs = stock_weight.abbrev_list()
+        if columns is None:
+            columns = range(len(self.abbrevs))
+        self.columns = numpy.array(columns, dtype=numpy.int64)
+        assert len(self.columns) == len(self.abbrevs), "One column per constituent expected"
+        weights = [weight if weight is not None else 0.0 for _, weight in stock_weight.abbreviations()]
+        self.weights = numpy.array(weights, dtype=numpy.float64)
+        total = self.weights.sum()
+        assert total > 0, f"No weights: {self.name}"
+        self.weights /= total
+        self.base_level = base_level
+
+    def compute(self, prices, base_row:int=0) -> dict:
+        """ Returns, for a prices matrix (dates x constituents):
+		'level': index level per date,
+		'contribution': index points per date and constituent, since the base date,
+		'drift': weight per date and constituent, minus the stored weight.
+        """
+        prices = filled_prices(prices)
+        assert prices.shape[1] == len(self.abbrevs), "One column per constituent expected"
+        shares = self.shares(prices[base_row])
+        held = prices * shares
+        level = held.sum(axis=1)
+        res = {
+            "level": level,
+            "contribution": held - held[base_row],
+            "drift": held / level[:, None] - self.weights,
+        }
+        return res
+
+    def shares(self, base_prices):
+        """ Returns the shares of each constituent, at base prices """
+        assert not numpy.isnan(base_prices).any(), "Base prices missing"
+        return self.weights * self.base_level / base_prices
+
+
+def index_levels(calculators, prices, base_row:int=0):
+    """ Returns the levels (dates x indexes) of several indexes at once.
+    'prices' is a matrix dates x universe; each calculator picks its own
+    columns (see IndexCalculator 'columns'): prices missing elsewhere
+    at the universe do not affect it.
+    """
+    assert numpy is not None, "numpy not available"
+    prices = filled_prices(prices)
+    shares = numpy.zeros((len(calculators), prices.shape[1]))
+    for row, calc in enumerate(calculators):
+        cols = calc.columns
+        shares[row, cols] = calc.shares(prices[base_row, cols])
+    missing = numpy.isnan(prices)
+    res = numpy.where(missing, 0.0, prices) @ shares.T
+    if missing.any():
+        # NaN only where an own constituent has no price (yet)
+        res[(missing.astype(numpy.float64) @ (shares != 0).T) > 0] = numpy.nan
+    return res
+
+
+def filled_prices(prices):
+    """ Returns float64 prices, NaN replaced by the previous date's price """
+    prices = numpy.array(prices, dtype=numpy.float64)
+    missing = numpy.isnan(prices)
+    if not missing.any():
+        return prices
+    rows = numpy.where(missing, 0, numpy.arange(prices.shape[0])[:, None])
+    numpy.maximum.accumulate(rows, axis=0, out=rows)
+    return prices[rows, numpy.arange(prices.shape[1])]
+
+
+def constituent_isins(stock_weight, ref_isin:dict) -> list:
+    """ Returns the ISINs of the constituents (empty if unknown),
+    'ref_isin' being full name -> ISIN (see RefISIN).
+    """
+    return [ref_isin.get(stock_weight.full_name(abbrev), "") for abbrev in stock_weight.abbrev_list()]
+
+
+def price_matrix(hist, isins, field:str="last") -> tuple:
+    """ Returns (dates, prices) of a PriceHistory: dates 'YYYY-MM-DD',
+    and the matrix dates x isins (NaN where there is no price).
+    """
+    assert numpy is not None, "numpy not available"
+    codes = {isin: code for code, isin in enumerate(hist.isins())}
+    dates = hist.numpy_column("date")
+    days, date_rows = numpy.unique(dates, return_inverse=True)
+    column_of = numpy.full(len(codes) + 1, -1)
+    for col, isin in enumerate(isins):
+        if isin in codes:
+            column_of[codes[isin]] = col
+    cols = column_of[hist.numpy_column("isin")] if len(dates) else numpy.zeros(0, dtype=int)
+    res = numpy.full((len(days), len(isins)), numpy.nan)
+    there = cols >= 0
+    res[date_rows[there], cols[there]] = hist.numpy_column(field)[there]
+    return [datetime.date.fromordinal(int(day)).isoformat() for day in days], res
+
+
+if __name__ == "__main__":
+    print("Please import me.")
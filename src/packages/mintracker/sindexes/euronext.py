@@ -2,16 +2,22 @@
 # euronext.py  (c)2020  Henrique Moreira
 
 """ Euronext indexes and stocks
+
+Each market tuple (e.g. EURONEXT_STOCKS_EN_LIS) lives in its own module,
+at 'euronextmkt', and is only imported when first used.
 """
 
-# pylint: disable=too-many-lines
+import importlib
+
+MARKETS_PACKAGE = "mintracker.sindexes.euronextmkt"
+EMPTY_MARKETS = ("EG.OSLO", "EX.OSLO", "OSLO")	# no Euro stocks: no module
 
 
 def sample():
     """ Dump a few vars.
     """
     print("Euronext Lisbon\n---")
-    stocks = EURONEXT_STOCKS_EN_LIS
+    stocks = stock_names_by_market("EN.LIS")
     there = globals()["EURONEXT_STOCKS_EN_LIS"]
     assert stocks == there
 
@@ -20,10 +26,35 @@ def stock_names_by_market(mkt_name):
     assert mkt_name in EURONEXT_STOCKS_LIST
     varmkt = mkt_name.replace(".", "_")
     varname = f"EURONEXT_STOCKS_{varmkt}"
-    there = globals()[varname]
+    there = globals().get(varname)
+    if there is None:
+        there = _load_market(varname)
     return there
 
 
+def _load_market(varname):
+    """ Imports the market module, and caches the tuple at globals().
+    Markets without data (see EMPTY_MARKETS) are empty tuples.
+    """
+    mkt_name = varname[len("EURONEXT_STOCKS_"):]
+    if mkt_name.replace("_", ".") in EMPTY_MARKETS:
+        there = ()
+    else:
+        module = importlib.import_module(f"{MARKETS_PACKAGE}.{mkt_name.lower()}")
+        there = getattr(module, varname)
+    globals()[varname] = there
+    return there
+
+
+def __getattr__(name):
+    """ Lazy EURONEXT_STOCKS_xxx module attributes """
+    if name.startswith("EURONEXT_STOCKS_"):
+        mkt_name = name[len("EURONEXT_STOCKS_"):].replace("_", ".")
+        if mkt_name in EURONEXT_STOCKS_LIST:
+            return stock_names_by_market(mkt_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 EURONEXT_STOCKS_LIST = (
     'AMS.A',
     'BRU.A',
@@ -53,1443 +84,12 @@ EURONEXT_STOCKS_LIST = (
     'PAR.A',
     )
 
-EURONEXT_STOCKS_AMS_A = (
-    ('EUR', 'NL0000852564', 'AALB', 'AALBERTS NV'),
-    ('EUR', 'NL0011540547', 'ABN', 'ABN AMRO BANK N.V.'),
-    ('EUR', 'NL0009767532', 'ACCEL', 'ACCELL GROUP'),
-    ('EUR', 'GB00BQQFX454', 'AXS', 'ACCSYS'),
-    ('EUR', 'NL0012969182', 'ADYEN', 'ADYEN'),
-    ('EUR', 'NL0000303709', 'AGN', 'AEGON'),
-    ('EUR', 'NL0000018034', 'AJAX', 'AJAX'),
-    ('EUR', 'NL0013267909', 'AKZA', 'AKZO NOBEL'),
-    ('EUR', 'NL0012817175', 'ALFEN', 'ALFEN'),
-    ('EUR', 'NL0011333760', 'ATCB', 'ALTICE EUROPE B'),
-    ('EUR', 'NL0011333752', 'ATC', 'ALTICE EUROPE N.V.'),
-    ('EUR', 'NL0012194724', 'ALX', 'ALUMEXX N.V.'),
-    ('EUR', 'NL0000888691', 'AMG', 'AMG'),
-    ('EUR', 'NL0000313286', 'ACOMO', 'AMSTERDAM COMMOD.'),
-    ('EUR', 'NL0000430106', 'AND', 'AND INTERNATIONAL'),
-    ('EUR', 'NL0006237562', 'ARCAD', 'ARCADIS'),
-    ('EUR', 'NL0000334118', 'ASM', 'ASM INTERNATIONAL'),
-    ('EUR', 'NL0010273215', 'ASML', 'ASML HOLDING'),
-    ('EUR', 'NL0011872643', 'ASRNL', 'ASR NEDERLAND'),
-    ('EUR', 'JE00B3DCF752', 'ATRS', 'ATRIUM EUR REALEST'),
-    ('EUR', 'LU1789205884', 'BSGR', 'B&S Group'),
-    ('EUR', 'NL0000337319', 'BAMNB', 'BAM GROEP KON'),
-    ('EUR', 'NL0011872650', 'BFIT', 'BASIC-FIT'),
-    ('EUR', 'NL0012866412', 'BESI', 'BE SEMICONDUCTOR'),
-    ('EUR', 'NL0000339703', 'BBED', 'BETER BED'),
-    ('EUR', 'NL0000285278', 'BEVER', 'BEVER HOLDING'),
-    ('EUR', 'NL0000852580', 'BOKA', 'BOSKALIS WESTMIN'),
-    ('EUR', 'GG00B1FQG453', 'BGHL', 'BOUSSARD GAVAUDAN'),
-    ('EUR', 'NL0000442523', 'BRILL', 'BRILL KON'),
-    ('EUR', 'NL0010776944', 'BRNL', 'BRUNEL INTERNAT'),
-    ('EUR', 'NL0012747059', 'CMCOM', 'CM.COM'),
-    ('EUR', 'GB00BDCPN049', 'CCEP', 'COCA-COLA EUROPEAN'),
-    ('EUR', 'NL0010583399', 'CRBN', 'CORBION'),
-    ('EUR', 'NL0000200384', 'CLB', 'CORE LABORATORIES'),
-    ('EUR', 'NL0000345577', 'CTAC', 'CTAC'),
-    ('EUR', 'NL0009169515', 'DGB', 'DGB GROUP N.V.'),
-    ('EUR', 'NL0009197771', 'DPA', 'DPA GROUP'),
-    ('EUR', 'NL00150000S7', 'DSC2', 'DSC2'),
-    ('EUR', 'NL00150002R5', 'DSC2S', 'DSC2 TREAS SHARES'),
-    ('EUR', 'NL0000009827', 'DSM', 'DSM KON'),
-    ('EUR', 'NL00150000T5', 'DSCW1', 'DUTCH STAR C W11'),
-    ('EUR', 'NL00150000U3', 'DSCW2', 'DUTCH STAR C W12'),
-    ('EUR', 'NL00150000V1', 'DSCW3', 'DUTCH STAR C W13'),
-    ('EUR', 'NL0000345627', 'EAS2P', 'EASE2PAY NV'),
-    ('EUR', 'NL0009901610', 'ENVI', 'ENVIPCO'),
-    ('EUR', 'GB00B94QM994', 'ECT', 'EUROCASTLE INVEST.'),
-    ('EUR', 'NL0013654809', 'FAST', 'FASTNED'),
-    ('EUR', 'NL0011279492', 'FLOW', 'FLOW TRADERS'),
-    ('EUR', 'NL0011832811', 'FFARM', 'FORFARMERS'),
-    ('EUR', 'NL00150004A7', 'FUR', 'FUGRO'),
-    ('EUR', 'NL0010937066', 'GVNV', 'GRANDVISION'),
-    ('EUR', 'BMG455841020', 'HAL', 'HAL TRUST'),
-    ('EUR', 'NL0009269109', 'HEIJM', 'HEIJMANS'),
-    ('EUR', 'NL0000009165', 'HEIA', 'HEINEKEN'),
-    ('EUR', 'NL0000008977', 'HEIO', 'HEINEKEN HOLDING'),
-    ('EUR', 'NL0000440311', 'HOLCO', 'HOLLAND COLOURS'),
-    ('EUR', 'ANN4327C1220', 'HDG', 'HUNTER DOUGLAS'),
-    ('EUR', 'ANN4327C1303', 'HUNDP', 'HUNTER DOUGLAS'),
-    ('EUR', 'NL0009391242', 'HYDRA', 'HYDRATEC'),
-    ('EUR', 'NL0000359537', 'ICT', 'ICT GROUP'),
-    ('EUR', 'NL0010556726', 'IEX', 'IEX GROUP NV'),
-    ('EUR', 'NL0010801007', 'IMCD', 'IMCD'),
-    ('EUR', 'NL0010937058', 'INTER', 'INTERTRUST'),
-    ('EUR', 'NL0014332678', 'JDEP', "JDE PEET'S"),
-    ('EUR', 'NL0012015705', 'TKWY', 'JUST EAT TAKEAWAY'),
-    ('EUR', 'NL0000852531', 'KENDR', 'KENDRION'),
-    ('EUR', 'NL0000009082', 'KPN', 'KPN KON'),
-    ('EUR', 'NL0010545679', 'LVIDE', 'LAVIDE HOLDING'),
-    ('EUR', 'NL0010998878', 'BOLS', 'LUCASBOLS'),
-    ('EUR', 'IS0000000388', 'MAREL', 'MAREL'),
-    ('EUR', 'NL0009312842', 'NEDSE', 'MKB Nedsense'),
-    ('EUR', 'CWN814651014', 'MORE', 'MOREFIELD GROUP'),
-    ('EUR', 'NL0000371243', 'NEDAP', 'NEDAP'),
-    ('EUR', 'IM00BDD7WV31', 'NRP', 'NEPI ROCKCASTLE'),
-    ('EUR', 'NL0009822014', 'NSE', 'NEW SOURCES ENERGY'),
-    ('EUR', 'NL0000440618', 'NEWAY', 'NEWAYS ELECTRONICS'),
-    ('EUR', 'NL0012756316', 'NIBC', 'NIBC HOLDING'),
-    ('EUR', 'NL0010773842', 'NN', 'NN GROUP'),
-    ('EUR', 'NL0010696704', 'NOVI', 'NOVISOURCE'),
-    ('EUR', 'NL0012365084', 'NSI', 'NSI N.V.'),
-    ('EUR', 'NL0010558797', 'OCI', 'OCI'),
-    ('EUR', 'NL0000370419', 'ORANW', 'ORANJEWOUD A'),
-    ('EUR', 'NL0000440584', 'ORDI', 'ORDINA'),
-    ('EUR', 'NL0010391025', 'PHARM', 'PHARMING GROUP'),
-    ('EUR', 'NL0000009322', 'INPHI', 'PHILIPS BUY BACK'),
-    ('EUR', 'NL0000009538', 'PHIA', 'PHILIPS KON'),
-    ('EUR', 'NL0000378669', 'PORF', 'PORCELEYNE FLES'),
-    ('EUR', 'NL0009739416', 'PNL', 'POSTNL'),
-    ('EUR', 'BMG7209L1000', 'PPLAA', 'PPLA CLASS A'),
-    ('EUR', 'BMG7209L1182', 'PPLAB', 'PPLA CLASS B'),
-    ('EUR', 'US69355L1098', 'PPLA', 'PPLA European Unit'),
-    ('EUR', 'NL0013654783', 'PRX', 'PROSUS'),
-    ('EUR', 'NL0000379121', 'RAND', 'RANDSTAD NV'),
-    ('EUR', 'LU0383812293', 'REINA', 'REINET INVESTMENTS'),
-    ('EUR', 'GB00B2B0DG97', 'REN', 'RELX'),
-    ('EUR', 'GB0007995243', 'RWI', 'RENEWI'),
-    ('EUR', 'NL0000440477', 'ROOD', 'ROODMICROTEC'),
-    ('EUR', 'GB00B03MLX29', 'RDSA', 'ROYAL DUTCH SHELLA'),
-    ('EUR', 'GB00B03MM408', 'RDSB', 'ROYAL DUTCH SHELLB'),
-    ('EUR', 'NL0000360618', 'SBMO', 'SBM OFFSHORE'),
-    ('EUR', 'NL0011660485', 'SIFG', 'SIF HOLDING'),
-    ('EUR', 'NL0011821392', 'LIGHT', 'SIGNIFY NV'),
-    ('EUR', 'NL0000817179', 'SLIGR', 'SLIGRO FOOD GROUP'),
-    ('EUR', 'NL0010627865', 'SNOW', 'SNOWWORLD'),
-    ('EUR', 'NL0000336303', 'STRN', 'STERN GROEP'),
-    ('EUR', 'NL0010389508', 'TIE', 'TIE KINETIX'),
-    ('EUR', 'NL0000852523', 'TWEKA', 'TKH GROUP'),
-    ('EUR', 'NL0013332471', 'TOM2', 'TOMTOM'),
-    ('EUR', 'GB00B10RZP78', 'UNA', 'UNILEVER'),
-    ('EUR', 'NL0000302636', 'VLK', 'V LANSCHOT KEMPEN'),
-    ('EUR', 'NL0010661864', 'VALUE', 'VALUE8'),
-    ('EUR', 'NL0015118803', 'PREVA', 'VALUE8 CUM PREF'),
-    ('EUR', 'NL0000288918', 'VASTN', 'VASTNED'),
-    ('EUR', 'BMG9349W1038', 'VEON', 'VEON'),
-    ('EUR', 'DE0007921835', 'VVY', 'VIVORYON'),
-    ('EUR', 'GG00B1GHHH78', 'VTA', 'VOLTA FINANCE'),
-    ('EUR', 'NL0009432491', 'VPK', 'VOPAK'),
-    ('EUR', 'NL0000289213', 'WHA', 'WERELDHAVE'),
-    ('EUR', 'NL0000395903', 'WKL', 'WOLTERS KLUWER'),
-    ('EUR', 'JE00B1FBT077', 'YATRA', 'YATRA'),
-    )
-
-EURONEXT_STOCKS_BRU_A = (
-    ('EUR', 'BE0003885051', 'FLEX', 'FLEXOS S.A.'),
-    ('EUR', 'BE0003861789', 'GROWN', 'GROWNERS'),
-    ('EUR', 'BE0003680916', 'MLNEU', 'NEUFCOUR-FIN.'),
-    ('EUR', 'BE0003832491', 'NEWT', 'NEWTREE'),
-    ('EUR', 'BE0003841583', 'REAL', 'REALCO'),
-    ('EUR', 'BE0003829463', 'REI', 'REIBEL'),
-    ('EUR', 'BE0003847648', 'UNI', 'U&I LEARNING'),
-    ('EUR', 'BE0003838555', 'PNSB', 'UCARE SERVICES BEL'),
-    )
-
-EURONEXT_STOCKS_EG_BRU = (
-    ('EUR', 'BE0974298300', 'CAND', 'CANDELA INVEST'),
-    ('EUR', 'BE0003519270', 'COBH', 'CO.BR.HA'),
-    ('EUR', 'BE0003843605', 'ALEMK', 'EMAKINA GROUP'),
-    ('EUR', 'BE0003840577', 'ALEVA', 'EVADIX'),
-    ('EUR', 'GB0033711010', 'ALIMM', 'IMMUPHARMA'),
-    ('EUR', 'BE0003773877', 'SOFT', 'SOFTIMAT'),
-    )
-
-EURONEXT_STOCKS_EG_DUBLIN = (
-    ('EUR', 'IE0000020408', 'DOY', 'ABBEY PLC'),
-    ('EUR', 'IE00BXC8D038', 'APGN', 'APPLEGREEN PLC'),
-    ('EUR', 'IE0007214426', 'DQ5', 'CPL RESOURCES PLC.'),
-    ('EUR', 'IE00BLRPQQ22', 'DQ7A', 'DONEGAL INVESTMENT'),
-    ('EUR', 'GB00BY7QYJ50', 'GRW', 'DRAPER ESPRIT PLC'),
-    ('EUR', 'GB0031477770', 'GYQ', 'FIRST DERIVATIVES'),
-    ('EUR', 'IE00B1FR8863', '8GW', 'GREAT WESTERN MIN.'),
-    ('EUR', 'IE00BF2NR112', 'GRP', 'GREENCOAT REN.'),
-    ('EUR', 'IE00BVGC3741', 'MLC', 'MALIN CORP. PLC'),
-    ('EUR', 'IE00BD64C665', 'MIO', 'MINCON GROUP PLC'),
-    ('EUR', 'GB00B9275X97', 'ORPH', 'OPEN ORPHAN PLC'),
-    ('EUR', 'IE00B1WV4493', 'OIZ', 'ORIGIN ENT. PLC'),
-    ('EUR', 'IE00BF0MZF04', 'ORQ1', 'ORMONDE MINING PLC'),
-    ('EUR', 'IE00B4XVDC01', 'OVXA', 'OVOCA BIO PLC'),
-    ('EUR', 'IE00B0Q82B24', 'P8ET', 'PETRONEFT RES.'),
-    ('EUR', 'IE00B66B5T26', 'PZQA', 'PROVIDENCE RES.'),
-    ('EUR', 'IE00B1HDWM43', 'T7O', 'TOTAL PRODUCE PLC'),
-    ('EUR', 'IE00BJ5FQX74', 'UPR', 'UNIPHAR PLC'),
-    ('EUR', 'IE00BG0HDR01', '6VR', 'VR EDUCATION HOLD.'),
-    ('EUR', 'IE00BDT5KP12', 'YEW', 'YEW GROVE REIT PLC'),
-    )
-
-EURONEXT_STOCKS_EG_LIS = (
-    ('EUR', 'PTNEX0AM0002', 'ALNOR', 'NEXPONOR-SICAFI'),
-    ('EUR', 'PTPRS0AM0009', 'ALPTR', 'PATRIS'),
-    )
-
-EURONEXT_STOCKS_EG_PAR = (
-    ('EUR', 'FR0010285965', 'ALMIL', '1000MERCIS'),
-    ('EUR', 'FR0010493510', 'ALALO', 'ACHETER-LOUER.FR'),
-    ('EUR', 'FR0011038348', 'ALACT', 'ACTIPLAY (GROUPE)'),
-    ('EUR', 'FR0000053076', 'ALADA', 'ADA'),
-    ('EUR', 'FR0013284627', 'ALARF', 'ADEUNIS'),
-    ('EUR', 'FR0013247244', 'ALADO', 'ADOMOS'),
-    ('EUR', 'FR0010457531', 'ALADM', 'ADTHINK'),
-    ('EUR', 'FR0013452281', 'ALAGP', 'AGRIPOWER'),
-    ('EUR', 'FR0010641449', 'ALAGR', 'AGROGENERATION'),
-    ('EUR', 'FR0014000JX7', 'ALCHI', 'ALCHIMIE'),
-    ('EUR', 'FR0000054652', 'ALPHY', 'ALES GROUPE'),
-    ('EUR', 'FR0011051598', 'ALMIB', 'AMOEBA'),
-    ('EUR', 'FR0011910652', 'ALANV', 'ANEVIA'),
-    ('EUR', 'FR0013469319', 'ANVBV', 'ANEVIA BSA B'),
-    ('EUR', 'ES0109429037', 'ALANT', 'ANTEVENIO'),
-    ('EUR', 'FR0010340711', 'ALAQU', 'AQUILA'),
-    ('EUR', 'FR0000182479', 'ALJXR', 'ARCHOS'),
-    ('EUR', 'FR0013398997', 'ALCUR', 'ARCURE'),
-    ('EUR', 'FR0000079683', 'ALATF', 'ARTEFACT'),
-    ('EUR', 'FR0013410370', 'ALAMG', 'AUPLATA MINING GR'),
-    ('EUR', 'FR0013384369', 'ALBKK', 'BAIKOWSKI'),
-    ('EUR', 'FR0000035305', 'ALBDM', 'BD MULTI MEDIA'),
-    ('EUR', 'FR0000066961', 'ALDBL', 'BERNARD LOISEAU'),
-    ('EUR', 'FR0004174233', 'ALBLD', 'BILENDI'),
-    ('EUR', 'FR0013345493', 'ALTUV', 'BIO-UV GROUP'),
-    ('EUR', 'FR0012788065', 'ALCOR', 'BIOCORP'),
-    ('EUR', 'FR0012816825', 'ALBPS', 'BIOPHYTIS'),
-    ('EUR', 'FR0013507290', 'BPSBS', 'BIOPHYTIS BSA'),
-    ('EUR', 'FR0011005933', 'ALBIO', 'BIOSYNEX'),
-    ('EUR', 'FR0013517380', 'BIOBS', 'BIOSYNEX BSAR'),
-    ('EUR', 'FR0011041011', 'ALBLU', 'BLUELINEA'),
-    ('EUR', 'FR0013480969', 'BLUBS', 'BLUELINEA BSA J'),
-    ('EUR', 'FR0013480985', 'BLUBT', 'BLUELINEA BSA Y'),
-    ('EUR', 'FR0000054421', 'ALBOU', 'BOURRELIER GROUP'),
-    ('EUR', 'FR0013530102', 'ALCG', 'CABASSE GROUP'),
-    ('EUR', 'FR0011648716', 'ALCRB', 'CARBIOS'),
-    ('EUR', 'FR0010907956', 'ALCAR', 'CARMAT'),
-    ('EUR', 'FR0010425595', 'ALCLS', 'CELLECTIS'),
-    ('EUR', 'FR0013178712', 'ALPCV', 'CERINNOV GROUP'),
-    ('EUR', 'FR0013297165', 'ALCES', 'CESAR'),
-    ('EUR', 'FR00140003K4', 'CIBBS', 'CIBOX BS'),
-    ('EUR', 'FR0004152882', 'ALCLA', 'CLASQUIN'),
-    ('EUR', 'FR0013257409', 'ALCOF', 'COFIDUR'),
-    ('EUR', 'FR0013335742', 'ALLEC', 'COGELEC'),
-    ('EUR', 'FR0011071570', 'ALCOG', 'COGRA'),
-    ('EUR', 'BE0160342011', 'ALCOI', 'COIL'),
-    ('EUR', 'FR0011716265', 'ALCJ', 'CROSSJECT'),
-    ('EUR', 'FR0013505583', 'ALCYB', 'CYBERGUN'),
-    ('EUR', 'FR0013340817', 'CYBBT', 'CYBERGUN BSA 2'),
-    ('EUR', 'FR0013507977', 'CYBK1', 'CYBERGUN BSA K1'),
-    ('EUR', 'FR0013507985', 'CYBKA', 'CYBERGUN BSA K2A'),
-    ('EUR', 'FR0013508009', 'CYBKB', 'CYBERGUN BSA K2B'),
-    ('EUR', 'FR0010404368', 'ALDLS', 'D.L.S.I.'),
-    ('EUR', 'FR0000185423', 'ALDAR', 'DAMARTEX'),
-    ('EUR', 'FR0013066750', 'ALDBT', 'DBT'),
-    ('EUR', 'FR0010879056', 'ALDEI', 'DEINOVE'),
-    ('EUR', 'FR0000054132', 'ALDEL', 'DELFINGEN'),
-    ('EUR', 'FR0011522168', 'ALDR', 'DELTA DRONE'),
-    ('EUR', 'FR0013239977', 'ALDBS', 'DELTA DRONE BSA'),
-    ('EUR', 'FR0013400991', 'ALDBY', 'DELTA DRONE BSA Y'),
-    ('EUR', 'FR0000060840', 'ALDEV', 'DEVERNOIS'),
-    ('EUR', 'FR0010436584', 'ALDNX', 'DNXCORP'),
-    ('EUR', 'FR0010377127', 'ALDOL', 'DOLFINES'),
-    ('EUR', 'FR0013331212', 'ALDNE', 'DONTNOD'),
-    ('EUR', 'FR0013088606', 'ALDRV', 'DRONE VOLT'),
-    ('EUR', 'FR0010246322', 'ALEZV', 'EASYVISTA'),
-    ('EUR', 'FR0013534617', 'ALECO', 'ECOMIAM'),
-    ('EUR', 'FR0011490648', 'ALESA', 'ECOSLOPS'),
-    ('EUR', 'IT0005351504', 'ALEAC', 'EDILIZIACROBATICA'),
-    ('EUR', 'FR0013356755', 'ALEMV', 'EMOVA GROUP'),
-    ('EUR', 'FR0004030708', 'ALDUB', 'ENCRES DUBUIT'),
-    ('EUR', 'FR0013330792', 'ALNN6', 'ENENSYS'),
-    ('EUR', 'FR0013399359', 'ALNRG', 'ENERGISME'),
-    ('EUR', 'FR0011915339', 'ALENE', 'ENERTIME'),
-    ('EUR', 'FR0010424697', 'ALENT', 'ENTREPARTICULIERS'),
-    ('EUR', 'FR0000045122', 'ALENR', 'ENTREPRENDRE'),
-    ('EUR', 'FR0010278762', 'ALTEV', 'ENVEA'),
-    ('EUR', 'FR0010465534', 'ALEO2', 'EO2'),
-    ('EUR', 'FR0000035818', 'ALESK', 'ESKER'),
-    ('EUR', 'FR0010844001', 'ALEUA', 'EURASIA GROUPE'),
-    ('EUR', 'FR0013240934', 'ALERS', 'EUROBIO-SCIENTIFIC'),
-    ('EUR', 'FR0013256518', 'ALECR', 'EUROFINS CEREP'),
-    ('EUR', 'FR0010452474', 'ALGEM', 'EUROGERM'),
-    ('EUR', 'FR0000075343', 'ALEMG', 'EUROMEDIS GROUPE'),
-    ('EUR', 'FR0013514114', 'ALEUP', 'EUROPLASMA'),
-    ('EUR', 'FR0013294089', 'EURBU', 'EUROPLASMA BSC'),
-    ('EUR', 'FR0004166197', 'ALTVO', 'EVOLIS'),
-    ('EUR', 'ES0105029005', 'ALPHI', 'FACEPHI'),
-    ('EUR', 'FR0004034593', 'ALFBA', 'FASHION B AIR'),
-    ('EUR', 'FR0010221069', 'ALFIL', 'FILAE'),
-    ('EUR', 'FR0000074759', 'ALFLE', 'FLEURY MICHON'),
-    ('EUR', 'FR0012419307', 'ALFOC', 'FOCUS HOME INT'),
-    ('EUR', 'FR0010485268', 'ALFPC', 'FOUNTAINE PAJOT'),
-    ('EUR', 'FR0004187367', 'ALFRE', 'FREELANCE.COM'),
-    ('EUR', 'FR0000124414', 'ALBI', 'GASCOGNE'),
-    ('EUR', 'FR0013495298', 'ALGAU', 'GAUSSIN'),
-    ('EUR', 'FR0004053510', 'ALGEN', 'GENOWAY'),
-    ('EUR', 'FR0013483047', 'GEPBS', 'GEP BSA 2020'),
-    ('EUR', 'FR0000033888', 'ALGEV', 'GEVELOT'),
-    ('EUR', 'FR0011052257', 'ALGBE', 'GLOBAL BIOENERGIES'),
-    ('EUR', 'FR0011289198', 'ALGEP', 'GLOBAL ECOPOWER'),
-    ('EUR', 'FR0011208693', 'ALGLD', 'GOLD BY GOLD'),
-    ('EUR', 'FR0013204070', 'ALPAR', 'GPE PAROT (AUTO)'),
-    ('EUR', 'FR0012819381', 'ALGIL', 'GROUPE GUILLIN'),
-    ('EUR', 'FR0000075442', 'ALLDL', 'GROUPE LDLC'),
-    ('EUR', 'FR0013429404', 'ALGTR', 'GROUPE TERA'),
-    ('EUR', 'FR0013297488', 'ALIMO', 'GROUPIMO'),
-    ('EUR', 'CA4433003064', 'ALHEO', 'H2O INNOVATION INC'),
-    ('EUR', 'FR0000066540', 'ALHRG', 'HERIGE'),
-    ('EUR', 'FR0000077562', 'ALHIO', 'HIOLLE INDUSTRIES'),
-    ('EUR', 'FR0010396309', 'ALHIT', 'HITECHPROS'),
-    ('EUR', 'FR0013451044', 'ALHGR', 'HOFFMANN'),
-    ('EUR', 'FR0004153930', 'ALHYG', 'HYBRIGENICS'),
-    ('EUR', 'FR0011511971', 'ALICR', 'I.CERAM'),
-    ('EUR', 'FR0005854700', 'ALI2S', 'I2S'),
-    ('EUR', 'FR0000062184', 'ALIDS', 'IDSUD'),
-    ('EUR', 'FR0013060100', 'ALIMR', 'IMMERSION'),
-    ('EUR', 'FR0013470168', 'ALIMP', 'IMPLANET'),
-    ('EUR', 'FR0000060451', 'ALLUX', 'INSTALLUX'),
-    ('EUR', 'FR0010908723', 'ALINT', 'INTEGRAGEN'),
-    ('EUR', 'FR0011179886', 'ALINS', 'INTRASENSE'),
-    ('EUR', 'BE0974299316', 'ALINV', 'INVIBES ADVERTSING'),
-    ('EUR', 'FR0000072597', 'ALITL', 'IT LINK'),
-    ('EUR', 'FR0010082305', 'ALIVA', 'IVALIS'),
-    ('EUR', 'FR0010722819', 'ALKAL', 'KALRAY'),
-    ('EUR', 'FR0013156007', 'ALKLK', 'KERLINK'),
-    ('EUR', 'GB00B19RTX44', 'ALSIM', 'KLIMVEST'),
-    ('EUR', 'NL0012191662', 'ALPER', 'LA PERLA FASHION'),
-    ('EUR', 'FR0004027068', 'ALLAN', 'LANSON-BCC'),
-    ('EUR', 'FR0000075673', 'ALTAN', 'LE TANNEUR'),
-    ('EUR', 'FR0007080254', 'ALLHB', 'LES HOTELS BAVEREZ'),
-    ('EUR', 'FR0000033599', 'ALLEX', 'LEXIBOOK LINGUIST.'),
-    ('EUR', 'ES0105089009', 'ALLLN', 'LLEIDA'),
-    ('EUR', 'FR0000044943', 'ALLOG', 'LOGIC INSTRUMENT'),
-    ('EUR', 'FR0011884378', 'ALUCI', 'LUCIBEL'),
-    ('EUR', 'FR0013525953', 'LUCBS', 'LUCIBEL BS'),
-    ('EUR', 'FR0013270626', 'ALMII', 'M2I'),
-    ('EUR', 'FR0010812230', 'ALMNG', 'MADVERTISE'),
-    ('EUR', 'FR0000072993', 'ALMAK', 'MAKHEIA GROUP'),
-    ('EUR', 'FR0013525557', 'MAKBS', 'MAKHEIA GROUP BSA'),
-    ('EUR', 'ES0105463006', 'ALMKS', 'MAKING SCIENCE'),
-    ('EUR', 'FR0013400835', 'ALMAR', 'MARE NOSTRUM'),
-    ('EUR', 'FR0004155687', 'ALMAS', 'MASTRAD'),
-    ('EUR', 'FR0013472446', 'MASBS', 'MASTRAD BS29'),
-    ('EUR', 'FR0000061244', 'ALMEC', 'MECELEC COMPOSITES'),
-    ('EUR', 'IT0005380438', 'ALKER', 'MEDIA MAKER'),
-    ('EUR', 'FR0011049824', 'ALMDT', 'MEDIANTECHNOLOGIES'),
-    ('EUR', 'FR0013483534', 'METBS', 'METABOLIC EX BSA21'),
-    ('EUR', 'FR0011217710', 'ALMET', 'METHANOR'),
-    ('EUR', 'IT0004615396', 'ALMTH', 'METHORIOS CAPITAL'),
-    ('EUR', 'FR0010204453', 'ALMGI', 'MG INTERNATIONAL'),
-    ('EUR', 'FR0010353888', 'ALMDG', 'MGI DIGITAL GRAPHI'),
-    ('EUR', 'FR0004058949', 'ALMIC', 'MICROWAVE VISION'),
-    ('EUR', 'FR0013053535', 'ALMLB', 'MILIBOO'),
-    ('EUR', 'FR0004172450', 'ALBUD', 'MINT'),
-    ('EUR', 'FR0013307329', 'BUDBS', 'MINT BS'),
-    ('EUR', 'FR0011584549', 'ALMND', 'MND'),
-    ('EUR', 'FR0013449857', 'ALMBS', 'MND BSA 2019'),
-    ('EUR', 'FR0011033083', 'ALMOU', 'MOULINVEST'),
-    ('EUR', 'FR0004034320', 'ALMRB', 'MR BRICOLAGE'),
-    ('EUR', 'FR0013462231', 'ALMUN', 'MUNIC'),
-    ('EUR', 'IT0005119109', 'ALMBG', 'MYBEST GROUP'),
-    ('EUR', 'FR0011636083', 'ALNLF', 'NEOLIFE'),
-    ('EUR', 'FR0013282936', 'NLFBS', 'NEOLIFE BS'),
-    ('EUR', 'FR0004032746', 'ALNEV', 'NEOVACS'),
-    ('EUR', 'FR0013275971', 'NEVBS', 'NEOVACS BSA'),
-    ('EUR', 'FR0004171346', 'ALNXT', 'NEXTEDIA'),
-    ('EUR', 'FR0010397232', 'ALNOV', 'NOVACYT'),
-    ('EUR', 'NL0012044762', 'ALNOX', 'NOXXON'),
-    ('EUR', 'FR0000064529', 'ALNSC', 'NSC GROUPE'),
-    ('EUR', 'FR0004065639', 'ALNSE', 'NSE'),
-    ('EUR', 'FR0010231860', 'ALODI', 'O2I'),
-    ('EUR', 'FR0013268042', 'O2IBS', 'O2I BSA'),
-    ('EUR', 'FR0013381431', 'ODBS2', 'O2I BSA 2'),
-    ('EUR', 'FR0010330613', 'ALOBR', 'OBER'),
-    ('EUR', 'FR0011766229', 'ALONC', 'ONCODESIGN'),
-    ('EUR', 'FR0010095596', 'ALONX', 'ONXEO'),
-    ('EUR', 'FR0013318052', 'ALORD', 'ORDISSIMO'),
-    ('EUR', 'FR0013231180', 'ALOSM', 'OSMOZIS'),
-    ('EUR', 'FR0013479730', 'ALPAU', 'PAULIC MEUNERIE'),
-    ('EUR', 'BE0974302342', 'ALPHS', 'PHARMASIMPLE'),
-    ('EUR', 'FR0011191287', 'ALPHA', 'PHARNEXT'),
-    ('EUR', 'FR0000061608', 'ALPDX', 'PISCINES DESJOYAUX'),
-    ('EUR', 'FR0011950641', 'ALPIX', 'PIXIUM VISION'),
-    ('EUR', 'FR0010211037', 'ALPLA', 'PLANET MEDIA'),
-    ('EUR', 'FR0010785790', 'ALPAT', 'PLANT ADVANCED'),
-    ('EUR', 'FR0011844067', 'PATBS', 'PLANT ADVANCED BS'),
-    ('EUR', 'FR0000066441', 'ALPJT', 'POUJOULAT'),
-    ('EUR', 'FR0013015583', 'ALPOU', 'POULAILLON'),
-    ('EUR', 'FR0010169920', 'ALPRE', 'PREDILIFE'),
-    ('EUR', 'FR0004044600', 'ALPRI', 'PRISMAFLEX INTL'),
-    ('EUR', 'FR0010313486', 'ALPRO', 'PRODWARE'),
-    ('EUR', 'FR0013398617', 'PROBT', 'PROLOGUE BSA'),
-    ('EUR', 'ES0105118006', 'ALQP', 'QUADPACK'),
-    ('EUR', 'FR0011648971', 'ALQGC', 'QUANTUM GENOMICS'),
-    ('EUR', 'FR0010889386', 'ALQWA', 'QWAMPLIFY'),
-    ('EUR', 'FR0013472677', 'QWABS', 'QWAMPLIFY BSAANE'),
-    ('EUR', 'FR0011858190', 'ALREA', 'REALITES'),
-    ('EUR', 'FR0010820274', 'ALREW', 'REWORLD MEDIA'),
-    ('EUR', 'FR0000075954', 'ALRIB', 'RIBER'),
-    ('EUR', 'FR0010523167', 'ALROC', 'ROCTOOL'),
-    ('EUR', 'FR0013477585', 'ROCBS', 'ROCTOOL BSA 2020'),
-    ('EUR', 'FR0013477593', 'ROCBT', 'ROCTOOL BSA 2020-2'),
-    ('EUR', 'FR0000037640', 'ALRGR', 'ROUGIER S.A.'),
-    ('EUR', 'FR0013467123', 'ALSAF', 'SAFE ORTHOPAEDICS'),
-    ('EUR', 'IT0004013725', 'ALWOO', 'SAFWOOD'),
-    ('EUR', 'FR0010776617', 'ALMER', 'SAPMER'),
-    ('EUR', 'IT0005353484', 'ALSEI', 'SEIF SPA'),
-    ('EUR', 'FR0012596468', 'ALSEN', 'SENSORION'),
-    ('EUR', 'FR0000073728', 'ALSER', 'SERMA GROUP'),
-    ('EUR', 'FR0000061582', 'ALSIP', 'SI PARTICIPATIONS'),
-    ('EUR', 'FR0010202606', 'ALBFR', 'SIDETRADE'),
-    ('EUR', 'FR0011464452', 'ALSGD', 'SPINEGUARD'),
-    ('EUR', 'FR0011398874', 'ALSPW', 'SPINEWAY'),
-    ('EUR', 'FR0000074775', 'ALSAS', 'STRADIM ESPAC.FIN'),
-    ('EUR', 'FR0010528059', 'ALSTW', 'STREAMWIDE'),
-    ('EUR', 'FR0012790756', 'STWDS', 'STREAMWIDE BS'),
-    ('EUR', 'FR0011053636', 'ALTBG', 'THE BLOCKCHAIN GP'),
-    ('EUR', 'FR0010120402', 'ALTHE', 'THERACLION'),
-    ('EUR', 'FR0004197747', 'ALTER', 'THERADIAG'),
-    ('EUR', 'FR0013286259', 'ALTHX', 'THERANEXUS'),
-    ('EUR', 'LU0394945660', 'ALTLX', 'TOOLUX SANDING'),
-    ('EUR', 'FR0010397901', 'ALTRI', 'TRILOGIQ'),
-    ('EUR', 'FR0004175099', 'ALTRO', 'TRONICS'),
-    ('EUR', 'FR0010383877', 'ALTTI', 'TTI'),
-    ('EUR', 'FR0010654087', 'ALTXC', 'TXCOM'),
-    ('EUR', 'FR0000079147', 'ALU10', 'U10 CORP'),
-    ('EUR', 'FR0011070457', 'ALUCR', 'UCAR'),
-    ('EUR', 'FR0013263878', 'ALUMS', 'UMANIS'),
-    ('EUR', 'FR0012709160', 'ALUNT', 'UNITI'),
-    ('EUR', 'FR0010337865', 'ALUPG', 'UPERGY'),
-    ('EUR', 'FR0011898584', 'ALUVI', 'UV GERMI'),
-    ('EUR', 'FR0013254851', 'ALVAL', 'VALBIOTIS'),
-    ('EUR', 'FR0010766667', 'ALVU', 'VENTE UNIQUE.COM'),
-    ('EUR', 'FR0004155240', 'ALVER', 'VERGNET'),
-    ('EUR', 'FR0010326090', 'ALVIA', 'VIALIFE'),
-    ('EUR', 'FR0004029478', 'ALVIV', 'VISIATIV'),
-    ('EUR', 'FR0013365277', 'VMGBW', 'VISIOMED BSA18T2.3'),
-    ('EUR', 'FR0013372471', 'VMGBX', 'VISIOMED BSA18T2.4'),
-    ('EUR', 'FR0013322724', 'VMGBS', 'VISIOMED BSA2018-1'),
-    ('EUR', 'FR0013352317', 'VMGBU', 'VISIOMED BSA2018-2'),
-    ('EUR', 'FR0013356441', 'VMGBV', 'VISIOMED BSA2018-3'),
-    ('EUR', 'FR0013481835', 'ALVMG', 'VISIOMED GROUP'),
-    ('EUR', 'FR0013321817', 'VMGBT', 'VISIOMEDBSA26OCT23'),
-    ('EUR', 'FR0011532225', 'ALVGO', 'VOGO'),
-    ('EUR', 'FR0004045847', 'ALVDM', 'VOYAGEURS DU MONDE'),
-    ('EUR', 'FR0010131409', 'ALLIX', 'WALLIX'),
-    ('EUR', 'FR0013079092', 'ALWEC', 'WE.CONNECT'),
-    ('EUR', 'FR0010688440', 'ALWED', 'WEDIA'),
-    ('EUR', 'FR0014000P11', 'ALWF', 'WINFARM'),
-    ('EUR', 'FR0013143872', 'ALWIT', 'WITBE'),
-    )
-
-EURONEXT_STOCKS_EG_PB = (
-    ('EUR', 'BE0974334667', 'ALAVY', 'AUDIOVALLEY'),
-    ('EUR', 'FR0013374667', 'ALKKO', 'KKO INTERNATIONAL'),
-    )
-
-EURONEXT_STOCKS_EN_AB = (
-    ('EUR', 'NL0011794037', 'AD', 'AHOLD DEL'),
-    ('EUR', 'NL0012047823', 'AVTX', 'AVANTIUM'),
-    ('EUR', 'NL0000288876', 'ECMPA', 'EUROCOMMERCIAL'),
-    ('EUR', 'BE0003818359', 'GLPG', 'GALAPAGOS'),
-    ('EUR', 'NL0011821202', 'INGA', 'ING GROEP N.V.'),
-    ('EUR', 'NL0011323407', 'KDS', 'KIADIS'),
-    )
-
-EURONEXT_STOCKS_EN_ABP = (
-    ('EUR', 'LU0569974404', 'APAM', 'APERAM'),
-    )
-
-EURONEXT_STOCKS_EN_AP = (
-    ('EUR', 'LU1598757687', 'MT', 'ARCELORMITTAL SA'),
-    ('EUR', 'NL0009272137', 'ESP', 'ESPERITE'),
-    ('EUR', 'FR0013326246', 'URW', 'UNIBAIL-RODAMCO-WE'),
-    )
-
-EURONEXT_STOCKS_EN_B = (
-    ('EUR', 'BE0974293251', 'ABI', 'AB INBEV'),
-    ('EUR', 'BE0974278104', 'ABO', 'ABO GROUP'),
-    ('EUR', 'GB00BYWF9Y76', 'ACPH', 'ACACIA PHARMA'),
-    ('EUR', 'BE0003696102', 'ACCB', 'ACCENTIS'),
-    ('EUR', 'BE0003764785', 'ACKB', 'ACKERMANS V.HAAREN'),
-    ('EUR', 'BE0974264930', 'AGS', 'AGEAS'),
-    ('EUR', 'BE0003755692', 'AGFB', 'AGFA-GEVAERT'),
-    ('EUR', 'BE0003676872', 'ANT', 'ANTARES CERT'),
-    ('EUR', 'NL0010832176', 'ARGX', 'ARGENX SE'),
-    ('EUR', 'BE0003856730', 'ASC', 'ASCENCIO'),
-    ('EUR', 'BE0003837540', 'ATEB', 'ATENOR'),
-    ('EUR', 'BE0974314461', 'BALTA', 'BALTA GROUP'),
-    ('EUR', 'BE0003870871', 'BANI', 'BANIMMO A'),
-    ('EUR', 'BE0974362940', 'BAR', 'BARCO'),
-    ('EUR', 'BE0003674851', 'BAS', 'BASILIX CERT'),
-    ('EUR', 'BE0003661726', 'BEAB', 'BEAULIEU-AV. CERT'),
-    ('EUR', 'BE0003678894', 'BEFB', 'BEFIMMO'),
-    ('EUR', 'BE0974258874', 'BEKB', 'BEKAERT'),
-    ('EUR', 'BE0020575115', 'BELR', 'BELRECA'),
-    ('EUR', 'BE0003723377', 'BELU', 'BELUGA'),
-    ('EUR', 'BE0974281132', 'BCART', 'BIOCARTIS'),
-    ('EUR', 'BE0974268972', 'BPOST', 'BPOST'),
-    ('EUR', 'BE0003008019', 'BNB', 'BQUE NAT. BELGIQUE'),
-    ('EUR', 'LU1068091351', 'BREB', 'BREDERODE'),
-    ('EUR', 'BE0003825420', 'CAMB', 'CAMPINE'),
-    ('EUR', 'BE0974273055', 'CPINV', 'CARE PROPERTY INV.'),
-    ('EUR', 'BE0974303357', 'CENER', 'CENERGY'),
-    ('EUR', 'BE0003883031', 'CFEB', 'CFE'),
-    ('EUR', 'BE0003592038', 'COMB', 'CIE BOIS SAUVAGE'),
-    ('EUR', 'BE0003593044', 'COFB', 'COFINIMMO'),
-    ('EUR', 'BE0974256852', 'COLR', 'COLRUYT'),
-    ('EUR', 'BE0003836534', 'OPTI', 'CRESCENT'),
-    ('EUR', 'BE0974259880', 'DIE', "D'IETEREN"),
-    ('EUR', 'BE0003789063', 'DECB', 'DECEUNINCK'),
-    ('EUR', 'BE0003698124', 'DIEG', 'DIEGEM KENNEDYCERT'),
-    ('EUR', 'BE0003605160', 'DISL', 'DISTRI-LAND CERT'),
-    ('EUR', 'BE0974313455', 'ECONB', 'ECONOCOM GROUP'),
-    ('EUR', 'BE0003822393', 'ELI', 'ELIA GROUP'),
-    ('EUR', 'BE0003816338', 'EURN', 'EURONAV'),
-    ('EUR', 'BE0003820371', 'EVS', 'EVS BROADC.EQUIPM.'),
-    ('EUR', 'BE0003808251', 'EXM', 'EXMAR'),
-    ('EUR', 'BE0003215143', 'FLOB', 'FLORIDIENNE'),
-    ('EUR', 'BE0974265945', 'FLUX', 'FLUXYS BELGIUM D'),
-    ('EUR', 'BE0003752665', 'FOU', 'FOUNTAIN'),
-    ('EUR', 'BE0003797140', 'GBLB', 'GBL'),
-    ('EUR', 'BE0003740546', 'GENK', 'GENK LOGIST. CERT'),
-    ('EUR', 'BE0003699130', 'GIMB', 'GIMV'),
-    ('EUR', 'GB00BYN5BY03', 'GLOG', 'GLOBAL GRAPHICS'),
-    ('EUR', 'BE0003765790', 'GREEN', 'GREENYARD'),
-    ('EUR', 'BE0974352842', 'HAMO', 'HAMON'),
-    ('EUR', 'BE0003760742', 'HOMI', 'HOME INVEST BE.'),
-    ('EUR', 'BE0974363955', 'HYL', 'HYLORIS'),
-    ('EUR', 'BE0003766806', 'IBAB', 'IBA'),
-    ('EUR', 'BE0003748622', 'IEP', 'IEP INVEST'),
-    ('EUR', 'BE0974287196', 'MCC', 'IMMO MCC'),
-    ('EUR', 'BE0003893139', 'IMMOU', 'IMMO MOURY'),
-    ('EUR', 'BE0003599108', 'IMMO', 'IMMOBEL'),
-    ('EUR', 'BE0974374069', 'INCLU', 'INCLUSIO SA/NV'),
-    ('EUR', 'BE0003746600', 'INTO', 'INTERVEST OFF-WARE'),
-    ('EUR', 'BE0003858751', 'JEN', 'JENSEN-GROUP'),
-    ('EUR', 'BE0003565737', 'KBC', 'KBC'),
-    ('EUR', 'BE0003867844', 'KBCA', 'KBC ANCORA'),
-    ('EUR', 'BE0003880979', 'KEYW', 'KEYWARE TECH.'),
-    ('EUR', 'BE0974274061', 'KIN', 'KINEPOLIS GROUP'),
-    ('EUR', 'BE0003770840', 'LEAS', 'LEASINVEST'),
-    ('EUR', 'BE0003604155', 'LOTB', 'LOTUS BAKERIES'),
-    ('EUR', 'BE0003844611', 'MDXH', 'MDXHEALTH'),
-    ('EUR', 'BE0165385973', 'MELE', 'MELEXIS'),
-    ('EUR', 'BE0003731453', 'MIKO', 'MIKO'),
-    ('EUR', 'BE0974283153', 'MITRA', 'MITHRA'),
-    ('EUR', 'NL0000488153', 'MOP', 'MOPOLI'),
-    ('EUR', 'NL0000488161', 'MOPF', 'MOPOLI FOND'),
-    ('EUR', 'BE0003602134', 'MOUR', 'MOURY CONSTRUCT'),
-    ('EUR', 'BE0974294267', 'NYR', 'NYRSTAR'),
-    ('EUR', 'BE0974358906', 'NYXH', 'NYXOAH'),
-    ('EUR', 'BE0974276082', 'ONTEX', 'ONTEX GROUP'),
-    ('EUR', 'BE0003735496', 'OBEL', 'ORANGE BELGIUM'),
-    ('EUR', 'BE0003846632', 'OXUR', 'OXURION'),
-    ('EUR', 'IL0010830391', 'PAY', 'PAYTON PLANAR'),
-    ('EUR', 'BE0003807246', 'PIC', 'PICANOL'),
-    ('EUR', 'BE0003810273', 'PROX', 'PROXIMUS'),
-    ('EUR', 'BE0974272040', 'QRF', 'QRF'),
-    ('EUR', 'BE0003730448', 'QFG', 'QUESTFOR GR-PRICAF'),
-    ('EUR', 'BE0003656676', 'REC', 'RECTICEL'),
-    ('EUR', 'BE0003707214', 'RES', 'RESILUX'),
-    ('EUR', 'BE0003575835', 'ENGB', 'ROSIER'),
-    ('EUR', 'BE0003741551', 'ROU', 'ROULARTA'),
-    ('EUR', 'BE0012378593', 'SCHD', 'SCHEERD.V KERCHOVE'),
-    ('EUR', 'BE0974340722', 'SEQUA', 'SEQUANA MEDICAL'),
-    ('EUR', 'LU1883301340', 'SHUR', 'SHURGARD'),
-    ('EUR', 'BE0003743573', 'SIOE', 'SIOEN'),
-    ('EUR', 'BE0003898187', 'SIP', 'SIPEF'),
-    ('EUR', 'BE0974323553', 'SMAR', 'SMARTPHOTO GROUP'),
-    ('EUR', 'BE0003717312', 'SOF', 'SOFINA'),
-    ('EUR', 'BE0003545531', 'SOLV', 'SOLVAC NOM(RETAIL)'),
-    ('EUR', 'BE0003798155', 'SPA', 'SPADEL'),
-    ('EUR', 'BE0003463685', 'SUCR', 'SUCRAF A & B'),
-    ('EUR', 'BE0003826436', 'TNET', 'TELENET GROUP'),
-    ('EUR', 'BE0003573814', 'TERB', 'TER BEKE'),
-    ('EUR', 'BE0003555639', 'TESB', 'TESSENDERLO'),
-    ('EUR', 'BE0974263924', 'TEXF', 'TEXAF'),
-    ('EUR', 'BE0974282148', 'TINC', 'TINC'),
-    ('EUR', 'BE0003823409', 'TUB', 'TUBIZE-FIN'),
-    ('EUR', 'BE0003739530', 'UCB', 'UCB'),
-    ('EUR', 'BE0974320526', 'UMI', 'UMICORE'),
-    ('EUR', 'BE0974371032', 'UPG', 'UNIFIEDPOST GROUP'),
-    ('EUR', 'BE0003839561', 'VAN', 'VAN DE VELDE'),
-    ('EUR', 'BE0003754687', 'VASTB', 'VASTNED RETAIL BEL'),
-    ('EUR', 'BE0003878957', 'VGP', 'VGP'),
-    ('EUR', 'BE0974271034', 'VIO', 'VIOHALCO'),
-    ('EUR', 'BE0003734481', 'WEB', 'WAREHOUSES'),
-    ('EUR', 'BE0003724383', 'WEHB', 'WERELDHAVE BELGIUM'),
-    ('EUR', 'BE0003600112', 'WOLE', 'WOL. EXTENS. CERT'),
-    ('EUR', 'BE0003571792', 'WOLS', 'WOL. SHOPPING CERT'),
-    ('EUR', 'BE0974288202', 'XIOR', 'XIOR'),
-    ('EUR', 'BE0974311434', 'ZENT', 'ZENITEL'),
-    ('EUR', 'BE0003809267', 'ZEN', 'ZENOBE GRAMME CERT'),
-    )
-
-EURONEXT_STOCKS_EN_BA = (
-    ('EUR', 'BE0003851681', 'AED', 'AEDIFICA'),
-    ('EUR', 'BE0003874915', 'FAGR', 'FAGRON'),
-    ('EUR', 'BE0974332646', 'FNG', 'FNG NV'),
-    ('EUR', 'BE0003720340', 'RET', 'RETAIL ESTATES'),
-    ('EUR', 'BE0974349814', 'WDP', 'WDP'),
-    )
-
-EURONEXT_STOCKS_EN_BP = (
-    ('EUR', 'BE0974289218', 'ASIT', 'ASIT'),
-    ('EUR', 'BE0974280126', 'BOTHE', 'BONE THERAPEUTICS'),
-    ('EUR', 'BE0974260896', 'CYAD', 'CELYAD ONCOLOGY'),
-    ('EUR', 'BE0003853703', 'MONT', 'MONTEA C.V.A.'),
-    ('EUR', 'BE0003470755', 'SOLB', 'SOLVAY'),
-    ('EUR', 'BE0974338700', 'TITC', 'TITAN CEMENT'),
-    )
-
-EURONEXT_STOCKS_EN_DUBLIN = (
-    ('EUR', 'IE00BF0L3536', 'A5G', 'AIB GROUP PLC'),
-    ('EUR', 'CH0043238366', 'YZA', 'ARYZTA AG'),
-    ('EUR', 'IE0000730790', 'DD7E', 'BANK OF IR NC PREF'),
-    ('EUR', 'IE0000730808', 'DD7D', 'BANK OF IR NCP STF'),
-    ('EUR', 'IE00BD1RP616', 'BIRG', 'BANK OF IRELAND GP'),
-    ('EUR', 'IE00BWY4ZF18', 'C5H', 'CAIRN HOMES PLC'),
-    ('EUR', 'IE0001827264', 'DD8A', 'CRH PLC 5PCCumPref'),
-    ('EUR', 'IE0001827603', 'DD8B', 'CRH PLC 7PCCumPref'),
-    ('EUR', 'IE0001827041', 'CRG', 'CRH PLC ord'),
-    ('EUR', 'IE00BJMZDW83', 'DHG', 'DALATA HOTEL GP.'),
-    ('EUR', 'IE0000527006', 'DLE', 'DATALEX PLC'),
-    ('EUR', 'IE0003290289', 'EG7', 'FBD HOLDINGS PLC'),
-    ('EUR', 'IE00BWT6H894', 'FLTR', 'FLUTTER ENTERTAIN'),
-    ('EUR', 'IE0000669501', 'GL9', 'GLANBIA PLC'),
-    ('EUR', 'IE00BD6JX574', 'GVR', 'GLENVEAGH PROP.PLC'),
-    ('EUR', 'IE00BGHQ1986', 'HBRN', 'HIBERNIA REIT PLC'),
-    ('EUR', 'GB00BYYN4225', 'HSW', 'HOSTELWORLD GROUP'),
-    ('EUR', 'IE00BLP58571', 'IR5B', 'IRISH CONT. GP.'),
-    ('EUR', 'IE00BJ34P519', 'IRES', 'IRISH RES. PROP.'),
-    ('EUR', 'IE00BDC5DG00', 'KMR', 'KENMARE RESOURCES'),
-    ('EUR', 'IE0004906560', 'KRZ', 'KERRY GROUP PLC'),
-    ('EUR', 'IE0004927939', 'KRX', 'KINGSPAN GROUP PLC'),
-    ('EUR', 'IE00BWB8X525', 'IL0A', 'PERM. TSB GP. HOLD'),
-    ('EUR', 'IE00BYTBXV33', 'RY4C', 'RYANAIR HOLD. PLC'),
-    ('EUR', 'IE00B1RR8406', 'SK3', 'SMURFIT KAPPA GP'),
-    ('EUR', 'GB0008847096', 'TCO', 'TESCO PLC'),
-    ('EUR', 'GB0001500809', 'TQW', 'TULLOW OIL PLC'),
-    )
-
-EURONEXT_STOCKS_EN_EXP = (
-    ('EUR', 'BE0946377455', '-', 'ABATTOIR'),
-    ('EUR', 'BE0010012210', '-', 'ACVLHO'),
-    ('EUR', 'BE0024915838', '-', 'AGENCE MARIT MINNE'),
-    ('EUR', 'BE0941243520', '-', 'ALIAXIS'),
-    ('EUR', 'BE0146350740', '-', 'ALME INVEST'),
-    ('EUR', 'BE0003243426', '-', 'ANS ROCOUR'),
-    ('EUR', 'LU0006047129', '-', 'ARCELOR MITT LUX'),
-    ('EUR', 'LU0006067663', '-', 'ARCELORMITT SCHIFF'),
-    ('EUR', 'BE0945331669', '-', 'ARKIMEDES FONDS'),
-    ('EUR', 'BE0051300847', '-', 'ARMA'),
-    ('EUR', 'CG000A0BKQF7', '-', 'BCDC'),
-    ('EUR', 'BE0046318490', '-', 'BEM INVEST'),
-    ('EUR', 'LU0097891112', '-', 'BGL BNP PARIBAS'),
-    ('EUR', 'BE0032095854', '-', 'BHA'),
-    ('EUR', 'LU0006040975', '-', 'BIL'),
-    ('EUR', 'LU0110790085', '-', 'BIP INV. PARTNERS'),
-    ('EUR', 'BE0172505399', '-', 'BNP PARIBAS FORTIS'),
-    ('EUR', 'BE0156880313', '-', 'BOIS DU LUC'),
-    ('EUR', 'BE0156881329', '-', 'BOIS DU LUC 10E'),
-    ('EUR', 'BE0014799556', '-', 'BOUFFIOULX-St-NICO'),
-    ('EUR', 'NL0012237614', '-', 'CBRE H2O'),
-    ('EUR', 'BE0010381029', '-', 'CHARB BONNIER'),
-    ('EUR', 'BE0003256550', '-', 'CHARB. HASARD'),
-    ('EUR', 'BE0003706208', '-', 'CIBIX'),
-    ('EUR', 'BE0027840017', '-', 'Cie HET ZOUTE'),
-    ('EUR', 'BE0021556221', '-', 'CKV'),
-    ('EUR', 'BE0013068706', '-', 'COMMERCIALE BELGE'),
-    ('EUR', 'NL0000121622', '-', 'CONTINENT. LAND CY'),
-    ('EUR', 'BE0099150162', '-', 'CP 76 PETROFINA'),
-    ('EUR', 'BE0099395676', '-', 'CP 79 PETROFINA'),
-    ('EUR', 'BE0015460372', '-', 'CREDIMO'),
-    ('EUR', 'BE0162868054', '-', 'CREDIMO HOLDING'),
-    ('EUR', 'BE0010566900', '-', 'CS BRUX'),
-    ('EUR', 'BE0974290224', 'DEXB', 'DEXIA'),
-    ('EUR', 'BE0036367895', '-', 'DIERK. ANTWERP.'),
-    ('EUR', 'BE0026342551', '-', 'DIERKUNDE ANTW'),
-    ('EUR', 'BE0003783975', '-', 'ECFC'),
-    ('EUR', 'BE0003849669', 'EMD', 'EMD MUSIC'),
-    ('EUR', 'BE0024644065', '-', 'EMULATION'),
-    ('EUR', 'BE0941244536', '-', 'ETEX'),
-    ('EUR', 'BE0049483135', '-', 'EUPEN FINANZ'),
-    ('EUR', 'BE0011238830', '-', 'FI BELGO-TUNISIENN'),
-    ('EUR', 'BE0945246784', '-', 'FIMMOBEL'),
-    ('EUR', 'BE0012544319', '-', 'FINASUCRE'),
-    ('EUR', 'NSCEX0000018', '-', 'FOYER'),
-    ('EUR', 'BE6303070104', '-', 'GEN BELGE ARGENTIN'),
-    ('EUR', 'BE0011395465', '-', 'GOSSON KESSALES'),
-    ('EUR', 'BE0057677594', '-', 'GROTTES DE HAN/s/L'),
-    ('EUR', 'BE0011606630', '-', 'GROUPE JOSI'),
-    ('EUR', 'BE6264882406', '-', 'IMBAKIN HOLDING'),
-    ('EUR', 'BE0020932779', '-', 'IMMAGRIFOR'),
-    ('EUR', 'BE0011253011', '-', "IMMO FOND'ROY"),
-    ('EUR', 'BE0011254027', '-', "IMMO FOND'ROY -5e"),
-    ('EUR', 'BE0003866838', 'IMMOP', 'IMMOPOOL'),
-    ('EUR', 'BE6265912038', '-', 'INFRABEL'),
-    ('EUR', 'BE0049482129', '-', 'KABELWERK EUPEN'),
-    ('EUR', 'LU0092281103', '-', 'KBL EPB - ORD'),
-    ('EUR', 'LU0092281442', '-', 'KBL EPB - PRIV'),
-    ('EUR', 'NL0000009645', '-', 'KLM'),
-    ('EUR', 'BE0011844108', '-', 'MAURAGE'),
-    ('EUR', 'BE0010342609', '-', 'MBZ (Gen-Jce)'),
-    ('EUR', 'BE0101614551', '-', 'MECHELEN'),
-    ('EUR', 'BE0003222214', '-', 'MESSER BELGIUM'),
-    ('EUR', 'BE0038785821', '-', 'METALEN GALLER'),
-    ('EUR', 'BE0010610377', '-', 'MICS PARTNERS'),
-    ('EUR', 'BE0035966762', '-', 'NMC'),
-    ('EUR', 'BE0034169251', '-', 'OLD ENGLAND'),
-    ('EUR', 'BE0003704187', '-', 'OPPIDUM'),
-    ('EUR', 'BE0942448938', '-', 'OPTIMCO'),
-    ('EUR', 'BE0003860773', 'ICE', 'OZ GROUP'),
-    ('EUR', 'BE0157892739', '-', 'PANTECH'),
-    ('EUR', 'BE0003640514', '-', 'PB FINANCE'),
-    ('EUR', 'BE0126745638', '-', 'PELTZER'),
-    ('EUR', 'BE6321065607', '-', 'PHIMA'),
-    ('EUR', 'NL0000288652', '-', 'RODAMCO'),
-    ('EUR', 'BE0003660710', '-', 'ROTON'),
-    ('EUR', 'BE0944264663', '-', 'SCR-SIBELCO'),
-    ('EUR', 'BE0016250517', '-', 'SIMINANS'),
-    ('EUR', 'BE0010621481', '-', 'SNCB/NMBS -Jce/Gen'),
-    ('EUR', 'QX0000022625', '-', 'SOCLINPAR'),
-    ('EUR', 'BE0099887748', '-', 'SOLVAY (CP 41)'),
-    ('EUR', 'BE0003279784', '-', 'ST GOBAIN IMB'),
-    ('EUR', 'BE0014199377', '-', 'ST-PIETERS-LEEUW'),
-    ('EUR', 'BE0010026350', '-', 'SUCRAF (ben/win)'),
-    ('EUR', 'BE0003527356', '-', 'SURONGO'),
-    ('EUR', 'BE6321066613', '-', 'T.PALM INTERN. LUX'),
-    ('EUR', 'BE0003886067', 'TET', 'TETRYS'),
-    ('EUR', 'BE0036061746', '-', 'TISSAGES BRUGGEMAN'),
-    ('EUR', 'BE0024981525', '-', 'TPF CONTRACTING'),
-    ('EUR', 'BE0099967573', 'TUBAT', 'TUBIZE (ATTR)'),
-    ('EUR', 'BE0017609521', '-', 'UTEXBEL'),
-    ('EUR', 'BE0022780820', '-', 'VDK BANK'),
-    ('EUR', 'BE0947790037', '-', 'VOLKSVERMOGEN'),
-    ('EUR', 'BE0020918638', '-', 'VOORUITZICHT'),
-    ('EUR', 'BE0107958945', '-', 'WEYVELD NOSSEGEM'),
-    )
-
-EURONEXT_STOCKS_EN_LIS = (
-    ('EUR', 'PTALT0AE0002', 'ALTR', 'ALTRI SGPS'),
-    ('EUR', 'PTBCP0AM0015', 'BCP', 'B.COM.PORTUGUES'),
-    ('EUR', 'PTSLB0AM0010', 'SLBEN', 'BENFICA'),
-    ('EUR', 'PTCFN0AE0003', 'CFN', 'COFINA,SGPS'),
-    ('EUR', 'PTCOR0AE0006', 'COR', 'CORTICEIRA AMORIM'),
-    ('EUR', 'PTCTT0AM0001', 'CTT', 'CTT CORREIOS PORT'),
-    ('EUR', 'PTEDP0AM0009', 'EDP', 'EDP'),
-    ('EUR', 'ES0127797019', 'EDPR', 'EDP RENOVAVEIS'),
-    ('EUR', 'PTESO0AM0000', 'ESON', 'ESTORIL SOL N'),
-    ('EUR', 'PTFXD0AM0018', 'FLEXD', 'FLEXDEAL'),
-    ('EUR', 'PTFCP0AM0008', 'FCP', 'FUT.CLUBE PORTO'),
-    ('EUR', 'PTGAL0AM0009', 'GALP', 'GALP ENERGIA-NOM'),
-    ('EUR', 'PTPAD0AM0007', 'GLINT', 'GLINTT'),
-    ('EUR', 'PTIBS0AM0008', 'IBS', 'IBERSOL,SGPS'),
-    ('EUR', 'PTGPA0AP0007', 'GPA', 'IMOB.C GRAO PARA'),
-    ('EUR', 'PTIPR0AM0000', 'IPR', 'IMPRESA,SGPS'),
-    ('EUR', 'PTINA0AP0008', 'INA', 'INAPA-INV.P.GESTAO'),
-    ('EUR', 'PTJMT0AE0001', 'JMT', 'J.MARTINS,SGPS'),
-    ('EUR', 'PTLIG0AE0002', 'LIG', 'LISGRAFICA'),
-    ('EUR', 'PTMFR0AM0003', 'MAR', 'MARTIFER'),
-    ('EUR', 'PTGMC0AM0003', 'MCP', 'MEDIA CAPITAL'),
-    ('EUR', 'ES0105025003', 'MRL', 'MERLIN PROPERTIES'),
-    ('EUR', 'PTMEN0AE0005', 'EGL', 'MOTA ENGIL'),
-    ('EUR', 'PTZON0AM0006', 'NOS', 'NOS, SGPS'),
-    ('EUR', 'PTNBA0AM0006', 'NBA', 'NOVABASE,SGPS'),
-    ('EUR', 'PTORE0AM0002', 'ORE', 'OREY ANTUNES ESC.'),
-    ('EUR', 'PTPTC0AM0009', 'PHR', 'PHAROL'),
-    ('EUR', 'PTFRV0AE0004', 'RAM', 'RAMADA'),
-    ('EUR', 'PTRED0AP0010', 'RED', 'REDITUS,SGPS'),
-    ('EUR', 'PTREL0AM0008', 'RENE', 'REN'),
-    ('EUR', 'PTSEM0AM0004', 'SEM', 'SEMAPA'),
-    ('EUR', 'PTSON0AM0001', 'SON', 'SONAE'),
-    ('EUR', 'PTS3P0AM0025', 'SONI', 'SONAE IND.SGPS'),
-    ('EUR', 'PTSNC0AM0006', 'SNC', 'SONAECOM,SGPS'),
-    ('EUR', 'PTSCP0AM0001', 'SCP', 'SPORTING'),
-    ('EUR', 'PTTD10AM0000', 'TDSA', 'TEIXEIRA DUARTE'),
-    ('EUR', 'PTPTI0AM0006', 'NVG', 'THE NAVIGATOR COMP'),
-    ('EUR', 'PTSCT0AP0018', 'SCT', 'TOYOTA CAETANO'),
-    ('EUR', 'PTVAA0AM0019', 'VAF', 'VAA VISTA ALEGRE'),
-    )
-
-EURONEXT_STOCKS_EN_PA = (
-    ('EUR', 'FR0012821890', 'ADUX', 'ADUX'),
-    ('EUR', 'FR0000031122', 'AF', 'AIR FRANCE -KLM'),
-    )
-
-EURONEXT_STOCKS_EN_PAB = (
-    ('EUR', 'NL0006294274', 'ENX', 'EURONEXT'),
-    ('EUR', 'FR0000125007', 'SGO', 'SAINT GOBAIN'),
-    )
-
-EURONEXT_STOCKS_EN_PAR = (
-    ('EUR', 'FR0013341781', '2CRSI', '2CRSI'),
-    ('EUR', 'FR0014000T90', '2MX', '2MX ORGANIC'),
-    ('EUR', 'FR0014000TB2', '2MXBS', '2MX ORGANIC BS'),
-    ('EUR', 'FR0000076887', 'ASP', 'A.S.T. GROUPE'),
-    ('EUR', 'FR0010557264', 'AB', 'AB SCIENCE'),
-    ('EUR', 'FR0004040608', 'ABCA', 'ABC ARBITRAGE'),
-    ('EUR', 'FR0013185857', 'ABEO', 'ABEO'),
-    ('EUR', 'FR0012616852', 'ABNX', 'ABIONYX PHARMA'),
-    ('EUR', 'FR0012333284', 'ABVX', 'ABIVAX'),
-    ('EUR', 'FR0000064602', 'ACAN', 'ACANTHE DEV.'),
-    ('EUR', 'FR0000120404', 'AC', 'ACCOR'),
-    ('EUR', 'FR0000076861', 'EOS', 'ACTEOS'),
-    ('EUR', 'FR0000076655', 'ATI', 'ACTIA GROUP'),
-    ('EUR', 'BE0974269012', 'ALDV', 'ADC SIIC'),
-    ('EUR', 'FR0000062978', 'ALP', 'ADL PARTNER'),
-    ('EUR', 'FR0011184241', 'ADOC', 'ADOCIA'),
-    ('EUR', 'FR0010340141', 'ADP', 'ADP'),
-    ('EUR', 'FR0004152874', 'ADV', 'ADVENIS'),
-    ('EUR', 'FR0000053043', 'ADVI', 'ADVINI'),
-    ('EUR', 'US00774B2088', 'AKOM', 'AERKOMM INC'),
-    ('EUR', 'FR0000120073', 'AI', 'AIR LIQUIDE'),
-    ('EUR', 'NL0000235190', 'AIR', 'AIRBUS'),
-    ('EUR', 'FR0000053027', 'AKW', 'AKWEL'),
-    ('EUR', 'FR0000060402', 'ABIO', 'ALBIOMA'),
-    ('EUR', 'FR0013258662', 'ALD', 'ALD'),
-    ('EUR', 'FR0000053324', 'CDA', 'ALPES (COMPAGNIE)'),
-    ('EUR', 'FR0013421286', 'ALM', 'ALPHA MOS'),
-    ('EUR', 'FR0010220475', 'ALO', 'ALSTOM'),
-    ('EUR', 'FR0000053837', 'LTA', 'ALTAMIR'),
-    ('EUR', 'FR0000033219', 'ALTA', 'ALTAREA'),
-    ('EUR', 'FR0000039216', 'AREIT', 'ALTAREIT'),
-    ('EUR', 'FR0000071946', 'ATE', 'ALTEN'),
-    ('EUR', 'FR0010395681', 'ALTUR', 'ALTUR INVEST.'),
-    ('EUR', 'FR0012789667', 'AMPLI', 'AMPLITUDE SURGICAL'),
-    ('EUR', 'FR0004125920', 'AMUN', 'AMUNDI'),
-    ('EUR', 'KYG6096M1069', 'APM', 'APTORUM GROUP CL A'),
-    ('EUR', 'FR0010481960', 'ARG', 'ARGAN'),
-    ('EUR', 'FR0010313833', 'AKE', 'ARKEMA'),
-    ('EUR', 'FR0012185536', 'ARTE', 'ARTEA'),
-    ('EUR', 'FR0000074783', 'PRC', 'ARTMARKET COM'),
-    ('EUR', 'FR0000076952', 'ARTO', 'ARTOIS NOM.'),
-    ('EUR', 'FR0000074148', 'ASY', 'ASSYSTEM'),
-    ('EUR', 'FR0010478248', 'ATA', 'ATARI'),
-    ('EUR', 'FR0011992700', 'ATEME', 'ATEME'),
-    ('EUR', 'FR0000051732', 'ATO', 'ATOS'),
-    ('EUR', 'FR0000063737', 'AUB', 'AUBAY'),
-    ('EUR', 'FR0000061780', 'AUGR', 'AUGROS COSMETICS'),
-    ('EUR', 'FR0000039232', 'AURE', 'AUREA'),
-    ('EUR', 'FR0013183589', 'AURS', 'AURES TECHNOLOGIES'),
-    ('EUR', 'FR0013529815', 'AVT', 'AVENIR TELECOM'),
-    ('EUR', 'FR0000120628', 'CS', 'AXA'),
-    ('EUR', 'FR0011040500', 'AXW', 'AXWAY SOFTWARE'),
-    ('EUR', 'FR0000064123', 'BCRA', 'BACCARAT'),
-    ('EUR', 'MC0000031187', 'BAIN', 'BAINS MER MONACO'),
-    ('EUR', 'FR0013258399', 'BALYO', 'BALYO'),
-    ('EUR', 'FR0000062788', 'BUI', 'BARBARA BUI'),
-    ('EUR', 'FR0004023208', 'BASS', 'BASSAC'),
-    ('EUR', 'FR0000035370', 'BLC', 'BASTIDE LE CONFORT'),
-    ('EUR', 'FR0000121857', 'FBEL', 'BEL'),
-    ('EUR', 'FR0000035164', 'BEN', 'BENETEAU'),
-    ('EUR', 'FR0000120966', 'BB', 'BIC'),
-    ('EUR', 'FR0000074072', 'BIG', 'BIGBEN INTERACTIVE'),
-    ('EUR', 'FR0013280286', 'BIM', 'BIOMERIEUX'),
-    ('EUR', 'FR0000062150', 'BLEE', 'BLEECKER'),
-    ('EUR', 'FR0000131104', 'BNP', 'BNP PARIBAS ACT.A'),
-    ('EUR', 'FR0000061129', 'BOI', 'BOIRON'),
-    ('EUR', 'FR0000039299', 'BOL', 'BOLLORE'),
-    ('EUR', 'FR0000063935', 'BON', 'BONDUELLE'),
-    ('EUR', 'FR0011814938', 'BOOST', 'BOOSTHEAT'),
-    ('EUR', 'FR0000074254', 'BSD', 'BOURSE DIRECT'),
-    ('EUR', 'FR0000120503', 'EN', 'BOUYGUES'),
-    ('EUR', 'FR0006174348', 'BVI', 'BUREAU VERITAS'),
-    ('EUR', 'FR0000061137', 'BUR', 'BURELLE'),
-    ('EUR', 'FR0000045544', 'CAT31', 'CA TOULOUSE 31 CCI'),
-    ('EUR', 'FR0010151589', 'CAFO', 'CAFOM'),
-    ('EUR', 'FR0000079659', 'CBDG', 'CAMBODGE NOM.'),
-    ('EUR', 'FR0012969095', 'CAPLI', 'CAPELLI'),
-    ('EUR', 'FR0000125338', 'CAP', 'CAPGEMINI'),
-    ('EUR', 'FR0010828137', 'CARM', 'CARMILA'),
-    ('EUR', 'FR0000064156', 'CARP', 'CARPINIENNE PART.'),
-    ('EUR', 'FR0000120172', 'CA', 'CARREFOUR'),
-    ('EUR', 'FR0000125585', 'CO', 'CASINO GUICHARD'),
-    ('EUR', 'FR0000072894', 'CAS', 'CAST'),
-    ('EUR', 'FR0010193052', 'CATG', 'CATANA GROUP'),
-    ('EUR', 'FR0000064446', 'CTRG', 'CATERING INTL SCES'),
-    ('EUR', 'US1491231015', 'CATR', 'CATERPILLAR INC'),
-    ('EUR', 'FR0010193979', 'CBOT', 'CBO TERRITORIA'),
-    ('EUR', 'FR0000053506', 'CGM', 'CEGEDIM'),
-    ('EUR', 'FR0010309096', 'CGR', 'CEGEREAL'),
-    ('EUR', 'FR0000037475', 'CFI', 'CFI'),
-    ('EUR', 'FR0013181864', 'CGG', 'CGG'),
-    ('EUR', 'FR0013309614', 'CGGBS', 'CGG BSA 1'),
-    ('EUR', 'FR0013309622', 'CGGBT', 'CGG BSA 2'),
-    ('EUR', 'FR0000130692', 'CRI', 'CHARGEURS'),
-    ('EUR', 'FR0000060907', 'CHSR', 'CHAUSSERIA'),
-    ('EUR', 'FR0000130403', 'CDI', 'CHRISTIAN DIOR'),
-    ('EUR', 'FR0000054322', 'CIB', 'CIBOX INTER A CTIV'),
-    ('EUR', 'FR0013426004', 'CLA', 'CLARANOVA'),
-    ('EUR', 'FR0000053399', 'COM', 'CNIM GROUP'),
-    ('EUR', 'NL0010949392', 'CNV', 'CNOVA'),
-    ('EUR', 'FR0000120222', 'CNP', 'CNP ASSURANCES'),
-    ('EUR', 'FR0010667147', 'COFA', 'COFACE'),
-    ('EUR', 'FR0004031763', 'COH', 'COHERIS'),
-    ('EUR', 'FR0000121634', 'RE', 'COLAS'),
-    ('EUR', 'FR0000065393', 'COUR', 'COURTOIS'),
-    ('EUR', 'FR0000064578', 'COV', 'COVIVIO'),
-    ('EUR', 'FR0000060303', 'COVH', 'COVIVIO HOTELS'),
-    ('EUR', 'FR0000044323', 'CRAP', 'CRCAM ALP.PROV.CCI'),
-    ('EUR', 'FR0000185506', 'CRAV', 'CRCAM ATL.VEND.CCI'),
-    ('EUR', 'FR0010483768', 'CRBP2', 'CRCAM BRIE PIC2CCI'),
-    ('EUR', 'FR0000045213', 'CIV', 'CRCAM ILLE-VIL.CCI'),
-    ('EUR', 'FR0010461053', 'CRLA', 'CRCAM LANGUED CCI'),
-    ('EUR', 'FR0000045239', 'CRLO', 'CRCAM LOIRE HTE L.'),
-    ('EUR', 'FR0000045551', 'CMO', 'CRCAM MORBIHAN CCI'),
-    ('EUR', 'FR0000185514', 'CNF', 'CRCAM NORD CCI'),
-    ('EUR', 'FR0000044364', 'CCN', 'CRCAM NORM.SEINE'),
-    ('EUR', 'FR0000045528', 'CAF', 'CRCAM PARIS ET IDF'),
-    ('EUR', 'FR0000045346', 'CRSU', 'CRCAM SUD R.A.CCI'),
-    ('EUR', 'FR0000045304', 'CRTO', 'CRCAM TOURAINE CCI'),
-    ('EUR', 'FR0000045072', 'ACA', 'CREDIT AGRICOLE'),
-    ('EUR', 'FR0000050395', 'CROS', 'CROSSWOOD'),
-    ('EUR', 'FR0007317813', 'SX', 'CS GROUP.'),
-    ('EUR', 'FR0011026749', 'DLT', 'DALET'),
-    ('EUR', 'FR0000120644', 'BN', 'DANONE'),
-    ('EUR', 'FR0000121725', 'AM', 'DASSAULT AVIATION'),
-    ('EUR', 'FR0000130650', 'DSY', 'DASSAULT SYSTEMES'),
-    ('EUR', 'FR0010417345', 'DBV', 'DBV TECHNOLOGIES'),
-    ('EUR', 'FR0013283108', 'DLTA', 'DELTA PLUS GROUP'),
-    ('EUR', 'FR0000053381', 'DBG', 'DERICHEBOURG'),
-    ('EUR', 'FR0000073793', 'DVT', 'DEVOTEAM'),
-    ('EUR', 'GB0002374006', 'DGE', 'DIAGEO'),
-    ('EUR', 'FR0012202497', 'DGM', 'DIAGNOSTIC MEDICAL'),
-    ('EUR', 'FR0000065260', 'DPAM', 'DOCK.PETR.AMBES AM'),
-    ('EUR', 'FR0010099515', 'ECASA', 'ECA'),
-    ('EUR', 'FR0010908533', 'EDEN', 'EDENRED'),
-    ('EUR', 'FR0010242511', 'EDF', 'EDF'),
-    ('EUR', 'FR0000072373', 'GID', 'EGIDE'),
-    ('EUR', 'FR0000130452', 'FGR', 'EIFFAGE'),
-    ('EUR', 'FR0011466069', 'EKI', 'EKINOPS'),
-    ('EUR', 'FR0000031023', 'ELEC', 'ELEC.STRASBOURG'),
-    ('EUR', 'FR0000035719', 'EEM', 'ELECT. MADAGASCAR'),
-    ('EUR', 'FR0011950732', 'ELIOR', 'ELIOR GROUP'),
-    ('EUR', 'FR0012435121', 'ELIS', 'ELIS'),
-    ('EUR', 'FR0012650166', 'EPS', 'ENGIE EPS'),
-    ('EUR', 'FR0011191766', 'EOSI', 'EOS IMAGING'),
-    ('EUR', 'FR0000131757', 'ERA', 'ERAMET'),
-    ('EUR', 'FR0011471135', 'ERYP', 'ERYTECH PHARMA'),
-    ('EUR', 'FR0004110310', 'ESI', 'ESI GROUP'),
-    ('EUR', 'FR0000121667', 'EL', 'ESSILORLUXOTTICA'),
-    ('EUR', 'FR0000120669', 'ES', 'ESSO'),
-    ('EUR', 'FR0000061475', 'EFI', 'EURASIA FONC INV'),
-    ('EUR', 'FR0000121121', 'RF', 'EURAZEO'),
-    ('EUR', 'FR0000054678', 'EUR', 'EURO RESSOURCES'),
-    ('EUR', 'FR0014000MR3', 'ERF', 'EUROFINS SCIENT.'),
-    ('EUR', 'FR0010490920', 'ECP', 'EUROPACORP'),
-    ('EUR', 'FR0012789949', 'EUCAR', 'EUROPCAR MOBILITY'),
-    ('EUR', 'FR0010221234', 'ETL', 'EUTELSAT COMMUNIC.'),
-    ('EUR', 'FR0000035784', 'EGR', 'EVERGREEN'),
-    ('EUR', 'FR0000064164', 'EXAC', 'EXACOMPTA CLAIREF.'),
-    ('EUR', 'FR0004527638', 'EXE', 'EXEL INDUSTRIES'),
-    ('EUR', 'FR0000037343', 'EPCP', 'EXPLOS.PROD.CHI.PF'),
-    ('EUR', 'FR0000039026', 'EXPL', 'EXPLOSIFS PROD.CHI'),
-    ('EUR', 'FR0000121147', 'EO', 'FAURECIA'),
-    ('EUR', 'FR0000063034', 'FAUV', 'FAUVET GIREL'),
-    ('EUR', 'FR0000031973', 'FAYE', 'FAYENC.SARREGUEMI.'),
-    ('EUR', 'FR0013451333', 'FDJ', 'FDJ'),
-    ('EUR', 'FR0000062101', 'FCMC', 'FERM.CAS.MUN.CANNE'),
-    ('EUR', 'FR0011271600', 'FALG', 'FERMENTALG'),
-    ('EUR', 'FR0000064784', 'FFP', 'FFP'),
-    ('EUR', 'FR0000061418', 'SACI', 'FIDUCIAL OFF.SOL.'),
-    ('EUR', 'FR0000060535', 'ORIA', 'FIDUCIAL REAL EST.'),
-    ('EUR', 'FR0011665280', 'FGA', 'FIGEAC AERO'),
-    ('EUR', 'FR0000062341', 'BERR', 'FIN.ETANG BERRE'),
-    ('EUR', 'FR0000062507', 'EBPF', 'FIN.ETANG BERRE PF'),
-    ('EUR', 'SN0000033192', 'FOAF', 'FIN.OUEST AFRICAIN'),
-    ('EUR', 'FR0000060824', 'FINM', 'FINANCIERE MARJOS'),
-    ('EUR', 'FR0000062234', 'ODET', 'FINANCIERE ODET'),
-    ('EUR', 'FR0000035123', 'FNTS', 'FINATIS'),
-    ('EUR', 'FR0000038184', 'FIPP', 'FIPP'),
-    ('EUR', 'FR0011476928', 'FNAC', 'FNAC DARTY'),
-    ('EUR', 'FR0011277391', 'FPN', 'FONC. PARIS NORD'),
-    ('EUR', 'FR0000065930', 'LEBL', 'FONCIERE 7 INVEST'),
-    ('EUR', 'FR0013455482', 'FATL', 'FONCIERE ATLAND'),
-    ('EUR', 'FR0000038499', 'EURS', 'FONCIERE EURIS'),
-    ('EUR', 'FR0010341032', 'INEA', 'FONCIERE INEA'),
-    ('EUR', 'FR0000033409', 'FLY', 'FONCIERE LYONNAISE'),
-    ('EUR', 'FR0000053944', 'SPEL', 'FONCIERE VOLTA'),
-    ('EUR', 'CI0000053161', 'FORE', 'FORESTIERE EQUAT.'),
-    ('EUR', 'FR0013030152', 'LFDE', 'FRANCAISE ENERGIE'),
-    ('EUR', 'FR0010588079', 'FREY', 'FREY'),
-    ('EUR', 'FR0000030611', 'GALIM', 'GALIMMO'),
-    ('EUR', 'FR0000034894', 'GAM', 'GAUMONT'),
-    ('EUR', 'FR0000053035', 'GEA', 'GEA GRENOBL.ELECT.'),
-    ('EUR', 'FR0000079634', 'GECP', 'GECI INTL'),
-    ('EUR', 'FR0013266764', 'GECBT', 'GECI INTL BSAR A'),
-    ('EUR', 'FR0010040865', 'GFC', 'GECINA'),
-    ('EUR', 'US3696041033', 'GNE', 'GENERAL ELECTRIC'),
-    ('EUR', 'FR0010501692', 'GENX', 'GENERIX GROUP'),
-    ('EUR', 'CH0308403085', 'GNRO', 'GENEURO'),
-    ('EUR', 'FR0004163111', 'GNFT', 'GENFIT'),
-    ('EUR', 'FR0011799907', 'GV', 'GENOMIC VISION'),
-    ('EUR', 'FR0013183985', 'SIGHT', 'GENSIGHT BIOLOGICS'),
-    ('EUR', 'FR0010533075', 'GET', 'GETLINK SE'),
-    ('EUR', 'FR0000066672', 'GLO', 'GL EVENTS'),
-    ('EUR', 'FR0010214064', 'GPE', 'GPE GROUP PIZZORNO'),
-    ('EUR', 'FR0000065971', 'GRVO', 'GRAINES VOLTZ'),
-    ('EUR', 'FR0000036675', 'CEN', 'GROUPE CRIT'),
-    ('EUR', 'FR0004076891', 'FLO', 'GROUPE FLO'),
-    ('EUR', 'FR0000062671', 'GOE', 'GROUPE GORGE'),
-    ('EUR', 'FR0000124232', 'IRD', 'GROUPE IRD'),
-    ('EUR', 'FR0004010338', 'GJAJ', 'GROUPE JAJ'),
-    ('EUR', 'FR0004050300', 'OPN', 'GROUPE OPEN'),
-    ('EUR', 'FR0012612646', 'PARP', 'GROUPE PARTOUCHE'),
-    ('EUR', 'FR0004155000', 'SFPI', 'GROUPE SFPI'),
-    ('EUR', 'US36254L1008', 'GTBP', 'GT BIOPHARMA INC'),
-    ('EUR', 'FR0011726835', 'GTT', 'GTT'),
-    ('EUR', 'FR0000032526', 'GBT', 'GUERBET'),
-    ('EUR', 'FR0000066722', 'GUI', 'GUILLEMOT'),
-    ('EUR', 'FR0000066755', 'PIG', 'HAULOTTE GROUP'),
-    ('EUR', 'FR0000052292', 'RMS', 'HERMES INTL'),
-    ('EUR', 'FR0004159473', 'HEXA', 'HEXAOM'),
-    ('EUR', 'FR0000038531', 'HF', 'HF'),
-    ('EUR', 'FR0000054231', 'HCO', 'HIGH CO'),
-    ('EUR', 'FR0012821916', 'HIPAY', 'HIPAY GROUP'),
-    ('EUR', 'FR0000065278', 'HOP', 'HOPSCOTCH GROUPE'),
-    ('EUR', 'FR0004165801', 'HDP', 'HOTELS DE PARIS'),
-    ('EUR', 'FR0000035081', 'ICAD', 'ICADE'),
-    ('EUR', 'FR0010929125', 'IDL', 'ID LOGISTICS GROUP'),
-    ('EUR', 'FR0000051393', 'IDIP', 'IDI'),
-    ('EUR', 'FR0000030827', 'IGE', 'IGE + XAO'),
-    ('EUR', 'FR0004035913', 'ILD', 'ILIAD'),
-    ('EUR', 'FR0000120859', 'NK', 'IMERYS'),
-    ('EUR', 'FR0000033243', 'IMDA', 'IMMOB.DASSAULT'),
-    ('EUR', 'FR0000066219', 'INFE', 'INDLE FIN.ENTREPR.'),
-    ('EUR', 'FR0000071797', 'INF', 'INFOTEL'),
-    ('EUR', 'FR0010331421', 'IPH', 'INNATE PHARMA'),
-    ('EUR', 'FR0000064297', 'INN', 'INNELEC MULTIMEDIA'),
-    ('EUR', 'FR0004024222', 'ITP', 'INTERPARFUMS'),
-    ('EUR', 'FR0000064958', 'ITXT', 'INTEXA'),
-    ('EUR', 'FR0013233012', 'IVA', 'INVENTIVA'),
-    ('EUR', 'FR0010259150', 'IPN', 'IPSEN'),
-    ('EUR', 'FR0000073298', 'IPS', 'IPSOS'),
-    ('EUR', 'FR0004026151', 'ITE', 'ITESOFT'),
-    ('EUR', 'FR0012872141', 'JBOG', 'JACQUES BOGART'),
-    ('EUR', 'FR0000033904', 'JCQ', 'JACQUET METALS'),
-    ('EUR', 'FR0000077919', 'DEC', 'JC DECAUX SA.'),
-    ('EUR', 'FR0004007813', 'KOF', 'KAUFMAN ET BROAD'),
-    ('EUR', 'FR0000121485', 'KER', 'KERING'),
-    ('EUR', 'FR0004029411', 'KEY', 'KEYRUS'),
-    ('EUR', 'FR0000121964', 'LI', 'KLEPIERRE'),
-    ('EUR', 'FR0010386334', 'KORI', 'KORIAN'),
-    ('EUR', 'FR0000120321', 'OR', "L''OREAL"),
-    ('EUR', 'FR0000039638', 'LFVE', 'LA FONCIERE VERTE'),
-    ('EUR', 'FR0000066607', 'LACR', 'LACROIX SA'),
-    ('EUR', 'CH0012214059', 'LHN', 'LAFARGEHOLCIM LTD'),
-    ('EUR', 'FR0000130213', 'MMB', 'LAGARDERE S.C.A.'),
-    ('EUR', 'FR0000032278', 'LAT', 'LATECOERE'),
-    ('EUR', 'FR0006864484', 'LPE', 'LAURENT-PERRIER'),
-    ('EUR', 'FR0013204336', 'LOUP', 'LDC'),
-    ('EUR', 'FR0000121295', 'LBON', 'LEBON'),
-    ('EUR', 'FR0000065484', 'LSS', 'LECTRA'),
-    ('EUR', 'FR0010307819', 'LR', 'LEGRAND'),
-    ('EUR', 'FR0004156297', 'LIN', 'LINEDATA SERVICES'),
-    ('EUR', 'FR0000050353', 'FII', 'LISI'),
-    ('EUR', 'FR0004170017', 'LNA', 'LNA SANTE'),
-    ('EUR', 'FR0000038242', 'LBIRD', 'LUMIBIRD'),
-    ('EUR', 'FR0000121014', 'MC', 'LVMH'),
-    ('EUR', 'FR0013233475', 'LYS', 'LYSOGENE'),
-    ('EUR', 'FR0000060196', 'MRM', 'M.R.M'),
-    ('EUR', 'FR0013153541', 'MDM', 'MAISONS DU MONDE'),
-    ('EUR', 'FR0000030074', 'MALT', 'MALTERIES FCO-BEL.'),
-    ('EUR', 'FR0000038606', 'MTU', 'MANITOU BF'),
-    ('EUR', 'FR0000032302', 'MAN', 'MANUTAN INTL'),
-    ('EUR', 'MA0000011488', 'IAM', 'MAROC TELECOM'),
-    ('EUR', 'FR0010609263', 'MKEA', 'MAUNA KEA TECH'),
-    ('EUR', 'FR0000051070', 'MAU', 'MAUREL ET PROM'),
-    ('EUR', 'FR0000060873', 'MBWS', 'MBWS'),
-    ('EUR', 'FR0013404944', 'MBWBT', 'MBWS BSA 2022'),
-    ('EUR', 'FR0013066313', 'MBWSZ', 'MBWS BSAR 2023'),
-    ('EUR', 'FR0011742329', 'MCPHY', 'MCPHY ENERGY'),
-    ('EUR', 'FR0000064404', 'EDI', 'MEDIA 6'),
-    ('EUR', 'FR0004065605', 'MEDCL', 'MEDINCELL'),
-    ('EUR', 'FR0010298620', 'MEMS', 'MEMSCAP REGPT'),
-    ('EUR', 'FR0010241638', 'MERY', 'MERCIALYS'),
-    ('EUR', 'US58933Y1055', 'MRK', 'MERCK AND CO INC'),
-    ('EUR', 'FR0000039620', 'MRN', 'MERSEN'),
-    ('EUR', 'FR0004177046', 'METEX', 'METABOLIC EXPLORER'),
-    ('EUR', 'FR0000053225', 'MMT', 'METROPOLE TV'),
-    ('EUR', 'FR0000121261', 'ML', 'MICHELIN'),
-    ('EUR', 'FR0000077570', 'MUN', 'MICROPOLE'),
-    ('EUR', 'FR0000076986', 'MONC', 'MONCEY (FIN.) NOM.'),
-    ('EUR', 'FR0000037970', 'GREV', 'MUSEE GREVIN'),
-    ('EUR', 'FR0013482791', 'NACON', 'NACON'),
-    ('EUR', 'FR0011341205', 'NANO', 'NANOBIOTIX'),
-    ('EUR', 'FR0000120685', 'KN', 'NATIXIS'),
-    ('EUR', 'FR0013018041', 'NAVYA', 'NAVYA'),
-    ('EUR', 'FR0011675362', 'NEOEN', 'NEOEN'),
-    ('EUR', 'FR0004154060', 'NTG', 'NETGEM'),
-    ('EUR', 'FR0004050250', 'NRO', 'NEURONES'),
-    ('EUR', 'FR0000044448', 'NEX', 'NEXANS'),
-    ('EUR', 'FR0010112524', 'NXI', 'NEXITY'),
-    ('EUR', 'FR0012789386', 'NEXTS', 'NEXTSTAGE'),
-    ('EUR', 'FR0013018124', 'COX', 'NICOX'),
-    ('EUR', 'FI0009000681', 'NOKIA', 'NOKIA'),
-    ('EUR', 'FR0004166155', 'NR21', 'NR21'),
-    ('EUR', 'FR0014000VN3', 'N21DS', 'NR21 DS'),
-    ('EUR', 'FR0000121691', 'NRG', 'NRJ GROUP'),
-    ('EUR', 'FR0000052680', 'SBT', 'OENEO'),
-    ('EUR', 'FR0010428771', 'OLG', 'OL GROUPE'),
-    ('EUR', 'FR0000133308', 'ORA', 'ORANGE'),
-    ('EUR', 'FR0000075392', 'ORAP', 'ORAPI'),
-    ('EUR', 'FR0013522216', 'ORAPB', 'ORAPI BSA'),
-    ('EUR', 'FR0013190410', 'KAZI', 'ORCHESTRA-PREMAMAN'),
-    ('EUR', 'FR0010609206', 'OREGE', 'OREGE'),
-    ('EUR', 'FR0000184798', 'ORP', 'ORPEA'),
-    ('EUR', 'FR0012127173', 'OSE', 'OSE IMMUNO'),
-    ('EUR', 'FR0013318813', 'PID', 'PARAGON ID'),
-    ('EUR', 'FR0010263202', 'PAR', 'PAREF'),
-    ('EUR', 'FR0004038263', 'PARRO', 'PARROT'),
-    ('EUR', 'FR0013054269', 'PABSA', 'PARROT BSA 1'),
-    ('EUR', 'FR0013054335', 'PABSB', 'PARROT BSA 2'),
-    ('EUR', 'FR0000038465', 'PSAT', 'PASSAT'),
-    ('EUR', 'FR0011027135', 'PAT', 'PATRIMOINE ET COMM'),
-    ('EUR', 'FR0000053514', 'PCA', 'PCAS'),
-    ('EUR', 'FR0000120693', 'RI', 'PERNOD RICARD'),
-    ('EUR', 'FR0000061459', 'PERR', 'PERRIER (GERARD)'),
-    ('EUR', 'FR0000121501', 'UG', 'PEUGEOT'),
-    ('EUR', 'FR0012882389', 'PHA', 'PHARMAGEST INTER.'),
-    ('EUR', 'FR0000073041', 'VAC', 'PIERRE VACANCES'),
-    ('EUR', 'FR0013252186', 'PVL', 'PLAST.VAL LOIRE'),
-    ('EUR', 'FR0000124570', 'POM', 'PLASTIC OMNIUM'),
-    ('EUR', 'FR0012432516', 'POXEL', 'POXEL'),
-    ('EUR', 'FR0000060832', 'PREC', 'PRECIA'),
-    ('EUR', 'FR0004052561', 'PROAC', 'PROACTIS SA'),
-    ('EUR', 'FR0012613610', 'PWG', 'PRODWAYS'),
-    ('EUR', 'FR0010380626', 'PROL', 'PROLOGUE'),
-    ('EUR', 'FR0011994326', 'PRBS2', 'PROLOGUE BSAA2021'),
-    ('EUR', 'FR0000060329', 'PSB', 'PSB INDUSTRIES'),
-    ('EUR', 'FR0000312928', 'PUBBS', 'PUBLICIS BSA'),
-    ('EUR', 'FR0000130577', 'PUB', 'PUBLICIS GROUPE SA'),
-    ('EUR', 'FR0000120560', 'QDT', 'QUADIENT'),
-    ('EUR', 'FR0000060618', 'RAL', 'RALLYE'),
-    ('EUR', 'FR0000044471', 'GDS', 'RAMSAY GEN SANTE'),
-    ('EUR', 'FR0000120388', 'RX', 'RECYLEX S.A.'),
-    ('EUR', 'FR0000130395', 'RCO', 'REMY COINTREAU'),
-    ('EUR', 'FR0000131906', 'RNO', 'RENAULT'),
-    ('EUR', 'FR0010451203', 'RXL', 'REXEL'),
-    ('EUR', 'FR0000039091', 'RBT', 'ROBERTET'),
-    ('EUR', 'FR0000045619', 'CBR', 'ROBERTET CDV 87'),
-    ('EUR', 'FR0000045601', 'CBE', 'ROBERTET CI'),
-    ('EUR', 'FR0013344173', 'RBO', 'ROCHE BOBOIS'),
-    ('EUR', 'FR0000031684', 'ROTH', 'ROTHSCHILD & CO'),
-    ('EUR', 'FR0013269123', 'RUI', 'RUBIS'),
-    ('EUR', 'FR0000121709', 'SK', 'S.E.B.'),
-    ('EUR', 'FR0000073272', 'SAF', 'SAFRAN'),
-    ('EUR', 'FR0000060121', 'SABE', 'SAINT JEAN GROUPE'),
-    ('EUR', 'FR0000060071', 'SAMS', 'SAMSE'),
-    ('EUR', 'FR0000120578', 'SAN', 'SANOFI'),
-    ('EUR', 'FR0013154002', 'DIM', 'SARTORIUS STED BIO'),
-    ('EUR', 'FR0000120107', 'SAVE', 'SAVENCIA'),
-    ('EUR', 'FR0006239109', 'CBSM', 'SCBSM'),
-    ('EUR', 'AN8068571086', 'SLB', 'SCHLUMBERGER'),
-    ('EUR', 'FR0000121972', 'SU', 'SCHNEIDER ELECTRIC'),
-    ('EUR', 'FR0010411983', 'SCR', 'SCOR SE'),
-    ('EUR', 'FR0000039109', 'SCHP', 'SECHE ENVIRONNEM.'),
-    ('EUR', 'GB00B5ZN1N88', 'SGRO', 'SEGRO PLC'),
-    ('EUR', 'FR0000065492', 'SLCO', 'SELCODIS'),
-    ('EUR', 'FR0004175842', 'SELER', 'SELECTIRENTE'),
-    ('EUR', 'FR0011950682', 'SEFER', 'SERGEFERRARI GROUP'),
-    ('EUR', 'LU0088087324', 'SESG', 'SES'),
-    ('EUR', 'FR0010282822', 'SESL', 'SES IMAGOTAG'),
-    ('EUR', 'FR0013006558', 'SRP', 'SHOWROOMPRIVE'),
-    ('EUR', 'FR0000060790', 'GIRO', 'SIGNAUX GIROD'),
-    ('EUR', 'FR0000074122', 'SII', 'SII'),
-    ('EUR', 'FR0013214145', 'SMCP', 'SMCP'),
-    ('EUR', 'FR0004016699', 'SMTPC', 'SMTPC'),
-    ('EUR', 'FR0010209809', 'SFCA', 'SOC FRANC CASINOS'),
-    ('EUR', 'FR0000130809', 'GLE', 'SOCIETE GENERALE'),
-    ('EUR', 'FR0000121220', 'SW', 'SODEXO'),
-    ('EUR', 'FR0000078321', 'SEC', 'SODITECH'),
-    ('EUR', 'FR0000038804', 'SFBS', 'SOFIBUS PATRIMOINE'),
-    ('EUR', 'FR0000030140', 'SOFR', 'SOFRAGI'),
-    ('EUR', 'FR0000065864', 'SOG', 'SOGECLAIR'),
-    ('EUR', 'FR0013227113', 'SOI', 'SOITEC'),
-    ('EUR', 'FR00140006O9', 'LOCAL', 'SOLOCAL GROUP'),
-    ('EUR', 'FR0013379484', 'S30', 'SOLUTIONS 30 SE'),
-    ('EUR', 'FR0013199916', 'SO', 'SOMFY SA'),
-    ('EUR', 'FR0000050809', 'SOP', 'SOPRA STERIA GROUP'),
-    ('EUR', 'FR0012757854', 'SPIE', 'SPIE'),
-    ('EUR', 'FR0000131732', 'SPI', 'SPIR COMMUNICATION'),
-    ('EUR', 'FR0011289040', 'SQI', 'SQLI'),
-    ('EUR', 'FR0000054199', 'DPT', 'ST DUPONT'),
-    ('EUR', 'FR0000064271', 'STF', 'STEF'),
-    ('EUR', 'FR0010949404', 'STNT', 'STENTYS'),
-    ('EUR', 'NL0000226223', 'STM', 'STMICROELECTRONICS'),
-    ('EUR', 'FR0010526814', 'SSI', 'SUPERSONIC IMAGINE'),
-    ('EUR', 'FR0004180578', 'SWP', 'SWORD GROUP'),
-    ('EUR', 'FR0000032658', 'SDG', 'SYNERGIE'),
-    ('EUR', 'FR0004188670', 'TKTT', 'TARKETT'),
-    ('EUR', 'FR0000063307', 'TAYN', 'TAYNINH'),
-    ('EUR', 'FR0013526225', 'TECBS', 'TECH BSA 2024'),
-    ('EUR', 'FR0013505062', 'TCH', 'TECHNICOLOR'),
-    ('EUR', 'GB00BDSFG982', 'FTI', 'TECHNIPFMC'),
-    ('EUR', 'FR0000051807', 'TEP', 'TELEPERFORMANCE'),
-    ('EUR', 'CH0008175645', 'TVRB', 'TELEVERBIER'),
-    ('EUR', 'FR0004529147', 'TES', 'TESSI'),
-    ('EUR', 'FR0000054900', 'TFI', 'TF1'),
-    ('EUR', 'FR0013295789', 'TFF', 'TFF GROUP'),
-    ('EUR', 'FR0000121329', 'HO', 'THALES'),
-    ('EUR', 'FR0013333432', 'THEP', 'THERMADOR GROUPE'),
-    ('EUR', 'FR0013230612', 'TKO', 'TIKEHAU CAPITAL'),
-    ('EUR', 'FR0000066482', 'TIPI', 'TIPIAK'),
-    ('EUR', 'FR0000060949', 'TVLY', 'TIVOLY'),
-    ('EUR', 'GA0000121459', 'EC', 'TOTAL GABON'),
-    ('EUR', 'FR0000033003', 'TOUP', 'TOUAX'),
-    ('EUR', 'FR0000036816', 'EIFF', 'TOUR EIFFEL'),
-    ('EUR', 'FR0005175080', 'TNG', 'TRANSGENE'),
-    ('EUR', 'FR0005691656', 'TRI', 'TRIGANO'),
-    ('EUR', 'FR0000054470', 'UBI', 'UBISOFT ENTERTAIN'),
-    ('EUR', 'FR0000054215', 'UNBL', 'UNIBEL'),
-    ('EUR', 'FR0000034548', 'UFF', 'UNION FIN.FRANCE'),
-    ('EUR', 'FR0000074197', 'FPG', 'UNION TECH.INFOR.'),
-    ('EUR', 'FR0013176526', 'FR', 'VALEO'),
-    ('EUR', 'FR0013506730', 'VK', 'VALLOUREC'),
-    ('EUR', 'FR0004056851', 'VLA', 'VALNEVA'),
-    ('EUR', 'FR0000124141', 'VIE', 'VEOLIA ENVIRON.'),
-    ('EUR', 'FR0013447729', 'VRLA', 'VERALLIA'),
-    ('EUR', 'FR0010291245', 'VMX', 'VERIMATRIX'),
-    ('EUR', 'FR0000062465', 'VRNL', 'VERNEUIL FINANCE'),
-    ('EUR', 'FR0004186856', 'VETO', 'VETOQUINOL'),
-    ('EUR', 'FR0000031775', 'VCT', 'VICAT'),
-    ('EUR', 'FR0000066680', 'VDLO', 'VIDELIO'),
-    ('EUR', 'FR0000050049', 'VIL', 'VIEL ET COMPAGNIE'),
-    ('EUR', 'FR0000052516', 'RIN', 'VILMORIN & CIE'),
-    ('EUR', 'FR0000125486', 'DG', 'VINCI'),
-    ('EUR', 'FR0000031577', 'VIRP', 'VIRBAC'),
-    ('EUR', 'FR0000065765', 'SDT', 'VISIODENT'),
-    ('EUR', 'FR0000127771', 'VIV', 'VIVENDI'),
-    ('EUR', 'FR0011995588', 'VLTSA', 'VOLTALIA'),
-    ('EUR', 'FR0004183960', 'VTX', 'VOLUNTIS'),
-    ('EUR', 'FR0013357621', 'WAVE', 'WAVESTONE'),
-    ('EUR', 'FR0000121204', 'MF', 'WENDEL'),
-    ('EUR', 'FR0011981968', 'WLN', 'WORLDLINE'),
-    ('EUR', 'BE0974310428', 'XFAB', 'X-FAB'),
-    ('EUR', 'FR0004034072', 'XIL', 'XILAM ANIMATION'),
-    ('EUR', 'FR0000052870', 'XPO', 'XPO LOGISTICS'),
-    ('EUR', 'FR0013484466', 'MAGBS', 'YMAGIS BSA'),
-    ('EUR', 'BMG9887P1068', 'CV', 'ZCI LIMITED'),
-    )
-
-EURONEXT_STOCKS_EN_PB = (
-    ('EUR', 'FR0013296746', 'ADVIC', 'ADVICENNE'),
-    ('EUR', 'FR0004180537', 'AKA', 'AKKA TECHNOLOGIES'),
-    ('EUR', 'FR0010208488', 'ENGI', 'ENGIE'),
-    ('EUR', 'FR0013399474', 'GKTX', 'GENKYOTEX'),
-    ('EUR', 'FR0010613471', 'SEV', 'SUEZ'),
-    ('EUR', 'FR0000120271', 'FP', 'TOTAL'),
-    ('EUR', 'FR0000062796', 'VRAP', 'VRANKEN-POMMERY'),
-    )
-
-EURONEXT_STOCKS_LIS_A = (
-    ('EUR', 'PTCUR0AP0000', 'CUR', 'AGUAS DA CURIA'),
-    ('EUR', 'PTCDU0AE0003', 'CDU', 'CONDURIL'),
-    ('EUR', 'PTCPA0AP0006', 'CPA', 'COPAM'),
-    ('EUR', 'PTFNV1AM0002', 'MLFMV', 'FARMINVESTE'),
-    ('EUR', 'PTLIT0AE0005', 'LIT', 'LITHO FORMAS'),
-    ('EUR', 'PTMNN0AE0006', 'MLMR', 'MONUMENTAL RES'),
-    ('EUR', 'PTMUS0AM0018', 'MLM24', 'MULTI 24'),
-    ('EUR', 'PTOTP0AM0004', 'MLORE', 'OLIMPO REAL ESTATE'),
-    ('EUR', 'PTRIZ0AM0009', 'MLRZE', 'RAIZE'),
-    ('EUR', 'ES0105505004', 'MLRSR', 'RSR SINGULAR'),
-    ('EUR', 'PTSCB0AM0001', 'SCB', 'S.CLUBE BRAGA'),
-    ('EUR', 'PTSNG0AM0007', 'SNG', 'SONAGI'),
-    )
-
-EURONEXT_STOCKS_NLB = (
-    ('EUR', 'IT0000062072', 'GEN', 'ASSICURAZ.GEN.ORD.'),
-    ('EUR', 'ES0113211835', 'BBV', 'BANCO BILBAO VIZC.'),
-    ('EUR', 'ES0113900J37', 'SANTA', 'BANCO SANTANDER'),
-    ('EUR', 'DE0005557508', 'DTEL', 'DEUTSCHE TELEKOM'),
-    ('EUR', 'DE000ENAG999', 'EON', 'E.ON SE'),
-    ('EUR', 'IT0003132476', 'ENI', 'ENI'),
-    ('EUR', 'DE0008430026', 'MEURV', 'MUNCHENER RUCKVERS'),
-    ('EUR', 'DE000PSM7770', 'PSMP', 'PROSIEBENSAT'),
-    ('EUR', 'DE0007236101', 'SIA', 'SIEMENS'),
-    ('EUR', 'IT0003497168', 'TIT', 'TELECOM ITALIA SPA'),
-    ('EUR', 'ES0178430E18', 'TFA', 'TELEFONICA'),
-    ('EUR', 'IT0004513666', 'TISN', 'TISCALI'),
-    ('EUR', 'DE0007664005', 'VWA', 'VOLKSWAGEN'),
-    ('EUR', 'DE0007664039', 'VWAP', 'VOLKSWAGEN PREF'),
-    )
-
-EURONEXT_STOCKS_PAR_A = (
-    ('EUR', 'FR0010050773', 'MLATV', 'A TOUTE VITESSE'),
-    ('EUR', 'FR0010979377', 'MLACT', 'ACTIVIUM GROUP'),
-    ('EUR', 'FR0011908045', 'MLAGI', 'AG3I'),
-    ('EUR', 'ES0105478004', 'MLAGP', 'AGP MALAGA SOCIMI'),
-    ('EUR', 'FR0013285103', 'MLAIM', 'AIR MARINE'),
-    ('EUR', 'GB00BJ9M4V82', 'MLALE', 'ALEPH FINANCE'),
-    ('EUR', 'FR0013253812', 'MLALV', 'ALVEEN'),
-    ('EUR', 'NL0010273694', 'MLAAH', 'AMATHEON AGRI'),
-    ('EUR', 'FR0005057635', 'MLARD', 'ARDOIN ST AMAND A'),
-    ('EUR', 'FR0004070795', 'ARDO', 'ARDOIN ST AMAND B'),
-    ('EUR', 'ES0105486007', 'MLARO', 'AROCA DEL PINAR'),
-    ('EUR', 'FR0012968485', 'MLAEM', 'ASHLER ET MANSON'),
-    ('EUR', 'FR0011896463', 'MLAUD', 'AUDIENCE LABS'),
-    ('EUR', 'IT0004812258', 'MLAZL', 'AZ LEASING'),
-    ('EUR', 'PTAZR0AM0006', 'MLAAT', 'AZOREAN TECH'),
-    ('EUR', 'ES0105362000', 'MLBAR', 'BARINGS CORE SPAIN'),
-    ('EUR', 'FR0010436170', 'MLBAT', 'BATLA MINERALS'),
-    ('EUR', 'FR0013340973', 'MLBSP', 'BLUE SHARK POWER'),
-    ('EUR', 'FR0010106039', 'MLONE', 'BODY ONE'),
-    ('EUR', 'FR0010781377', 'MLAAE', 'CAIRE'),
-    ('EUR', 'FR0010717579', 'MLCEC', 'CECURITY.COM'),
-    ('EUR', 'IT0005402034', 'MLCSA', 'CESYNT A SHARES'),
-    ('EUR', 'IT0005398877', 'MLCSB', 'CESYNT B SHARES'),
-    ('EUR', 'MC0010000826', 'MLCFM', 'CFM INDOSUEZWEALTH'),
-    ('EUR', 'FR0000037871', 'MLCFD', 'CH.FER DEPARTEMENT'),
-    ('EUR', 'FR0000051567', 'MLCVG', 'CH.FER VAR GARD N.'),
-    ('EUR', 'FR0010447086', 'MLCHE', 'CHEOPS TECHNOLOGY'),
-    ('EUR', 'FR0000060428', 'MLCMB', 'CIE DU MONT BLANC'),
-    ('EUR', 'FR0012384907', 'MLCIO', 'CIOA'),
-    ('EUR', 'FR0010959684', 'MLCLP', 'COLIPAYS'),
-    ('EUR', 'BE6252013725', 'MLMFI', 'CONDOR TECHNOLOG'),
-    ('EUR', 'FR0000077828', 'MLCNT', 'CONSORT NT'),
-    ('EUR', 'FR00140007I9', 'MLLCB', 'CONSTRUCTEURS BOIS'),
-    ('EUR', 'FR0010035816', 'MLCOR', 'COREP LIGHTING'),
-    ('EUR', 'FR0004998318', 'MLCOU', 'COURBET'),
-    ('EUR', 'FR0012336675', 'MLGEL', 'D2L GROUP'),
-    ('EUR', 'FR0000077885', 'MLDAM', 'DAMARIS'),
-    ('EUR', 'SE0007045380', 'MLDYH', 'DESIGN YOUR HOME'),
-    ('EUR', 'FR0000052920', 'MLDYN', 'DYNAFOND'),
-    ('EUR', 'LU0881232630', 'MLDYX', 'DYNEX ENERGY SA'),
-    ('EUR', 'HK0000038783', 'MLEAS', 'EASSON HOLDINGS'),
-    ('EUR', 'FR0007200100', 'MLEDR', 'EAUX DE ROYAN'),
-    ('EUR', 'FR0010536185', 'MLEAV', 'EAVS'),
-    ('EUR', 'DE000A0XYM45', 'MLECO', 'ECOLUTIONS'),
-    ('EUR', 'FR0000052755', 'MLEDS', 'EDITIONS DU SIGNE'),
-    ('EUR', 'FR0010439265', 'MLEDU', 'EDUNIVERSAL'),
-    ('EUR', 'FR0010945733', 'MLEES', 'EES'),
-    ('EUR', 'FR0010157115', 'MLERO', 'EUROLAND CORPORATE'),
-    ('EUR', 'FR0000044745', 'MLEVE', 'EVERSET'),
-    ('EUR', 'FR0012300424', 'MLFDV', 'FD'),
-    ('EUR', 'FR0010487272', 'MLFXO', 'FINAXO'),
-    ('EUR', 'CH0120879058', 'MLFIR', 'FIRSTCAUTION'),
-    ('EUR', 'FR0011605617', 'MLVIN', 'FONCIERE VINDI'),
-    ('EUR', 'FR0013222346', 'MLFSG', 'FRANCE SOIR GROUPE'),
-    ('EUR', 'FR0010823724', 'MLFTI', 'FRANCE TOURISME'),
-    ('EUR', 'FR0000053415', 'MLGAI', 'G.A.I.'),
-    ('EUR', 'FR0011100759', 'MLGAL', 'GALEO'),
-    ('EUR', 'PTGVE1AE0009', 'MLGEQ', 'GENTLEMENS EQUITY'),
-    ('EUR', 'FR0013371507', 'MLGML', 'GOUR MEDICAL'),
-    ('EUR', 'FR0013406881', 'MLCMG', 'GRECEMAR'),
-    ('EUR', 'FR0000076960', 'MLGRC', 'GROUPE CARNIVOR'),
-    ('EUR', 'FR0010529719', 'MLPVG', 'GROUPE PLUS-VALUES'),
-    ('EUR', 'LU1840650458', 'MLGDI', 'GUANDAO PUER INVES'),
-    ('EUR', 'FR0013251584', 'MLAHC', 'HEALTH'),
-    ('EUR', 'ES0105498002', 'MLHAY', 'HEALTHCARE ACTIVOS'),
-    ('EUR', 'DE000A11Q133', 'MLHK', 'HK'),
-    ('EUR', 'FR0000051302', 'MLHBB', 'HOCHE BAINS L.BAIN'),
-    ('EUR', 'FR0012336691', 'MLHCF', 'HOME CONCEPT'),
-    ('EUR', 'FR0010312181', 'MLHPE', 'HOPENING'),
-    ('EUR', 'FR0014000U63', 'MLHPI', 'HOPIUM'),
-    ('EUR', 'FR0006226791', 'MLHMC', 'HOT.MAJESTIC CANNE'),
-    ('EUR', 'FR0000053738', 'MLHOT', 'HOTELIM'),
-    ('EUR', 'FR0006563904', 'MLHIN', 'HOTL.IMMOB.NICE'),
-    ('EUR', 'FR0000064735', 'MLHYD', 'HYDRAULIQUE PB'),
-    ('EUR', 'FR0005843125', 'MLHYE', 'HYDRO-EXPLOIT.'),
-    ('EUR', 'ES0105479002', 'MLINT', 'IANTE INVESTMENTS'),
-    ('EUR', 'FR0000079691', 'MLIDS', 'IDS'),
-    ('EUR', 'FR0010086371', 'MLIML', 'IMALLIANCE'),
-    ('EUR', 'FR0006859039', 'MLIPP', 'IMM.PARIS.PERLE'),
-    ('EUR', 'FR0000065773', 'MLIMP', 'IMPRIMERIE CHIRAT'),
-    ('EUR', 'FR0011158823', 'MLIFC', 'INFOCLIP'),
-    ('EUR', 'ES0105473005', 'MLISP', 'INMOSUPA'),
-    ('EUR', 'GB00BT9PTW34', 'MLIDP', 'INNOVADERMA PLC'),
-    ('EUR', 'IT0005391161', 'MLIRF', 'INNOVATIVE RFK SPA'),
-    ('EUR', 'BE6200101556', 'MLIOC', 'IOC HOLDING'),
-    ('EUR', 'ES0105417002', 'MLIPO', 'IPOSA PROPERTIES'),
-    ('EUR', 'IT0005336521', 'MLITN', 'ITALY INNOVAZIONI'),
-    ('EUR', 'FR0010680033', 'MLJSA', 'JSA TECHNOLOGY'),
-    ('EUR', 'FR0004152700', 'MLKRI', 'KRIEF GROUP'),
-    ('EUR', 'FR0013419876', 'MLVAP', 'KUMULUS VAPE'),
-    ('EUR', 'FR0013483401', 'TBMBT', 'LESTQBLANC202212BS'),
-    ('EUR', 'FR0004155208', 'MLLOI', 'LOCASYSTEM INTL'),
-    ('EUR', 'ES0105333001', 'MLLOG', 'LOGIS CONFORT'),
-    ('EUR', 'FR0006205019', 'MLCAC', 'LOMBARD ET MEDOT'),
-    ('EUR', 'BE6201089735', 'MLV4S', 'LV4S'),
-    ('EUR', 'FR0010328302', 'MLMAD', 'MADE'),
-    ('EUR', 'FR0010827741', 'MLMGL', 'MAGILLEM'),
-    ('EUR', 'FR0000061657', 'MLMAB', 'MAIS.ANTOINE BAUD'),
-    ('EUR', 'FR0011092089', 'MLCLI', 'MAISON CLIO BLUE'),
-    ('EUR', 'FR0010515742', 'MLMAI', "MAISONS D'AUJOURD"),
-    ('EUR', 'ES0105447009', 'MLMAQ', 'MAQ ADMON. URBANAS'),
-    ('EUR', 'IT0005324105', 'MLLAB', 'MEDIA LAB'),
-    ('EUR', 'IT0004844848', 'MLMCE', 'MEDIOCREDITO EUROP'),
-    ('EUR', 'FR0010492181', 'MLETA', 'METALLIANCE'),
-    ('EUR', 'BE0974328602', 'MLMIB', 'METRICS IN BALANCE'),
-    ('EUR', 'GB00BF553726', 'MLSKN', 'MICROSKIN'),
-    ('EUR', 'FR0010500363', 'MLNMA', 'MIGUET ET ASSOCIES'),
-    ('EUR', 'FR0013268067', 'MLAMY', 'MLD'),
-    ('EUR', 'FR0010882886', 'MLMON', 'MONFINANCIER'),
-    ('EUR', 'ES0105412003', 'MLMRE', 'MRE-III.P-5.SOCIMI'),
-    ('EUR', 'FR0010518936', 'MLMTD', 'MTD FINANCE'),
-    ('EUR', 'FR0012990968', 'MLMUL', 'MULANN'),
-    ('EUR', 'FR0013230067', 'MLMMC', 'MULTIMICROCLOUD'),
-    ('EUR', 'FR0013344223', 'MLNAT', 'NATURE ET LOGIS'),
-    ('EUR', 'FR0004157543', 'MLNEO', 'NEOCOM MULTIMEDIA'),
-    ('EUR', 'FR0010358507', 'MLNEI', 'NEWSINVEST'),
-    ('EUR', 'FR0000185464', 'MLNOV', 'NOVATECH IND.'),
-    ('EUR', 'FR0013072741', 'MLOSA', 'O SORBET D AMOUR'),
-    ('EUR', 'FR0013310281', 'MLOCT', 'OCTOPUS BIOSAFETY'),
-    ('EUR', 'FR0010176115', 'MLOLM', 'OLMIX'),
-    ('EUR', 'FR0013266772', 'MLOEX', 'ONE EXPERIENCE'),
-    ('EUR', 'FR0004174712', 'MLONL', 'ONLINEFORMAPRO'),
-    ('EUR', 'ES0105490009', 'MLORB', 'ORBIS PROPERTIES'),
-    ('EUR', 'FR0000077992', 'MLPAC', 'PACTE NOVATION'),
-    ('EUR', 'FR0000185928', 'MLPFX', 'PARFEX'),
-    ('EUR', 'FR0006823092', 'MLHOP', 'PART.INDLES MINI.'),
-    ('EUR', 'NL0012650535', 'MLPRX', 'PARX MATERIALS NV'),
-    ('EUR', 'FR0000185480', 'MLPHW', 'PHONE WEB'),
-    ('EUR', 'BE0948608451', 'MLPHO', 'PHOTONIKE CAPITAL'),
-    ('EUR', 'FR0000030769', 'MLPLC', 'PLACOPLATRE'),
-    ('EUR', 'FR0000061376', 'MLPRI', 'PROP.IMMEUBLES'),
-    ('EUR', 'CA74375L1058', 'MLPRO', 'PROVENTURE GOLD'),
-    ('EUR', 'FR0012395457', 'ML350', 'RAPIDO PRET'),
-    ('EUR', 'FR0000077232', 'MLREX', 'REVIVAL EXPANSION'),
-    ('EUR', 'FR0000035750', 'MLROU', 'ROUSSELET CENTRIF.'),
-    ('EUR', 'FR0013155975', 'MLSDN', 'SAVONNERIE NYONS'),
-    ('EUR', 'FR0004175222', 'MLSBT', 'SBT'),
-    ('EUR', 'CH0220529603', 'MLSHD', 'SCANDINAVIAN HOUSE'),
-    ('EUR', 'FR0010972091', 'MLCMI', 'SCEMI'),
-    ('EUR', 'FR0010961920', 'MLSCH', 'SCHOBRUNN PARIS'),
-    ('EUR', 'IT0005072811', 'MLSMP', 'SEMPLICEMENTE SpA'),
-    ('EUR', 'NL0010623518', 'MLSEQ', 'SEQUA PETROLEUM NV'),
-    ('EUR', 'FR0010679365', 'MLSIL', 'SILC'),
-    ('EUR', 'CI0000000832', 'MLMAT', 'SIMAT'),
-    ('EUR', 'FR0004038818', 'MLSIM', 'SIMO INTERNATIONAL'),
-    ('EUR', 'IT0005072167', 'MLSNT', 'SINTESI SpA'),
-    ('EUR', 'FR0011131788', 'MLSML', 'SMALTO'),
-    ('EUR', 'FR0010649228', 'SMLBS', 'SMALTO BSA'),
-    ('EUR', 'FR0000054371', 'MLSRP', 'SPEED RABBIT PIZZA'),
-    ('EUR', 'FR0013063559', 'MLSTM', 'STEAM FRANCE'),
-    ('EUR', 'FR0000063976', 'MLSTR', 'STREIT MECANIQUE'),
-    ('EUR', 'GB00B8GJBS16', 'MLSUM', 'SUMO RESOURCES PLC'),
-    ('EUR', 'FR0000033466', 'MLTEA', 'TEAM'),
-    ('EUR', 'FR0011076595', 'MLVST', 'TELEVISTA'),
-    ('EUR', 'FR0011668821', 'MLTBM', 'TOQUEBLANCHEMONDE'),
-    ('EUR', 'FR0010621722', 'MLABO', 'TOUTABO'),
-    ('EUR', 'FR0011040690', 'MLPSH', 'TPSH'),
-    ('EUR', 'FR0000031866', 'MLTRA', 'TRAMWAYS DE ROUEN'),
-    ('EUR', 'FR0000031106', 'MLTRO', 'TROC ILE'),
-    ('EUR', 'FR0000076481', 'MLTRC', 'TROIS CHENES'),
-    ('EUR', 'FR0011776889', 'MLUMG', 'UMALIS GROUP'),
-    ('EUR', 'FR0005783503', 'MLUMH', 'UNI.METALG.HT-SEI.'),
-    ('EUR', 'FR0012833770', 'MLVAL', 'VALONEO'),
-    ('EUR', 'FR0006174496', 'MLVER', 'VERNEY CARRON'),
-    ('EUR', 'FR0010033480', 'MLVIS', 'VISIO NERF'),
-    ('EUR', 'ES0105492005', 'MLVRF', 'VREF SEVILLE'),
-    ('EUR', 'FR0010688465', 'MLWEA', 'WEACCESS GROUP'),
-    ('EUR', 'FR0010768770', 'MLWEY', 'WEYA'),
-    ('EUR', 'ES0105399002', 'MLWRC', 'WHITENI R CAJAL'),
-    ('EUR', 'ZM0000000037', 'MLZAM', 'ZCCM'),
-    )
-
 
 # Main script
 if __name__ == "__main__":
     print("Import sindexes.euronext !")
     # ...or use
     #	python euronextimport.py Euronext_Equities.xlsx EUR
-    # to generate the appropriate 'EURONEXT_STOCKS'.
+    # to generate the appropriate 'EURONEXT_STOCKS',
+    # each market tuple goes into its module at euronextmkt/
     sample()
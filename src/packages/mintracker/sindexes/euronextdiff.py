@@ -0,0 +1,177 @@
+#-*- coding: utf-8 -*-
+# euronextdiff.py  (c)2022  Henrique Moreira
+
+""" Differences between two Euronext lists of stocks
+
+A list is either an imported snapshot (xlsx, csv or txt),
+a compiled universe file (see universe.py), or the euronext.py tables.
+Records are (coin, isin, symbol, name, market), keyed by ISIN;
+market is the short market name, e.g. 'EN.LIS'.
+"""
+
+import sys
+from mintracker.sindexes.euronextimport import Importer, dump_import, stocks_by_market
+from mintracker.sindexes.universe import UNIVERSE_MAGIC, Universe, write_universe, markets_from_tables
+
+# pylint: disable=missing-function-docstring
+
+TABLES = "-"	# source name of the euronext.py tables
+FIELDS = ("coin", "isin", "symbol", "name", "market")
+
+
+def main():
+    """ Main script """
+    myprog = __file__
+    code = runner(sys.argv[1:])
+    if code is None:
+        print(f"""Usage:
+{myprog} OLD NEW [--patch universe.bin]
+
+OLD and NEW are Euronext_Equities_...(xlsx|csv|txt),
+compiled universe files, or '{TABLES}' for the euronext.py tables.
+
+Options:
+   --patch X   Apply the differences to the universe file X
+""")
+    sys.exit(code if code else 0)
+
+
+def runner(args):
+    """ Shows the changelog from OLD to NEW """
+    param = args
+    patch = ""
+    if len(param) >= 2 and param[-2] == "--patch":
+        patch = param[-1]
+        del param[-2:]
+    if len(param) != 2:
+        return None
+    old, new = records_from(param[0]), records_from(param[1])
+    diff = diff_records(old, new)
+    for line in diff.changelog():
+        print(line)
+    if patch:
+        num = patch_universe(patch, diff)
+        print(f"Patched {patch}: {num} stocks")
+    return 0
+
+
+class UniverseDiff():
+    """ Added, removed and changed records, by ISIN """
+    def __init__(self):
+        self.added = {}
+        self.removed = {}
+        self.changed = {}	# isin -> (old record, new record)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def changelog(self) -> list:
+        """ Returns one line per difference, sorted by ISIN """
+        res = []
+        for isin in sorted(self.added):
+            res.append(f"+ {isin} {shown_record(self.added[isin])}")
+        for isin in sorted(self.removed):
+            res.append(f"- {isin} {shown_record(self.removed[isin])}")
+        for isin in sorted(self.changed):
+            old, new = self.changed[isin]
+            shown = ", ".join(
+                f"{field}: {was!r} -> {now!r}"
+                for field, was, now in zip(FIELDS, old, new) if was != now
+            )
+            res.append(f"~ {isin} {shown}")
+        return res
+
+    def apply(self, markets:dict) -> dict:
+        """ Returns the markets (market -> fourplets) with the differences applied.
+        Kept stocks stay in place; added (or moved) stocks go to the end of their market.
+        """
+        res = {}
+        for mkt, stocks in markets.items():
+            kept = []
+            for fourplet in stocks:
+                isin = fourplet[1]
+                if isin in self.removed:
+                    continue
+                pair = self.changed.get(isin)
+                if pair is None:
+                    kept.append(tuple(fourplet))
+                elif pair[1][4] == mkt:
+                    kept.append(pair[1][:4])
+            res[mkt] = kept
+        moved = [new for old, new in self.changed.values() if old[4] != new[4]]
+        for record in list(self.added.values()) + moved:
+            res.setdefault(record[4], []).append(record[:4])
+        return {mkt: res[mkt] for mkt in sorted(res) if res[mkt]}
+
+
+def diff_records(old:dict, new:dict) -> UniverseDiff:
+    """ Returns the differences from 'old' to 'new' (ISIN -> record), in linear time """
+    res = UniverseDiff()
+    for isin, record in new.items():
+        there = old.get(isin)
+        if there is None:
+            res.added[isin] = record
+        elif there != record:
+            res.changed[isin] = (there, record)
+    for isin, record in old.items():
+        if isin not in new:
+            res.removed[isin] = record
+    return res
+
+
+def records_from(source:str) -> dict:
+    """ Returns the records (by ISIN) of a snapshot, a universe file, or the tables """
+    if source == TABLES:
+        return records_of_markets(markets_from_tables())
+    if is_universe(source):
+        with Universe(source) as there:
+            return records_of_markets(
+                {mkt: list(there.stock_names_by_market(mkt)) for mkt in there.markets()}
+            )
+    return records_of_import(Importer(source))
+
+
+def records_of_import(imp) -> dict:
+    """ Returns the records (by ISIN) of an Importer, as in dump_universe() """
+    dct = dump_import(imp, {"filter": None, "pre": ""}, None)
+    res = {}
+    for mkt, stocks in stocks_by_market(dct).items():
+        for tup in stocks:
+            res[tup[1]] = tup[:4] + (mkt,)
+    return res
+
+
+def records_of_markets(markets:dict) -> dict:
+    """ Returns the records (by ISIN) of markets: market -> fourplets """
+    res = {}
+    for mkt, stocks in markets.items():
+        for fourplet in stocks:
+            res[fourplet[1]] = tuple(fourplet) + (mkt,)
+    return res
+
+
+def patch_universe(fname:str, diff:UniverseDiff, out_name:str="") -> int:
+    """ Applies 'diff' to the universe file 'fname' (or writes 'out_name'),
+    without importing the whole list again. Returns the number of stocks.
+    """
+    with Universe(fname) as there:
+        markets = {mkt: list(there.stock_names_by_market(mkt)) for mkt in there.markets()}
+    return write_universe(out_name if out_name else fname, diff.apply(markets))
+
+
+def is_universe(fname:str) -> bool:
+    with open(fname, "rb") as fdin:
+        return fdin.read(len(UNIVERSE_MAGIC)) == UNIVERSE_MAGIC
+
+
+def shown_record(record:tuple) -> str:
+    coin, _, symbol, name, mkt = record
+    return f"{mkt} {symbol} {coin} {name!r}"
+
+
+# Main script
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,37 @@
 """
 
 import sys
+import os
+import os.path
+import re
+import time
+import csv
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import openpyxl
 from waxpage.redit import char_map
 from mintracker.sindexes.isin import ISIN
+from mintracker.sindexes.universe import write_universe
+from mintracker.sindexes.pricehist import MarketData, PriceHistory
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # pylint: disable=missing-function-docstring, line-too-long, use-list-literal
 
 DEF_EN_EQ_FNAME = "Euronext_Equities.xlsx"
+TEXT_FORMATS = ("csv", "txt")
+CHUNK_ROWS = 1000
+CHUNK_FIELDS = ("name", "isin", "symbol", "market", "currency")
+FOLD_CACHE_SIZE = 4096	# per column
+FOLD_CACHED_COLUMNS = (3, 4)	# Market, Trading Currency: highly repeated
+DAMAGED_CHAR = r"(?:[a-z]|\.{1,4})"	# a non-ASCII letter: folded, or damaged
+HEADER_LINES = 50	# csv/ txt lines looked at, for the 'Name' header
+SNAPSHOT_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+BATCH_UNIVERSE = "Euronext_Universe_{}.bin"
 LINEAR_DUMP = False	# use True if you want to generate EURONEXT_STOCKS linearly
 
 MKT_MAP = {
@@ -75,10 +99,20 @@ def main():
     code = runner(args)
     if code is None:
         print(f"""Usage:
-{myprog} Euronext_Equities_...xlsx [hints]
+{myprog} [--universe file.bin] Euronext_Equities_...(xlsx|csv|txt) [hints]
+{myprog} --batch DIR [--jobs N] [--history HDIR] Euronext_Equities_YYYY-MM-DD... [...]
 
 Hints are:
    EUR - only display Euro stocks
+
+Options:
+   --universe X   Write the compiled (binary) universe file X,
+                  instead of dumping python source
+   --batch DIR    Import all snapshots (in parallel), and write one
+                  universe file per date into DIR
+   --jobs N       Number of worker processes (default: #cpus)
+   --history HDIR Append the prices and volumes of each snapshot date
+                  to the price history store HDIR (see pricehist.py)
 """)
     sys.exit(code if code else 0)
 
@@ -87,6 +121,14 @@ def runner (args, debug=0):
     """ Run importer """
     param = args
     filtered = None
+    universe = ""
+    if param and param[0] == "--batch":
+        return batch_runner(param[1:], debug)
+    if param and param[0] == "--universe":
+        if len(param) < 2:
+            return None
+        universe = param[1]
+        del param[:2]
     if not args:
         return None
     fname = param[0]
@@ -105,13 +147,102 @@ def runner (args, debug=0):
     opts = {"filter": filtered,
             "pre": " " * 4,
             }
+    if universe:
+        num = dump_universe(imp, opts, universe)
+        print(f"Wrote {num} stocks to: {universe}")
+        return 0
+    if debug > 0:
+        opts["folder"] = AsciiFolder()
     if LINEAR_DUMP:
         linear_dump(imp, opts, sys.stdout, debug)
         return 0
     dump_by_index(imp, opts, sys.stdout, debug)
+    if debug > 0:
+        print(f"Debug: ASCII folding (hits, misses) of columns {FOLD_CACHED_COLUMNS}: {opts['folder'].stats()}")
+    unknown = MARKETS.unknown_markets()
+    if unknown:
+        shown = ", ".join(f"'{market}' (#{count})" for market, count in unknown)
+        sys.stderr.write(f"Unknown markets: {shown}\n")
     return 0
 
 
+def batch_runner(args, debug=0):
+    """ Run importer on several snapshots """
+    param = args
+    if not param:
+        return None
+    outdir = param[0]
+    del param[0]
+    workers = None
+    if param and param[0] == "--jobs":
+        if len(param) < 2:
+            return None
+        workers = int(param[1])
+        del param[:2]
+    history = ""
+    if param and param[0] == "--history":
+        if len(param) < 2:
+            return None
+        history = param[1]
+        del param[:2]
+    if not param:
+        return None
+    if not os.path.isdir(outdir):
+        print("Note!\n")
+        print(f"Output directory not found: {outdir}")
+        return 1
+    undated = [fname for fname in param if not snapshot_date(fname)]
+    if undated:
+        print("Note!\n")
+        print("\n".join(f"No date (YYYY-MM-DD) in snapshot name: {fname}" for fname in undated))
+        return 1
+    start = time.perf_counter()
+    snaps = import_many(param, workers, market_data=bool(history))
+    code = 0
+    for snap in snaps:
+        print(f"{snap.fname}: {len(snap.content)} rows, {snap.elapsed:.3f}s")
+        if snap.msgs:
+            print("Note!\n")
+            print("\n".join(snap.msgs))
+            code = 1
+    if code:
+        return code
+    opts = {"filter": None,
+            "pre": "",
+            }
+    merged = merge_by_date(snaps)
+    for date, snap in merged.items():
+        fname = os.path.join(outdir, BATCH_UNIVERSE.format(date))
+        num = dump_universe(snap, opts, fname)
+        print(f"Wrote {num} stocks to: {fname}")
+    if history:
+        store_history(merged.values(), history)
+    if debug > 0:
+        elapsed = time.perf_counter() - start
+        busy = sum(snap.elapsed for snap in snaps)
+        print(f"Debug: {len(snaps)} files in {elapsed:.3f}s (parsing, overall: {busy:.3f}s)")
+    return 0
+
+
+def store_history(snaps, dirname:str) -> int:
+    """ Appends the market data of snapshots to a PriceHistory,
+    once per date (dates already stored are skipped).
+    Returns the number of rows appended.
+    """
+    total = 0
+    with PriceHistory(dirname) as hist:
+        stored = set(hist.dates())
+        for snap in sorted(snaps, key=lambda snap: snap.date):
+            data = snap.market_data
+            if not data.date or data.date in stored:
+                print(f"Skipped price history of: {snap.fname}")
+                continue
+            stored.add(data.date)
+            total += hist.append(data)
+        print(f"Price history {dirname}: {len(hist)} rows, {len(stored)} dates")
+    return total
+
+
 def linear_dump(imp, opts, out, debug=0):
     dump_import(imp, opts, out)
     num = len(imp.content)
@@ -127,7 +258,7 @@ def dump_by_index(imp, opts, out, debug=0):
     if debug > 0:
         print(f"Debug: markets={markets}\n")
         for m_name in m_names:
-            mkt = short_market_name(m_name)
+            mkt = MARKETS.short_name(m_name)
             isin_list = dct["market-isin"].get(mkt)
             if isin_list is None:
                 print(f"Debug: note '{mkt}' ('{m_name}') is not mapped")
@@ -135,33 +266,15 @@ def dump_by_index(imp, opts, out, debug=0):
             assert isinstance(isin_list, (list, tuple))
             shown_isin = isin_list if len(isin_list) < 3 else (isin_list[:4] + ["..."])
             print(f"market-isin[{mkt}] len#{len(isin_list)}:", shown_isin)
-    avar = {}
     mkts = sorted(MKT_MAP.keys())
     shown = ""
     for mkt in mkts:
         shown += (" " * 4) + f"'{mkt}',\n"
     out.write(f"EURONEXT_STOCKS_LIST = (\n{shown}    )\n\n")
-    for mkt in mkts:
+    avar = {}
+    for mkt, stocks in stocks_by_market(dct).items():
         abbrev = market_to_varname(mkt)
-        varname = f"EURONEXT_STOCKS_{abbrev}"
-        avar[varname] = list()
-        isin_list = dct["market-isin"].get(mkt)
-        if isin_list is None:
-            continue
-        assert isin_list
-        for item in isin_list:
-            count, tup = 0, None
-            for stock in dct["list"]:
-                isin = stock[1]
-                if isin == item:
-                    tup = stock
-                    count += 1
-            #print("Debug: market", mkt, "item:", item, "count:", count, "tup:", tup)
-            assert count > 0
-            if count > 1:
-                continue
-            #print(f"mkt={mkt}: {tup}")
-            avar[varname].append(tup)
+        avar[f"EURONEXT_STOCKS_{abbrev}"] = stocks
     for varname in sorted(avar.keys()):
         cont = avar[varname]
         if not cont:
@@ -192,6 +305,40 @@ def dump_by_index(imp, opts, out, debug=0):
             out.write(f"DUPS_{varname} = ({shown},)\n\n")
 
 
+def stocks_by_market(dct) -> dict:
+    """ Returns the stocks tuples per market (see dump_import()),
+    for all markets at MKT_MAP, sorted by market.
+    ISINs listed more than once are left out.
+    """
+    by_isin = {}
+    for stock in dct["list"]:
+        by_isin.setdefault(stock[1], []).append(stock)
+    res = {}
+    for mkt in sorted(MKT_MAP.keys()):
+        res[mkt] = list()
+        isin_list = dct["market-isin"].get(mkt)
+        if isin_list is None:
+            continue
+        assert isin_list
+        for item in isin_list:
+            tups = by_isin.get(item)
+            assert tups, item
+            if len(tups) > 1:
+                continue
+            res[mkt].append(tups[0])
+    return res
+
+
+def dump_universe(imp, opts, fname) -> int:
+    """ Writes the compiled universe file (see universe.py) """
+    dct = dump_import(imp, opts, None)
+    markets = {
+        mkt: [tup[:-1] for tup in stocks]
+        for mkt, stocks in stocks_by_market(dct).items() if stocks
+    }
+    return write_universe(fname, markets)
+
+
 def dump_import(imp, opts, out=None) -> dict:
     err = sys.stderr
     stocks = list()
@@ -200,8 +347,11 @@ def dump_import(imp, opts, out=None) -> dict:
     pre = opts["pre"]
     if pre:
         post = ","
+    folder = opts.get("folder")
+    if folder is None:
+        folder = AsciiFolder()
     for row in imp.content:
-        alist = char_map.simpler_ascii(row)
+        alist = folder.fold_row(row)
         tup = alist[4], alist[1], alist[2], alist[0], alist[3]
         coin, isin, symb = tup[0], tup[1], tup[2]
         if isin in isins:
@@ -223,31 +373,99 @@ def dump_import(imp, opts, out=None) -> dict:
         "markets": [],
         "market-isin": {},
     }
+    seen = set()
     for stock in stocks:
         market = stock[-1]
-        symb = stock[1]
-        if market not in res["markets"]:
+        if market not in seen:
+            seen.add(market)
             res["markets"].append(market)
-            mname = short_market_name(market)
-            res["market-isin"][mname] = list()
-    for stock in stocks:
-        mname = short_market_name(stock[-1])
-        isin = stock[1]
-        res["market-isin"][mname].append(isin)
+        mname = MARKETS.short_name(market)
+        res["market-isin"].setdefault(mname, list()).append(stock[1])
     return res
 
 
+class Snapshot():
+    """ Imported contents of one (dated) Euronext equities list """
+    def __init__(self, fname:str, content=None, msgs=None, elapsed=0.0, market_data=None):
+        self.fname = fname
+        self.date = snapshot_date(fname)
+        self.content = [] if content is None else content
+        self.msgs = [] if msgs is None else msgs
+        self.elapsed = elapsed
+        self.market_data = market_data
+
+
+def import_one(fname:str, market_data:bool=False) -> Snapshot:
+    """ Imports one file, timing it (runs at worker processes) """
+    start = time.perf_counter()
+    imp = Importer(fname, market_data)
+    elapsed = time.perf_counter() - start
+    return Snapshot(fname, imp.content, imp.get_messages(), elapsed, imp.market_data)
+
+
+def import_many(fnames, workers=None, market_data:bool=False) -> list:
+    """ Imports several files, in a pool of 'workers' processes
+    (one per cpu, by default); returns the Snapshot list, in the same order.
+    """
+    fnames = list(fnames)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(fnames))
+    if workers <= 1:
+        return [import_one(fname, market_data) for fname in fnames]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(functools.partial(import_one, market_data=market_data), fnames))
+
+
+def merge_by_date(snaps) -> dict:
+    """ Returns one Snapshot per date, sorted by date.
+    Snapshots of the same date are concatenated, and so is their market data;
+    dump_import() then keeps the first occurrence of each ISIN.
+    Snapshots must be dated (see snapshot_date()).
+    """
+    res = {}
+    for snap in snaps:
+        assert snap.date, f"Undated snapshot: {snap.fname}"
+        there = res.get(snap.date)
+        if there is None:
+            data = None if snap.market_data is None else MarketData(snap.date)
+            there = Snapshot(snap.fname, market_data=data)
+            res[snap.date] = there
+        else:
+            assert (there.market_data is None) == (snap.market_data is None), f"Market data mismatch: {snap.fname}"
+        there.content.extend(snap.content)
+        there.msgs.extend(snap.msgs)
+        there.elapsed += snap.elapsed
+        if snap.market_data is not None:
+            there.market_data.extend(snap.market_data)
+    return {date: res[date] for date in sorted(res)}
+
+
+def snapshot_date(fname:str) -> str:
+    """ Returns the date 'YYYY-MM-DD' of a snapshot name, or an empty string """
+    found = SNAPSHOT_DATE.search(os.path.basename(fname))
+    return found.group(1) if found else ""
+
+
 class Importer():
-    """ XLS importer """
-    def __init__(self, fname=""):
+    """ Euronext equities list importer: xlsx, csv or txt
+    When 'market_data' is True, prices, volumes and times are kept,
+    typed, at 'market_data' (see pricehist.MarketData).
+    """
+    def __init__(self, fname="", market_data:bool=False):
         self._msgs = list()
         aname = DEF_EN_EQ_FNAME if not fname else fname
+        self.market_data = MarketData(snapshot_date(aname)) if market_data else None
         self.content = self._read(aname)
+        if not self.content:
+            self._msgs.append(f"No stocks found: {aname}")
 
     def get_messages(self):
         return self._msgs
 
     def _read(self,fname) -> list:
+        if file_format(fname) in TEXT_FORMATS:
+            return self._read_text(fname)
         wbk = openpyxl.open(fname, read_only=True, data_only=True)
         sheet_name = wbk.sheetnames[0]
         if len(wbk.sheetnames) > 1:
@@ -256,31 +474,215 @@ class Importer():
         sheet = wbk[sheet_name]
         return self._parse_sheet(sheet)
 
+    def _read_text(self, fname) -> list:
+        with open(fname, "r", encoding="utf-8-sig", newline="") as fdin:
+            return self._parse_rows(text_rows(fdin))
+
     def _parse_sheet(self, sheet) -> list:
         """ Returns the list of stocks tuples """
-        res = list()
-        state = -1
-        for row in sheet:
-            if len(row) < 4:
-                continue
-            first = row[0].value
-            if state == -1:
-                if first == "Name":
-                    state = 0
-                continue
-            assert first
-            alist = [str(entry.value) for entry in row]
-            res.append(alist[:5])
+        if self.market_data is not None:
+            # Market data columns stay typed (numbers, dates)
+            rows = (
+                [str(value) for value in row[:5]] + list(row[5:]) for row in sheet.iter_rows(values_only=True)
+            )
+            return self._parse_rows(rows)
+        rows = (
+            [str(value) for value in row] for row in sheet.iter_rows(values_only=True)
+        )
+        return self._parse_rows(rows)
+
+    def _parse_rows(self, rows) -> list:
+        """ Returns the list of stocks tuples, from rows of strings """
+        if self.market_data is None:
+            return list(iter_stock_rows(rows))
+        res = []
+        capture = self.market_data.append
+        for row in iter_stock_rows(rows, width=None):
+            res.append(row[:5])
+            capture(row[1], row)
+        return res
+
+
+def iter_stock_rows(rows, width=5):
+    """ Yields the first five columns (or 'width', None for all)
+    of stock rows, after the header.
+    """
+    state = -1
+    for row in rows:
+        if len(row) < 4:
+            continue
+        first = row[0]
+        if state == -1:
+            if first == "Name":
+                state = 0
+            continue
+        assert first
+        yield row[:width]
+
+
+def file_format(fname) -> str:
+    """ Returns 'xlsx', 'csv' or 'txt' (by extension, or by content) """
+    ext = os.path.splitext(fname)[1].lower()[1:]
+    if ext in TEXT_FORMATS or ext.startswith("xls"):
+        return ext if ext in TEXT_FORMATS else "xlsx"
+    with open(fname, "rb") as fdin:
+        magic = fdin.read(2)
+    return "xlsx" if magic == b"PK" else "txt"
+
+
+def text_rows(fdin):
+    """ Returns a csv reader of a Euronext csv/ txt list:
+    the delimiter (';', tab, or ',') is found at the 'Name' header line
+    (or else at the first line with one), as lines before it are allowed.
+    """
+    delimiter = ""
+    for _ in range(HEADER_LINES):
+        line = fdin.readline()
+        if not line:
+            break
+        there = text_delimiter(line)
+        if line.lstrip('"').startswith("Name") and there:
+            delimiter = there
+            break
+        if not delimiter:
+            delimiter = there
+    fdin.seek(0)
+    return csv.reader(fdin, delimiter=delimiter if delimiter else ",")
+
+
+def text_delimiter(line:str) -> str:
+    """ Returns the delimiter (';', tab, or ',') of a line, empty if none """
+    counts = [(line.count(there), there) for there in (";", "\t", ",")]
+    num, delimiter = max(counts, key=lambda pair: pair[0])
+    return delimiter if num else ""
+
+
+def read_text_chunks(fname, chunk_size=CHUNK_ROWS):
+    """ Yields NumPy structured arrays (see CHUNK_FIELDS) of a csv/ txt list,
+    'chunk_size' stocks at a time.
+    """
+    assert numpy is not None, "numpy not available"
+    with open(fname, "r", encoding="utf-8-sig", newline="") as fdin:
+        chunk = []
+        for row in iter_stock_rows(text_rows(fdin)):
+            chunk.append(tuple(row))
+            if len(chunk) >= chunk_size:
+                yield _chunk_array(chunk)
+                chunk = []
+        if chunk:
+            yield _chunk_array(chunk)
+
+
+def _chunk_array(chunk):
+    widths = [max(1, max(len(row[idx]) for row in chunk)) for idx in range(len(CHUNK_FIELDS))]
+    dtype = [(field, f"U{width}") for field, width in zip(CHUNK_FIELDS, widths)]
+    return numpy.array(chunk, dtype=dtype)
+
+
+class AsciiFolder():
+    """ Memoized char_map.simpler_ascii(), one bounded LRU cache per column
+    (see FOLD_CACHED_COLUMNS): repeated cells, such as market names and
+    currencies, are folded once. Other columns (names, ISINs) are mostly
+    unique, and are folded directly.
+    """
+    def __init__(self, maxsize=FOLD_CACHE_SIZE, cached=FOLD_CACHED_COLUMNS):
+        self._maxsize = maxsize
+        self._cached = cached
+        self._columns = []
+        self._memos = []
+
+    def fold_row(self, row) -> list:
+        columns = self._columns
+        while len(columns) < len(row):
+            if len(columns) in self._cached:
+                fold = functools.lru_cache(maxsize=self._maxsize)(char_map.simpler_ascii)
+                self._memos.append(fold)
+            else:
+                fold = char_map.simpler_ascii
+            columns.append(fold)
+        return [fold(cell) for fold, cell in zip(columns, row)]
+
+    def stats(self) -> list:
+        """ Returns (hits, misses) per memoized column """
+        res = []
+        for fold in self._memos:
+            info = fold.cache_info()
+            res.append((info.hits, info.misses))
         return res
 
+    def hit_rate(self) -> float:
+        pairs = self.stats()
+        hits = sum(hits for hits, _ in pairs)
+        total = hits + sum(misses for _, misses in pairs)
+        return hits / total if total else 0.0
+
+
+class MarketRegistry():
+    """ Market names, short (e.g. 'EN.LIS') and full ('Euronext Lisbon').
+    Full names not found verbatim (e.g. 'Oslo B\u00f8rs', after ASCII folding)
+    are matched loosely, and remembered; unknown ones are counted.
+    Loose matches differ only where the known name has a non-ASCII letter:
+    there, a folded letter or a few damaged characters (e.g. 'B?rs').
+    """
+    def __init__(self, mkt_map:dict):
+        self._by_short = dict(mkt_map)
+        self._by_full = {}
+        for key, fullname in mkt_map.items():
+            self._by_full.setdefault(fullname, key)
+        self._loose = {loose_market_key(fullname): key for fullname, key in self._by_full.items()}
+        self._patterns = [
+            (re.compile("".join(DAMAGED_CHAR if char == "." else re.escape(char) for char in loose)), key)
+            for loose, key in self._loose.items()
+        ]
+        self._unknown = Counter()
+
+    def full_name(self, short:str, not_found="") -> str:
+        return self._by_short.get(short, not_found)
+
+    def short_name(self, market:str, not_found="?") -> str:
+        """ Returns the short name of a (full name) market """
+        there = self._by_full.get(market)
+        if there is None:
+            assert isinstance(market, str)
+            there = self._loose_match(market)
+            self._by_full[market] = there
+        if not there:
+            self._unknown[market] += 1
+            return not_found
+        return there
+
+    def unknown_markets(self) -> list:
+        """ Returns the pairs (market, count) of unknown markets """
+        return self._unknown.most_common()
+
+    def _loose_match(self, market:str) -> str:
+        key = loose_market_key(market)
+        there = self._loose.get(key)
+        if there:
+            return there
+        for pattern, short in self._patterns:
+            if pattern.fullmatch(key):
+                return short
+        return ""
+
+
+def loose_market_key(market:str) -> str:
+    """ Lowercase market name, blanks collapsed; non-ASCII characters,
+    '?' and '.' (which stands for a non-ASCII letter, e.g. 'Oslo B.rs') are dots.
+    ASCII punctuation is kept.
+    """
+    astr = "".join(
+        "." if not char.isascii() or char == "?" else char for char in market.lower()
+    )
+    return " ".join(astr.split())
+
+
+MARKETS = MarketRegistry(MKT_MAP)
+
 
 def short_market_name(market, not_found="?"):
     """ Returns the short name of a market """
-    assert isinstance(market, str)
-    for key, fullname in MKT_MAP.items():
-        if fullname == market:
-            return key
-    return not_found
+    return MARKETS.short_name(market, not_found)
 
 def market_to_varname(mkt):
     """ Example... 'EURONEXT_STOCKS_EN_LIS', mkt='EN.LIS'
@@ -0,0 +1,128 @@
+#-*- coding: utf-8 -*-
+# ams_a.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_AMS_A = (
+    ('EUR', 'NL0000852564', 'AALB', 'AALBERTS NV'),
+    ('EUR', 'NL0011540547', 'ABN', 'ABN AMRO BANK N.V.'),
+    ('EUR', 'NL0009767532', 'ACCEL', 'ACCELL GROUP'),
+    ('EUR', 'GB00BQQFX454', 'AXS', 'ACCSYS'),
+    ('EUR', 'NL0012969182', 'ADYEN', 'ADYEN'),
+    ('EUR', 'NL0000303709', 'AGN', 'AEGON'),
+    ('EUR', 'NL0000018034', 'AJAX', 'AJAX'),
+    ('EUR', 'NL0013267909', 'AKZA', 'AKZO NOBEL'),
+    ('EUR', 'NL0012817175', 'ALFEN', 'ALFEN'),
+    ('EUR', 'NL0011333760', 'ATCB', 'ALTICE EUROPE B'),
+    ('EUR', 'NL0011333752', 'ATC', 'ALTICE EUROPE N.V.'),
+    ('EUR', 'NL0012194724', 'ALX', 'ALUMEXX N.V.'),
+    ('EUR', 'NL0000888691', 'AMG', 'AMG'),
+    ('EUR', 'NL0000313286', 'ACOMO', 'AMSTERDAM COMMOD.'),
+    ('EUR', 'NL0000430106', 'AND', 'AND INTERNATIONAL'),
+    ('EUR', 'NL0006237562', 'ARCAD', 'ARCADIS'),
+    ('EUR', 'NL0000334118', 'ASM', 'ASM INTERNATIONAL'),
+    ('EUR', 'NL0010273215', 'ASML', 'ASML HOLDING'),
+    ('EUR', 'NL0011872643', 'ASRNL', 'ASR NEDERLAND'),
+    ('EUR', 'JE00B3DCF752', 'ATRS', 'ATRIUM EUR REALEST'),
+    ('EUR', 'LU1789205884', 'BSGR', 'B&S Group'),
+    ('EUR', 'NL0000337319', 'BAMNB', 'BAM GROEP KON'),
+    ('EUR', 'NL0011872650', 'BFIT', 'BASIC-FIT'),
+    ('EUR', 'NL0012866412', 'BESI', 'BE SEMICONDUCTOR'),
+    ('EUR', 'NL0000339703', 'BBED', 'BETER BED'),
+    ('EUR', 'NL0000285278', 'BEVER', 'BEVER HOLDING'),
+    ('EUR', 'NL0000852580', 'BOKA', 'BOSKALIS WESTMIN'),
+    ('EUR', 'GG00B1FQG453', 'BGHL', 'BOUSSARD GAVAUDAN'),
+    ('EUR', 'NL0000442523', 'BRILL', 'BRILL KON'),
+    ('EUR', 'NL0010776944', 'BRNL', 'BRUNEL INTERNAT'),
+    ('EUR', 'NL0012747059', 'CMCOM', 'CM.COM'),
+    ('EUR', 'GB00BDCPN049', 'CCEP', 'COCA-COLA EUROPEAN'),
+    ('EUR', 'NL0010583399', 'CRBN', 'CORBION'),
+    ('EUR', 'NL0000200384', 'CLB', 'CORE LABORATORIES'),
+    ('EUR', 'NL0000345577', 'CTAC', 'CTAC'),
+    ('EUR', 'NL0009169515', 'DGB', 'DGB GROUP N.V.'),
+    ('EUR', 'NL0009197771', 'DPA', 'DPA GROUP'),
+    ('EUR', 'NL00150000S7', 'DSC2', 'DSC2'),
+    ('EUR', 'NL00150002R5', 'DSC2S', 'DSC2 TREAS SHARES'),
+    ('EUR', 'NL0000009827', 'DSM', 'DSM KON'),
+    ('EUR', 'NL00150000T5', 'DSCW1', 'DUTCH STAR C W11'),
+    ('EUR', 'NL00150000U3', 'DSCW2', 'DUTCH STAR C W12'),
+    ('EUR', 'NL00150000V1', 'DSCW3', 'DUTCH STAR C W13'),
+    ('EUR', 'NL0000345627', 'EAS2P', 'EASE2PAY NV'),
+    ('EUR', 'NL0009901610', 'ENVI', 'ENVIPCO'),
+    ('EUR', 'GB00B94QM994', 'ECT', 'EUROCASTLE INVEST.'),
+    ('EUR', 'NL0013654809', 'FAST', 'FASTNED'),
+    ('EUR', 'NL0011279492', 'FLOW', 'FLOW TRADERS'),
+    ('EUR', 'NL0011832811', 'FFARM', 'FORFARMERS'),
+    ('EUR', 'NL00150004A7', 'FUR', 'FUGRO'),
+    ('EUR', 'NL0010937066', 'GVNV', 'GRANDVISION'),
+    ('EUR', 'BMG455841020', 'HAL', 'HAL TRUST'),
+    ('EUR', 'NL0009269109', 'HEIJM', 'HEIJMANS'),
+    ('EUR', 'NL0000009165', 'HEIA', 'HEINEKEN'),
+    ('EUR', 'NL0000008977', 'HEIO', 'HEINEKEN HOLDING'),
+    ('EUR', 'NL0000440311', 'HOLCO', 'HOLLAND COLOURS'),
+    ('EUR', 'ANN4327C1220', 'HDG', 'HUNTER DOUGLAS'),
+    ('EUR', 'ANN4327C1303', 'HUNDP', 'HUNTER DOUGLAS'),
+    ('EUR', 'NL0009391242', 'HYDRA', 'HYDRATEC'),
+    ('EUR', 'NL0000359537', 'ICT', 'ICT GROUP'),
+    ('EUR', 'NL0010556726', 'IEX', 'IEX GROUP NV'),
+    ('EUR', 'NL0010801007', 'IMCD', 'IMCD'),
+    ('EUR', 'NL0010937058', 'INTER', 'INTERTRUST'),
+    ('EUR', 'NL0014332678', 'JDEP', "JDE PEET'S"),
+    ('EUR', 'NL0012015705', 'TKWY', 'JUST EAT TAKEAWAY'),
+    ('EUR', 'NL0000852531', 'KENDR', 'KENDRION'),
+    ('EUR', 'NL0000009082', 'KPN', 'KPN KON'),
+    ('EUR', 'NL0010545679', 'LVIDE', 'LAVIDE HOLDING'),
+    ('EUR', 'NL0010998878', 'BOLS', 'LUCASBOLS'),
+    ('EUR', 'IS0000000388', 'MAREL', 'MAREL'),
+    ('EUR', 'NL0009312842', 'NEDSE', 'MKB Nedsense'),
+    ('EUR', 'CWN814651014', 'MORE', 'MOREFIELD GROUP'),
+    ('EUR', 'NL0000371243', 'NEDAP', 'NEDAP'),
+    ('EUR', 'IM00BDD7WV31', 'NRP', 'NEPI ROCKCASTLE'),
+    ('EUR', 'NL0009822014', 'NSE', 'NEW SOURCES ENERGY'),
+    ('EUR', 'NL0000440618', 'NEWAY', 'NEWAYS ELECTRONICS'),
+    ('EUR', 'NL0012756316', 'NIBC', 'NIBC HOLDING'),
+    ('EUR', 'NL0010773842', 'NN', 'NN GROUP'),
+    ('EUR', 'NL0010696704', 'NOVI', 'NOVISOURCE'),
+    ('EUR', 'NL0012365084', 'NSI', 'NSI N.V.'),
+    ('EUR', 'NL0010558797', 'OCI', 'OCI'),
+    ('EUR', 'NL0000370419', 'ORANW', 'ORANJEWOUD A'),
+    ('EUR', 'NL0000440584', 'ORDI', 'ORDINA'),
+    ('EUR', 'NL0010391025', 'PHARM', 'PHARMING GROUP'),
+    ('EUR', 'NL0000009322', 'INPHI', 'PHILIPS BUY BACK'),
+    ('EUR', 'NL0000009538', 'PHIA', 'PHILIPS KON'),
+    ('EUR', 'NL0000378669', 'PORF', 'PORCELEYNE FLES'),
+    ('EUR', 'NL0009739416', 'PNL', 'POSTNL'),
+    ('EUR', 'BMG7209L1000', 'PPLAA', 'PPLA CLASS A'),
+    ('EUR', 'BMG7209L1182', 'PPLAB', 'PPLA CLASS B'),
+    ('EUR', 'US69355L1098', 'PPLA', 'PPLA European Unit'),
+    ('EUR', 'NL0013654783', 'PRX', 'PROSUS'),
+    ('EUR', 'NL0000379121', 'RAND', 'RANDSTAD NV'),
+    ('EUR', 'LU0383812293', 'REINA', 'REINET INVESTMENTS'),
+    ('EUR', 'GB00B2B0DG97', 'REN', 'RELX'),
+    ('EUR', 'GB0007995243', 'RWI', 'RENEWI'),
+    ('EUR', 'NL0000440477', 'ROOD', 'ROODMICROTEC'),
+    ('EUR', 'GB00B03MLX29', 'RDSA', 'ROYAL DUTCH SHELLA'),
+    ('EUR', 'GB00B03MM408', 'RDSB', 'ROYAL DUTCH SHELLB'),
+    ('EUR', 'NL0000360618', 'SBMO', 'SBM OFFSHORE'),
+    ('EUR', 'NL0011660485', 'SIFG', 'SIF HOLDING'),
+    ('EUR', 'NL0011821392', 'LIGHT', 'SIGNIFY NV'),
+    ('EUR', 'NL0000817179', 'SLIGR', 'SLIGRO FOOD GROUP'),
+    ('EUR', 'NL0010627865', 'SNOW', 'SNOWWORLD'),
+    ('EUR', 'NL0000336303', 'STRN', 'STERN GROEP'),
+    ('EUR', 'NL0010389508', 'TIE', 'TIE KINETIX'),
+    ('EUR', 'NL0000852523', 'TWEKA', 'TKH GROUP'),
+    ('EUR', 'NL0013332471', 'TOM2', 'TOMTOM'),
+    ('EUR', 'GB00B10RZP78', 'UNA', 'UNILEVER'),
+    ('EUR', 'NL0000302636', 'VLK', 'V LANSCHOT KEMPEN'),
+    ('EUR', 'NL0010661864', 'VALUE', 'VALUE8'),
+    ('EUR', 'NL0015118803', 'PREVA', 'VALUE8 CUM PREF'),
+    ('EUR', 'NL0000288918', 'VASTN', 'VASTNED'),
+    ('EUR', 'BMG9349W1038', 'VEON', 'VEON'),
+    ('EUR', 'DE0007921835', 'VVY', 'VIVORYON'),
+    ('EUR', 'GG00B1GHHH78', 'VTA', 'VOLTA FINANCE'),
+    ('EUR', 'NL0009432491', 'VPK', 'VOPAK'),
+    ('EUR', 'NL0000289213', 'WHA', 'WERELDHAVE'),
+    ('EUR', 'NL0000395903', 'WKL', 'WOLTERS KLUWER'),
+    ('EUR', 'JE00B1FBT077', 'YATRA', 'YATRA'),
+    )
@@ -0,0 +1,16 @@
+#-*- coding: utf-8 -*-
+# bru_a.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_BRU_A = (
+    ('EUR', 'BE0003885051', 'FLEX', 'FLEXOS S.A.'),
+    ('EUR', 'BE0003861789', 'GROWN', 'GROWNERS'),
+    ('EUR', 'BE0003680916', 'MLNEU', 'NEUFCOUR-FIN.'),
+    ('EUR', 'BE0003832491', 'NEWT', 'NEWTREE'),
+    ('EUR', 'BE0003841583', 'REAL', 'REALCO'),
+    ('EUR', 'BE0003829463', 'REI', 'REIBEL'),
+    ('EUR', 'BE0003847648', 'UNI', 'U&I LEARNING'),
+    ('EUR', 'BE0003838555', 'PNSB', 'UCARE SERVICES BEL'),
+    )
@@ -0,0 +1,14 @@
+#-*- coding: utf-8 -*-
+# eg_bru.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EG_BRU = (
+    ('EUR', 'BE0974298300', 'CAND', 'CANDELA INVEST'),
+    ('EUR', 'BE0003519270', 'COBH', 'CO.BR.HA'),
+    ('EUR', 'BE0003843605', 'ALEMK', 'EMAKINA GROUP'),
+    ('EUR', 'BE0003840577', 'ALEVA', 'EVADIX'),
+    ('EUR', 'GB0033711010', 'ALIMM', 'IMMUPHARMA'),
+    ('EUR', 'BE0003773877', 'SOFT', 'SOFTIMAT'),
+    )
@@ -0,0 +1,28 @@
+#-*- coding: utf-8 -*-
+# eg_dublin.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EG_DUBLIN = (
+    ('EUR', 'IE0000020408', 'DOY', 'ABBEY PLC'),
+    ('EUR', 'IE00BXC8D038', 'APGN', 'APPLEGREEN PLC'),
+    ('EUR', 'IE0007214426', 'DQ5', 'CPL RESOURCES PLC.'),
+    ('EUR', 'IE00BLRPQQ22', 'DQ7A', 'DONEGAL INVESTMENT'),
+    ('EUR', 'GB00BY7QYJ50', 'GRW', 'DRAPER ESPRIT PLC'),
+    ('EUR', 'GB0031477770', 'GYQ', 'FIRST DERIVATIVES'),
+    ('EUR', 'IE00B1FR8863', '8GW', 'GREAT WESTERN MIN.'),
+    ('EUR', 'IE00BF2NR112', 'GRP', 'GREENCOAT REN.'),
+    ('EUR', 'IE00BVGC3741', 'MLC', 'MALIN CORP. PLC'),
+    ('EUR', 'IE00BD64C665', 'MIO', 'MINCON GROUP PLC'),
+    ('EUR', 'GB00B9275X97', 'ORPH', 'OPEN ORPHAN PLC'),
+    ('EUR', 'IE00B1WV4493', 'OIZ', 'ORIGIN ENT. PLC'),
+    ('EUR', 'IE00BF0MZF04', 'ORQ1', 'ORMONDE MINING PLC'),
+    ('EUR', 'IE00B4XVDC01', 'OVXA', 'OVOCA BIO PLC'),
+    ('EUR', 'IE00B0Q82B24', 'P8ET', 'PETRONEFT RES.'),
+    ('EUR', 'IE00B66B5T26', 'PZQA', 'PROVIDENCE RES.'),
+    ('EUR', 'IE00B1HDWM43', 'T7O', 'TOTAL PRODUCE PLC'),
+    ('EUR', 'IE00BJ5FQX74', 'UPR', 'UNIPHAR PLC'),
+    ('EUR', 'IE00BG0HDR01', '6VR', 'VR EDUCATION HOLD.'),
+    ('EUR', 'IE00BDT5KP12', 'YEW', 'YEW GROVE REIT PLC'),
+    )
@@ -0,0 +1,10 @@
+#-*- coding: utf-8 -*-
+# eg_lis.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EG_LIS = (
+    ('EUR', 'PTNEX0AM0002', 'ALNOR', 'NEXPONOR-SICAFI'),
+    ('EUR', 'PTPRS0AM0009', 'ALPTR', 'PATRIS'),
+    )
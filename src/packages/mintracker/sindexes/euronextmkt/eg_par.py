@@ -0,0 +1,259 @@
+#-*- coding: utf-8 -*-
+# eg_par.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EG_PAR = (
+    ('EUR', 'FR0010285965', 'ALMIL', '1000MERCIS'),
+    ('EUR', 'FR0010493510', 'ALALO', 'ACHETER-LOUER.FR'),
+    ('EUR', 'FR0011038348', 'ALACT', 'ACTIPLAY (GROUPE)'),
+    ('EUR', 'FR0000053076', 'ALADA', 'ADA'),
+    ('EUR', 'FR0013284627', 'ALARF', 'ADEUNIS'),
+    ('EUR', 'FR0013247244', 'ALADO', 'ADOMOS'),
+    ('EUR', 'FR0010457531', 'ALADM', 'ADTHINK'),
+    ('EUR', 'FR0013452281', 'ALAGP', 'AGRIPOWER'),
+    ('EUR', 'FR0010641449', 'ALAGR', 'AGROGENERATION'),
+    ('EUR', 'FR0014000JX7', 'ALCHI', 'ALCHIMIE'),
+    ('EUR', 'FR0000054652', 'ALPHY', 'ALES GROUPE'),
+    ('EUR', 'FR0011051598', 'ALMIB', 'AMOEBA'),
+    ('EUR', 'FR0011910652', 'ALANV', 'ANEVIA'),
+    ('EUR', 'FR0013469319', 'ANVBV', 'ANEVIA BSA B'),
+    ('EUR', 'ES0109429037', 'ALANT', 'ANTEVENIO'),
+    ('EUR', 'FR0010340711', 'ALAQU', 'AQUILA'),
+    ('EUR', 'FR0000182479', 'ALJXR', 'ARCHOS'),
+    ('EUR', 'FR0013398997', 'ALCUR', 'ARCURE'),
+    ('EUR', 'FR0000079683', 'ALATF', 'ARTEFACT'),
+    ('EUR', 'FR0013410370', 'ALAMG', 'AUPLATA MINING GR'),
+    ('EUR', 'FR0013384369', 'ALBKK', 'BAIKOWSKI'),
+    ('EUR', 'FR0000035305', 'ALBDM', 'BD MULTI MEDIA'),
+    ('EUR', 'FR0000066961', 'ALDBL', 'BERNARD LOISEAU'),
+    ('EUR', 'FR0004174233', 'ALBLD', 'BILENDI'),
+    ('EUR', 'FR0013345493', 'ALTUV', 'BIO-UV GROUP'),
+    ('EUR', 'FR0012788065', 'ALCOR', 'BIOCORP'),
+    ('EUR', 'FR0012816825', 'ALBPS', 'BIOPHYTIS'),
+    ('EUR', 'FR0013507290', 'BPSBS', 'BIOPHYTIS BSA'),
+    ('EUR', 'FR0011005933', 'ALBIO', 'BIOSYNEX'),
+    ('EUR', 'FR0013517380', 'BIOBS', 'BIOSYNEX BSAR'),
+    ('EUR', 'FR0011041011', 'ALBLU', 'BLUELINEA'),
+    ('EUR', 'FR0013480969', 'BLUBS', 'BLUELINEA BSA J'),
+    ('EUR', 'FR0013480985', 'BLUBT', 'BLUELINEA BSA Y'),
+    ('EUR', 'FR0000054421', 'ALBOU', 'BOURRELIER GROUP'),
+    ('EUR', 'FR0013530102', 'ALCG', 'CABASSE GROUP'),
+    ('EUR', 'FR0011648716', 'ALCRB', 'CARBIOS'),
+    ('EUR', 'FR0010907956', 'ALCAR', 'CARMAT'),
+    ('EUR', 'FR0010425595', 'ALCLS', 'CELLECTIS'),
+    ('EUR', 'FR0013178712', 'ALPCV', 'CERINNOV GROUP'),
+    ('EUR', 'FR0013297165', 'ALCES', 'CESAR'),
+    ('EUR', 'FR00140003K4', 'CIBBS', 'CIBOX BS'),
+    ('EUR', 'FR0004152882', 'ALCLA', 'CLASQUIN'),
+    ('EUR', 'FR0013257409', 'ALCOF', 'COFIDUR'),
+    ('EUR', 'FR0013335742', 'ALLEC', 'COGELEC'),
+    ('EUR', 'FR0011071570', 'ALCOG', 'COGRA'),
+    ('EUR', 'BE0160342011', 'ALCOI', 'COIL'),
+    ('EUR', 'FR0011716265', 'ALCJ', 'CROSSJECT'),
+    ('EUR', 'FR0013505583', 'ALCYB', 'CYBERGUN'),
+    ('EUR', 'FR0013340817', 'CYBBT', 'CYBERGUN BSA 2'),
+    ('EUR', 'FR0013507977', 'CYBK1', 'CYBERGUN BSA K1'),
+    ('EUR', 'FR0013507985', 'CYBKA', 'CYBERGUN BSA K2A'),
+    ('EUR', 'FR0013508009', 'CYBKB', 'CYBERGUN BSA K2B'),
+    ('EUR', 'FR0010404368', 'ALDLS', 'D.L.S.I.'),
+    ('EUR', 'FR0000185423', 'ALDAR', 'DAMARTEX'),
+    ('EUR', 'FR0013066750', 'ALDBT', 'DBT'),
+    ('EUR', 'FR0010879056', 'ALDEI', 'DEINOVE'),
+    ('EUR', 'FR0000054132', 'ALDEL', 'DELFINGEN'),
+    ('EUR', 'FR0011522168', 'ALDR', 'DELTA DRONE'),
+    ('EUR', 'FR0013239977', 'ALDBS', 'DELTA DRONE BSA'),
+    ('EUR', 'FR0013400991', 'ALDBY', 'DELTA DRONE BSA Y'),
+    ('EUR', 'FR0000060840', 'ALDEV', 'DEVERNOIS'),
+    ('EUR', 'FR0010436584', 'ALDNX', 'DNXCORP'),
+    ('EUR', 'FR0010377127', 'ALDOL', 'DOLFINES'),
+    ('EUR', 'FR0013331212', 'ALDNE', 'DONTNOD'),
+    ('EUR', 'FR0013088606', 'ALDRV', 'DRONE VOLT'),
+    ('EUR', 'FR0010246322', 'ALEZV', 'EASYVISTA'),
+    ('EUR', 'FR0013534617', 'ALECO', 'ECOMIAM'),
+    ('EUR', 'FR0011490648', 'ALESA', 'ECOSLOPS'),
+    ('EUR', 'IT0005351504', 'ALEAC', 'EDILIZIACROBATICA'),
+    ('EUR', 'FR0013356755', 'ALEMV', 'EMOVA GROUP'),
+    ('EUR', 'FR0004030708', 'ALDUB', 'ENCRES DUBUIT'),
+    ('EUR', 'FR0013330792', 'ALNN6', 'ENENSYS'),
+    ('EUR', 'FR0013399359', 'ALNRG', 'ENERGISME'),
+    ('EUR', 'FR0011915339', 'ALENE', 'ENERTIME'),
+    ('EUR', 'FR0010424697', 'ALENT', 'ENTREPARTICULIERS'),
+    ('EUR', 'FR0000045122', 'ALENR', 'ENTREPRENDRE'),
+    ('EUR', 'FR0010278762', 'ALTEV', 'ENVEA'),
+    ('EUR', 'FR0010465534', 'ALEO2', 'EO2'),
+    ('EUR', 'FR0000035818', 'ALESK', 'ESKER'),
+    ('EUR', 'FR0010844001', 'ALEUA', 'EURASIA GROUPE'),
+    ('EUR', 'FR0013240934', 'ALERS', 'EUROBIO-SCIENTIFIC'),
+    ('EUR', 'FR0013256518', 'ALECR', 'EUROFINS CEREP'),
+    ('EUR', 'FR0010452474', 'ALGEM', 'EUROGERM'),
+    ('EUR', 'FR0000075343', 'ALEMG', 'EUROMEDIS GROUPE'),
+    ('EUR', 'FR0013514114', 'ALEUP', 'EUROPLASMA'),
+    ('EUR', 'FR0013294089', 'EURBU', 'EUROPLASMA BSC'),
+    ('EUR', 'FR0004166197', 'ALTVO', 'EVOLIS'),
+    ('EUR', 'ES0105029005', 'ALPHI', 'FACEPHI'),
+    ('EUR', 'FR0004034593', 'ALFBA', 'FASHION B AIR'),
+    ('EUR', 'FR0010221069', 'ALFIL', 'FILAE'),
+    ('EUR', 'FR0000074759', 'ALFLE', 'FLEURY MICHON'),
+    ('EUR', 'FR0012419307', 'ALFOC', 'FOCUS HOME INT'),
+    ('EUR', 'FR0010485268', 'ALFPC', 'FOUNTAINE PAJOT'),
+    ('EUR', 'FR0004187367', 'ALFRE', 'FREELANCE.COM'),
+    ('EUR', 'FR0000124414', 'ALBI', 'GASCOGNE'),
+    ('EUR', 'FR0013495298', 'ALGAU', 'GAUSSIN'),
+    ('EUR', 'FR0004053510', 'ALGEN', 'GENOWAY'),
+    ('EUR', 'FR0013483047', 'GEPBS', 'GEP BSA 2020'),
+    ('EUR', 'FR0000033888', 'ALGEV', 'GEVELOT'),
+    ('EUR', 'FR0011052257', 'ALGBE', 'GLOBAL BIOENERGIES'),
+    ('EUR', 'FR0011289198', 'ALGEP', 'GLOBAL ECOPOWER'),
+    ('EUR', 'FR0011208693', 'ALGLD', 'GOLD BY GOLD'),
+    ('EUR', 'FR0013204070', 'ALPAR', 'GPE PAROT (AUTO)'),
+    ('EUR', 'FR0012819381', 'ALGIL', 'GROUPE GUILLIN'),
+    ('EUR', 'FR0000075442', 'ALLDL', 'GROUPE LDLC'),
+    ('EUR', 'FR0013429404', 'ALGTR', 'GROUPE TERA'),
+    ('EUR', 'FR0013297488', 'ALIMO', 'GROUPIMO'),
+    ('EUR', 'CA4433003064', 'ALHEO', 'H2O INNOVATION INC'),
+    ('EUR', 'FR0000066540', 'ALHRG', 'HERIGE'),
+    ('EUR', 'FR0000077562', 'ALHIO', 'HIOLLE INDUSTRIES'),
+    ('EUR', 'FR0010396309', 'ALHIT', 'HITECHPROS'),
+    ('EUR', 'FR0013451044', 'ALHGR', 'HOFFMANN'),
+    ('EUR', 'FR0004153930', 'ALHYG', 'HYBRIGENICS'),
+    ('EUR', 'FR0011511971', 'ALICR', 'I.CERAM'),
+    ('EUR', 'FR0005854700', 'ALI2S', 'I2S'),
+    ('EUR', 'FR0000062184', 'ALIDS', 'IDSUD'),
+    ('EUR', 'FR0013060100', 'ALIMR', 'IMMERSION'),
+    ('EUR', 'FR0013470168', 'ALIMP', 'IMPLANET'),
+    ('EUR', 'FR0000060451', 'ALLUX', 'INSTALLUX'),
+    ('EUR', 'FR0010908723', 'ALINT', 'INTEGRAGEN'),
+    ('EUR', 'FR0011179886', 'ALINS', 'INTRASENSE'),
+    ('EUR', 'BE0974299316', 'ALINV', 'INVIBES ADVERTSING'),
+    ('EUR', 'FR0000072597', 'ALITL', 'IT LINK'),
+    ('EUR', 'FR0010082305', 'ALIVA', 'IVALIS'),
+    ('EUR', 'FR0010722819', 'ALKAL', 'KALRAY'),
+    ('EUR', 'FR0013156007', 'ALKLK', 'KERLINK'),
+    ('EUR', 'GB00B19RTX44', 'ALSIM', 'KLIMVEST'),
+    ('EUR', 'NL0012191662', 'ALPER', 'LA PERLA FASHION'),
+    ('EUR', 'FR0004027068', 'ALLAN', 'LANSON-BCC'),
+    ('EUR', 'FR0000075673', 'ALTAN', 'LE TANNEUR'),
+    ('EUR', 'FR0007080254', 'ALLHB', 'LES HOTELS BAVEREZ'),
+    ('EUR', 'FR0000033599', 'ALLEX', 'LEXIBOOK LINGUIST.'),
+    ('EUR', 'ES0105089009', 'ALLLN', 'LLEIDA'),
+    ('EUR', 'FR0000044943', 'ALLOG', 'LOGIC INSTRUMENT'),
+    ('EUR', 'FR0011884378', 'ALUCI', 'LUCIBEL'),
+    ('EUR', 'FR0013525953', 'LUCBS', 'LUCIBEL BS'),
+    ('EUR', 'FR0013270626', 'ALMII', 'M2I'),
+    ('EUR', 'FR0010812230', 'ALMNG', 'MADVERTISE'),
+    ('EUR', 'FR0000072993', 'ALMAK', 'MAKHEIA GROUP'),
+    ('EUR', 'FR0013525557', 'MAKBS', 'MAKHEIA GROUP BSA'),
+    ('EUR', 'ES0105463006', 'ALMKS', 'MAKING SCIENCE'),
+    ('EUR', 'FR0013400835', 'ALMAR', 'MARE NOSTRUM'),
+    ('EUR', 'FR0004155687', 'ALMAS', 'MASTRAD'),
+    ('EUR', 'FR0013472446', 'MASBS', 'MASTRAD BS29'),
+    ('EUR', 'FR0000061244', 'ALMEC', 'MECELEC COMPOSITES'),
+    ('EUR', 'IT0005380438', 'ALKER', 'MEDIA MAKER'),
+    ('EUR', 'FR0011049824', 'ALMDT', 'MEDIANTECHNOLOGIES'),
+    ('EUR', 'FR0013483534', 'METBS', 'METABOLIC EX BSA21'),
+    ('EUR', 'FR0011217710', 'ALMET', 'METHANOR'),
+    ('EUR', 'IT0004615396', 'ALMTH', 'METHORIOS CAPITAL'),
+    ('EUR', 'FR0010204453', 'ALMGI', 'MG INTERNATIONAL'),
+    ('EUR', 'FR0010353888', 'ALMDG', 'MGI DIGITAL GRAPHI'),
+    ('EUR', 'FR0004058949', 'ALMIC', 'MICROWAVE VISION'),
+    ('EUR', 'FR0013053535', 'ALMLB', 'MILIBOO'),
+    ('EUR', 'FR0004172450', 'ALBUD', 'MINT'),
+    ('EUR', 'FR0013307329', 'BUDBS', 'MINT BS'),
+    ('EUR', 'FR0011584549', 'ALMND', 'MND'),
+    ('EUR', 'FR0013449857', 'ALMBS', 'MND BSA 2019'),
+    ('EUR', 'FR0011033083', 'ALMOU', 'MOULINVEST'),
+    ('EUR', 'FR0004034320', 'ALMRB', 'MR BRICOLAGE'),
+    ('EUR', 'FR0013462231', 'ALMUN', 'MUNIC'),
+    ('EUR', 'IT0005119109', 'ALMBG', 'MYBEST GROUP'),
+    ('EUR', 'FR0011636083', 'ALNLF', 'NEOLIFE'),
+    ('EUR', 'FR0013282936', 'NLFBS', 'NEOLIFE BS'),
+    ('EUR', 'FR0004032746', 'ALNEV', 'NEOVACS'),
+    ('EUR', 'FR0013275971', 'NEVBS', 'NEOVACS BSA'),
+    ('EUR', 'FR0004171346', 'ALNXT', 'NEXTEDIA'),
+    ('EUR', 'FR0010397232', 'ALNOV', 'NOVACYT'),
+    ('EUR', 'NL0012044762', 'ALNOX', 'NOXXON'),
+    ('EUR', 'FR0000064529', 'ALNSC', 'NSC GROUPE'),
+    ('EUR', 'FR0004065639', 'ALNSE', 'NSE'),
+    ('EUR', 'FR0010231860', 'ALODI', 'O2I'),
+    ('EUR', 'FR0013268042', 'O2IBS', 'O2I BSA'),
+    ('EUR', 'FR0013381431', 'ODBS2', 'O2I BSA 2'),
+    ('EUR', 'FR0010330613', 'ALOBR', 'OBER'),
+    ('EUR', 'FR0011766229', 'ALONC', 'ONCODESIGN'),
+    ('EUR', 'FR0010095596', 'ALONX', 'ONXEO'),
+    ('EUR', 'FR0013318052', 'ALORD', 'ORDISSIMO'),
+    ('EUR', 'FR0013231180', 'ALOSM', 'OSMOZIS'),
+    ('EUR', 'FR0013479730', 'ALPAU', 'PAULIC MEUNERIE'),
+    ('EUR', 'BE0974302342', 'ALPHS', 'PHARMASIMPLE'),
+    ('EUR', 'FR0011191287', 'ALPHA', 'PHARNEXT'),
+    ('EUR', 'FR0000061608', 'ALPDX', 'PISCINES DESJOYAUX'),
+    ('EUR', 'FR0011950641', 'ALPIX', 'PIXIUM VISION'),
+    ('EUR', 'FR0010211037', 'ALPLA', 'PLANET MEDIA'),
+    ('EUR', 'FR0010785790', 'ALPAT', 'PLANT ADVANCED'),
+    ('EUR', 'FR0011844067', 'PATBS', 'PLANT ADVANCED BS'),
+    ('EUR', 'FR0000066441', 'ALPJT', 'POUJOULAT'),
+    ('EUR', 'FR0013015583', 'ALPOU', 'POULAILLON'),
+    ('EUR', 'FR0010169920', 'ALPRE', 'PREDILIFE'),
+    ('EUR', 'FR0004044600', 'ALPRI', 'PRISMAFLEX INTL'),
+    ('EUR', 'FR0010313486', 'ALPRO', 'PRODWARE'),
+    ('EUR', 'FR0013398617', 'PROBT', 'PROLOGUE BSA'),
+    ('EUR', 'ES0105118006', 'ALQP', 'QUADPACK'),
+    ('EUR', 'FR0011648971', 'ALQGC', 'QUANTUM GENOMICS'),
+    ('EUR', 'FR0010889386', 'ALQWA', 'QWAMPLIFY'),
+    ('EUR', 'FR0013472677', 'QWABS', 'QWAMPLIFY BSAANE'),
+    ('EUR', 'FR0011858190', 'ALREA', 'REALITES'),
+    ('EUR', 'FR0010820274', 'ALREW', 'REWORLD MEDIA'),
+    ('EUR', 'FR0000075954', 'ALRIB', 'RIBER'),
+    ('EUR', 'FR0010523167', 'ALROC', 'ROCTOOL'),
+    ('EUR', 'FR0013477585', 'ROCBS', 'ROCTOOL BSA 2020'),
+    ('EUR', 'FR0013477593', 'ROCBT', 'ROCTOOL BSA 2020-2'),
+    ('EUR', 'FR0000037640', 'ALRGR', 'ROUGIER S.A.'),
+    ('EUR', 'FR0013467123', 'ALSAF', 'SAFE ORTHOPAEDICS'),
+    ('EUR', 'IT0004013725', 'ALWOO', 'SAFWOOD'),
+    ('EUR', 'FR0010776617', 'ALMER', 'SAPMER'),
+    ('EUR', 'IT0005353484', 'ALSEI', 'SEIF SPA'),
+    ('EUR', 'FR0012596468', 'ALSEN', 'SENSORION'),
+    ('EUR', 'FR0000073728', 'ALSER', 'SERMA GROUP'),
+    ('EUR', 'FR0000061582', 'ALSIP', 'SI PARTICIPATIONS'),
+    ('EUR', 'FR0010202606', 'ALBFR', 'SIDETRADE'),
+    ('EUR', 'FR0011464452', 'ALSGD', 'SPINEGUARD'),
+    ('EUR', 'FR0011398874', 'ALSPW', 'SPINEWAY'),
+    ('EUR', 'FR0000074775', 'ALSAS', 'STRADIM ESPAC.FIN'),
+    ('EUR', 'FR0010528059', 'ALSTW', 'STREAMWIDE'),
+    ('EUR', 'FR0012790756', 'STWDS', 'STREAMWIDE BS'),
+    ('EUR', 'FR0011053636', 'ALTBG', 'THE BLOCKCHAIN GP'),
+    ('EUR', 'FR0010120402', 'ALTHE', 'THERACLION'),
+    ('EUR', 'FR0004197747', 'ALTER', 'THERADIAG'),
+    ('EUR', 'FR0013286259', 'ALTHX', 'THERANEXUS'),
+    ('EUR', 'LU0394945660', 'ALTLX', 'TOOLUX SANDING'),
+    ('EUR', 'FR0010397901', 'ALTRI', 'TRILOGIQ'),
+    ('EUR', 'FR0004175099', 'ALTRO', 'TRONICS'),
+    ('EUR', 'FR0010383877', 'ALTTI', 'TTI'),
+    ('EUR', 'FR0010654087', 'ALTXC', 'TXCOM'),
+    ('EUR', 'FR0000079147', 'ALU10', 'U10 CORP'),
+    ('EUR', 'FR0011070457', 'ALUCR', 'UCAR'),
+    ('EUR', 'FR0013263878', 'ALUMS', 'UMANIS'),
+    ('EUR', 'FR0012709160', 'ALUNT', 'UNITI'),
+    ('EUR', 'FR0010337865', 'ALUPG', 'UPERGY'),
+    ('EUR', 'FR0011898584', 'ALUVI', 'UV GERMI'),
+    ('EUR', 'FR0013254851', 'ALVAL', 'VALBIOTIS'),
+    ('EUR', 'FR0010766667', 'ALVU', 'VENTE UNIQUE.COM'),
+    ('EUR', 'FR0004155240', 'ALVER', 'VERGNET'),
+    ('EUR', 'FR0010326090', 'ALVIA', 'VIALIFE'),
+    ('EUR', 'FR0004029478', 'ALVIV', 'VISIATIV'),
+    ('EUR', 'FR0013365277', 'VMGBW', 'VISIOMED BSA18T2.3'),
+    ('EUR', 'FR0013372471', 'VMGBX', 'VISIOMED BSA18T2.4'),
+    ('EUR', 'FR0013322724', 'VMGBS', 'VISIOMED BSA2018-1'),
+    ('EUR', 'FR0013352317', 'VMGBU', 'VISIOMED BSA2018-2'),
+    ('EUR', 'FR0013356441', 'VMGBV', 'VISIOMED BSA2018-3'),
+    ('EUR', 'FR0013481835', 'ALVMG', 'VISIOMED GROUP'),
+    ('EUR', 'FR0013321817', 'VMGBT', 'VISIOMEDBSA26OCT23'),
+    ('EUR', 'FR0011532225', 'ALVGO', 'VOGO'),
+    ('EUR', 'FR0004045847', 'ALVDM', 'VOYAGEURS DU MONDE'),
+    ('EUR', 'FR0010131409', 'ALLIX', 'WALLIX'),
+    ('EUR', 'FR0013079092', 'ALWEC', 'WE.CONNECT'),
+    ('EUR', 'FR0010688440', 'ALWED', 'WEDIA'),
+    ('EUR', 'FR0014000P11', 'ALWF', 'WINFARM'),
+    ('EUR', 'FR0013143872', 'ALWIT', 'WITBE'),
+    )
@@ -0,0 +1,10 @@
+#-*- coding: utf-8 -*-
+# eg_pb.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EG_PB = (
+    ('EUR', 'BE0974334667', 'ALAVY', 'AUDIOVALLEY'),
+    ('EUR', 'FR0013374667', 'ALKKO', 'KKO INTERNATIONAL'),
+    )
@@ -0,0 +1,14 @@
+#-*- coding: utf-8 -*-
+# en_ab.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_AB = (
+    ('EUR', 'NL0011794037', 'AD', 'AHOLD DEL'),
+    ('EUR', 'NL0012047823', 'AVTX', 'AVANTIUM'),
+    ('EUR', 'NL0000288876', 'ECMPA', 'EUROCOMMERCIAL'),
+    ('EUR', 'BE0003818359', 'GLPG', 'GALAPAGOS'),
+    ('EUR', 'NL0011821202', 'INGA', 'ING GROEP N.V.'),
+    ('EUR', 'NL0011323407', 'KDS', 'KIADIS'),
+    )
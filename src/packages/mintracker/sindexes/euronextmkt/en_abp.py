@@ -0,0 +1,9 @@
+#-*- coding: utf-8 -*-
+# en_abp.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_ABP = (
+    ('EUR', 'LU0569974404', 'APAM', 'APERAM'),
+    )
@@ -0,0 +1,11 @@
+#-*- coding: utf-8 -*-
+# en_ap.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_AP = (
+    ('EUR', 'LU1598757687', 'MT', 'ARCELORMITTAL SA'),
+    ('EUR', 'NL0009272137', 'ESP', 'ESPERITE'),
+    ('EUR', 'FR0013326246', 'URW', 'UNIBAIL-RODAMCO-WE'),
+    )
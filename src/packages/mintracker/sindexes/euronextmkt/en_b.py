@@ -0,0 +1,125 @@
+#-*- coding: utf-8 -*-
+# en_b.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_B = (
+    ('EUR', 'BE0974293251', 'ABI', 'AB INBEV'),
+    ('EUR', 'BE0974278104', 'ABO', 'ABO GROUP'),
+    ('EUR', 'GB00BYWF9Y76', 'ACPH', 'ACACIA PHARMA'),
+    ('EUR', 'BE0003696102', 'ACCB', 'ACCENTIS'),
+    ('EUR', 'BE0003764785', 'ACKB', 'ACKERMANS V.HAAREN'),
+    ('EUR', 'BE0974264930', 'AGS', 'AGEAS'),
+    ('EUR', 'BE0003755692', 'AGFB', 'AGFA-GEVAERT'),
+    ('EUR', 'BE0003676872', 'ANT', 'ANTARES CERT'),
+    ('EUR', 'NL0010832176', 'ARGX', 'ARGENX SE'),
+    ('EUR', 'BE0003856730', 'ASC', 'ASCENCIO'),
+    ('EUR', 'BE0003837540', 'ATEB', 'ATENOR'),
+    ('EUR', 'BE0974314461', 'BALTA', 'BALTA GROUP'),
+    ('EUR', 'BE0003870871', 'BANI', 'BANIMMO A'),
+    ('EUR', 'BE0974362940', 'BAR', 'BARCO'),
+    ('EUR', 'BE0003674851', 'BAS', 'BASILIX CERT'),
+    ('EUR', 'BE0003661726', 'BEAB', 'BEAULIEU-AV. CERT'),
+    ('EUR', 'BE0003678894', 'BEFB', 'BEFIMMO'),
+    ('EUR', 'BE0974258874', 'BEKB', 'BEKAERT'),
+    ('EUR', 'BE0020575115', 'BELR', 'BELRECA'),
+    ('EUR', 'BE0003723377', 'BELU', 'BELUGA'),
+    ('EUR', 'BE0974281132', 'BCART', 'BIOCARTIS'),
+    ('EUR', 'BE0974268972', 'BPOST', 'BPOST'),
+    ('EUR', 'BE0003008019', 'BNB', 'BQUE NAT. BELGIQUE'),
+    ('EUR', 'LU1068091351', 'BREB', 'BREDERODE'),
+    ('EUR', 'BE0003825420', 'CAMB', 'CAMPINE'),
+    ('EUR', 'BE0974273055', 'CPINV', 'CARE PROPERTY INV.'),
+    ('EUR', 'BE0974303357', 'CENER', 'CENERGY'),
+    ('EUR', 'BE0003883031', 'CFEB', 'CFE'),
+    ('EUR', 'BE0003592038', 'COMB', 'CIE BOIS SAUVAGE'),
+    ('EUR', 'BE0003593044', 'COFB', 'COFINIMMO'),
+    ('EUR', 'BE0974256852', 'COLR', 'COLRUYT'),
+    ('EUR', 'BE0003836534', 'OPTI', 'CRESCENT'),
+    ('EUR', 'BE0974259880', 'DIE', "D'IETEREN"),
+    ('EUR', 'BE0003789063', 'DECB', 'DECEUNINCK'),
+    ('EUR', 'BE0003698124', 'DIEG', 'DIEGEM KENNEDYCERT'),
+    ('EUR', 'BE0003605160', 'DISL', 'DISTRI-LAND CERT'),
+    ('EUR', 'BE0974313455', 'ECONB', 'ECONOCOM GROUP'),
+    ('EUR', 'BE0003822393', 'ELI', 'ELIA GROUP'),
+    ('EUR', 'BE0003816338', 'EURN', 'EURONAV'),
+    ('EUR', 'BE0003820371', 'EVS', 'EVS BROADC.EQUIPM.'),
+    ('EUR', 'BE0003808251', 'EXM', 'EXMAR'),
+    ('EUR', 'BE0003215143', 'FLOB', 'FLORIDIENNE'),
+    ('EUR', 'BE0974265945', 'FLUX', 'FLUXYS BELGIUM D'),
+    ('EUR', 'BE0003752665', 'FOU', 'FOUNTAIN'),
+    ('EUR', 'BE0003797140', 'GBLB', 'GBL'),
+    ('EUR', 'BE0003740546', 'GENK', 'GENK LOGIST. CERT'),
+    ('EUR', 'BE0003699130', 'GIMB', 'GIMV'),
+    ('EUR', 'GB00BYN5BY03', 'GLOG', 'GLOBAL GRAPHICS'),
+    ('EUR', 'BE0003765790', 'GREEN', 'GREENYARD'),
+    ('EUR', 'BE0974352842', 'HAMO', 'HAMON'),
+    ('EUR', 'BE0003760742', 'HOMI', 'HOME INVEST BE.'),
+    ('EUR', 'BE0974363955', 'HYL', 'HYLORIS'),
+    ('EUR', 'BE0003766806', 'IBAB', 'IBA'),
+    ('EUR', 'BE0003748622', 'IEP', 'IEP INVEST'),
+    ('EUR', 'BE0974287196', 'MCC', 'IMMO MCC'),
+    ('EUR', 'BE0003893139', 'IMMOU', 'IMMO MOURY'),
+    ('EUR', 'BE0003599108', 'IMMO', 'IMMOBEL'),
+    ('EUR', 'BE0974374069', 'INCLU', 'INCLUSIO SA/NV'),
+    ('EUR', 'BE0003746600', 'INTO', 'INTERVEST OFF-WARE'),
+    ('EUR', 'BE0003858751', 'JEN', 'JENSEN-GROUP'),
+    ('EUR', 'BE0003565737', 'KBC', 'KBC'),
+    ('EUR', 'BE0003867844', 'KBCA', 'KBC ANCORA'),
+    ('EUR', 'BE0003880979', 'KEYW', 'KEYWARE TECH.'),
+    ('EUR', 'BE0974274061', 'KIN', 'KINEPOLIS GROUP'),
+    ('EUR', 'BE0003770840', 'LEAS', 'LEASINVEST'),
+    ('EUR', 'BE0003604155', 'LOTB', 'LOTUS BAKERIES'),
+    ('EUR', 'BE0003844611', 'MDXH', 'MDXHEALTH'),
+    ('EUR', 'BE0165385973', 'MELE', 'MELEXIS'),
+    ('EUR', 'BE0003731453', 'MIKO', 'MIKO'),
+    ('EUR', 'BE0974283153', 'MITRA', 'MITHRA'),
+    ('EUR', 'NL0000488153', 'MOP', 'MOPOLI'),
+    ('EUR', 'NL0000488161', 'MOPF', 'MOPOLI FOND'),
+    ('EUR', 'BE0003602134', 'MOUR', 'MOURY CONSTRUCT'),
+    ('EUR', 'BE0974294267', 'NYR', 'NYRSTAR'),
+    ('EUR', 'BE0974358906', 'NYXH', 'NYXOAH'),
+    ('EUR', 'BE0974276082', 'ONTEX', 'ONTEX GROUP'),
+    ('EUR', 'BE0003735496', 'OBEL', 'ORANGE BELGIUM'),
+    ('EUR', 'BE0003846632', 'OXUR', 'OXURION'),
+    ('EUR', 'IL0010830391', 'PAY', 'PAYTON PLANAR'),
+    ('EUR', 'BE0003807246', 'PIC', 'PICANOL'),
+    ('EUR', 'BE0003810273', 'PROX', 'PROXIMUS'),
+    ('EUR', 'BE0974272040', 'QRF', 'QRF'),
+    ('EUR', 'BE0003730448', 'QFG', 'QUESTFOR GR-PRICAF'),
+    ('EUR', 'BE0003656676', 'REC', 'RECTICEL'),
+    ('EUR', 'BE0003707214', 'RES', 'RESILUX'),
+    ('EUR', 'BE0003575835', 'ENGB', 'ROSIER'),
+    ('EUR', 'BE0003741551', 'ROU', 'ROULARTA'),
+    ('EUR', 'BE0012378593', 'SCHD', 'SCHEERD.V KERCHOVE'),
+    ('EUR', 'BE0974340722', 'SEQUA', 'SEQUANA MEDICAL'),
+    ('EUR', 'LU1883301340', 'SHUR', 'SHURGARD'),
+    ('EUR', 'BE0003743573', 'SIOE', 'SIOEN'),
+    ('EUR', 'BE0003898187', 'SIP', 'SIPEF'),
+    ('EUR', 'BE0974323553', 'SMAR', 'SMARTPHOTO GROUP'),
+    ('EUR', 'BE0003717312', 'SOF', 'SOFINA'),
+    ('EUR', 'BE0003545531', 'SOLV', 'SOLVAC NOM(RETAIL)'),
+    ('EUR', 'BE0003798155', 'SPA', 'SPADEL'),
+    ('EUR', 'BE0003463685', 'SUCR', 'SUCRAF A & B'),
+    ('EUR', 'BE0003826436', 'TNET', 'TELENET GROUP'),
+    ('EUR', 'BE0003573814', 'TERB', 'TER BEKE'),
+    ('EUR', 'BE0003555639', 'TESB', 'TESSENDERLO'),
+    ('EUR', 'BE0974263924', 'TEXF', 'TEXAF'),
+    ('EUR', 'BE0974282148', 'TINC', 'TINC'),
+    ('EUR', 'BE0003823409', 'TUB', 'TUBIZE-FIN'),
+    ('EUR', 'BE0003739530', 'UCB', 'UCB'),
+    ('EUR', 'BE0974320526', 'UMI', 'UMICORE'),
+    ('EUR', 'BE0974371032', 'UPG', 'UNIFIEDPOST GROUP'),
+    ('EUR', 'BE0003839561', 'VAN', 'VAN DE VELDE'),
+    ('EUR', 'BE0003754687', 'VASTB', 'VASTNED RETAIL BEL'),
+    ('EUR', 'BE0003878957', 'VGP', 'VGP'),
+    ('EUR', 'BE0974271034', 'VIO', 'VIOHALCO'),
+    ('EUR', 'BE0003734481', 'WEB', 'WAREHOUSES'),
+    ('EUR', 'BE0003724383', 'WEHB', 'WERELDHAVE BELGIUM'),
+    ('EUR', 'BE0003600112', 'WOLE', 'WOL. EXTENS. CERT'),
+    ('EUR', 'BE0003571792', 'WOLS', 'WOL. SHOPPING CERT'),
+    ('EUR', 'BE0974288202', 'XIOR', 'XIOR'),
+    ('EUR', 'BE0974311434', 'ZENT', 'ZENITEL'),
+    ('EUR', 'BE0003809267', 'ZEN', 'ZENOBE GRAMME CERT'),
+    )
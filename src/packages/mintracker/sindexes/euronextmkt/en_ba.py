@@ -0,0 +1,13 @@
+#-*- coding: utf-8 -*-
+# en_ba.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_BA = (
+    ('EUR', 'BE0003851681', 'AED', 'AEDIFICA'),
+    ('EUR', 'BE0003874915', 'FAGR', 'FAGRON'),
+    ('EUR', 'BE0974332646', 'FNG', 'FNG NV'),
+    ('EUR', 'BE0003720340', 'RET', 'RETAIL ESTATES'),
+    ('EUR', 'BE0974349814', 'WDP', 'WDP'),
+    )
@@ -0,0 +1,14 @@
+#-*- coding: utf-8 -*-
+# en_bp.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_BP = (
+    ('EUR', 'BE0974289218', 'ASIT', 'ASIT'),
+    ('EUR', 'BE0974280126', 'BOTHE', 'BONE THERAPEUTICS'),
+    ('EUR', 'BE0974260896', 'CYAD', 'CELYAD ONCOLOGY'),
+    ('EUR', 'BE0003853703', 'MONT', 'MONTEA C.V.A.'),
+    ('EUR', 'BE0003470755', 'SOLB', 'SOLVAY'),
+    ('EUR', 'BE0974338700', 'TITC', 'TITAN CEMENT'),
+    )
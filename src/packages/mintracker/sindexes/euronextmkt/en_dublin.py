@@ -0,0 +1,35 @@
+#-*- coding: utf-8 -*-
+# en_dublin.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_DUBLIN = (
+    ('EUR', 'IE00BF0L3536', 'A5G', 'AIB GROUP PLC'),
+    ('EUR', 'CH0043238366', 'YZA', 'ARYZTA AG'),
+    ('EUR', 'IE0000730790', 'DD7E', 'BANK OF IR NC PREF'),
+    ('EUR', 'IE0000730808', 'DD7D', 'BANK OF IR NCP STF'),
+    ('EUR', 'IE00BD1RP616', 'BIRG', 'BANK OF IRELAND GP'),
+    ('EUR', 'IE00BWY4ZF18', 'C5H', 'CAIRN HOMES PLC'),
+    ('EUR', 'IE0001827264', 'DD8A', 'CRH PLC 5PCCumPref'),
+    ('EUR', 'IE0001827603', 'DD8B', 'CRH PLC 7PCCumPref'),
+    ('EUR', 'IE0001827041', 'CRG', 'CRH PLC ord'),
+    ('EUR', 'IE00BJMZDW83', 'DHG', 'DALATA HOTEL GP.'),
+    ('EUR', 'IE0000527006', 'DLE', 'DATALEX PLC'),
+    ('EUR', 'IE0003290289', 'EG7', 'FBD HOLDINGS PLC'),
+    ('EUR', 'IE00BWT6H894', 'FLTR', 'FLUTTER ENTERTAIN'),
+    ('EUR', 'IE0000669501', 'GL9', 'GLANBIA PLC'),
+    ('EUR', 'IE00BD6JX574', 'GVR', 'GLENVEAGH PROP.PLC'),
+    ('EUR', 'IE00BGHQ1986', 'HBRN', 'HIBERNIA REIT PLC'),
+    ('EUR', 'GB00BYYN4225', 'HSW', 'HOSTELWORLD GROUP'),
+    ('EUR', 'IE00BLP58571', 'IR5B', 'IRISH CONT. GP.'),
+    ('EUR', 'IE00BJ34P519', 'IRES', 'IRISH RES. PROP.'),
+    ('EUR', 'IE00BDC5DG00', 'KMR', 'KENMARE RESOURCES'),
+    ('EUR', 'IE0004906560', 'KRZ', 'KERRY GROUP PLC'),
+    ('EUR', 'IE0004927939', 'KRX', 'KINGSPAN GROUP PLC'),
+    ('EUR', 'IE00BWB8X525', 'IL0A', 'PERM. TSB GP. HOLD'),
+    ('EUR', 'IE00BYTBXV33', 'RY4C', 'RYANAIR HOLD. PLC'),
+    ('EUR', 'IE00B1RR8406', 'SK3', 'SMURFIT KAPPA GP'),
+    ('EUR', 'GB0008847096', 'TCO', 'TESCO PLC'),
+    ('EUR', 'GB0001500809', 'TQW', 'TULLOW OIL PLC'),
+    )
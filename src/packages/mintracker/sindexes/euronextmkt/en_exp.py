@@ -0,0 +1,103 @@
+#-*- coding: utf-8 -*-
+# en_exp.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_EXP = (
+    ('EUR', 'BE0946377455', '-', 'ABATTOIR'),
+    ('EUR', 'BE0010012210', '-', 'ACVLHO'),
+    ('EUR', 'BE0024915838', '-', 'AGENCE MARIT MINNE'),
+    ('EUR', 'BE0941243520', '-', 'ALIAXIS'),
+    ('EUR', 'BE0146350740', '-', 'ALME INVEST'),
+    ('EUR', 'BE0003243426', '-', 'ANS ROCOUR'),
+    ('EUR', 'LU0006047129', '-', 'ARCELOR MITT LUX'),
+    ('EUR', 'LU0006067663', '-', 'ARCELORMITT SCHIFF'),
+    ('EUR', 'BE0945331669', '-', 'ARKIMEDES FONDS'),
+    ('EUR', 'BE0051300847', '-', 'ARMA'),
+    ('EUR', 'CG000A0BKQF7', '-', 'BCDC'),
+    ('EUR', 'BE0046318490', '-', 'BEM INVEST'),
+    ('EUR', 'LU0097891112', '-', 'BGL BNP PARIBAS'),
+    ('EUR', 'BE0032095854', '-', 'BHA'),
+    ('EUR', 'LU0006040975', '-', 'BIL'),
+    ('EUR', 'LU0110790085', '-', 'BIP INV. PARTNERS'),
+    ('EUR', 'BE0172505399', '-', 'BNP PARIBAS FORTIS'),
+    ('EUR', 'BE0156880313', '-', 'BOIS DU LUC'),
+    ('EUR', 'BE0156881329', '-', 'BOIS DU LUC 10E'),
+    ('EUR', 'BE0014799556', '-', 'BOUFFIOULX-St-NICO'),
+    ('EUR', 'NL0012237614', '-', 'CBRE H2O'),
+    ('EUR', 'BE0010381029', '-', 'CHARB BONNIER'),
+    ('EUR', 'BE0003256550', '-', 'CHARB. HASARD'),
+    ('EUR', 'BE0003706208', '-', 'CIBIX'),
+    ('EUR', 'BE0027840017', '-', 'Cie HET ZOUTE'),
+    ('EUR', 'BE0021556221', '-', 'CKV'),
+    ('EUR', 'BE0013068706', '-', 'COMMERCIALE BELGE'),
+    ('EUR', 'NL0000121622', '-', 'CONTINENT. LAND CY'),
+    ('EUR', 'BE0099150162', '-', 'CP 76 PETROFINA'),
+    ('EUR', 'BE0099395676', '-', 'CP 79 PETROFINA'),
+    ('EUR', 'BE0015460372', '-', 'CREDIMO'),
+    ('EUR', 'BE0162868054', '-', 'CREDIMO HOLDING'),
+    ('EUR', 'BE0010566900', '-', 'CS BRUX'),
+    ('EUR', 'BE0974290224', 'DEXB', 'DEXIA'),
+    ('EUR', 'BE0036367895', '-', 'DIERK. ANTWERP.'),
+    ('EUR', 'BE0026342551', '-', 'DIERKUNDE ANTW'),
+    ('EUR', 'BE0003783975', '-', 'ECFC'),
+    ('EUR', 'BE0003849669', 'EMD', 'EMD MUSIC'),
+    ('EUR', 'BE0024644065', '-', 'EMULATION'),
+    ('EUR', 'BE0941244536', '-', 'ETEX'),
+    ('EUR', 'BE0049483135', '-', 'EUPEN FINANZ'),
+    ('EUR', 'BE0011238830', '-', 'FI BELGO-TUNISIENN'),
+    ('EUR', 'BE0945246784', '-', 'FIMMOBEL'),
+    ('EUR', 'BE0012544319', '-', 'FINASUCRE'),
+    ('EUR', 'NSCEX0000018', '-', 'FOYER'),
+    ('EUR', 'BE6303070104', '-', 'GEN BELGE ARGENTIN'),
+    ('EUR', 'BE0011395465', '-', 'GOSSON KESSALES'),
+    ('EUR', 'BE0057677594', '-', 'GROTTES DE HAN/s/L'),
+    ('EUR', 'BE0011606630', '-', 'GROUPE JOSI'),
+    ('EUR', 'BE6264882406', '-', 'IMBAKIN HOLDING'),
+    ('EUR', 'BE0020932779', '-', 'IMMAGRIFOR'),
+    ('EUR', 'BE0011253011', '-', "IMMO FOND'ROY"),
+    ('EUR', 'BE0011254027', '-', "IMMO FOND'ROY -5e"),
+    ('EUR', 'BE0003866838', 'IMMOP', 'IMMOPOOL'),
+    ('EUR', 'BE6265912038', '-', 'INFRABEL'),
+    ('EUR', 'BE0049482129', '-', 'KABELWERK EUPEN'),
+    ('EUR', 'LU0092281103', '-', 'KBL EPB - ORD'),
+    ('EUR', 'LU0092281442', '-', 'KBL EPB - PRIV'),
+    ('EUR', 'NL0000009645', '-', 'KLM'),
+    ('EUR', 'BE0011844108', '-', 'MAURAGE'),
+    ('EUR', 'BE0010342609', '-', 'MBZ (Gen-Jce)'),
+    ('EUR', 'BE0101614551', '-', 'MECHELEN'),
+    ('EUR', 'BE0003222214', '-', 'MESSER BELGIUM'),
+    ('EUR', 'BE0038785821', '-', 'METALEN GALLER'),
+    ('EUR', 'BE0010610377', '-', 'MICS PARTNERS'),
+    ('EUR', 'BE0035966762', '-', 'NMC'),
+    ('EUR', 'BE0034169251', '-', 'OLD ENGLAND'),
+    ('EUR', 'BE0003704187', '-', 'OPPIDUM'),
+    ('EUR', 'BE0942448938', '-', 'OPTIMCO'),
+    ('EUR', 'BE0003860773', 'ICE', 'OZ GROUP'),
+    ('EUR', 'BE0157892739', '-', 'PANTECH'),
+    ('EUR', 'BE0003640514', '-', 'PB FINANCE'),
+    ('EUR', 'BE0126745638', '-', 'PELTZER'),
+    ('EUR', 'BE6321065607', '-', 'PHIMA'),
+    ('EUR', 'NL0000288652', '-', 'RODAMCO'),
+    ('EUR', 'BE0003660710', '-', 'ROTON'),
+    ('EUR', 'BE0944264663', '-', 'SCR-SIBELCO'),
+    ('EUR', 'BE0016250517', '-', 'SIMINANS'),
+    ('EUR', 'BE0010621481', '-', 'SNCB/NMBS -Jce/Gen'),
+    ('EUR', 'QX0000022625', '-', 'SOCLINPAR'),
+    ('EUR', 'BE0099887748', '-', 'SOLVAY (CP 41)'),
+    ('EUR', 'BE0003279784', '-', 'ST GOBAIN IMB'),
+    ('EUR', 'BE0014199377', '-', 'ST-PIETERS-LEEUW'),
+    ('EUR', 'BE0010026350', '-', 'SUCRAF (ben/win)'),
+    ('EUR', 'BE0003527356', '-', 'SURONGO'),
+    ('EUR', 'BE6321066613', '-', 'T.PALM INTERN. LUX'),
+    ('EUR', 'BE0003886067', 'TET', 'TETRYS'),
+    ('EUR', 'BE0036061746', '-', 'TISSAGES BRUGGEMAN'),
+    ('EUR', 'BE0024981525', '-', 'TPF CONTRACTING'),
+    ('EUR', 'BE0099967573', 'TUBAT', 'TUBIZE (ATTR)'),
+    ('EUR', 'BE0017609521', '-', 'UTEXBEL'),
+    ('EUR', 'BE0022780820', '-', 'VDK BANK'),
+    ('EUR', 'BE0947790037', '-', 'VOLKSVERMOGEN'),
+    ('EUR', 'BE0020918638', '-', 'VOORUITZICHT'),
+    ('EUR', 'BE0107958945', '-', 'WEYVELD NOSSEGEM'),
+    )
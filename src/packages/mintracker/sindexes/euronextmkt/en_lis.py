@@ -0,0 +1,47 @@
+#-*- coding: utf-8 -*-
+# en_lis.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_LIS = (
+    ('EUR', 'PTALT0AE0002', 'ALTR', 'ALTRI SGPS'),
+    ('EUR', 'PTBCP0AM0015', 'BCP', 'B.COM.PORTUGUES'),
+    ('EUR', 'PTSLB0AM0010', 'SLBEN', 'BENFICA'),
+    ('EUR', 'PTCFN0AE0003', 'CFN', 'COFINA,SGPS'),
+    ('EUR', 'PTCOR0AE0006', 'COR', 'CORTICEIRA AMORIM'),
+    ('EUR', 'PTCTT0AM0001', 'CTT', 'CTT CORREIOS PORT'),
+    ('EUR', 'PTEDP0AM0009', 'EDP', 'EDP'),
+    ('EUR', 'ES0127797019', 'EDPR', 'EDP RENOVAVEIS'),
+    ('EUR', 'PTESO0AM0000', 'ESON', 'ESTORIL SOL N'),
+    ('EUR', 'PTFXD0AM0018', 'FLEXD', 'FLEXDEAL'),
+    ('EUR', 'PTFCP0AM0008', 'FCP', 'FUT.CLUBE PORTO'),
+    ('EUR', 'PTGAL0AM0009', 'GALP', 'GALP ENERGIA-NOM'),
+    ('EUR', 'PTPAD0AM0007', 'GLINT', 'GLINTT'),
+    ('EUR', 'PTIBS0AM0008', 'IBS', 'IBERSOL,SGPS'),
+    ('EUR', 'PTGPA0AP0007', 'GPA', 'IMOB.C GRAO PARA'),
+    ('EUR', 'PTIPR0AM0000', 'IPR', 'IMPRESA,SGPS'),
+    ('EUR', 'PTINA0AP0008', 'INA', 'INAPA-INV.P.GESTAO'),
+    ('EUR', 'PTJMT0AE0001', 'JMT', 'J.MARTINS,SGPS'),
+    ('EUR', 'PTLIG0AE0002', 'LIG', 'LISGRAFICA'),
+    ('EUR', 'PTMFR0AM0003', 'MAR', 'MARTIFER'),
+    ('EUR', 'PTGMC0AM0003', 'MCP', 'MEDIA CAPITAL'),
+    ('EUR', 'ES0105025003', 'MRL', 'MERLIN PROPERTIES'),
+    ('EUR', 'PTMEN0AE0005', 'EGL', 'MOTA ENGIL'),
+    ('EUR', 'PTZON0AM0006', 'NOS', 'NOS, SGPS'),
+    ('EUR', 'PTNBA0AM0006', 'NBA', 'NOVABASE,SGPS'),
+    ('EUR', 'PTORE0AM0002', 'ORE', 'OREY ANTUNES ESC.'),
+    ('EUR', 'PTPTC0AM0009', 'PHR', 'PHAROL'),
+    ('EUR', 'PTFRV0AE0004', 'RAM', 'RAMADA'),
+    ('EUR', 'PTRED0AP0010', 'RED', 'REDITUS,SGPS'),
+    ('EUR', 'PTREL0AM0008', 'RENE', 'REN'),
+    ('EUR', 'PTSEM0AM0004', 'SEM', 'SEMAPA'),
+    ('EUR', 'PTSON0AM0001', 'SON', 'SONAE'),
+    ('EUR', 'PTS3P0AM0025', 'SONI', 'SONAE IND.SGPS'),
+    ('EUR', 'PTSNC0AM0006', 'SNC', 'SONAECOM,SGPS'),
+    ('EUR', 'PTSCP0AM0001', 'SCP', 'SPORTING'),
+    ('EUR', 'PTTD10AM0000', 'TDSA', 'TEIXEIRA DUARTE'),
+    ('EUR', 'PTPTI0AM0006', 'NVG', 'THE NAVIGATOR COMP'),
+    ('EUR', 'PTSCT0AP0018', 'SCT', 'TOYOTA CAETANO'),
+    ('EUR', 'PTVAA0AM0019', 'VAF', 'VAA VISTA ALEGRE'),
+    )
@@ -0,0 +1,10 @@
+#-*- coding: utf-8 -*-
+# en_pa.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_PA = (
+    ('EUR', 'FR0012821890', 'ADUX', 'ADUX'),
+    ('EUR', 'FR0000031122', 'AF', 'AIR FRANCE -KLM'),
+    )
@@ -0,0 +1,10 @@
+#-*- coding: utf-8 -*-
+# en_pab.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_PAB = (
+    ('EUR', 'NL0006294274', 'ENX', 'EURONEXT'),
+    ('EUR', 'FR0000125007', 'SGO', 'SAINT GOBAIN'),
+    )
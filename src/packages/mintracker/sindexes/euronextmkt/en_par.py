@@ -0,0 +1,456 @@
+#-*- coding: utf-8 -*-
+# en_par.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_PAR = (
+    ('EUR', 'FR0013341781', '2CRSI', '2CRSI'),
+    ('EUR', 'FR0014000T90', '2MX', '2MX ORGANIC'),
+    ('EUR', 'FR0014000TB2', '2MXBS', '2MX ORGANIC BS'),
+    ('EUR', 'FR0000076887', 'ASP', 'A.S.T. GROUPE'),
+    ('EUR', 'FR0010557264', 'AB', 'AB SCIENCE'),
+    ('EUR', 'FR0004040608', 'ABCA', 'ABC ARBITRAGE'),
+    ('EUR', 'FR0013185857', 'ABEO', 'ABEO'),
+    ('EUR', 'FR0012616852', 'ABNX', 'ABIONYX PHARMA'),
+    ('EUR', 'FR0012333284', 'ABVX', 'ABIVAX'),
+    ('EUR', 'FR0000064602', 'ACAN', 'ACANTHE DEV.'),
+    ('EUR', 'FR0000120404', 'AC', 'ACCOR'),
+    ('EUR', 'FR0000076861', 'EOS', 'ACTEOS'),
+    ('EUR', 'FR0000076655', 'ATI', 'ACTIA GROUP'),
+    ('EUR', 'BE0974269012', 'ALDV', 'ADC SIIC'),
+    ('EUR', 'FR0000062978', 'ALP', 'ADL PARTNER'),
+    ('EUR', 'FR0011184241', 'ADOC', 'ADOCIA'),
+    ('EUR', 'FR0010340141', 'ADP', 'ADP'),
+    ('EUR', 'FR0004152874', 'ADV', 'ADVENIS'),
+    ('EUR', 'FR0000053043', 'ADVI', 'ADVINI'),
+    ('EUR', 'US00774B2088', 'AKOM', 'AERKOMM INC'),
+    ('EUR', 'FR0000120073', 'AI', 'AIR LIQUIDE'),
+    ('EUR', 'NL0000235190', 'AIR', 'AIRBUS'),
+    ('EUR', 'FR0000053027', 'AKW', 'AKWEL'),
+    ('EUR', 'FR0000060402', 'ABIO', 'ALBIOMA'),
+    ('EUR', 'FR0013258662', 'ALD', 'ALD'),
+    ('EUR', 'FR0000053324', 'CDA', 'ALPES (COMPAGNIE)'),
+    ('EUR', 'FR0013421286', 'ALM', 'ALPHA MOS'),
+    ('EUR', 'FR0010220475', 'ALO', 'ALSTOM'),
+    ('EUR', 'FR0000053837', 'LTA', 'ALTAMIR'),
+    ('EUR', 'FR0000033219', 'ALTA', 'ALTAREA'),
+    ('EUR', 'FR0000039216', 'AREIT', 'ALTAREIT'),
+    ('EUR', 'FR0000071946', 'ATE', 'ALTEN'),
+    ('EUR', 'FR0010395681', 'ALTUR', 'ALTUR INVEST.'),
+    ('EUR', 'FR0012789667', 'AMPLI', 'AMPLITUDE SURGICAL'),
+    ('EUR', 'FR0004125920', 'AMUN', 'AMUNDI'),
+    ('EUR', 'KYG6096M1069', 'APM', 'APTORUM GROUP CL A'),
+    ('EUR', 'FR0010481960', 'ARG', 'ARGAN'),
+    ('EUR', 'FR0010313833', 'AKE', 'ARKEMA'),
+    ('EUR', 'FR0012185536', 'ARTE', 'ARTEA'),
+    ('EUR', 'FR0000074783', 'PRC', 'ARTMARKET COM'),
+    ('EUR', 'FR0000076952', 'ARTO', 'ARTOIS NOM.'),
+    ('EUR', 'FR0000074148', 'ASY', 'ASSYSTEM'),
+    ('EUR', 'FR0010478248', 'ATA', 'ATARI'),
+    ('EUR', 'FR0011992700', 'ATEME', 'ATEME'),
+    ('EUR', 'FR0000051732', 'ATO', 'ATOS'),
+    ('EUR', 'FR0000063737', 'AUB', 'AUBAY'),
+    ('EUR', 'FR0000061780', 'AUGR', 'AUGROS COSMETICS'),
+    ('EUR', 'FR0000039232', 'AURE', 'AUREA'),
+    ('EUR', 'FR0013183589', 'AURS', 'AURES TECHNOLOGIES'),
+    ('EUR', 'FR0013529815', 'AVT', 'AVENIR TELECOM'),
+    ('EUR', 'FR0000120628', 'CS', 'AXA'),
+    ('EUR', 'FR0011040500', 'AXW', 'AXWAY SOFTWARE'),
+    ('EUR', 'FR0000064123', 'BCRA', 'BACCARAT'),
+    ('EUR', 'MC0000031187', 'BAIN', 'BAINS MER MONACO'),
+    ('EUR', 'FR0013258399', 'BALYO', 'BALYO'),
+    ('EUR', 'FR0000062788', 'BUI', 'BARBARA BUI'),
+    ('EUR', 'FR0004023208', 'BASS', 'BASSAC'),
+    ('EUR', 'FR0000035370', 'BLC', 'BASTIDE LE CONFORT'),
+    ('EUR', 'FR0000121857', 'FBEL', 'BEL'),
+    ('EUR', 'FR0000035164', 'BEN', 'BENETEAU'),
+    ('EUR', 'FR0000120966', 'BB', 'BIC'),
+    ('EUR', 'FR0000074072', 'BIG', 'BIGBEN INTERACTIVE'),
+    ('EUR', 'FR0013280286', 'BIM', 'BIOMERIEUX'),
+    ('EUR', 'FR0000062150', 'BLEE', 'BLEECKER'),
+    ('EUR', 'FR0000131104', 'BNP', 'BNP PARIBAS ACT.A'),
+    ('EUR', 'FR0000061129', 'BOI', 'BOIRON'),
+    ('EUR', 'FR0000039299', 'BOL', 'BOLLORE'),
+    ('EUR', 'FR0000063935', 'BON', 'BONDUELLE'),
+    ('EUR', 'FR0011814938', 'BOOST', 'BOOSTHEAT'),
+    ('EUR', 'FR0000074254', 'BSD', 'BOURSE DIRECT'),
+    ('EUR', 'FR0000120503', 'EN', 'BOUYGUES'),
+    ('EUR', 'FR0006174348', 'BVI', 'BUREAU VERITAS'),
+    ('EUR', 'FR0000061137', 'BUR', 'BURELLE'),
+    ('EUR', 'FR0000045544', 'CAT31', 'CA TOULOUSE 31 CCI'),
+    ('EUR', 'FR0010151589', 'CAFO', 'CAFOM'),
+    ('EUR', 'FR0000079659', 'CBDG', 'CAMBODGE NOM.'),
+    ('EUR', 'FR0012969095', 'CAPLI', 'CAPELLI'),
+    ('EUR', 'FR0000125338', 'CAP', 'CAPGEMINI'),
+    ('EUR', 'FR0010828137', 'CARM', 'CARMILA'),
+    ('EUR', 'FR0000064156', 'CARP', 'CARPINIENNE PART.'),
+    ('EUR', 'FR0000120172', 'CA', 'CARREFOUR'),
+    ('EUR', 'FR0000125585', 'CO', 'CASINO GUICHARD'),
+    ('EUR', 'FR0000072894', 'CAS', 'CAST'),
+    ('EUR', 'FR0010193052', 'CATG', 'CATANA GROUP'),
+    ('EUR', 'FR0000064446', 'CTRG', 'CATERING INTL SCES'),
+    ('EUR', 'US1491231015', 'CATR', 'CATERPILLAR INC'),
+    ('EUR', 'FR0010193979', 'CBOT', 'CBO TERRITORIA'),
+    ('EUR', 'FR0000053506', 'CGM', 'CEGEDIM'),
+    ('EUR', 'FR0010309096', 'CGR', 'CEGEREAL'),
+    ('EUR', 'FR0000037475', 'CFI', 'CFI'),
+    ('EUR', 'FR0013181864', 'CGG', 'CGG'),
+    ('EUR', 'FR0013309614', 'CGGBS', 'CGG BSA 1'),
+    ('EUR', 'FR0013309622', 'CGGBT', 'CGG BSA 2'),
+    ('EUR', 'FR0000130692', 'CRI', 'CHARGEURS'),
+    ('EUR', 'FR0000060907', 'CHSR', 'CHAUSSERIA'),
+    ('EUR', 'FR0000130403', 'CDI', 'CHRISTIAN DIOR'),
+    ('EUR', 'FR0000054322', 'CIB', 'CIBOX INTER A CTIV'),
+    ('EUR', 'FR0013426004', 'CLA', 'CLARANOVA'),
+    ('EUR', 'FR0000053399', 'COM', 'CNIM GROUP'),
+    ('EUR', 'NL0010949392', 'CNV', 'CNOVA'),
+    ('EUR', 'FR0000120222', 'CNP', 'CNP ASSURANCES'),
+    ('EUR', 'FR0010667147', 'COFA', 'COFACE'),
+    ('EUR', 'FR0004031763', 'COH', 'COHERIS'),
+    ('EUR', 'FR0000121634', 'RE', 'COLAS'),
+    ('EUR', 'FR0000065393', 'COUR', 'COURTOIS'),
+    ('EUR', 'FR0000064578', 'COV', 'COVIVIO'),
+    ('EUR', 'FR0000060303', 'COVH', 'COVIVIO HOTELS'),
+    ('EUR', 'FR0000044323', 'CRAP', 'CRCAM ALP.PROV.CCI'),
+    ('EUR', 'FR0000185506', 'CRAV', 'CRCAM ATL.VEND.CCI'),
+    ('EUR', 'FR0010483768', 'CRBP2', 'CRCAM BRIE PIC2CCI'),
+    ('EUR', 'FR0000045213', 'CIV', 'CRCAM ILLE-VIL.CCI'),
+    ('EUR', 'FR0010461053', 'CRLA', 'CRCAM LANGUED CCI'),
+    ('EUR', 'FR0000045239', 'CRLO', 'CRCAM LOIRE HTE L.'),
+    ('EUR', 'FR0000045551', 'CMO', 'CRCAM MORBIHAN CCI'),
+    ('EUR', 'FR0000185514', 'CNF', 'CRCAM NORD CCI'),
+    ('EUR', 'FR0000044364', 'CCN', 'CRCAM NORM.SEINE'),
+    ('EUR', 'FR0000045528', 'CAF', 'CRCAM PARIS ET IDF'),
+    ('EUR', 'FR0000045346', 'CRSU', 'CRCAM SUD R.A.CCI'),
+    ('EUR', 'FR0000045304', 'CRTO', 'CRCAM TOURAINE CCI'),
+    ('EUR', 'FR0000045072', 'ACA', 'CREDIT AGRICOLE'),
+    ('EUR', 'FR0000050395', 'CROS', 'CROSSWOOD'),
+    ('EUR', 'FR0007317813', 'SX', 'CS GROUP.'),
+    ('EUR', 'FR0011026749', 'DLT', 'DALET'),
+    ('EUR', 'FR0000120644', 'BN', 'DANONE'),
+    ('EUR', 'FR0000121725', 'AM', 'DASSAULT AVIATION'),
+    ('EUR', 'FR0000130650', 'DSY', 'DASSAULT SYSTEMES'),
+    ('EUR', 'FR0010417345', 'DBV', 'DBV TECHNOLOGIES'),
+    ('EUR', 'FR0013283108', 'DLTA', 'DELTA PLUS GROUP'),
+    ('EUR', 'FR0000053381', 'DBG', 'DERICHEBOURG'),
+    ('EUR', 'FR0000073793', 'DVT', 'DEVOTEAM'),
+    ('EUR', 'GB0002374006', 'DGE', 'DIAGEO'),
+    ('EUR', 'FR0012202497', 'DGM', 'DIAGNOSTIC MEDICAL'),
+    ('EUR', 'FR0000065260', 'DPAM', 'DOCK.PETR.AMBES AM'),
+    ('EUR', 'FR0010099515', 'ECASA', 'ECA'),
+    ('EUR', 'FR0010908533', 'EDEN', 'EDENRED'),
+    ('EUR', 'FR0010242511', 'EDF', 'EDF'),
+    ('EUR', 'FR0000072373', 'GID', 'EGIDE'),
+    ('EUR', 'FR0000130452', 'FGR', 'EIFFAGE'),
+    ('EUR', 'FR0011466069', 'EKI', 'EKINOPS'),
+    ('EUR', 'FR0000031023', 'ELEC', 'ELEC.STRASBOURG'),
+    ('EUR', 'FR0000035719', 'EEM', 'ELECT. MADAGASCAR'),
+    ('EUR', 'FR0011950732', 'ELIOR', 'ELIOR GROUP'),
+    ('EUR', 'FR0012435121', 'ELIS', 'ELIS'),
+    ('EUR', 'FR0012650166', 'EPS', 'ENGIE EPS'),
+    ('EUR', 'FR0011191766', 'EOSI', 'EOS IMAGING'),
+    ('EUR', 'FR0000131757', 'ERA', 'ERAMET'),
+    ('EUR', 'FR0011471135', 'ERYP', 'ERYTECH PHARMA'),
+    ('EUR', 'FR0004110310', 'ESI', 'ESI GROUP'),
+    ('EUR', 'FR0000121667', 'EL', 'ESSILORLUXOTTICA'),
+    ('EUR', 'FR0000120669', 'ES', 'ESSO'),
+    ('EUR', 'FR0000061475', 'EFI', 'EURASIA FONC INV'),
+    ('EUR', 'FR0000121121', 'RF', 'EURAZEO'),
+    ('EUR', 'FR0000054678', 'EUR', 'EURO RESSOURCES'),
+    ('EUR', 'FR0014000MR3', 'ERF', 'EUROFINS SCIENT.'),
+    ('EUR', 'FR0010490920', 'ECP', 'EUROPACORP'),
+    ('EUR', 'FR0012789949', 'EUCAR', 'EUROPCAR MOBILITY'),
+    ('EUR', 'FR0010221234', 'ETL', 'EUTELSAT COMMUNIC.'),
+    ('EUR', 'FR0000035784', 'EGR', 'EVERGREEN'),
+    ('EUR', 'FR0000064164', 'EXAC', 'EXACOMPTA CLAIREF.'),
+    ('EUR', 'FR0004527638', 'EXE', 'EXEL INDUSTRIES'),
+    ('EUR', 'FR0000037343', 'EPCP', 'EXPLOS.PROD.CHI.PF'),
+    ('EUR', 'FR0000039026', 'EXPL', 'EXPLOSIFS PROD.CHI'),
+    ('EUR', 'FR0000121147', 'EO', 'FAURECIA'),
+    ('EUR', 'FR0000063034', 'FAUV', 'FAUVET GIREL'),
+    ('EUR', 'FR0000031973', 'FAYE', 'FAYENC.SARREGUEMI.'),
+    ('EUR', 'FR0013451333', 'FDJ', 'FDJ'),
+    ('EUR', 'FR0000062101', 'FCMC', 'FERM.CAS.MUN.CANNE'),
+    ('EUR', 'FR0011271600', 'FALG', 'FERMENTALG'),
+    ('EUR', 'FR0000064784', 'FFP', 'FFP'),
+    ('EUR', 'FR0000061418', 'SACI', 'FIDUCIAL OFF.SOL.'),
+    ('EUR', 'FR0000060535', 'ORIA', 'FIDUCIAL REAL EST.'),
+    ('EUR', 'FR0011665280', 'FGA', 'FIGEAC AERO'),
+    ('EUR', 'FR0000062341', 'BERR', 'FIN.ETANG BERRE'),
+    ('EUR', 'FR0000062507', 'EBPF', 'FIN.ETANG BERRE PF'),
+    ('EUR', 'SN0000033192', 'FOAF', 'FIN.OUEST AFRICAIN'),
+    ('EUR', 'FR0000060824', 'FINM', 'FINANCIERE MARJOS'),
+    ('EUR', 'FR0000062234', 'ODET', 'FINANCIERE ODET'),
+    ('EUR', 'FR0000035123', 'FNTS', 'FINATIS'),
+    ('EUR', 'FR0000038184', 'FIPP', 'FIPP'),
+    ('EUR', 'FR0011476928', 'FNAC', 'FNAC DARTY'),
+    ('EUR', 'FR0011277391', 'FPN', 'FONC. PARIS NORD'),
+    ('EUR', 'FR0000065930', 'LEBL', 'FONCIERE 7 INVEST'),
+    ('EUR', 'FR0013455482', 'FATL', 'FONCIERE ATLAND'),
+    ('EUR', 'FR0000038499', 'EURS', 'FONCIERE EURIS'),
+    ('EUR', 'FR0010341032', 'INEA', 'FONCIERE INEA'),
+    ('EUR', 'FR0000033409', 'FLY', 'FONCIERE LYONNAISE'),
+    ('EUR', 'FR0000053944', 'SPEL', 'FONCIERE VOLTA'),
+    ('EUR', 'CI0000053161', 'FORE', 'FORESTIERE EQUAT.'),
+    ('EUR', 'FR0013030152', 'LFDE', 'FRANCAISE ENERGIE'),
+    ('EUR', 'FR0010588079', 'FREY', 'FREY'),
+    ('EUR', 'FR0000030611', 'GALIM', 'GALIMMO'),
+    ('EUR', 'FR0000034894', 'GAM', 'GAUMONT'),
+    ('EUR', 'FR0000053035', 'GEA', 'GEA GRENOBL.ELECT.'),
+    ('EUR', 'FR0000079634', 'GECP', 'GECI INTL'),
+    ('EUR', 'FR0013266764', 'GECBT', 'GECI INTL BSAR A'),
+    ('EUR', 'FR0010040865', 'GFC', 'GECINA'),
+    ('EUR', 'US3696041033', 'GNE', 'GENERAL ELECTRIC'),
+    ('EUR', 'FR0010501692', 'GENX', 'GENERIX GROUP'),
+    ('EUR', 'CH0308403085', 'GNRO', 'GENEURO'),
+    ('EUR', 'FR0004163111', 'GNFT', 'GENFIT'),
+    ('EUR', 'FR0011799907', 'GV', 'GENOMIC VISION'),
+    ('EUR', 'FR0013183985', 'SIGHT', 'GENSIGHT BIOLOGICS'),
+    ('EUR', 'FR0010533075', 'GET', 'GETLINK SE'),
+    ('EUR', 'FR0000066672', 'GLO', 'GL EVENTS'),
+    ('EUR', 'FR0010214064', 'GPE', 'GPE GROUP PIZZORNO'),
+    ('EUR', 'FR0000065971', 'GRVO', 'GRAINES VOLTZ'),
+    ('EUR', 'FR0000036675', 'CEN', 'GROUPE CRIT'),
+    ('EUR', 'FR0004076891', 'FLO', 'GROUPE FLO'),
+    ('EUR', 'FR0000062671', 'GOE', 'GROUPE GORGE'),
+    ('EUR', 'FR0000124232', 'IRD', 'GROUPE IRD'),
+    ('EUR', 'FR0004010338', 'GJAJ', 'GROUPE JAJ'),
+    ('EUR', 'FR0004050300', 'OPN', 'GROUPE OPEN'),
+    ('EUR', 'FR0012612646', 'PARP', 'GROUPE PARTOUCHE'),
+    ('EUR', 'FR0004155000', 'SFPI', 'GROUPE SFPI'),
+    ('EUR', 'US36254L1008', 'GTBP', 'GT BIOPHARMA INC'),
+    ('EUR', 'FR0011726835', 'GTT', 'GTT'),
+    ('EUR', 'FR0000032526', 'GBT', 'GUERBET'),
+    ('EUR', 'FR0000066722', 'GUI', 'GUILLEMOT'),
+    ('EUR', 'FR0000066755', 'PIG', 'HAULOTTE GROUP'),
+    ('EUR', 'FR0000052292', 'RMS', 'HERMES INTL'),
+    ('EUR', 'FR0004159473', 'HEXA', 'HEXAOM'),
+    ('EUR', 'FR0000038531', 'HF', 'HF'),
+    ('EUR', 'FR0000054231', 'HCO', 'HIGH CO'),
+    ('EUR', 'FR0012821916', 'HIPAY', 'HIPAY GROUP'),
+    ('EUR', 'FR0000065278', 'HOP', 'HOPSCOTCH GROUPE'),
+    ('EUR', 'FR0004165801', 'HDP', 'HOTELS DE PARIS'),
+    ('EUR', 'FR0000035081', 'ICAD', 'ICADE'),
+    ('EUR', 'FR0010929125', 'IDL', 'ID LOGISTICS GROUP'),
+    ('EUR', 'FR0000051393', 'IDIP', 'IDI'),
+    ('EUR', 'FR0000030827', 'IGE', 'IGE + XAO'),
+    ('EUR', 'FR0004035913', 'ILD', 'ILIAD'),
+    ('EUR', 'FR0000120859', 'NK', 'IMERYS'),
+    ('EUR', 'FR0000033243', 'IMDA', 'IMMOB.DASSAULT'),
+    ('EUR', 'FR0000066219', 'INFE', 'INDLE FIN.ENTREPR.'),
+    ('EUR', 'FR0000071797', 'INF', 'INFOTEL'),
+    ('EUR', 'FR0010331421', 'IPH', 'INNATE PHARMA'),
+    ('EUR', 'FR0000064297', 'INN', 'INNELEC MULTIMEDIA'),
+    ('EUR', 'FR0004024222', 'ITP', 'INTERPARFUMS'),
+    ('EUR', 'FR0000064958', 'ITXT', 'INTEXA'),
+    ('EUR', 'FR0013233012', 'IVA', 'INVENTIVA'),
+    ('EUR', 'FR0010259150', 'IPN', 'IPSEN'),
+    ('EUR', 'FR0000073298', 'IPS', 'IPSOS'),
+    ('EUR', 'FR0004026151', 'ITE', 'ITESOFT'),
+    ('EUR', 'FR0012872141', 'JBOG', 'JACQUES BOGART'),
+    ('EUR', 'FR0000033904', 'JCQ', 'JACQUET METALS'),
+    ('EUR', 'FR0000077919', 'DEC', 'JC DECAUX SA.'),
+    ('EUR', 'FR0004007813', 'KOF', 'KAUFMAN ET BROAD'),
+    ('EUR', 'FR0000121485', 'KER', 'KERING'),
+    ('EUR', 'FR0004029411', 'KEY', 'KEYRUS'),
+    ('EUR', 'FR0000121964', 'LI', 'KLEPIERRE'),
+    ('EUR', 'FR0010386334', 'KORI', 'KORIAN'),
+    ('EUR', 'FR0000120321', 'OR', "L''OREAL"),
+    ('EUR', 'FR0000039638', 'LFVE', 'LA FONCIERE VERTE'),
+    ('EUR', 'FR0000066607', 'LACR', 'LACROIX SA'),
+    ('EUR', 'CH0012214059', 'LHN', 'LAFARGEHOLCIM LTD'),
+    ('EUR', 'FR0000130213', 'MMB', 'LAGARDERE S.C.A.'),
+    ('EUR', 'FR0000032278', 'LAT', 'LATECOERE'),
+    ('EUR', 'FR0006864484', 'LPE', 'LAURENT-PERRIER'),
+    ('EUR', 'FR0013204336', 'LOUP', 'LDC'),
+    ('EUR', 'FR0000121295', 'LBON', 'LEBON'),
+    ('EUR', 'FR0000065484', 'LSS', 'LECTRA'),
+    ('EUR', 'FR0010307819', 'LR', 'LEGRAND'),
+    ('EUR', 'FR0004156297', 'LIN', 'LINEDATA SERVICES'),
+    ('EUR', 'FR0000050353', 'FII', 'LISI'),
+    ('EUR', 'FR0004170017', 'LNA', 'LNA SANTE'),
+    ('EUR', 'FR0000038242', 'LBIRD', 'LUMIBIRD'),
+    ('EUR', 'FR0000121014', 'MC', 'LVMH'),
+    ('EUR', 'FR0013233475', 'LYS', 'LYSOGENE'),
+    ('EUR', 'FR0000060196', 'MRM', 'M.R.M'),
+    ('EUR', 'FR0013153541', 'MDM', 'MAISONS DU MONDE'),
+    ('EUR', 'FR0000030074', 'MALT', 'MALTERIES FCO-BEL.'),
+    ('EUR', 'FR0000038606', 'MTU', 'MANITOU BF'),
+    ('EUR', 'FR0000032302', 'MAN', 'MANUTAN INTL'),
+    ('EUR', 'MA0000011488', 'IAM', 'MAROC TELECOM'),
+    ('EUR', 'FR0010609263', 'MKEA', 'MAUNA KEA TECH'),
+    ('EUR', 'FR0000051070', 'MAU', 'MAUREL ET PROM'),
+    ('EUR', 'FR0000060873', 'MBWS', 'MBWS'),
+    ('EUR', 'FR0013404944', 'MBWBT', 'MBWS BSA 2022'),
+    ('EUR', 'FR0013066313', 'MBWSZ', 'MBWS BSAR 2023'),
+    ('EUR', 'FR0011742329', 'MCPHY', 'MCPHY ENERGY'),
+    ('EUR', 'FR0000064404', 'EDI', 'MEDIA 6'),
+    ('EUR', 'FR0004065605', 'MEDCL', 'MEDINCELL'),
+    ('EUR', 'FR0010298620', 'MEMS', 'MEMSCAP REGPT'),
+    ('EUR', 'FR0010241638', 'MERY', 'MERCIALYS'),
+    ('EUR', 'US58933Y1055', 'MRK', 'MERCK AND CO INC'),
+    ('EUR', 'FR0000039620', 'MRN', 'MERSEN'),
+    ('EUR', 'FR0004177046', 'METEX', 'METABOLIC EXPLORER'),
+    ('EUR', 'FR0000053225', 'MMT', 'METROPOLE TV'),
+    ('EUR', 'FR0000121261', 'ML', 'MICHELIN'),
+    ('EUR', 'FR0000077570', 'MUN', 'MICROPOLE'),
+    ('EUR', 'FR0000076986', 'MONC', 'MONCEY (FIN.) NOM.'),
+    ('EUR', 'FR0000037970', 'GREV', 'MUSEE GREVIN'),
+    ('EUR', 'FR0013482791', 'NACON', 'NACON'),
+    ('EUR', 'FR0011341205', 'NANO', 'NANOBIOTIX'),
+    ('EUR', 'FR0000120685', 'KN', 'NATIXIS'),
+    ('EUR', 'FR0013018041', 'NAVYA', 'NAVYA'),
+    ('EUR', 'FR0011675362', 'NEOEN', 'NEOEN'),
+    ('EUR', 'FR0004154060', 'NTG', 'NETGEM'),
+    ('EUR', 'FR0004050250', 'NRO', 'NEURONES'),
+    ('EUR', 'FR0000044448', 'NEX', 'NEXANS'),
+    ('EUR', 'FR0010112524', 'NXI', 'NEXITY'),
+    ('EUR', 'FR0012789386', 'NEXTS', 'NEXTSTAGE'),
+    ('EUR', 'FR0013018124', 'COX', 'NICOX'),
+    ('EUR', 'FI0009000681', 'NOKIA', 'NOKIA'),
+    ('EUR', 'FR0004166155', 'NR21', 'NR21'),
+    ('EUR', 'FR0014000VN3', 'N21DS', 'NR21 DS'),
+    ('EUR', 'FR0000121691', 'NRG', 'NRJ GROUP'),
+    ('EUR', 'FR0000052680', 'SBT', 'OENEO'),
+    ('EUR', 'FR0010428771', 'OLG', 'OL GROUPE'),
+    ('EUR', 'FR0000133308', 'ORA', 'ORANGE'),
+    ('EUR', 'FR0000075392', 'ORAP', 'ORAPI'),
+    ('EUR', 'FR0013522216', 'ORAPB', 'ORAPI BSA'),
+    ('EUR', 'FR0013190410', 'KAZI', 'ORCHESTRA-PREMAMAN'),
+    ('EUR', 'FR0010609206', 'OREGE', 'OREGE'),
+    ('EUR', 'FR0000184798', 'ORP', 'ORPEA'),
+    ('EUR', 'FR0012127173', 'OSE', 'OSE IMMUNO'),
+    ('EUR', 'FR0013318813', 'PID', 'PARAGON ID'),
+    ('EUR', 'FR0010263202', 'PAR', 'PAREF'),
+    ('EUR', 'FR0004038263', 'PARRO', 'PARROT'),
+    ('EUR', 'FR0013054269', 'PABSA', 'PARROT BSA 1'),
+    ('EUR', 'FR0013054335', 'PABSB', 'PARROT BSA 2'),
+    ('EUR', 'FR0000038465', 'PSAT', 'PASSAT'),
+    ('EUR', 'FR0011027135', 'PAT', 'PATRIMOINE ET COMM'),
+    ('EUR', 'FR0000053514', 'PCA', 'PCAS'),
+    ('EUR', 'FR0000120693', 'RI', 'PERNOD RICARD'),
+    ('EUR', 'FR0000061459', 'PERR', 'PERRIER (GERARD)'),
+    ('EUR', 'FR0000121501', 'UG', 'PEUGEOT'),
+    ('EUR', 'FR0012882389', 'PHA', 'PHARMAGEST INTER.'),
+    ('EUR', 'FR0000073041', 'VAC', 'PIERRE VACANCES'),
+    ('EUR', 'FR0013252186', 'PVL', 'PLAST.VAL LOIRE'),
+    ('EUR', 'FR0000124570', 'POM', 'PLASTIC OMNIUM'),
+    ('EUR', 'FR0012432516', 'POXEL', 'POXEL'),
+    ('EUR', 'FR0000060832', 'PREC', 'PRECIA'),
+    ('EUR', 'FR0004052561', 'PROAC', 'PROACTIS SA'),
+    ('EUR', 'FR0012613610', 'PWG', 'PRODWAYS'),
+    ('EUR', 'FR0010380626', 'PROL', 'PROLOGUE'),
+    ('EUR', 'FR0011994326', 'PRBS2', 'PROLOGUE BSAA2021'),
+    ('EUR', 'FR0000060329', 'PSB', 'PSB INDUSTRIES'),
+    ('EUR', 'FR0000312928', 'PUBBS', 'PUBLICIS BSA'),
+    ('EUR', 'FR0000130577', 'PUB', 'PUBLICIS GROUPE SA'),
+    ('EUR', 'FR0000120560', 'QDT', 'QUADIENT'),
+    ('EUR', 'FR0000060618', 'RAL', 'RALLYE'),
+    ('EUR', 'FR0000044471', 'GDS', 'RAMSAY GEN SANTE'),
+    ('EUR', 'FR0000120388', 'RX', 'RECYLEX S.A.'),
+    ('EUR', 'FR0000130395', 'RCO', 'REMY COINTREAU'),
+    ('EUR', 'FR0000131906', 'RNO', 'RENAULT'),
+    ('EUR', 'FR0010451203', 'RXL', 'REXEL'),
+    ('EUR', 'FR0000039091', 'RBT', 'ROBERTET'),
+    ('EUR', 'FR0000045619', 'CBR', 'ROBERTET CDV 87'),
+    ('EUR', 'FR0000045601', 'CBE', 'ROBERTET CI'),
+    ('EUR', 'FR0013344173', 'RBO', 'ROCHE BOBOIS'),
+    ('EUR', 'FR0000031684', 'ROTH', 'ROTHSCHILD & CO'),
+    ('EUR', 'FR0013269123', 'RUI', 'RUBIS'),
+    ('EUR', 'FR0000121709', 'SK', 'S.E.B.'),
+    ('EUR', 'FR0000073272', 'SAF', 'SAFRAN'),
+    ('EUR', 'FR0000060121', 'SABE', 'SAINT JEAN GROUPE'),
+    ('EUR', 'FR0000060071', 'SAMS', 'SAMSE'),
+    ('EUR', 'FR0000120578', 'SAN', 'SANOFI'),
+    ('EUR', 'FR0013154002', 'DIM', 'SARTORIUS STED BIO'),
+    ('EUR', 'FR0000120107', 'SAVE', 'SAVENCIA'),
+    ('EUR', 'FR0006239109', 'CBSM', 'SCBSM'),
+    ('EUR', 'AN8068571086', 'SLB', 'SCHLUMBERGER'),
+    ('EUR', 'FR0000121972', 'SU', 'SCHNEIDER ELECTRIC'),
+    ('EUR', 'FR0010411983', 'SCR', 'SCOR SE'),
+    ('EUR', 'FR0000039109', 'SCHP', 'SECHE ENVIRONNEM.'),
+    ('EUR', 'GB00B5ZN1N88', 'SGRO', 'SEGRO PLC'),
+    ('EUR', 'FR0000065492', 'SLCO', 'SELCODIS'),
+    ('EUR', 'FR0004175842', 'SELER', 'SELECTIRENTE'),
+    ('EUR', 'FR0011950682', 'SEFER', 'SERGEFERRARI GROUP'),
+    ('EUR', 'LU0088087324', 'SESG', 'SES'),
+    ('EUR', 'FR0010282822', 'SESL', 'SES IMAGOTAG'),
+    ('EUR', 'FR0013006558', 'SRP', 'SHOWROOMPRIVE'),
+    ('EUR', 'FR0000060790', 'GIRO', 'SIGNAUX GIROD'),
+    ('EUR', 'FR0000074122', 'SII', 'SII'),
+    ('EUR', 'FR0013214145', 'SMCP', 'SMCP'),
+    ('EUR', 'FR0004016699', 'SMTPC', 'SMTPC'),
+    ('EUR', 'FR0010209809', 'SFCA', 'SOC FRANC CASINOS'),
+    ('EUR', 'FR0000130809', 'GLE', 'SOCIETE GENERALE'),
+    ('EUR', 'FR0000121220', 'SW', 'SODEXO'),
+    ('EUR', 'FR0000078321', 'SEC', 'SODITECH'),
+    ('EUR', 'FR0000038804', 'SFBS', 'SOFIBUS PATRIMOINE'),
+    ('EUR', 'FR0000030140', 'SOFR', 'SOFRAGI'),
+    ('EUR', 'FR0000065864', 'SOG', 'SOGECLAIR'),
+    ('EUR', 'FR0013227113', 'SOI', 'SOITEC'),
+    ('EUR', 'FR00140006O9', 'LOCAL', 'SOLOCAL GROUP'),
+    ('EUR', 'FR0013379484', 'S30', 'SOLUTIONS 30 SE'),
+    ('EUR', 'FR0013199916', 'SO', 'SOMFY SA'),
+    ('EUR', 'FR0000050809', 'SOP', 'SOPRA STERIA GROUP'),
+    ('EUR', 'FR0012757854', 'SPIE', 'SPIE'),
+    ('EUR', 'FR0000131732', 'SPI', 'SPIR COMMUNICATION'),
+    ('EUR', 'FR0011289040', 'SQI', 'SQLI'),
+    ('EUR', 'FR0000054199', 'DPT', 'ST DUPONT'),
+    ('EUR', 'FR0000064271', 'STF', 'STEF'),
+    ('EUR', 'FR0010949404', 'STNT', 'STENTYS'),
+    ('EUR', 'NL0000226223', 'STM', 'STMICROELECTRONICS'),
+    ('EUR', 'FR0010526814', 'SSI', 'SUPERSONIC IMAGINE'),
+    ('EUR', 'FR0004180578', 'SWP', 'SWORD GROUP'),
+    ('EUR', 'FR0000032658', 'SDG', 'SYNERGIE'),
+    ('EUR', 'FR0004188670', 'TKTT', 'TARKETT'),
+    ('EUR', 'FR0000063307', 'TAYN', 'TAYNINH'),
+    ('EUR', 'FR0013526225', 'TECBS', 'TECH BSA 2024'),
+    ('EUR', 'FR0013505062', 'TCH', 'TECHNICOLOR'),
+    ('EUR', 'GB00BDSFG982', 'FTI', 'TECHNIPFMC'),
+    ('EUR', 'FR0000051807', 'TEP', 'TELEPERFORMANCE'),
+    ('EUR', 'CH0008175645', 'TVRB', 'TELEVERBIER'),
+    ('EUR', 'FR0004529147', 'TES', 'TESSI'),
+    ('EUR', 'FR0000054900', 'TFI', 'TF1'),
+    ('EUR', 'FR0013295789', 'TFF', 'TFF GROUP'),
+    ('EUR', 'FR0000121329', 'HO', 'THALES'),
+    ('EUR', 'FR0013333432', 'THEP', 'THERMADOR GROUPE'),
+    ('EUR', 'FR0013230612', 'TKO', 'TIKEHAU CAPITAL'),
+    ('EUR', 'FR0000066482', 'TIPI', 'TIPIAK'),
+    ('EUR', 'FR0000060949', 'TVLY', 'TIVOLY'),
+    ('EUR', 'GA0000121459', 'EC', 'TOTAL GABON'),
+    ('EUR', 'FR0000033003', 'TOUP', 'TOUAX'),
+    ('EUR', 'FR0000036816', 'EIFF', 'TOUR EIFFEL'),
+    ('EUR', 'FR0005175080', 'TNG', 'TRANSGENE'),
+    ('EUR', 'FR0005691656', 'TRI', 'TRIGANO'),
+    ('EUR', 'FR0000054470', 'UBI', 'UBISOFT ENTERTAIN'),
+    ('EUR', 'FR0000054215', 'UNBL', 'UNIBEL'),
+    ('EUR', 'FR0000034548', 'UFF', 'UNION FIN.FRANCE'),
+    ('EUR', 'FR0000074197', 'FPG', 'UNION TECH.INFOR.'),
+    ('EUR', 'FR0013176526', 'FR', 'VALEO'),
+    ('EUR', 'FR0013506730', 'VK', 'VALLOUREC'),
+    ('EUR', 'FR0004056851', 'VLA', 'VALNEVA'),
+    ('EUR', 'FR0000124141', 'VIE', 'VEOLIA ENVIRON.'),
+    ('EUR', 'FR0013447729', 'VRLA', 'VERALLIA'),
+    ('EUR', 'FR0010291245', 'VMX', 'VERIMATRIX'),
+    ('EUR', 'FR0000062465', 'VRNL', 'VERNEUIL FINANCE'),
+    ('EUR', 'FR0004186856', 'VETO', 'VETOQUINOL'),
+    ('EUR', 'FR0000031775', 'VCT', 'VICAT'),
+    ('EUR', 'FR0000066680', 'VDLO', 'VIDELIO'),
+    ('EUR', 'FR0000050049', 'VIL', 'VIEL ET COMPAGNIE'),
+    ('EUR', 'FR0000052516', 'RIN', 'VILMORIN & CIE'),
+    ('EUR', 'FR0000125486', 'DG', 'VINCI'),
+    ('EUR', 'FR0000031577', 'VIRP', 'VIRBAC'),
+    ('EUR', 'FR0000065765', 'SDT', 'VISIODENT'),
+    ('EUR', 'FR0000127771', 'VIV', 'VIVENDI'),
+    ('EUR', 'FR0011995588', 'VLTSA', 'VOLTALIA'),
+    ('EUR', 'FR0004183960', 'VTX', 'VOLUNTIS'),
+    ('EUR', 'FR0013357621', 'WAVE', 'WAVESTONE'),
+    ('EUR', 'FR0000121204', 'MF', 'WENDEL'),
+    ('EUR', 'FR0011981968', 'WLN', 'WORLDLINE'),
+    ('EUR', 'BE0974310428', 'XFAB', 'X-FAB'),
+    ('EUR', 'FR0004034072', 'XIL', 'XILAM ANIMATION'),
+    ('EUR', 'FR0000052870', 'XPO', 'XPO LOGISTICS'),
+    ('EUR', 'FR0013484466', 'MAGBS', 'YMAGIS BSA'),
+    ('EUR', 'BMG9887P1068', 'CV', 'ZCI LIMITED'),
+    )
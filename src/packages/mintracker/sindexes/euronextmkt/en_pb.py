@@ -0,0 +1,15 @@
+#-*- coding: utf-8 -*-
+# en_pb.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_EN_PB = (
+    ('EUR', 'FR0013296746', 'ADVIC', 'ADVICENNE'),
+    ('EUR', 'FR0004180537', 'AKA', 'AKKA TECHNOLOGIES'),
+    ('EUR', 'FR0010208488', 'ENGI', 'ENGIE'),
+    ('EUR', 'FR0013399474', 'GKTX', 'GENKYOTEX'),
+    ('EUR', 'FR0010613471', 'SEV', 'SUEZ'),
+    ('EUR', 'FR0000120271', 'FP', 'TOTAL'),
+    ('EUR', 'FR0000062796', 'VRAP', 'VRANKEN-POMMERY'),
+    )
@@ -0,0 +1,20 @@
+#-*- coding: utf-8 -*-
+# lis_a.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_LIS_A = (
+    ('EUR', 'PTCUR0AP0000', 'CUR', 'AGUAS DA CURIA'),
+    ('EUR', 'PTCDU0AE0003', 'CDU', 'CONDURIL'),
+    ('EUR', 'PTCPA0AP0006', 'CPA', 'COPAM'),
+    ('EUR', 'PTFNV1AM0002', 'MLFMV', 'FARMINVESTE'),
+    ('EUR', 'PTLIT0AE0005', 'LIT', 'LITHO FORMAS'),
+    ('EUR', 'PTMNN0AE0006', 'MLMR', 'MONUMENTAL RES'),
+    ('EUR', 'PTMUS0AM0018', 'MLM24', 'MULTI 24'),
+    ('EUR', 'PTOTP0AM0004', 'MLORE', 'OLIMPO REAL ESTATE'),
+    ('EUR', 'PTRIZ0AM0009', 'MLRZE', 'RAIZE'),
+    ('EUR', 'ES0105505004', 'MLRSR', 'RSR SINGULAR'),
+    ('EUR', 'PTSCB0AM0001', 'SCB', 'S.CLUBE BRAGA'),
+    ('EUR', 'PTSNG0AM0007', 'SNG', 'SONAGI'),
+    )
@@ -0,0 +1,22 @@
+#-*- coding: utf-8 -*-
+# nlb.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_NLB = (
+    ('EUR', 'IT0000062072', 'GEN', 'ASSICURAZ.GEN.ORD.'),
+    ('EUR', 'ES0113211835', 'BBV', 'BANCO BILBAO VIZC.'),
+    ('EUR', 'ES0113900J37', 'SANTA', 'BANCO SANTANDER'),
+    ('EUR', 'DE0005557508', 'DTEL', 'DEUTSCHE TELEKOM'),
+    ('EUR', 'DE000ENAG999', 'EON', 'E.ON SE'),
+    ('EUR', 'IT0003132476', 'ENI', 'ENI'),
+    ('EUR', 'DE0008430026', 'MEURV', 'MUNCHENER RUCKVERS'),
+    ('EUR', 'DE000PSM7770', 'PSMP', 'PROSIEBENSAT'),
+    ('EUR', 'DE0007236101', 'SIA', 'SIEMENS'),
+    ('EUR', 'IT0003497168', 'TIT', 'TELECOM ITALIA SPA'),
+    ('EUR', 'ES0178430E18', 'TFA', 'TELEFONICA'),
+    ('EUR', 'IT0004513666', 'TISN', 'TISCALI'),
+    ('EUR', 'DE0007664005', 'VWA', 'VOLKSWAGEN'),
+    ('EUR', 'DE0007664039', 'VWAP', 'VOLKSWAGEN PREF'),
+    )
@@ -0,0 +1,178 @@
+#-*- coding: utf-8 -*-
+# par_a.py  (c)2020  Henrique Moreira
+
+""" Euronext stocks, market data (see euronext.stock_names_by_market())
+"""
+
+EURONEXT_STOCKS_PAR_A = (
+    ('EUR', 'FR0010050773', 'MLATV', 'A TOUTE VITESSE'),
+    ('EUR', 'FR0010979377', 'MLACT', 'ACTIVIUM GROUP'),
+    ('EUR', 'FR0011908045', 'MLAGI', 'AG3I'),
+    ('EUR', 'ES0105478004', 'MLAGP', 'AGP MALAGA SOCIMI'),
+    ('EUR', 'FR0013285103', 'MLAIM', 'AIR MARINE'),
+    ('EUR', 'GB00BJ9M4V82', 'MLALE', 'ALEPH FINANCE'),
+    ('EUR', 'FR0013253812', 'MLALV', 'ALVEEN'),
+    ('EUR', 'NL0010273694', 'MLAAH', 'AMATHEON AGRI'),
+    ('EUR', 'FR0005057635', 'MLARD', 'ARDOIN ST AMAND A'),
+    ('EUR', 'FR0004070795', 'ARDO', 'ARDOIN ST AMAND B'),
+    ('EUR', 'ES0105486007', 'MLARO', 'AROCA DEL PINAR'),
+    ('EUR', 'FR0012968485', 'MLAEM', 'ASHLER ET MANSON'),
+    ('EUR', 'FR0011896463', 'MLAUD', 'AUDIENCE LABS'),
+    ('EUR', 'IT0004812258', 'MLAZL', 'AZ LEASING'),
+    ('EUR', 'PTAZR0AM0006', 'MLAAT', 'AZOREAN TECH'),
+    ('EUR', 'ES0105362000', 'MLBAR', 'BARINGS CORE SPAIN'),
+    ('EUR', 'FR0010436170', 'MLBAT', 'BATLA MINERALS'),
+    ('EUR', 'FR0013340973', 'MLBSP', 'BLUE SHARK POWER'),
+    ('EUR', 'FR0010106039', 'MLONE', 'BODY ONE'),
+    ('EUR', 'FR0010781377', 'MLAAE', 'CAIRE'),
+    ('EUR', 'FR0010717579', 'MLCEC', 'CECURITY.COM'),
+    ('EUR', 'IT0005402034', 'MLCSA', 'CESYNT A SHARES'),
+    ('EUR', 'IT0005398877', 'MLCSB', 'CESYNT B SHARES'),
+    ('EUR', 'MC0010000826', 'MLCFM', 'CFM INDOSUEZWEALTH'),
+    ('EUR', 'FR0000037871', 'MLCFD', 'CH.FER DEPARTEMENT'),
+    ('EUR', 'FR0000051567', 'MLCVG', 'CH.FER VAR GARD N.'),
+    ('EUR', 'FR0010447086', 'MLCHE', 'CHEOPS TECHNOLOGY'),
+    ('EUR', 'FR0000060428', 'MLCMB', 'CIE DU MONT BLANC'),
+    ('EUR', 'FR0012384907', 'MLCIO', 'CIOA'),
+    ('EUR', 'FR0010959684', 'MLCLP', 'COLIPAYS'),
+    ('EUR', 'BE6252013725', 'MLMFI', 'CONDOR TECHNOLOG'),
+    ('EUR', 'FR0000077828', 'MLCNT', 'CONSORT NT'),
+    ('EUR', 'FR00140007I9', 'MLLCB', 'CONSTRUCTEURS BOIS'),
+    ('EUR', 'FR0010035816', 'MLCOR', 'COREP LIGHTING'),
+    ('EUR', 'FR0004998318', 'MLCOU', 'COURBET'),
+    ('EUR', 'FR0012336675', 'MLGEL', 'D2L GROUP'),
+    ('EUR', 'FR0000077885', 'MLDAM', 'DAMARIS'),
+    ('EUR', 'SE0007045380', 'MLDYH', 'DESIGN YOUR HOME'),
+    ('EUR', 'FR0000052920', 'MLDYN', 'DYNAFOND'),
+    ('EUR', 'LU0881232630', 'MLDYX', 'DYNEX ENERGY SA'),
+    ('EUR', 'HK0000038783', 'MLEAS', 'EASSON HOLDINGS'),
+    ('EUR', 'FR0007200100', 'MLEDR', 'EAUX DE ROYAN'),
+    ('EUR', 'FR0010536185', 'MLEAV', 'EAVS'),
+    ('EUR', 'DE000A0XYM45', 'MLECO', 'ECOLUTIONS'),
+    ('EUR', 'FR0000052755', 'MLEDS', 'EDITIONS DU SIGNE'),
+    ('EUR', 'FR0010439265', 'MLEDU', 'EDUNIVERSAL'),
+    ('EUR', 'FR0010945733', 'MLEES', 'EES'),
+    ('EUR', 'FR0010157115', 'MLERO', 'EUROLAND CORPORATE'),
+    ('EUR', 'FR0000044745', 'MLEVE', 'EVERSET'),
+    ('EUR', 'FR0012300424', 'MLFDV', 'FD'),
+    ('EUR', 'FR0010487272', 'MLFXO', 'FINAXO'),
+    ('EUR', 'CH0120879058', 'MLFIR', 'FIRSTCAUTION'),
+    ('EUR', 'FR0011605617', 'MLVIN', 'FONCIERE VINDI'),
+    ('EUR', 'FR0013222346', 'MLFSG', 'FRANCE SOIR GROUPE'),
+    ('EUR', 'FR0010823724', 'MLFTI', 'FRANCE TOURISME'),
+    ('EUR', 'FR0000053415', 'MLGAI', 'G.A.I.'),
+    ('EUR', 'FR0011100759', 'MLGAL', 'GALEO'),
+    ('EUR', 'PTGVE1AE0009', 'MLGEQ', 'GENTLEMENS EQUITY'),
+    ('EUR', 'FR0013371507', 'MLGML', 'GOUR MEDICAL'),
+    ('EUR', 'FR0013406881', 'MLCMG', 'GRECEMAR'),
+    ('EUR', 'FR0000076960', 'MLGRC', 'GROUPE CARNIVOR'),
+    ('EUR', 'FR0010529719', 'MLPVG', 'GROUPE PLUS-VALUES'),
+    ('EUR', 'LU1840650458', 'MLGDI', 'GUANDAO PUER INVES'),
+    ('EUR', 'FR0013251584', 'MLAHC', 'HEALTH'),
+    ('EUR', 'ES0105498002', 'MLHAY', 'HEALTHCARE ACTIVOS'),
+    ('EUR', 'DE000A11Q133', 'MLHK', 'HK'),
+    ('EUR', 'FR0000051302', 'MLHBB', 'HOCHE BAINS L.BAIN'),
+    ('EUR', 'FR0012336691', 'MLHCF', 'HOME CONCEPT'),
+    ('EUR', 'FR0010312181', 'MLHPE', 'HOPENING'),
+    ('EUR', 'FR0014000U63', 'MLHPI', 'HOPIUM'),
+    ('EUR', 'FR0006226791', 'MLHMC', 'HOT.MAJESTIC CANNE'),
+    ('EUR', 'FR0000053738', 'MLHOT', 'HOTELIM'),
+    ('EUR', 'FR0006563904', 'MLHIN', 'HOTL.IMMOB.NICE'),
+    ('EUR', 'FR0000064735', 'MLHYD', 'HYDRAULIQUE PB'),
+    ('EUR', 'FR0005843125', 'MLHYE', 'HYDRO-EXPLOIT.'),
+    ('EUR', 'ES0105479002', 'MLINT', 'IANTE INVESTMENTS'),
+    ('EUR', 'FR0000079691', 'MLIDS', 'IDS'),
+    ('EUR', 'FR0010086371', 'MLIML', 'IMALLIANCE'),
+    ('EUR', 'FR0006859039', 'MLIPP', 'IMM.PARIS.PERLE'),
+    ('EUR', 'FR0000065773', 'MLIMP', 'IMPRIMERIE CHIRAT'),
+    ('EUR', 'FR0011158823', 'MLIFC', 'INFOCLIP'),
+    ('EUR', 'ES0105473005', 'MLISP', 'INMOSUPA'),
+    ('EUR', 'GB00BT9PTW34', 'MLIDP', 'INNOVADERMA PLC'),
+    ('EUR', 'IT0005391161', 'MLIRF', 'INNOVATIVE RFK SPA'),
+    ('EUR', 'BE6200101556', 'MLIOC', 'IOC HOLDING'),
+    ('EUR', 'ES0105417002', 'MLIPO', 'IPOSA PROPERTIES'),
+    ('EUR', 'IT0005336521', 'MLITN', 'ITALY INNOVAZIONI'),
+    ('EUR', 'FR0010680033', 'MLJSA', 'JSA TECHNOLOGY'),
+    ('EUR', 'FR0004152700', 'MLKRI', 'KRIEF GROUP'),
+    ('EUR', 'FR0013419876', 'MLVAP', 'KUMULUS VAPE'),
+    ('EUR', 'FR0013483401', 'TBMBT', 'LESTQBLANC202212BS'),
+    ('EUR', 'FR0004155208', 'MLLOI', 'LOCASYSTEM INTL'),
+    ('EUR', 'ES0105333001', 'MLLOG', 'LOGIS CONFORT'),
+    ('EUR', 'FR0006205019', 'MLCAC', 'LOMBARD ET MEDOT'),
+    ('EUR', 'BE6201089735', 'MLV4S', 'LV4S'),
+    ('EUR', 'FR0010328302', 'MLMAD', 'MADE'),
+    ('EUR', 'FR0010827741', 'MLMGL', 'MAGILLEM'),
+    ('EUR', 'FR0000061657', 'MLMAB', 'MAIS.ANTOINE BAUD'),
+    ('EUR', 'FR0011092089', 'MLCLI', 'MAISON CLIO BLUE'),
+    ('EUR', 'FR0010515742', 'MLMAI', "MAISONS D'AUJOURD"),
+    ('EUR', 'ES0105447009', 'MLMAQ', 'MAQ ADMON. URBANAS'),
+    ('EUR', 'IT0005324105', 'MLLAB', 'MEDIA LAB'),
+    ('EUR', 'IT0004844848', 'MLMCE', 'MEDIOCREDITO EUROP'),
+    ('EUR', 'FR0010492181', 'MLETA', 'METALLIANCE'),
+    ('EUR', 'BE0974328602', 'MLMIB', 'METRICS IN BALANCE'),
+    ('EUR', 'GB00BF553726', 'MLSKN', 'MICROSKIN'),
+    ('EUR', 'FR0010500363', 'MLNMA', 'MIGUET ET ASSOCIES'),
+    ('EUR', 'FR0013268067', 'MLAMY', 'MLD'),
+    ('EUR', 'FR0010882886', 'MLMON', 'MONFINANCIER'),
+    ('EUR', 'ES0105412003', 'MLMRE', 'MRE-III.P-5.SOCIMI'),
+    ('EUR', 'FR0010518936', 'MLMTD', 'MTD FINANCE'),
+    ('EUR', 'FR0012990968', 'MLMUL', 'MULANN'),
+    ('EUR', 'FR0013230067', 'MLMMC', 'MULTIMICROCLOUD'),
+    ('EUR', 'FR0013344223', 'MLNAT', 'NATURE ET LOGIS'),
+    ('EUR', 'FR0004157543', 'MLNEO', 'NEOCOM MULTIMEDIA'),
+    ('EUR', 'FR0010358507', 'MLNEI', 'NEWSINVEST'),
+    ('EUR', 'FR0000185464', 'MLNOV', 'NOVATECH IND.'),
+    ('EUR', 'FR0013072741', 'MLOSA', 'O SORBET D AMOUR'),
+    ('EUR', 'FR0013310281', 'MLOCT', 'OCTOPUS BIOSAFETY'),
+    ('EUR', 'FR0010176115', 'MLOLM', 'OLMIX'),
+    ('EUR', 'FR0013266772', 'MLOEX', 'ONE EXPERIENCE'),
+    ('EUR', 'FR0004174712', 'MLONL', 'ONLINEFORMAPRO'),
+    ('EUR', 'ES0105490009', 'MLORB', 'ORBIS PROPERTIES'),
+    ('EUR', 'FR0000077992', 'MLPAC', 'PACTE NOVATION'),
+    ('EUR', 'FR0000185928', 'MLPFX', 'PARFEX'),
+    ('EUR', 'FR0006823092', 'MLHOP', 'PART.INDLES MINI.'),
+    ('EUR', 'NL0012650535', 'MLPRX', 'PARX MATERIALS NV'),
+    ('EUR', 'FR0000185480', 'MLPHW', 'PHONE WEB'),
+    ('EUR', 'BE0948608451', 'MLPHO', 'PHOTONIKE CAPITAL'),
+    ('EUR', 'FR0000030769', 'MLPLC', 'PLACOPLATRE'),
+    ('EUR', 'FR0000061376', 'MLPRI', 'PROP.IMMEUBLES'),
+    ('EUR', 'CA74375L1058', 'MLPRO', 'PROVENTURE GOLD'),
+    ('EUR', 'FR0012395457', 'ML350', 'RAPIDO PRET'),
+    ('EUR', 'FR0000077232', 'MLREX', 'REVIVAL EXPANSION'),
+    ('EUR', 'FR0000035750', 'MLROU', 'ROUSSELET CENTRIF.'),
+    ('EUR', 'FR0013155975', 'MLSDN', 'SAVONNERIE NYONS'),
+    ('EUR', 'FR0004175222', 'MLSBT', 'SBT'),
+    ('EUR', 'CH0220529603', 'MLSHD', 'SCANDINAVIAN HOUSE'),
+    ('EUR', 'FR0010972091', 'MLCMI', 'SCEMI'),
+    ('EUR', 'FR0010961920', 'MLSCH', 'SCHOBRUNN PARIS'),
+    ('EUR', 'IT0005072811', 'MLSMP', 'SEMPLICEMENTE SpA'),
+    ('EUR', 'NL0010623518', 'MLSEQ', 'SEQUA PETROLEUM NV'),
+    ('EUR', 'FR0010679365', 'MLSIL', 'SILC'),
+    ('EUR', 'CI0000000832', 'MLMAT', 'SIMAT'),
+    ('EUR', 'FR0004038818', 'MLSIM', 'SIMO INTERNATIONAL'),
+    ('EUR', 'IT0005072167', 'MLSNT', 'SINTESI SpA'),
+    ('EUR', 'FR0011131788', 'MLSML', 'SMALTO'),
+    ('EUR', 'FR0010649228', 'SMLBS', 'SMALTO BSA'),
+    ('EUR', 'FR0000054371', 'MLSRP', 'SPEED RABBIT PIZZA'),
+    ('EUR', 'FR0013063559', 'MLSTM', 'STEAM FRANCE'),
+    ('EUR', 'FR0000063976', 'MLSTR', 'STREIT MECANIQUE'),
+    ('EUR', 'GB00B8GJBS16', 'MLSUM', 'SUMO RESOURCES PLC'),
+    ('EUR', 'FR0000033466', 'MLTEA', 'TEAM'),
+    ('EUR', 'FR0011076595', 'MLVST', 'TELEVISTA'),
+    ('EUR', 'FR0011668821', 'MLTBM', 'TOQUEBLANCHEMONDE'),
+    ('EUR', 'FR0010621722', 'MLABO', 'TOUTABO'),
+    ('EUR', 'FR0011040690', 'MLPSH', 'TPSH'),
+    ('EUR', 'FR0000031866', 'MLTRA', 'TRAMWAYS DE ROUEN'),
+    ('EUR', 'FR0000031106', 'MLTRO', 'TROC ILE'),
+    ('EUR', 'FR0000076481', 'MLTRC', 'TROIS CHENES'),
+    ('EUR', 'FR0011776889', 'MLUMG', 'UMALIS GROUP'),
+    ('EUR', 'FR0005783503', 'MLUMH', 'UNI.METALG.HT-SEI.'),
+    ('EUR', 'FR0012833770', 'MLVAL', 'VALONEO'),
+    ('EUR', 'FR0006174496', 'MLVER', 'VERNEY CARRON'),
+    ('EUR', 'FR0010033480', 'MLVIS', 'VISIO NERF'),
+    ('EUR', 'ES0105492005', 'MLVRF', 'VREF SEVILLE'),
+    ('EUR', 'FR0010688465', 'MLWEA', 'WEACCESS GROUP'),
+    ('EUR', 'FR0010768770', 'MLWEY', 'WEYA'),
+    ('EUR', 'ES0105399002', 'MLWRC', 'WHITENI R CAJAL'),
+    ('EUR', 'ZM0000000037', 'MLZAM', 'ZCCM'),
+    )
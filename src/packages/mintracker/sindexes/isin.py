@@ -11,6 +11,13 @@ Follows:
 
 import string
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ISIN_ALPHABET = string.digits + string.ascii_uppercase
+
 
 class ISIN():
     """
@@ -54,15 +61,30 @@ class ISIN():
 
 
 class StockDB():
-    """ Stock Database """
+    """ Stock Database
+
+    Besides ISIN, stocks are indexed by symbol, (normalized) name,
+    market and currency. The same ISIN may be listed in several markets.
+    """
     def __init__(self):
         self._isin_ref = {}
         self.markets = {}
+        self._by_symbol = {}
+        self._by_name = {}
+        self._by_market = {}
+        self._by_currency = {}
 
     def add_market(self, mkt_name, stocks) -> bool:
         """ Add market sock list (fourplets) """
+        assert mkt_name not in self.markets, f"Market already added: {mkt_name}"
         assert self._check_stocks(stocks)
         self.markets[mkt_name] = stocks
+        in_market = self._by_market.setdefault(mkt_name, set())
+        for coin, isin, symbol, name in stocks:
+            in_market.add(isin)
+            self._by_currency.setdefault(coin, set()).add(isin)
+            _add_ref(self._by_symbol, symbol, isin)
+            _add_ref(self._by_name, normal_name(name), isin)
         return True
 
     def get_from_ISIN(self, isin) -> tuple:
@@ -70,18 +92,59 @@ class StockDB():
         assert isinstance(isin, str)
         return self._isin_ref[isin]
 
+    def get_from_symbol(self, symbol) -> tuple:
+        """ Returns the ISINs for a symbol (abbreviation), or an empty tuple """
+        return tuple(self._by_symbol.get(symbol, ()))
+
+    def get_from_name(self, name) -> tuple:
+        """ Returns the ISINs for a stock name (see normal_name()) """
+        return tuple(self._by_name.get(normal_name(name), ()))
+
+    def isins_in(self, *mkt_names) -> set:
+        """ Returns the ISINs listed in all the markets given """
+        sets = [self._by_market.get(mkt, set()) for mkt in mkt_names]
+        if not sets:
+            return set()
+        return set.intersection(*sets)
+
+    def isins_in_any(self, *mkt_names) -> set:
+        """ Returns the ISINs listed in at least one of the markets given """
+        return set().union(*(self._by_market.get(mkt, ()) for mkt in mkt_names))
+
+    def isins_by_currency(self, coin) -> set:
+        """ Returns the ISINs traded in currency 'coin' (e.g. 'EUR') """
+        return set(self._by_currency.get(coin, ()))
+
     def _check_stocks(self, stocks) -> bool:
         """ Basic checks on stock list (fourplets) """
         for fourplet in stocks:
             assert len(fourplet) == 4
-            myisin = ISIN(fourplet[1])
-            if not myisin.is_valid():
-                return False
-            assert myisin.isin_str not in self._isin_ref
-            self._isin_ref[myisin.isin_str] = fourplet[2:]
+        if not all(validate_many(fourplet[1] for fourplet in stocks)):
+            return False
+        isins = set()
+        for fourplet in stocks:
+            isin = fourplet[1]
+            assert isin not in isins, f"Duplicate ISIN: {isin}"
+            isins.add(isin)
+            if isin not in self._isin_ref:
+                self._isin_ref[isin] = fourplet[2:]
         return True
 
 
+def normal_name(name) -> str:
+    """ Normalized stock name: uppercase, alphanumeric words only """
+    words = "".join(c if c.isalnum() else " " for c in name.upper()).split()
+    return " ".join(words)
+
+
+def _add_ref(dct, key, isin):
+    there = dct.get(key)
+    if there is None:
+        dct[key] = [isin]
+    elif isin not in there:
+        there.append(isin)
+
+
 def ISIN_checksum(s):
     """
     Calculate checksum of ISIN string
@@ -107,18 +170,127 @@ def ISIN_checksum_digit(isin):
     :param isin: string, 12 octets
     :return: int, the checksum digit
     """
-    # pylint: disable=line-too-long
+    assert len(isin) == 12
+    total, doubled = 0, True
+    for c in reversed(isin[:11]):
+        contrib, flips = _LUHN_STEP[doubled][c]
+        total += contrib
+        doubled ^= flips
+    return -total % 10
+
+
+def checksum_many(isins) -> list:
+    """
+    Checksum digits of several ISIN strings, in one pass
+    :param isins: iterable of strings (12 octets)
+    :return: list of int, -1 for malformed strings
+    """
+    res = []
+    odd, even = _LUHN_STEP[True], _LUHN_STEP[False]
+    for isin in isins:
+        if not isinstance(isin, str) or len(isin) != 12:
+            res.append(-1)
+            continue
+        total, table = 0, odd
+        try:
+            for c in isin[10::-1]:
+                contrib, flips = table[c]
+                total += contrib
+                if flips:
+                    table = even if table is odd else odd
+        except KeyError:
+            res.append(-1)
+            continue
+        res.append(-total % 10)
+    return res
 
+
+def validate_many(isins) -> list:
+    """
+    Validates several ISIN strings, in one pass
+    :param isins: iterable of strings
+    :return: list of bool, True iff the ISIN at that position is valid
+    """
+    alist = isins if isinstance(isins, (list, tuple)) else list(isins)
+    digits = checksum_many(alist)
+    return [
+        digit >= 0 and isin[11] == _DIGIT_CHR[digit] for isin, digit in zip(alist, digits)
+    ]
+
+
+def checksum_array(isins):
+    """
+    Vectorized checksum digits (NumPy path)
+    :param isins: array of fixed-width bytes ('S12'), or uint8 array shaped (n, 12)
+    :return: int array, -1 for malformed rows (e.g. not 12 octets)
+    """
+    assert numpy is not None, "numpy not available"
+    arr, bad = _octets_of(isins)
+    values = _VALUE_OF_BYTE[arr[:, 10::-1]]
+    bad |= (values < 0).any(axis=1)
+    values = numpy.where(values < 0, 0, values)
+    # Number of expanded digits at the right of each character tells its parity:
+    widths = 1 + (values >= 10)
+    offset = numpy.cumsum(widths, axis=1) - widths
+    doubled = (offset % 2) == 0
+    contrib = numpy.where(doubled, _ARR_ODD[values], _ARR_EVEN[values])
+    res = (-contrib.sum(axis=1)) % 10
+    res[bad] = -1
+    return res
+
+
+def validate_array(isins):
+    """
+    Vectorized ISIN validation (NumPy path)
+    :param isins: array of fixed-width bytes ('S12'), or uint8 array shaped (n, 12)
+    :return: bool array
+    """
+    assert numpy is not None, "numpy not available"
+    arr, bad = _octets_of(isins)
+    digits = checksum_array(isins)
+    return ~bad & (digits >= 0) & (arr[:, 11].astype(int) - ord("0") == digits)
+
+
+def _octets_of(isins) -> tuple:
+    """ Returns the uint8 array (n, 12) of ISINs, and the mask of those not 12 octets long """
+    arr = numpy.asarray(isins)
+    if arr.dtype.kind == "S":
+        bad = numpy.char.str_len(arr).reshape(-1) != 12
+        arr = numpy.frombuffer(arr.astype("S12").tobytes(), dtype=numpy.uint8).reshape(-1, 12)
+        return arr, bad
+    assert arr.ndim == 2 and arr.shape[1] == 12, f"Bad shape: {arr.shape}"
+    return arr, numpy.zeros(len(arr), dtype=bool)
+
+
+def _luhn_tables() -> tuple:
+    """ Per-character contributions, for 'doubled' and plain positions.
+    Letters expand into two digits, so they do not change the parity
+    of the next (leftmost) character.
+    """
     def digit_sum(n):
         return (n // 10) + (n % 10)
 
-    assert len(isin) == 12
-    # See: https://stackoverflow.com/questions/46061228/calculating-isin-checksum
-    all_uppercase = string.ascii_uppercase
-    alphabet = {letter: value for (value, letter) in
-                enumerate(''.join(str(n) for n in range(10)) + all_uppercase)}
-    val = - sum(digit_sum(2 * int(c))
-                if i % 2 == 1
-                else int(c) for (i, c) in enumerate(reversed(''.join(str(d) for d in (alphabet[v] for v in isin[:-1]))), 1)) % 10
-    checksum_digit = abs(val)
-    return checksum_digit
+    odd, even = {}, {}
+    for value, letter in enumerate(ISIN_ALPHABET):
+        digits = [int(d) for d in reversed(str(value))]
+        flips = len(digits) % 2 == 1
+        odd[letter] = (
+            sum(digit_sum(2 * d) if idx % 2 == 0 else d for idx, d in enumerate(digits)), flips
+        )
+        even[letter] = (
+            sum(d if idx % 2 == 0 else digit_sum(2 * d) for idx, d in enumerate(digits)), flips
+        )
+    return even, odd
+
+
+_LUHN_STEP = _luhn_tables()
+_DIGIT_CHR = string.digits
+
+if numpy is not None:
+    _VALUE_OF_BYTE = numpy.full(256, -1, dtype=numpy.int64)
+    for _value, _letter in enumerate(ISIN_ALPHABET):
+        _VALUE_OF_BYTE[ord(_letter)] = _value
+    _ARR_ODD = numpy.array([_LUHN_STEP[True][c][0] for c in ISIN_ALPHABET])
+    _ARR_EVEN = numpy.array([_LUHN_STEP[False][c][0] for c in ISIN_ALPHABET])
+else:
+    _VALUE_OF_BYTE, _ARR_ODD, _ARR_EVEN = None, None, None
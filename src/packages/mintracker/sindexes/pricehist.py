@@ -0,0 +1,296 @@
+#-*- coding: utf-8 -*-
+# pricehist.py  (c)2022  Henrique Moreira
+
+""" Price history of stocks, from dated Euronext snapshots.
+
+The store is a directory, with one file per column (native byte order):
+	date.i4		day ordinal of the snapshot
+	isin.i4		ISIN code, see isins.txt (one ISIN per line)
+	open.f8, high.f8, low.f8, last.f8, turnover.f8
+	volume.i8
+	time.i8		'Last Date/Time', seconds since 1970 (MISSING_TIME if none)
+and 'rows', the number of committed rows (written last, atomically):
+appends interrupted before are discarded at the next append.
+Readers map the column files, and decode nothing until accessed.
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os
+import os.path
+import re
+import math
+import mmap
+import datetime
+import tempfile
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Field -> array typecode
+PRICE_FIELDS = {
+    "open": "d",
+    "high": "d",
+    "low": "d",
+    "last": "d",
+    "volume": "q",
+    "turnover": "d",
+    "time": "q",
+}
+STORE_COLUMNS = dict({"date": "i", "isin": "i"}, **PRICE_FIELDS)
+MISSING_TIME = -(2 ** 63)	# NaT, as datetime64
+MISSING_VOLUME = -1
+NAN = float("nan")
+TIME_FORMATS = ("%d/%m/%Y %H:%M", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y")
+THOUSANDS = re.compile(r"[+-]?\d{1,3}(,\d{3})+$")	# e.g. '1,234,567'
+
+
+class MarketData():
+    """ Typed market data columns of one snapshot (see PRICE_FIELDS), by row """
+    def __init__(self, date:str=""):
+        self.date = date	# 'YYYY-MM-DD'
+        self.isins = []
+        self.columns = {field: array(code) for field, code in PRICE_FIELDS.items()}
+
+    def __len__(self) -> int:
+        return len(self.isins)
+
+    def append(self, isin:str, row):
+        """ Adds the market data of a Euronext row (Open at column #6) """
+        cols = self.columns
+        self.isins.append(isin)
+        cells = list(row[5:13]) + [None] * (13 - max(5, len(row)))
+        opening, high, low, last, when, _, volume, turnover = cells
+        cols["open"].append(number_of(opening))
+        cols["high"].append(number_of(high))
+        cols["low"].append(number_of(low))
+        cols["last"].append(number_of(last))
+        cols["volume"].append(volume_of(volume))
+        cols["turnover"].append(number_of(turnover))
+        cols["time"].append(time_of(when))
+
+    def extend(self, other):
+        """ Adds all rows of another MarketData """
+        self.isins.extend(other.isins)
+        for field, col in self.columns.items():
+            col.extend(other.columns[field])
+
+    def row(self, idx:int) -> dict:
+        res = {field: col[idx] for field, col in self.columns.items()}
+        res["isin"] = self.isins[idx]
+        return res
+
+    def as_numpy(self) -> dict:
+        """ Returns the columns as NumPy arrays ('time' as datetime64[s]) """
+        assert numpy is not None, "numpy not available"
+        res = {field: numpy.frombuffer(col, dtype=col.typecode) for field, col in self.columns.items()}
+        res["time"] = res["time"].view("datetime64[s]")
+        return res
+
+
+class PriceHistory():
+    """ Column store of market data, keyed by ISIN, appended per snapshot """
+    def __init__(self, dirname:str):
+        self.dirname = dirname
+        os.makedirs(dirname, exist_ok=True)
+        self._isins = []
+        self._codes = {}
+        isins_name = self._path("isins.txt")
+        if os.path.exists(isins_name):
+            with open(isins_name, "r", encoding="ascii") as fdin:
+                for line in fdin:
+                    self._code(line.strip())
+        self.num_rows = self._committed()
+        self._maps = {}
+        self._by_isin = None
+
+    def close(self):
+        """ Unmaps the columns; those still in use are unmapped once released """
+        for there in self._maps.values():
+            if there is not None:
+                try:
+                    there.close()
+                except BufferError:
+                    pass
+        self._maps = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def append(self, data:MarketData) -> int:
+        """ Appends the rows of a snapshot; returns how many """
+        assert data.date, "Snapshot without date"
+        day = datetime.date.fromisoformat(data.date).toordinal()
+        assert day not in set(self.column("date")), f"Snapshot already stored: {data.date}"
+        num = len(data)
+        if not num:
+            return 0
+        self.close()
+        known = len(self._isins)
+        codes = array("i", [self._code(isin) for isin in data.isins])
+        if len(self._isins) > known:
+            with open(self._path("isins.txt"), "a", encoding="ascii") as fdout:
+                fdout.write("".join(isin + "\n" for isin in self._isins[known:]))
+        values = dict(data.columns, date=array("i", [day]) * num, isin=codes)
+        for field, code in STORE_COLUMNS.items():
+            with open(self._path(column_name(field)), "ab") as fdout:
+                fdout.truncate(self.num_rows * array(code).itemsize)
+                values[field].tofile(fdout)
+        self._commit(self.num_rows + num)
+        self._by_isin = None
+        return num
+
+    def isins(self) -> list:
+        return list(self._isins)
+
+    def dates(self) -> list:
+        """ Returns the dates 'YYYY-MM-DD' of stored snapshots """
+        return [datetime.date.fromordinal(day).isoformat() for day in sorted(set(self.column("date")))]
+
+    def column(self, field:str):
+        """ Returns the (memory-mapped) column 'field', see STORE_COLUMNS """
+        code = STORE_COLUMNS[field]
+        if field not in self._maps:
+            self._maps[field] = self._map(field, code)
+        there = self._maps[field]
+        if there is None:
+            return array(code)
+        return memoryview(there).cast(code)[:self.num_rows]
+
+    def numpy_column(self, field:str):
+        """ Returns the column 'field' as a NumPy array (no copy) """
+        assert numpy is not None, "numpy not available"
+        res = numpy.frombuffer(self.column(field), dtype=STORE_COLUMNS[field])
+        return res.view("datetime64[s]") if field == "time" else res
+
+    def rows_of(self, isin:str) -> list:
+        """ Returns the row numbers of 'isin', by snapshot order """
+        if self._by_isin is None:
+            by_isin = {}
+            for num, code in enumerate(self.column("isin")):
+                by_isin.setdefault(code, array("l")).append(num)
+            self._by_isin = by_isin
+        code = self._codes.get(isin)
+        return self._by_isin.get(code, array("l")) if code is not None else array("l")
+
+    def series(self, isin:str, field:str="last") -> list:
+        """ Returns the time series [(date, value), ...] of 'isin', sorted by date """
+        dates, values = self.column("date"), self.column(field)
+        res = [(dates[num], values[num]) for num in self.rows_of(isin)]
+        return [(datetime.date.fromordinal(day).isoformat(), value) for day, value in sorted(res)]
+
+    def _code(self, isin:str) -> int:
+        there = self._codes.get(isin)
+        if there is None:
+            there = len(self._isins)
+            self._codes[isin] = there
+            self._isins.append(isin)
+        return there
+
+    def _path(self, name:str) -> str:
+        return os.path.join(self.dirname, name)
+
+    def _map(self, field:str, code:str):
+        fname = self._path(column_name(field))
+        if not self.num_rows or not os.path.exists(fname):
+            return None
+        with open(fname, "rb") as fdin:
+            return mmap.mmap(fdin.fileno(), self.num_rows * array(code).itemsize, access=mmap.ACCESS_READ)
+
+    def _committed(self) -> int:
+        try:
+            with open(self._path("rows"), "r", encoding="ascii") as fdin:
+                return int(fdin.read())
+        except FileNotFoundError:
+            return 0
+
+    def _commit(self, num:int):
+        handle, tmp_name = tempfile.mkstemp(dir=self.dirname)
+        try:
+            with os.fdopen(handle, "w", encoding="ascii") as fdout:
+                fdout.write(f"{num}\n")
+            os.replace(tmp_name, self._path("rows"))
+        except OSError:
+            os.remove(tmp_name)
+            raise
+        self.num_rows = num
+
+
+def column_name(field:str) -> str:
+    """ Returns the file name of a column, e.g. 'last.f8' """
+    code = STORE_COLUMNS[field]
+    return f"{field}.{'f' if code == 'd' else 'i'}{array(code).itemsize}"
+
+
+def number_of(value) -> float:
+    """ Returns the float of a cell (number, or string), NaN if none.
+    With both '.' and ',' the last one is the decimal mark ('1,234.5', '1.234,5');
+    a lone ',' groups thousands when followed by three digits ('1,234'),
+    otherwise it is a decimal comma ('1,5').
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return NAN
+    astr = str(value).strip()
+    if "," in astr:
+        if "." in astr:
+            if astr.rindex(",") > astr.rindex("."):
+                astr = astr.replace(".", "").replace(",", ".")
+            else:
+                astr = astr.replace(",", "")
+        elif THOUSANDS.match(astr):
+            astr = astr.replace(",", "")
+        elif astr.count(",") == 1:
+            astr = astr.replace(",", ".")
+    try:
+        return float(astr)
+    except ValueError:
+        return NAN
+
+
+def volume_of(value) -> int:
+    """ Returns the volume of a cell, MISSING_VOLUME if none (or not a 64 bit integer) """
+    num = number_of(value)
+    if not math.isfinite(num) or abs(num) >= 2 ** 63:
+        return MISSING_VOLUME
+    return int(num)
+
+
+def time_of(value) -> int:
+    """ Returns the seconds since 1970 of a 'Last Date/Time' cell, or MISSING_TIME """
+    if isinstance(value, datetime.datetime):
+        when = value
+    else:
+        astr = str(value).strip() if value else ""
+        when = None
+        if len(astr) == 16 and astr[2] == "/" and astr[5] == "/" and astr[13] == ":":
+            # fixed width 'dd/mm/YYYY HH:MM'
+            astr = f"{astr[6:10]}-{astr[3:5]}-{astr[:2]}T{astr[11:]}"
+            try:
+                when = datetime.datetime.fromisoformat(astr)
+            except ValueError:
+                return MISSING_TIME
+        for fmt in TIME_FORMATS if when is None else ():
+            try:
+                when = datetime.datetime.strptime(astr, fmt)
+                break
+            except ValueError:
+                continue
+        if when is None:
+            return MISSING_TIME
+    return int((when - datetime.datetime(1970, 1, 1)).total_seconds())
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
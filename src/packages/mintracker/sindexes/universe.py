@@ -0,0 +1,206 @@
+#-*- coding: utf-8 -*-
+# universe.py  (c)2022  Henrique Moreira
+
+""" Compiled (binary) universe of stocks, per market.
+
+File layout (little endian):
+	header		magic, version, #markets, #records, strings size
+	markets		one entry per market: name, first record, #records
+	records		fixed width: ISIN, currency, symbol, name
+	ISIN index	record numbers, sorted by ISIN
+	strings		UTF-8 string table (names, symbols, market names)
+
+Strings are referenced by (offset, length) within the string table.
+The reader maps the file and decodes records only when accessed.
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os
+import mmap
+import struct
+import tempfile
+
+UNIVERSE_MAGIC = b"ENXU"
+UNIVERSE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIII")
+_MARKET = struct.Struct("<IHxxII")
+_RECORD = struct.Struct("<12s4sIHIH")
+_INDEX = struct.Struct("<I")
+
+
+class Universe():
+    """ Reader of a compiled universe file """
+    def __init__(self, fname:str):
+        self.fname = fname
+        with open(fname, "rb") as fdin:
+            self._map = mmap.mmap(fdin.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n_markets, n_records, _ = _HEADER.unpack_from(self._map, 0)
+        assert magic == UNIVERSE_MAGIC, f"Not a universe file: {fname}"
+        assert version == UNIVERSE_VERSION, f"Unsupported universe version: {version}"
+        self._records_at = _HEADER.size + n_markets * _MARKET.size
+        self._index_at = self._records_at + n_records * _RECORD.size
+        self._strings_at = self._index_at + n_records * _INDEX.size
+        self.num_records = n_records
+        self._markets = {}
+        for idx in range(n_markets):
+            name_off, name_len, first, count = _MARKET.unpack_from(
+                self._map, _HEADER.size + idx * _MARKET.size
+            )
+            self._markets[self._string(name_off, name_len)] = (first, count)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def markets(self) -> list:
+        """ Returns the market names, e.g. 'EN.LIS' """
+        return list(self._markets)
+
+    def stock_names_by_market(self, mkt_name):
+        """ Returns the (lazy) sequence of fourplets of a market """
+        first, count = self._markets.get(mkt_name, (0, 0))
+        return MarketStocks(self, first, count)
+
+    def record(self, num:int) -> tuple:
+        """ Returns the fourplet (currency, ISIN, symbol, name) of record 'num' """
+        isin, coin, symb_off, symb_len, name_off, name_len = _RECORD.unpack_from(
+            self._map, self._records_at + num * _RECORD.size
+        )
+        return (
+            coin.rstrip(b"\0").decode("ascii"),
+            isin.decode("ascii"),
+            self._string(symb_off, symb_len),
+            self._string(name_off, name_len),
+        )
+
+    def get_from_ISIN(self, isin:str) -> tuple:
+        """ Get pair abbreviation and full name from ISIN (binary search) """
+        key = isin.encode("ascii")
+        low, high = 0, self.num_records
+        while low < high:
+            mid = (low + high) // 2
+            num = self._index(mid)
+            there = self._isin_bytes(num)
+            if there < key:
+                low = mid + 1
+            elif there > key:
+                high = mid
+            else:
+                return self.record(num)[2:]
+        raise KeyError(isin)
+
+    def stock_db(self, stock_db=None, mkt_names=None):
+        """ Adds markets (all, by default) to a StockDB """
+        if stock_db is None:
+            # pylint: disable=import-outside-toplevel
+            from mintracker.sindexes.isin import StockDB
+            stock_db = StockDB()
+        for mkt in (self.markets() if mkt_names is None else mkt_names):
+            stock_db.add_market(mkt, self.stock_names_by_market(mkt))
+        return stock_db
+
+    def _index(self, pos:int) -> int:
+        return _INDEX.unpack_from(self._map, self._index_at + pos * _INDEX.size)[0]
+
+    def _isin_bytes(self, num:int) -> bytes:
+        start = self._records_at + num * _RECORD.size
+        return self._map[start:start + 12]
+
+    def _string(self, offset:int, length:int) -> str:
+        start = self._strings_at + offset
+        return self._map[start:start + length].decode("utf-8")
+
+
+class MarketStocks():
+    """ Fourplets of one market, decoded from the universe file on access """
+    def __init__(self, universe:Universe, first:int, count:int):
+        self._universe = universe
+        self._first, self._count = first, count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[idx] for idx in range(*pos.indices(self._count))]
+        if pos < 0:
+            pos += self._count
+        if not 0 <= pos < self._count:
+            raise IndexError(pos)
+        return self._universe.record(self._first + pos)
+
+    def __iter__(self):
+        record = self._universe.record
+        for num in range(self._first, self._first + self._count):
+            yield record(num)
+
+
+def write_universe(fname:str, markets) -> int:
+    """ Writes the universe file 'fname' (atomically), from 'markets':
+    a dictionary (or list of pairs) of market name -> fourplets.
+    Returns the number of records written.
+    """
+    pairs = list(markets.items()) if isinstance(markets, dict) else list(markets)
+    strings = bytearray()
+    offsets = {}
+
+    def string_ref(astr:str) -> tuple:
+        there = offsets.get(astr)
+        if there is None:
+            data = astr.encode("utf-8")
+            assert len(data) < 0x10000, f"String too long: {astr}"
+            there = (len(strings), len(data))
+            offsets[astr] = there
+            strings.extend(data)
+        return there
+
+    mkt_part, rec_part, isins = bytearray(), bytearray(), []
+    num = 0
+    for mkt_name, stocks in pairs:
+        name_off, name_len = string_ref(mkt_name)
+        first = num
+        for coin, isin, symbol, name in stocks:
+            assert len(isin) == 12, f"Bad ISIN: {isin}"
+            rec_part += _RECORD.pack(
+                isin.encode("ascii"), coin.encode("ascii"), *string_ref(symbol), *string_ref(name)
+            )
+            isins.append((isin, num))
+            num += 1
+        mkt_part += _MARKET.pack(name_off, name_len, first, num - first)
+    index = b"".join(_INDEX.pack(there) for _, there in sorted(isins))
+    header = _HEADER.pack(UNIVERSE_MAGIC, UNIVERSE_VERSION, 0, len(pairs), num, len(strings))
+    dirname = os.path.dirname(fname)
+    handle, tmp_name = tempfile.mkstemp(dir=dirname if dirname else ".")
+    try:
+        with os.fdopen(handle, "wb") as fdout:
+            fdout.write(header + mkt_part + rec_part + index + strings)
+        os.replace(tmp_name, fname)
+    except OSError:
+        os.remove(tmp_name)
+        raise
+    return num
+
+
+def markets_from_tables(mkt_names=None) -> dict:
+    """ Returns the markets (of euronext.py) to write as a universe file """
+    # pylint: disable=import-outside-toplevel
+    from mintracker.sindexes import euronext
+    names = euronext.EURONEXT_STOCKS_LIST if mkt_names is None else mkt_names
+    res = {}
+    for mkt in names:
+        stocks = euronext.stock_names_by_market(mkt)
+        if stocks:
+            res[mkt] = stocks
+    return res
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
@@ -0,0 +1,121 @@
+#-*- coding: utf-8 -*-
+# dateindex.py  (c)2022  Henrique Moreira
+
+"""
+Per-account index of transactions by date, for as-of holdings queries.
+
+Each account keeps its rows sorted by day ordinal, and a checkpoint
+of cumulative quantities (per ISIN, or product name) every CHECKPOINT_ROWS:
+an as-of query is a binary search, plus the replay of a few rows.
+"""
+
+# pylint: disable=missing-function-docstring
+
+import bisect
+import datetime
+from array import array
+
+CHECKPOINT_ROWS = 64
+
+
+class AccountDates():
+    """ Rows of one account, by date """
+    def __init__(self, entries, every:int=CHECKPOINT_ROWS):
+        """ 'entries' are (date ordinal, key, quant, row) """
+        entries = sorted(entries, key=lambda entry: entry[0])
+        self.dates = array("l", [entry[0] for entry in entries])
+        self.keys = [entry[1] for entry in entries]
+        self.quants = [entry[2] for entry in entries]
+        self.rows = [entry[3] for entry in entries]
+        self._every = every
+        self._checkpoints = []	# holdings before row #(idx * every)
+        held = {}
+        for idx, (key, quant) in enumerate(zip(self.keys, self.quants)):
+            if idx % every == 0:
+                self._checkpoints.append(dict(held))
+            held[key] = held.get(key, 0) + quant
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def count_until(self, day:int) -> int:
+        """ Returns the number of rows up to (including) 'day' """
+        return bisect.bisect_right(self.dates, day)
+
+    def holdings(self, day:int) -> dict:
+        """ Returns key -> quantity held at the end of 'day' (non-zero only) """
+        num = self.count_until(day)
+        if not num:
+            return {}
+        first = (num - 1) // self._every * self._every
+        held = dict(self._checkpoints[first // self._every])
+        keys, quants = self.keys, self.quants
+        for idx in range(first, num):
+            key = keys[idx]
+            held[key] = held.get(key, 0) + quants[idx]
+        return {key: quant for key, quant in held.items() if quant}
+
+    def between(self, first:int, last:int) -> list:
+        """ Returns the rows from day 'first' to day 'last' (both included) """
+        low = bisect.bisect_left(self.dates, first)
+        return self.rows[low:self.count_until(last)]
+
+
+class DateIndex():
+    """ AccountDates of all accounts """
+    def __init__(self, by_account:dict, every:int=CHECKPOINT_ROWS):
+        """ 'by_account' is account -> entries, see AccountDates """
+        self._accounts = {
+            account: AccountDates(entries, every) for account, entries in by_account.items()
+        }
+
+    def accounts(self) -> list:
+        return sorted(self._accounts)
+
+    def account(self, account:str) -> AccountDates:
+        there = self._accounts.get(account)
+        return AccountDates(()) if there is None else there
+
+    def holdings(self, account:str, adate) -> dict:
+        """ Returns what 'account' held at the end of 'adate' """
+        return self.account(account).holdings(day_ordinal(adate))
+
+    def between(self, account:str, first, last) -> list:
+        return self.account(account).between(day_ordinal(first), day_ordinal(last))
+
+
+def from_table(table, every:int=CHECKPOINT_ROWS) -> DateIndex:
+    """ Returns the DateIndex of a TransactionTable; rows are table row indexes """
+    dates, pool = table.column("date"), table.strings()
+    isins, products, quants = table.column("isin"), table.column("product"), table.column("quant")
+    by_account = {}
+    for account in table.accounts():
+        by_account[account] = [
+            (dates[idx], pool[isins[idx]] or pool[products[idx]], quants[idx], idx)
+            for idx in table.by_account(account).indexes
+        ]
+    return DateIndex(by_account, every)
+
+
+def from_content(content:dict, every:int=CHECKPOINT_ROWS) -> DateIndex:
+    """ Returns the DateIndex of Transactions content; rows are the 'by-id' elements """
+    by_account = {}
+    for account, elems in content["data"]["by-id"].items():
+        by_account[account] = [
+            (day_ordinal(elem[2]), elem[8] or elem[4], elem[6], elem) for elem in elems
+        ]
+    return DateIndex(by_account, every)
+
+
+def day_ordinal(adate) -> int:
+    """ Returns the day ordinal of an ISO date string, a date, or an ordinal """
+    if isinstance(adate, int):
+        return adate
+    if isinstance(adate, str):
+        adate = datetime.date.fromisoformat(adate)
+    return adate.toordinal()
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
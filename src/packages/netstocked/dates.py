@@ -0,0 +1,62 @@
+#-*- coding: utf-8 -*-
+# dates.py  (c)2022  Henrique Moreira
+
+"""
+Date cells, from xlsx, into ISO strings or day ordinals.
+
+Cells are pairs (data_type, value), where data_type is either
+'s' (an excel string, 'dd-mm-YYYY'), or 'd' (a date/ datetime).
+"""
+
+# pylint: disable=missing-function-docstring
+
+import datetime
+
+DMY_FORMAT = "%d-%m-%Y"
+
+
+class DateNormalizer():
+    """ Memoized date cell conversion; repeated dates are parsed once """
+    def __init__(self):
+        self._dates = {}
+        self.hits, self.misses = 0, 0
+
+    def date(self, tup:tuple) -> datetime.date:
+        there = self._dates.get(tup)
+        if there is None:
+            self.misses += 1
+            there = date_of(tup)
+            self._dates[tup] = there
+        else:
+            self.hits += 1
+        return there
+
+    def iso(self, tup:tuple) -> str:
+        """ Returns the ISO date string 'YYYY-mm-dd' of a date cell """
+        return self.date(tup).isoformat()
+
+    def ordinal(self, tup:tuple) -> int:
+        """ Returns the day ordinal of a date cell """
+        return self.date(tup).toordinal()
+
+    def iso_column(self, tups) -> list:
+        get = self.iso
+        return [get(tup) for tup in tups]
+
+
+def date_of(tup:tuple) -> datetime.date:
+    """ Returns the date of a date cell (hand-rolled 'dd-mm-YYYY' parser) """
+    atype, aval = tup
+    if atype == "s":	# excel string
+        if len(aval) == 10 and aval[2] == "-" and aval[5] == "-":
+            return datetime.date(int(aval[6:]), int(aval[3:5]), int(aval[:2]))
+        return datetime.datetime.strptime(aval, DMY_FORMAT).date()
+    assert atype == "d", f"Not a date cell: {tup}"
+    if isinstance(aval, datetime.datetime):
+        return aval.date()
+    return aval
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
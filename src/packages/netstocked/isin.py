@@ -5,11 +5,22 @@
 ISIN and stock cache
 """
 
+import os
+import os.path
+import json
+import tempfile
+import bisect
+import threading
+from collections import deque
 from netstocked.common import known_str
 
 # pylint: disable=missing-function-docstring, line-too-long
 
 LOG_CACHE = 1
+LOG_SIZE = 1000		# last update_cache() calls kept; None: unbounded, 0: counters only
+BOGUS_SIZE = 1000	# last mismatch messages kept; same as above
+STRIPES = 16		# locks of a SharedIsinCache
+SNAPSHOT_VERSION = 1	# see IsinCache.save()
 
 FAST_ISIN = {
     "NL0000009538": "PHILIPS",	# KON.PHILIPS N.V.
@@ -18,15 +29,23 @@ FAST_ISIN = {
 
 
 class IsinCache():
-    """ ISIN cache """
-    def __init__(self):
+    """ ISIN cache
+
+    The 'log' and 'bogus' lists are ring buffers (see LOG_SIZE and BOGUS_SIZE),
+    while stats() aggregates all calls.
+    """
+    def __init__(self, log_size=LOG_SIZE, bogus_size=BOGUS_SIZE):
         self._msg = ""
         self._stocks = {
             "by-name": {},
             "by-isin": {},
-            "log": [],
-            "bogus": [],
+            "log": deque(maxlen=log_size),
+            "bogus": deque(maxlen=bogus_size),
         }
+        self._counters = CacheCounters()
+        self._names = []	# sorted 'by-name' keys
+        self._fast = dict(FAST_ISIN)
+        self._seeds = {}	# normalized name -> isin, see seed()
 
     def last_error(self) -> str:
         """ Return last error """
@@ -37,39 +56,178 @@ class IsinCache():
 
     def stock_names(self) -> list:
         """ Returns all cached names """
-        res = [(name, self._stocks["by-name"][name]) for name in sorted(self._stocks["by-name"])]
+        return self._named(lambda names: names[:])
+
+    def names_starting_with(self, prefix:str, start:int=0, count=None) -> list:
+        """ Returns (name, isin) pairs of names starting with 'prefix',
+        at most 'count' of them, skipping the first 'start'.
+        """
+        def select(names):
+            low = bisect.bisect_left(names, prefix)
+            high = bisect.bisect_left(names, prefix + "\U0010ffff") if prefix else len(names)
+            low += start
+            if count is not None:
+                high = min(high, low + count)
+            return names[low:high]
+
+        return self._named(select)
+
+    def names_range(self, low:str, high:str) -> list:
+        """ Returns (name, isin) pairs of names from 'low' to 'high' (excluded) """
+        return self._named(
+            lambda names: names[bisect.bisect_left(names, low):bisect.bisect_left(names, high)]
+        )
+
+    def names_page(self, page:int, size:int=50) -> list:
+        """ Returns the (name, isin) pairs of page 'page' (starting at 0) """
+        return self._named(lambda names: names[page * size:(page + 1) * size])
+
+    def num_names(self) -> int:
+        return len(self._names)
+
+    def save(self, fname:str) -> bool:
+        """ Writes the cache snapshot (json, atomically): names, seeds and FAST_ISIN.
+        Returns False if not possible.
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "by-name": self._stocks["by-name"],
+            "seeds": self._seeds,
+            "fast-isin": self._fast,
+        }
+        dirname = os.path.dirname(fname)
+        tmp_name = ""
+        try:
+            handle, tmp_name = tempfile.mkstemp(dir=dirname if dirname else ".")
+            with os.fdopen(handle, "w", encoding="utf-8") as fdout:
+                json.dump(snapshot, fdout, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, fname)
+        except OSError:
+            if tmp_name and os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            return False
+        return True
+
+    def load(self, fname:str) -> int:
+        """ Adds the names of a snapshot (see save()) to the cache;
+        returns the number of names, or -1 if the snapshot is missing or invalid.
+        """
+        try:
+            with open(fname, "r", encoding="utf-8") as fdin:
+                snapshot = json.load(fdin)
+        except (OSError, ValueError):
+            return -1
+        if not _valid_snapshot(snapshot):
+            return -1
+        by_name, by_isin = self._stocks["by-name"], self._stocks["by-isin"]
+        for name, isin in snapshot["by-name"].items():
+            if name in by_name or isin in by_isin:
+                continue
+            by_name[name] = isin
+            by_isin[isin] = name
+        self._names = sorted(by_name)
+        self._seeds.update(snapshot["seeds"])
+        self._fast.update(snapshot["fast-isin"])
+        return len(snapshot["by-name"])
+
+    def seed(self, stock_db) -> int:
+        """ Adds names of a StockDB (mintracker) as seeds, used to resolve
+        the ISIN of names not yet in the cache. Names of more than one ISIN are left out.
+        Returns the number of seeds.
+        """
+        isins = {}
+        for stocks in stock_db.markets.values():
+            for _, isin, _, name in stocks:
+                isins.setdefault(_normal_name(name), set()).add(isin)
+        for key, there in isins.items():
+            if len(there) == 1:
+                self._seeds[key] = there.pop()
+            else:
+                self._seeds.pop(key, None)
+        return len(self._seeds)
+
+    def _named(self, select) -> list:
+        """ Returns (name, isin) pairs of the sorted names 'select(names)' picks """
+        by_name = self._stocks["by-name"]
+        return [(name, by_name[name]) for name in select(self._names)]
+
+    def _add_name(self, name:str):
+        bisect.insort(self._names, name)
+
+    def stats(self) -> dict:
+        """ Returns the number of calls, hits and conflicts,
+        overall and per ISIN ('per-isin': isin -> (calls, hits, conflicts)).
+        """
+        res = CacheCounters.merged(self._all_counters())
+        res["logged"] = len(self._stocks["log"])
+        res["bogus"] = len(self._stocks["bogus"])
         return res
 
     def update_cache(self, name:str, isin:str) -> tuple:
         if LOG_CACHE:
             self._stocks["log"].append((isin, name))
+        is_hit = isin in self._stocks["by-isin"] or name in self._stocks["by-name"]
         res_name, res_isin = self._update_cache(name, isin)
         msg = self._msg
         if msg:
             self._stocks["bogus"].append(msg)
+        self._counters.count(res_isin, is_hit, bool(msg))
         return res_name, res_isin
 
+    def update_many(self, pairs) -> list:
+        """ update_cache() of many (name, isin) pairs, in one pass;
+        repeated pairs with an ISIN, already resolved without error, are not looked up again
+        (a name without ISIN may resolve differently, once its ISIN is known).
+        """
+        res, known, repeats = [], {}, {}
+        log = self._stocks["log"] if LOG_CACHE else None
+        for pair in pairs:
+            there = known.get(pair)
+            if there is None:
+                there = self.update_cache(*pair)
+                if pair[1] and not self._msg:
+                    known[pair] = there
+                    repeats[pair] = 0
+            else:
+                if log is not None:
+                    log.append((pair[1], pair[0]))
+                repeats[pair] += 1
+            res.append(there)
+        for pair, num in repeats.items():
+            if num:
+                self._counters.count_hits(known[pair][1], num)
+        return res
+
+    def _all_counters(self) -> list:
+        return [self._counters]
+
     def _update_cache(self, name:str, isin:str) -> tuple:
-        self._msg = ""
+        res_name, res_isin, self._msg = self._resolve(name, isin)
+        return res_name, res_isin
+
+    def _resolve(self, name:str, isin:str) -> tuple:
+        """ Returns the triplet (name, isin, error message) """
         if not name:
-            return name, ""
+            return name, "", ""
         if not isin:
-            return name, known_str(self._stocks["by-name"].get(name))
+            there = self._stocks["by-name"].get(name)
+            if not there and self._seeds:
+                there = self._seeds.get(_normal_name(name))
+            return name, known_str(there), ""
         if isin in self._stocks["by-isin"]:
             there = self._stocks["by-isin"][isin]
             is_ok = there == name
-            if not is_ok:
-                self._msg = f"ISIN {isin}: is not '{name}', but {there}"
-            return name, isin
+            msg = "" if is_ok else f"ISIN {isin}: is not '{name}', but {there}"
+            return name, isin, msg
         isin_there = self._stocks["by-name"].get(name)
         if isin_there:
             is_ok = isin_there == isin
-            if not is_ok:
-                self._msg = f"ISIN for {name} expected as '{isin_there}'"
-            return name, isin_there
+            msg = "" if is_ok else f"ISIN for {name} expected as '{isin_there}'"
+            return name, isin_there, msg
         self._stocks["by-name"][name] = isin
         self._stocks["by-isin"][isin] = name
-        return name, isin
+        self._add_name(name)
+        return name, isin, ""
 
     def easier_name(self, isin:str) -> str:
         """ Returns empty if ISIN 'isin' does not exist,
@@ -77,13 +235,157 @@ class IsinCache():
         """
         if not isin:
             return ""
-        name = FAST_ISIN.get(isin)
+        name = self._fast.get(isin)
         if not name:
             return ""
         assert name
         return name
 
 
+class SharedIsinCache(IsinCache):
+    """ Thread-safe ISIN cache: lock striping by name and ISIN hash.
+
+    Each call holds the locks of its name and of its ISIN (in a fixed order),
+    so that calls on other stocks do not wait; errors are per call,
+    see update(), and last_error() is per thread.
+    stats() copies the counters of each stripe under its lock,
+    and name queries select from the sorted names under their lock.
+    Use load() and seed() before sharing the cache.
+    """
+    def __init__(self, log_size=LOG_SIZE, bogus_size=BOGUS_SIZE, stripes=STRIPES):
+        super().__init__(log_size, bogus_size)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stripe_counters = [CacheCounters() for _ in range(stripes)]
+        self._local = threading.local()
+        self._names_lock = threading.Lock()
+
+    def last_error(self) -> str:
+        """ Return last error of the calling thread """
+        return getattr(self._local, "msg", "")
+
+    def update_cache(self, name:str, isin:str) -> tuple:
+        res_name, res_isin, self._local.msg = self.update(name, isin)
+        return res_name, res_isin
+
+    def update(self, name:str, isin:str) -> tuple:
+        """ Returns the triplet (name, isin, error message) """
+        if LOG_CACHE:
+            self._stocks["log"].append((isin, name))
+        stripes = len(self._locks)
+        first, second = sorted((hash(name) % stripes, hash(isin) % stripes))
+        with self._locks[first]:
+            if second != first:
+                self._locks[second].acquire()
+            try:
+                is_hit = isin in self._stocks["by-isin"] or name in self._stocks["by-name"]
+                res_name, res_isin, msg = self._resolve(name, isin)
+                self._stripe_counters[first].count(res_isin, is_hit, bool(msg))
+            finally:
+                if second != first:
+                    self._locks[second].release()
+        if msg:
+            self._stocks["bogus"].append(msg)
+        return res_name, res_isin, msg
+
+    def update_many(self, pairs) -> list:
+        return [self.update_cache(name, isin) for name, isin in pairs]
+
+    def _all_counters(self) -> list:
+        res = []
+        for lock, counters in zip(self._locks, self._stripe_counters):
+            with lock:
+                res.append(counters.copy())
+        return res
+
+    def _named(self, select) -> list:
+        with self._names_lock:
+            return super()._named(select)
+
+    def _add_name(self, name:str):
+        with self._names_lock:
+            super()._add_name(name)
+
+
+class CacheCounters():
+    """ Calls, hits and conflicts of an ISIN cache """
+    def __init__(self):
+        self.calls, self.hits, self.conflicts = 0, 0, 0
+        self.per_isin = {}	# isin -> [calls, hits, conflicts]
+
+    def count(self, isin:str, is_hit:bool, is_conflict:bool):
+        self.calls += 1
+        counts = self.per_isin.get(isin)
+        if counts is None:
+            counts = [0, 0, 0]
+            self.per_isin[isin] = counts
+        counts[0] += 1
+        if is_hit:
+            self.hits += 1
+            counts[1] += 1
+        if is_conflict:
+            self.conflicts += 1
+            counts[2] += 1
+
+    def copy(self):
+        res = CacheCounters()
+        res.calls, res.hits, res.conflicts = self.calls, self.hits, self.conflicts
+        res.per_isin = {isin: list(counts) for isin, counts in self.per_isin.items()}
+        return res
+
+    def count_hits(self, isin:str, num:int):
+        """ Counts 'num' calls of 'isin', all hits without conflicts """
+        self.calls += num
+        self.hits += num
+        counts = self.per_isin.setdefault(isin, [0, 0, 0])
+        counts[0] += num
+        counts[1] += num
+
+    @staticmethod
+    def merged(counters) -> dict:
+        res = {"calls": 0, "hits": 0, "conflicts": 0, "per-isin": {}}
+        per_isin = {}
+        for there in counters:
+            res["calls"] += there.calls
+            res["hits"] += there.hits
+            res["conflicts"] += there.conflicts
+            for isin, counts in there.per_isin.items():
+                sums = per_isin.setdefault(isin, [0, 0, 0])
+                for idx, value in enumerate(counts):
+                    sums[idx] += value
+        res["per-isin"] = {isin: tuple(counts) for isin, counts in per_isin.items()}
+        return res
+
+
+def _valid_snapshot(snapshot) -> bool:
+    """ Returns True if 'snapshot' is a dictionary as IsinCache.save() writes """
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return False
+    for field in ("by-name", "seeds", "fast-isin"):
+        there = snapshot.get(field)
+        if not isinstance(there, dict):
+            return False
+        if not all(isinstance(key, str) and isinstance(value, str) and value for key, value in there.items()):
+            return False
+    return True
+
+
+def _normal_name(name:str) -> str:
+    # pylint: disable=import-outside-toplevel
+    from mintracker.sindexes.isin import normal_name
+    return normal_name(name)
+
+
+def euronext_stock_db(mkt_names=None):
+    """ Returns the StockDB of Euronext markets (all, by default), to seed a cache """
+    # pylint: disable=import-outside-toplevel
+    from mintracker.sindexes.isin import StockDB
+    from mintracker.sindexes.universe import markets_from_tables
+    stock_db = StockDB()
+    for mkt, stocks in markets_from_tables(mkt_names).items():
+        stock_db.add_market(mkt, stocks)
+    return stock_db
+
+
 isin_cache = IsinCache()
 
 
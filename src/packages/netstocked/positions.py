@@ -0,0 +1,165 @@
+#-*- coding: utf-8 -*-
+# positions.py  (c)2022  Henrique Moreira
+
+"""
+Stock positions, per account and ISIN, as FIFO lots.
+
+Rows are tuples as TransactionTable.row():
+	(account, date, product, isin, quant, price, value, tax, line)
+quant is negative for sells; stocks without ISIN are keyed by product name.
+"""
+
+# pylint: disable=missing-function-docstring
+
+import datetime
+from collections import deque
+
+EPSILON = 1e-9
+
+
+class Lot():
+    """ Open quantity bought (or sold short) at a unit price """
+    __slots__ = ("quant", "price", "date")
+
+    def __init__(self, quant, price:float, date:int):
+        self.quant, self.price, self.date = quant, price, date
+
+    def cost(self) -> float:
+        return self.quant * self.price
+
+
+class Position():
+    """ FIFO lots of one stock, at one account """
+    __slots__ = ("lots", "quant", "cost", "realized", "fees")
+
+    def __init__(self):
+        self.lots = deque()
+        self.quant, self.cost = 0, 0.0
+        self.realized, self.fees = 0.0, 0.0
+
+    def trade(self, quant, price:float, date:int, tax:float=0.0):
+        """ Buys (quant > 0) or sells (quant < 0): opposite lots are closed first """
+        self.fees += tax
+        lots = self.lots
+        while quant and lots and (lots[0].quant > 0) != (quant > 0):
+            lot = lots[0]
+            closed = -quant if abs(quant) < abs(lot.quant) else lot.quant
+            self.realized += closed * (price - lot.price)
+            self.cost -= closed * lot.price
+            self.quant -= closed
+            lot.quant -= closed
+            quant += closed
+            if abs(lot.quant) < EPSILON:
+                lots.popleft()
+        if quant:
+            lots.append(Lot(quant, price, date))
+            self.quant += quant
+            self.cost += quant * price
+        return self
+
+    def average_price(self) -> float:
+        return self.cost / self.quant if self.quant else 0.0
+
+    def is_open(self) -> bool:
+        return bool(self.lots)
+
+
+class PositionBook():
+    """ Positions of all accounts, updated incrementally:
+    apply() (or update()) costs O(new rows), not O(ledger).
+    Rows of each account must be applied by date order.
+    """
+    def __init__(self):
+        self._positions = {}	# (account, isin or product) -> Position
+        self.last_dates = {}	# account -> date of its last row applied
+        self.applied = 0	# rows of the table applied, see update()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def apply(self, rows) -> int:
+        """ Applies transaction rows; returns how many.
+        Rows are all checked first: if one is out of order, none is applied.
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        self._check_order(rows)
+        for row in rows:
+            self._trade(row)
+        return len(rows)
+
+    def update(self, table) -> int:
+        """ Applies the rows appended to a TransactionTable since the last update() """
+        row = table.row
+        rows = [row(idx) for idx in range(self.applied, len(table))]
+        self._check_order(rows)
+        for there in rows:
+            self._trade(there)
+            self.applied += 1
+        return len(rows)
+
+    def _check_order(self, rows):
+        last_dates = dict(self.last_dates)
+        for account, date, *_ in rows:
+            last = last_dates.get(account, 0)
+            assert date >= last, f"Row of '{account}' older than {last}: {date}"
+            last_dates[account] = date
+
+    def _trade(self, row):
+        account, date, product, isin, quant, price, _, tax, _ = row
+        key = (account, isin if isin else product)
+        there = self._positions.get(key)
+        if there is None:
+            there = Position()
+            self._positions[key] = there
+        there.trade(quant, price, date, tax)
+        self.last_dates[account] = date
+
+    def apply_transactions(self, account:str, transactions) -> int:
+        """ Applies AsTransaction objects (ISO dates) of 'account' """
+        return self.apply(
+            (account, iso_ordinal(trans.date), trans.stock_name(), trans.isin(),
+             trans.quant, abs(trans.t_val / trans.quant) if trans.quant else 0.0, trans.t_val, 0.0, 0)
+            for trans in transactions
+        )
+
+    def position(self, account:str, isin:str):
+        """ Returns the Position of 'isin' (or product name) at 'account', or None """
+        return self._positions.get((account, isin))
+
+    def holdings(self, account:str="") -> dict:
+        """ Returns (account, isin) -> (quantity, cost) of open positions,
+        of all accounts, or only of 'account'.
+        """
+        return {
+            key: (there.quant, round(there.cost, 2))
+            for key, there in self._positions.items()
+            if there.lots and (not account or key[0] == account)
+        }
+
+    def realized(self, account:str="") -> float:
+        return round(sum(
+            there.realized for key, there in self._positions.items()
+            if not account or key[0] == account
+        ), 2)
+
+
+def from_table(table) -> PositionBook:
+    """ Builds the positions of a whole TransactionTable (by date order) """
+    book = PositionBook()
+    if not len(table):
+        return book
+    dates = table.column("date")
+    order = sorted(range(len(table)), key=dates.__getitem__)
+    book.apply(table.row(idx) for idx in order)
+    book.applied = len(table)
+    return book
+
+
+def iso_ordinal(adate:str) -> int:
+    """ Returns the day ordinal of an ISO date 'YYYY-mm-dd' """
+    return datetime.date.fromisoformat(adate).toordinal()
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
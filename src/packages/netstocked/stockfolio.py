@@ -13,10 +13,15 @@ from os import environ
 import datetime
 import openpyxl
 from netstocked.common import money_string
+from netstocked.dates import DateNormalizer, date_of
+from netstocked.transtable import TransactionTable
+from netstocked.wbcache import WorkbookCache
+from netstocked import dateindex
 
 DEBUG = 0
 DEFAULT_ENV_VAR_DIR = "PINT"
 DEFAULT_BASENAME = "Transactions_accoes.xlsx"
+DEFAULT_SHEET_NAME = "stock_transactions"
 
 VALID_IDS = ("m", "H", "p",)
 WHO_ID = "p"
@@ -31,7 +36,10 @@ def main():
     if code is None:
         print(f"""Usage:
 
-{__file__} [excel-input-file]
+{__file__} [--no-cache] [excel-input-file]
+
+Options:
+   --no-cache   Do not use (nor write) the parsed workbook cache
 """)
     sys.exit(code if code else 0)
 
@@ -40,6 +48,8 @@ def run(out, err, args):
     """ Run script """
     who = WHO_ID
     assert err, "stderr"
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg != "--no-cache"]
     if args:
         if len(args) > 1:
             return None
@@ -48,21 +58,27 @@ def run(out, err, args):
         dirname = environ[DEFAULT_ENV_VAR_DIR]
         fname = os.path.join(dirname, DEFAULT_BASENAME)
         who = ""	# show all
-    msg = reader(out, fname, who, int(DEBUG))
+    msg = reader(out, fname, who, int(DEBUG), use_cache)
     if msg and err:
         err.write(f"{msg}\n")
     return 0
 
 
 class Transactions():
-    """ Transactions class """
-    def __init__(self, fname:str="", sheet_name:str=""):
-        self._wbk = openpyxl.load_workbook(fname, read_only=True, data_only=True) if fname else None
-        self._sheet, self._content = None, {}
-        sheet = sheet_name if sheet_name else "stock_transactions"
+    """ Transactions class
+    When 'columnar' is True, only the TransactionTable is built (see table()).
+    Parsed workbooks are cached next to 'fname', unless 'use_cache' is False.
+    """
+    def __init__(self, fname:str="", sheet_name:str="", columnar:bool=False, use_cache:bool=True):
+        self._sheet = sheet_name if sheet_name else DEFAULT_SHEET_NAME
         self._msg, self._content = "", {}
-        if self._wbk:
-            self._sheet = self._init_sheet(fname, sheet)
+        self._table = None
+        self._date_index = None
+        if fname:
+            if columnar:
+                self._init_table(fname, self._sheet, use_cache)
+            else:
+                self._init_sheet(fname, self._sheet, use_cache)
             self.heads = self._from_heading()
         else:
             self.heads = []
@@ -72,17 +88,59 @@ class Transactions():
         assert self._content
         return self._content
 
-    def by_account(self, account_name:str) -> list:
-        """ Returns the list of transactions per account """
+    def table(self):
+        """ Returns the TransactionTable, or None if not columnar """
+        return self._table
+
+    def by_account(self, account_name:str):
+        """ Returns the list of transactions per account,
+        or a TableView when columnar.
+        """
         assert account_name
+        if self._table is not None:
+            return self._table.by_account(account_name)
         return self._content["data"]["by-id"][account_name]
 
-    def _init_sheet(self, fname, sheet_name:str):
+    def date_index(self):
+        """ Returns the per-account DateIndex (built on first use) """
+        if self._date_index is None:
+            if self._table is not None:
+                self._date_index = dateindex.from_table(self._table)
+            else:
+                self._date_index = dateindex.from_content(self._content)
+        return self._date_index
+
+    def holdings_as_of(self, account_name:str, adate) -> dict:
+        """ Returns ISIN (or product name) -> quantity held by an account,
+        at the end of 'adate' (ISO string, date, or day ordinal).
+        """
+        return self.date_index().holdings(account_name, adate)
+
+    def transactions_between(self, account_name:str, first, last) -> list:
+        """ Returns the transactions of an account, from 'first' to 'last' (dates included):
+        table row indexes when columnar, else elements as by_account().
+        """
+        return self.date_index().between(account_name, first, last)
+
+    def _init_sheet(self, fname, sheet_name:str, use_cache:bool=True):
         assert sheet_name
-        sheet = self._wbk[sheet_name]
-        msg, content = read_sheet(sheet, fname)
+        msg, content = load_content(fname, sheet_name, use_cache=use_cache)
         self._msg, self._content = msg, content
-        return sheet
+        return sheet_name
+
+    def _init_table(self, fname, sheet_name:str, use_cache:bool=True):
+        assert sheet_name
+        cache = WorkbookCache(fname, sheet_name, "table") if use_cache else None
+        cached = cache.load() if cache else None
+        if cached is None:
+            msg, header, table = read_table(iter_transactions(fname, sheet_name), fname)
+            if cache and not msg:
+                cache.save((header, table))
+        else:
+            msg, (header, table) = "", cached
+        self._msg, self._content = msg, {"header": header}
+        self._table = table
+        return sheet_name
 
     def _from_heading(self) -> list:
         """ Returns pairs of (index, header-name), 1..n """
@@ -96,11 +154,9 @@ class Transactions():
         return res
 
 
-def reader(out, fname:str, who:str, debug:int=0) -> str:
+def reader(out, fname:str, who:str, debug:int=0, use_cache:bool=True) -> str:
     """ Read stocks xls """
-    wbk = openpyxl.load_workbook(fname)
-    sheet = wbk["stock_transactions"]
-    msg, content = read_sheet(sheet, fname, debug)
+    msg, content = load_content(fname, debug=debug, use_cache=use_cache)
     if debug > 0:
         print("." * 40 + "\n" + str(content))
         print("." * 40, end="\n\n")
@@ -115,10 +171,45 @@ def reader(out, fname:str, who:str, debug:int=0) -> str:
     return msg
 
 
+def load_content(fname:str, sheet_name:str="", debug:int=0, use_cache:bool=True) -> tuple:
+    """ Returns (msg, content) of the transactions sheet,
+    from the cache when it is up-to-date (skipping openpyxl).
+    """
+    sheet_name = sheet_name if sheet_name else DEFAULT_SHEET_NAME
+    cache = WorkbookCache(fname, sheet_name) if use_cache else None
+    content = cache.load() if cache else None
+    if content is not None:
+        if debug > 0:
+            print(f"Debug: '{fname}' from cache: {cache.cache_name}")
+        return "", content
+    msg, content = read_rows(iter_transactions(fname, sheet_name), fname, debug)
+    if cache and not msg:
+        cache.save(content)
+    return msg, content
+
+
+def iter_transactions(fname:str, sheet_name:str=""):
+    """ Streams the transactions sheet, in read-only mode.
+    Yields the header first, then the tuple of cell values of each row
+    (blank rows included: iter_brute() skips them, counting sheet rows).
+    """
+    wbk = openpyxl.load_workbook(fname, read_only=True, data_only=True)
+    try:
+        sheet = wbk[sheet_name if sheet_name else DEFAULT_SHEET_NAME]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        wbk.close()
+
+
 def read_sheet(sheet, fname:str="", debug:int=0) -> tuple:
+    return read_rows(sheet.iter_rows(values_only=True), fname, debug)
+
+
+def read_rows(rows, fname:str="", debug:int=0) -> tuple:
+    """ Parses rows of cell values (the header first), lazily """
     msg = ""
-    rows = [row for row in sheet]
-    header = [ala.value for ala in rows[0]]
+    rows = iter(rows)
+    header = list(next(rows))
     hdr = columns()
     if debug > 0:
         print(f"Debug: read '{fname}', header:\n",
@@ -126,7 +217,7 @@ def read_sheet(sheet, fname:str="", debug:int=0) -> tuple:
               ">>> expected header:\n",
               hdr["header"],
               end="\n\n")
-    data_dict = parse_input(header, hdr, rows[1:])
+    data_dict = parse_input(header, hdr, rows)
     content = {
         "header": header,
         "data": data_dict,
@@ -134,6 +225,43 @@ def read_sheet(sheet, fname:str="", debug:int=0) -> tuple:
     return msg, content
 
 
+def read_table(rows, fname:str="", debug:int=0) -> tuple:
+    """ Parses rows of cell values (the header first) into a TransactionTable """
+    rows = iter(rows)
+    header = list(next(rows))
+    hdr = columns()
+    if debug > 0:
+        print(f"Debug: read '{fname}' (columnar), header:\n", header, end="\n\n")
+    starting_row_idx = len(hdr["header"]) + 1
+    brutes = checked_rows(hdr["header"][0], starting_row_idx, iter_brute(hdr, rows, starting_row_idx))
+    table = table_from_brutes(brutes, starting_row_idx)
+    return "", header, table
+
+
+def table_from_brutes(rows, line:int=2, table=None) -> TransactionTable:
+    """ Appends brute rows (see iter_brute()) to a TransactionTable """
+    if table is None:
+        table = TransactionTable()
+    dates = DateNormalizer()
+    for brute in rows:
+        quant, per = brute["Quantidade"][1], brute["Per"][1]
+        assert brute["Quantidade"][0] == "n", f"Wrong quantity type: {quant}"
+        taxa = brute["Taxa"][1]
+        table.append(
+            brute["ID"][1],
+            dates.ordinal(brute["Data"]),
+            brute["Produto"][1],
+            brute["ISIN"][1] if brute["ISIN"][1] else "",
+            quant,
+            per,
+            round(quant * per, 2),
+            0.0 if taxa is None else round(taxa, 2),
+            brute.get("@line", line),
+        )
+        line += 1
+    return table
+
+
 def columns() -> dict:
     # for col in header: idx += 1; print(" " * 8 + '"' + f'{col}' + f'": {idx}' + ',')
     cols = {
@@ -173,40 +301,24 @@ def columns() -> dict:
     return hdr
 
 
-def parse_input(header:list, hdr:dict, payload:list):
+def parse_input(header:list, hdr:dict, payload):
+    """ Parses 'payload', an iterable of cell value tuples (one per row).
+    Rows are consumed lazily, and not retained.
+    """
     assert isinstance(header, list)
     hdr_dicts = hdr["header"]
     assert len(hdr_dicts) == 1
     starting_row_idx = len(hdr_dicts) + 1
     hdr_dict = hdr_dicts[0]
     assert hdr_dict["ID"] == 1, "ID must be column# 1 (A)"
-    hletter = hdr["head-letters"]
-    rowlist = []
-    for row in payload:
-        brute = {
-            "@data_types": "",
-        }
-        for cell in row:
-            letra = cell.column_letter
-            brute["@data_types"] += cell.data_type
-            field = hletter.get(letra)
-            if not field:
-                assert field is None
-                continue
-            brute[field] = (cell.data_type, cell.value)
-        rowlist.append(brute)
     content = {
         "header": header,
-        "tail": rowlist,
         "starting-row-idx": starting_row_idx,
         "from-to": [],
         "by-id": {},
     }
-    #	types = [brute["@data_types"] for brute in content["tail"]]
-    #	print('\n'.join(types))
-    msg = check_all_columns(hdr_dict, starting_row_idx, rowlist)
-    assert msg == "", f"check_all_columns(): {msg}"
-    dct = process_brute_content(content, starting_row_idx)
+    rowlist = checked_rows(hdr_dict, starting_row_idx, iter_brute(hdr, payload, starting_row_idx))
+    dct = process_brute_content(content, rowlist, starting_row_idx)
     # Sanity check only:
     for acronym in dct:
         # Check listing By acronym 'H', 'm', 'p', ...etc.
@@ -216,90 +328,124 @@ def parse_input(header:list, hdr:dict, payload:list):
     return content
 
 
-def process_brute_content(content:dict, idx:int=2, debug=0) -> dict:
-    """ Makes formulas """
-    alist, taxlist = [], []
-    from_to = []
-    rowlist = content["tail"]
-    baselist = ["NADA"] * idx
+def iter_brute(hdr:dict, payload, line:int=2):
+    """ Yields one dictionary per row: field name -> (data_type, value);
+    blank rows are skipped, and '@line' is the sheet row number ('line' the first one).
+    """
+    names = hdr["head-indexes"]
+    for line, row in enumerate(payload, line):
+        if all(value is None for value in row):
+            continue
+        brute = {"@line": line}
+        types = ""
+        for col_idx, value in enumerate(row, 1):
+            data_type = value_data_type(value)
+            types += data_type
+            field = names.get(col_idx)
+            if not field:
+                assert field is None
+                continue
+            brute[field] = (data_type, value)
+        brute["@data_types"] = types
+        yield brute
+
+
+def value_data_type(value) -> str:
+    """ Returns the openpyxl cell data type for a (values only) cell """
+    if value is None:
+        return "n"
+    if isinstance(value, str):
+        return "s"
+    if isinstance(value, bool):
+        return "b"
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return "d"
+    return "n"
+
+
+def process_brute_content(content:dict, tail, idx:int=2, debug=0) -> dict:
+    """ Makes formulas, from 'tail' rows (see iter_brute()) """
+    rows = []
     for acronym in VALID_IDS:
         assert acronym not in content["by-id"], acronym
         content["by-id"][acronym] = []
     line = idx
-    tax_idx = {}
-    for brute in rowlist:
-        types = brute["@data_types"]
-        quant, per, local = brute["Quantidade"][1], brute["Per"][1], brute["Valor_local"][1]
-        #print("Debug:", content, quant, per, local)
-        astr = date_from_cell_tup(brute["Data"])
-        adate = astr
-        value = round(quant * per, 2)
-        shown_total = money_string(value)
-        if debug > 0:
-            print(f"Debug: #{idx}", types, quant, per, local)
-        assert brute["Quantidade"][0] == "n", f"Wrong quantity type: {quant}"
-        elem = [
-            idx,
-            brute["ID"][1],
-            adate,
-            shown_total,
-            brute["Produto"][1],
-            "buy" if quant > 0 else "sell",
-            quant,
-            value,
-            brute["ISIN"][1] if brute["ISIN"][1] else "",
-            f"line={line}",
-        ]
-        alist = [elem] + alist
-        taxa = brute["Taxa"][1]
-        if taxa is None:
-            taxa = "-"
-            taxval = 0.0
-        else:
-            taxa = money_string(taxa)
-            taxval = float(taxa)
-        taxlist = [(taxa, taxval, TAX_COIN)] + taxlist
-        baselist.append(elem)
+    dates = DateNormalizer()
+    for brute in tail:
+        rows.append(elem_from_brute(brute, idx, brute.get("@line", line), debug, dates))
         idx += 1
         line += 1
-    row_id = 1000
-    for idx, elem in enumerate(alist):
-        row_id += 1
+    # Listings go from the newest (last row) to the oldest
+    from_to = []
+    by_id = content["by-id"]
+    for row_id, (elem, tax) in enumerate(reversed(rows), 1001):
         elem[0] = row_id
         acronym = elem[1]
-        tup = tuple(elem)
-        from_to.append(tup)
-        elem[0] = len(content["by-id"][acronym]) + LOW_IDX + 1
-        elem[1] = taxlist[idx]
-        content["by-id"][acronym].append(elem)
+        from_to.append(tuple(elem))
+        elem[0] = len(by_id[acronym]) + LOW_IDX + 1
+        elem[1] = tax
+        by_id[acronym].append(elem)
     # Transactions().content()["data"]["from-to"] lists transactions linearly for all accounts
     content["from-to"] = from_to
-    return content["by-id"]
+    return by_id
+
 
+def elem_from_brute(brute:dict, idx:int, line:int, debug=0, dates=None) -> tuple:
+    """ Returns the transaction (list) of a row, and its tax triplet """
+    quant, per = brute["Quantidade"][1], brute["Per"][1]
+    if dates is None:
+        adate = date_from_cell_tup(brute["Data"])
+    else:
+        adate = dates.iso(brute["Data"])
+    value = round(quant * per, 2)
+    if debug > 0:
+        print(f"Debug: #{idx}", brute["@data_types"], quant, per, brute["Valor_local"][1])
+    assert brute["Quantidade"][0] == "n", f"Wrong quantity type: {quant}"
+    elem = [
+        idx,
+        brute["ID"][1],
+        adate,
+        money_string(value),
+        brute["Produto"][1],
+        "buy" if quant > 0 else "sell",
+        quant,
+        value,
+        brute["ISIN"][1] if brute["ISIN"][1] else "",
+        f"line={line}",
+    ]
+    taxa = brute["Taxa"][1]
+    if taxa is None:
+        taxa = "-"
+        taxval = 0.0
+    else:
+        taxa = money_string(taxa)
+        taxval = float(taxa)
+    return elem, (taxa, taxval, TAX_COIN)
 
-def check_all_columns(hdr_dict:dict, idx:int, rowlist:list) -> str:
-    for row in rowlist:
-        has = "@data_types" in row
-        assert has
-        n_fields = len(row) - int(has)
-        if n_fields != len(hdr_dict):
-            #print("# row:", row)
-            return f"Row {idx}: has {n_fields} columns, expected {len(hdr_dict)}"
+
+def checked_rows(hdr_dict:dict, idx:int, rows):
+    """ Yields the rows, asserting check_columns() on each one """
+    for row in rows:
+        msg = check_columns(hdr_dict, row.get("@line", idx), row)
+        assert msg == "", f"checked_rows(): {msg}"
+        yield row
         idx += 1
+
+
+def check_columns(hdr_dict:dict, idx:int, row:dict) -> str:
+    has = "@data_types" in row
+    assert has
+    n_fields = len(row) - int(has) - int("@line" in row)
+    if n_fields != len(hdr_dict):
+        #print("# row:", row)
+        return f"Row {idx}: has {n_fields} columns, expected {len(hdr_dict)}"
     return ""
 
 
 def date_from_cell_tup(tup:tuple) -> str:
-    atype, aval = tup
-    # f'{brute["Data"][0]}:{brute["Data"][1]}'
-    # f'{atype}:{aval}'
-    if atype == "s":	# excel string
-        obj = datetime.datetime.strptime(aval, "%d-%m-%Y")
-    elif atype == "d":
-        obj = aval
-    new = obj.strftime("%Y-%m-%d")
-    assert isinstance(new, str)
-    iso_date = new
+    """ Returns the ISO date of a date cell, see also dates.DateNormalizer """
+    iso_date = date_of(tup).isoformat()
+    assert isinstance(iso_date, str)
     return iso_date
 
 
@@ -7,14 +7,17 @@ Stock transaction(s)
 
 # pylint: disable=missing-function-docstring, line-too-long
 
+from concurrent.futures import ThreadPoolExecutor
 from netstocked.common import money_string
-from netstocked.isin import isin_cache
+from netstocked.isin import isin_cache, SharedIsinCache
 
 
 class AsTransaction():
     """ Transaction (see class Transactions)
     """
-    def __init__(self, tup, isin=""):
+    __slots__ = ("t_id", "date", "buy", "quant", "t_val", "_name", "_isin", "_easy")
+
+    def __init__(self, tup, isin="", cache=None):
         assert isinstance(tup, (list, tuple))
         t_id, star, date, s_val, s_name, buy, quant, t_val = tup
         if isinstance(t_val, int):
@@ -32,14 +35,55 @@ class AsTransaction():
         self.t_id, self.date = t_id, date
         self.buy, self.quant, self.t_val = buy, quant, t_val
         assert star == "*"
-        self._name, self._isin = isin_cache.update_cache(s_name, isin)
+        if cache is None:
+            cache = isin_cache
+        self._name, self._isin = cache.update_cache(s_name, isin)
+        self._easy = cache.easier_name(self._isin)
+
+    @classmethod
+    def from_rows(cls, rows, isins=None, cache=None) -> list:
+        """ Returns the transactions of many rows (tuples, as for __init__),
+        checked column by column, and ISINs resolved in one cache pass.
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        if not rows:
+            return []
+        assert set(map(len, rows)) == {8}
+        t_ids, stars, dates, s_vals, s_names, buys, quants, t_vals = zip(*rows)
+        assert set(stars) == {"*"}
+        assert set(buys) <= {"buy", "sell"}, f"Wrong 'buy': {set(buys) - {'buy', 'sell'}}"
+        assert all(s_vals) and set(map(type, s_vals)) == {str}
+        assert all(s_names)
+        assert set(map(type, quants)) <= {int}
+        assert set(map(type, t_vals)) <= {int, float}
+        values = [
+            (float(t_val) if isinstance(t_val, int) else round(t_val, 2)) * (-1.0 if quant < 0 else 1.0)
+            for t_val, quant in zip(t_vals, quants)
+        ]
+        isins = [""] * len(rows) if isins is None else list(isins)
+        assert len(isins) == len(rows), f"{len(isins)} ISINs for {len(rows)} rows"
+        if cache is None:
+            cache = isin_cache
+        resolved = cache.update_many(zip(s_names, isins))
+        res = []
+        for t_id, date, buy, quant, t_val, (name, isin) in zip(t_ids, dates, buys, quants, values, resolved):
+            trans = cls.__new__(cls)
+            trans.t_id, trans.date = t_id, date
+            trans.buy, trans.quant, trans.t_val = buy, quant, t_val
+            trans._name, trans._isin = name, isin
+            trans._easy = cache.easier_name(isin)
+            res.append(trans)
+        return res
 
     def stock_name(self) -> str:
-        name = isin_cache.easier_name(self._isin)
-        if name:
-            return name
+        """ Returns the easier name (of the cache used), or the name """
+        if self._easy:
+            return self._easy
         return self._name
 
+    def isin(self) -> str:
+        return self._isin
+
     def string(self) -> str:
         aval = money_string(self.t_val)
         shown = stock_string(self._name)
@@ -59,6 +103,24 @@ class AsTransaction():
         return res
 
 
+def load_transactions(by_account:dict, workers:int=4, cache=None) -> tuple:
+    """ Builds AsTransaction lists of several accounts, in threads.
+    'by_account' is account -> list of (tup, isin).
+    Returns the pair (account -> transactions, the shared ISIN cache used).
+    """
+    if cache is None:
+        cache = SharedIsinCache()
+
+    def load(pairs):
+        return [AsTransaction(tup, isin, cache) for tup, isin in pairs]
+
+    accounts = list(by_account)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        lists = pool.map(load, [by_account[account] for account in accounts])
+        res = dict(zip(accounts, lists))
+    return res, cache
+
+
 def stock_string(astr:str) -> str:
     shown = f"{astr:_<16.14}"
     if len(astr) > 14:
@@ -0,0 +1,144 @@
+#-*- coding: utf-8 -*-
+# transtable.py  (c)2022  Henrique Moreira
+
+"""
+Column-oriented store of stock transactions.
+"""
+
+# pylint: disable=missing-function-docstring
+
+from array import array
+
+# Column name -> array typecode
+TABLE_COLUMNS = {
+    "account": "l",	# code, see strings()
+    "date": "l",	# day ordinal, see datetime.date.fromordinal()
+    "product": "l",	# code, see strings()
+    "isin": "l",	# code, see strings()
+    "quant": "d",
+    "price": "d",
+    "value": "d",
+    "tax": "d",
+    "line": "l",	# row (line) at the sheet
+}
+
+
+class StringPool():
+    """ Interned strings, each one with an integer code """
+    def __init__(self):
+        self._codes = {}
+        self._strings = []
+
+    def code(self, astr:str) -> int:
+        """ Returns the code of 'astr', adding it if new """
+        there = self._codes.get(astr)
+        if there is None:
+            there = len(self._strings)
+            self._codes[astr] = there
+            self._strings.append(astr)
+        return there
+
+    def find(self, astr:str) -> int:
+        """ Returns the code of 'astr', or -1 if unknown """
+        return self._codes.get(astr, -1)
+
+    def __getitem__(self, code:int) -> str:
+        return self._strings[code]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class TransactionTable():
+    """ Transactions, one array per column (see TABLE_COLUMNS),
+    in the same order as the rows at the sheet.
+    """
+    def __init__(self):
+        self._cols = {name: array(code) for name, code in TABLE_COLUMNS.items()}
+        self._strings = StringPool()
+        self._by_account = {}
+
+    def __len__(self) -> int:
+        return len(self._cols["line"])
+
+    def strings(self) -> StringPool:
+        return self._strings
+
+    def column(self, name:str) -> array:
+        """ Returns the array of column 'name' (not a copy!) """
+        return self._cols[name]
+
+    def accounts(self) -> list:
+        return sorted(self._by_account)
+
+    def append(self, account:str, date:int, product:str, isin:str,
+               quant, price, value, tax, line:int) -> int:
+        """ Adds a transaction, returns its row index """
+        cols, pool = self._cols, self._strings
+        idx = len(self)
+        cols["account"].append(pool.code(account))
+        cols["date"].append(date)
+        cols["product"].append(pool.code(product))
+        cols["isin"].append(pool.code(isin))
+        cols["quant"].append(quant)
+        cols["price"].append(price)
+        cols["value"].append(value)
+        cols["tax"].append(tax)
+        cols["line"].append(line)
+        if account not in self._by_account:
+            self._by_account[account] = array("l")
+        self._by_account[account].append(idx)
+        return idx
+
+    def row(self, idx:int) -> tuple:
+        """ Returns the row at 'idx', as a tuple (see TABLE_COLUMNS),
+        strings decoded.
+        """
+        cols, pool = self._cols, self._strings
+        return (
+            pool[cols["account"][idx]],
+            cols["date"][idx],
+            pool[cols["product"][idx]],
+            pool[cols["isin"][idx]],
+            cols["quant"][idx],
+            cols["price"][idx],
+            cols["value"][idx],
+            cols["tax"][idx],
+            cols["line"][idx],
+        )
+
+    def by_account(self, account:str):
+        """ Returns the view of transactions of 'account' """
+        assert account
+        indexes = self._by_account.get(account)
+        if indexes is None:
+            indexes = array("l")
+        return TableView(self, indexes)
+
+
+class TableView():
+    """ Subset of rows of a TransactionTable, by row index (no copies) """
+    def __init__(self, table:TransactionTable, indexes:array):
+        self._table = table
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, pos:int) -> tuple:
+        return self._table.row(self.indexes[pos])
+
+    def __iter__(self):
+        row = self._table.row
+        for idx in self.indexes:
+            yield row(idx)
+
+    def column(self, name:str) -> list:
+        """ Returns the values of column 'name' for this view """
+        col = self._table.column(name)
+        return [col[idx] for idx in self.indexes]
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
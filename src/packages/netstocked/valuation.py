@@ -0,0 +1,156 @@
+#-*- coding: utf-8 -*-
+# valuation.py  (c)2022  Henrique Moreira
+
+"""
+Valuation of positions, at the latest Euronext prices.
+
+Holdings are (account, isin or product name) -> (quantity, cost),
+as PositionBook.holdings(); prices are ISIN -> last price,
+see price_index() and latest_prices().
+"""
+
+# pylint: disable=missing-function-docstring
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Valuation():
+    """ Valuation columns, one row per position """
+    def __init__(self, keys, isins, quant, cost, price):
+        self.keys = keys	# (account, isin or product name)
+        self.isins = isins	# resolved ISIN, empty if not found
+        self.quant, self.cost, self.price = quant, cost, price
+        self.value, self.pnl, self.weight = [], [], []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rows(self) -> list:
+        """ Returns tuples (account, key, isin, quant, price, value, cost, pnl, weight) """
+        return [
+            (account, key, isin, quant, price, value, cost, pnl, weight)
+            for (account, key), isin, quant, price, value, cost, pnl, weight in zip(
+                self.keys, self.isins, _listed(self.quant), _listed(self.price), _listed(self.value),
+                _listed(self.cost), _listed(self.pnl), _listed(self.weight),
+            )
+        ]
+
+    def totals(self) -> dict:
+        """ Returns account -> (value, cost, unrealized P&L), of priced positions """
+        res = {}
+        for (account, _), value, cost in zip(self.keys, _listed(self.value), _listed(self.cost)):
+            if math.isnan(value):
+                continue
+            there = res.get(account, (0.0, 0.0, 0.0))
+            res[account] = (there[0] + value, there[1] + cost, there[2] + value - cost)
+        return {account: tuple(round(num, 2) for num in there) for account, there in res.items()}
+
+    def missing(self) -> list:
+        """ Returns the keys of positions without price """
+        return [key for key, price in zip(self.keys, _listed(self.price)) if math.isnan(price)]
+
+
+def value_book(holdings:dict, prices:dict, stock_db=None) -> Valuation:
+    """ Values all positions in one pass: market value, unrealized P&L, and weight
+    at its account. Keys without ISIN are looked up by name, then by symbol,
+    at 'stock_db' (a mintracker StockDB), if given.
+    """
+    keys = list(holdings)
+    isins = [resolved_isin(key[1], prices, stock_db) for key in keys]
+    quant = [holdings[key][0] for key in keys]
+    cost = [holdings[key][1] for key in keys]
+    price = [prices.get(isin, math.nan) if isin else math.nan for isin in isins]
+    res = Valuation(keys, isins, quant, cost, price)
+    if numpy is None:
+        _evaluate_lists(res)
+    else:
+        _evaluate_arrays(res)
+    return res
+
+
+def _evaluate_arrays(res:Valuation):
+    codes = {}
+    accounts = numpy.array([codes.setdefault(account, len(codes)) for account, _ in res.keys], dtype=numpy.int64)
+    res.quant = numpy.array(res.quant, dtype=numpy.float64)
+    res.cost = numpy.array(res.cost, dtype=numpy.float64)
+    res.price = numpy.array(res.price, dtype=numpy.float64)
+    res.value = res.quant * res.price
+    res.pnl = res.value - res.cost
+    totals = numpy.bincount(accounts, weights=numpy.nan_to_num(res.value), minlength=len(codes))
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        res.weight = res.value / totals[accounts]
+
+
+def _evaluate_lists(res:Valuation):
+    res.quant = [float(quant) for quant in res.quant]
+    res.cost = [float(cost) for cost in res.cost]
+    res.value = [quant * price for quant, price in zip(res.quant, res.price)]
+    res.pnl = [value - cost for value, cost in zip(res.value, res.cost)]
+    totals = {}
+    for (account, _), value in zip(res.keys, res.value):
+        if not math.isnan(value):
+            totals[account] = totals.get(account, 0.0) + value
+    res.weight = [
+        value / totals[account] if totals.get(account) else math.nan
+        for (account, _), value in zip(res.keys, res.value)
+    ]
+
+
+def resolved_isin(key:str, prices:dict, stock_db=None) -> str:
+    """ Returns the ISIN of a holdings key: an ISIN, or a product name (or symbol) """
+    if key in prices:
+        return key
+    if stock_db is None:
+        return key if _looks_like_isin(key) else ""
+    for isins in (stock_db.get_from_name(key), stock_db.get_from_symbol(key)):
+        if len(isins) == 1:
+            return isins[0]
+        priced = [isin for isin in isins if isin in prices]
+        if len(priced) == 1:
+            return priced[0]
+    return key if _looks_like_isin(key) else ""
+
+
+def price_index(data, field:str="last") -> dict:
+    """ Returns ISIN -> price, of a MarketData snapshot (prices missing left out) """
+    return {
+        isin: price for isin, price in zip(data.isins, data.columns[field]) if not math.isnan(price)
+    }
+
+
+def latest_prices(hist, field:str="last") -> dict:
+    """ Returns ISIN -> price at the newest snapshot of a PriceHistory """
+    dates = hist.column("date")
+    if not len(dates):
+        return {}
+    isins = hist.isins()
+    if numpy is not None:
+        dates = hist.numpy_column("date")
+        values = hist.numpy_column(field)
+        rows = numpy.flatnonzero((dates == dates.max()) & ~numpy.isnan(values))
+        codes = hist.numpy_column("isin")[rows]
+        return dict(zip([isins[code] for code in codes.tolist()], values[rows].tolist()))
+    newest = max(dates)
+    values, codes = hist.column(field), hist.column("isin")
+    return {
+        isins[codes[num]]: values[num]
+        for num in range(len(dates)) if dates[num] == newest and not math.isnan(values[num])
+    }
+
+
+def _looks_like_isin(key:str) -> bool:
+    return len(key) == 12 and key[:2].isalpha() and key.isalnum()
+
+
+def _listed(column) -> list:
+    return column.tolist() if numpy is not None and isinstance(column, numpy.ndarray) else column
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
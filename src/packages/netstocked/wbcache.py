@@ -0,0 +1,116 @@
+#-*- coding: utf-8 -*-
+# wbcache.py  (c)2022  Henrique Moreira
+
+"""
+Sidecar cache of parsed workbooks.
+
+Cache files stay next to the workbook, one per sheet and kind of content
+('.<basename>.<sheet>.<kind>.cache'), and hold two pickles:
+the key, and the already processed content.
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os
+import os.path
+import pickle
+import hashlib
+import tempfile
+
+CACHE_VERSION = 3
+CACHE_SUFFIX = ".cache"
+
+
+class WorkbookCache():
+    """ Cache of a workbook 'fname', for a given sheet and kind of content """
+    def __init__(self, fname:str, sheet_name:str, kind:str="content"):
+        assert fname
+        self.fname = fname
+        self.cache_name = cache_name(fname, sheet_name, kind)
+        self._what = (sheet_name, kind)
+        self._key = None	# workbook key, before it is parsed (see load())
+
+    def load(self):
+        """ Returns the cached content, or None if missing or stale.
+        Call it before parsing the workbook: the key save() stores is the one seen here.
+        """
+        try:
+            self._key = self.key()
+            with open(self.cache_name, "rb") as fdin:
+                key = pickle.load(fdin)
+                if key != self._key:
+                    return None
+                return pickle.load(fdin)
+        except Exception:	# pylint: disable=broad-except
+            # e.g. a pickle of a class meanwhile renamed or moved: parse again
+            return None
+
+    def save(self, content) -> bool:
+        """ Writes the cache (atomically); returns False if not possible """
+        dirname = os.path.dirname(self.cache_name)
+        tmp_name = ""
+        try:
+            key = self.key() if self._key is None else self._key
+            handle, tmp_name = tempfile.mkstemp(dir=dirname if dirname else ".")
+            with os.fdopen(handle, "wb") as fdout:
+                pickle.dump(key, fdout, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(content, fdout, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self.cache_name)
+        except OSError:
+            if tmp_name and os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            return False
+        return True
+
+    def invalidate(self) -> bool:
+        """ Removes the cache file; returns True if there was one """
+        self._key = None
+        try:
+            os.remove(self.cache_name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def key(self) -> tuple:
+        """ Returns the key: path, size, mtime, and content hash """
+        stat = os.stat(self.fname)
+        with open(self.fname, "rb") as fdin:
+            digest = hashlib.sha1(fdin.read()).hexdigest()
+        return (
+            CACHE_VERSION,
+            os.path.abspath(self.fname),
+            stat.st_size,
+            stat.st_mtime_ns,
+            digest,
+        ) + self._what
+
+
+def cache_name(fname:str, sheet_name:str="", kind:str="content") -> str:
+    """ Returns the sidecar cache path of workbook 'fname', for a sheet and kind """
+    dirname, basename = os.path.split(fname)
+    sheet = f".{sheet_name}" if sheet_name else ""
+    return os.path.join(dirname, f".{basename}{sheet}.{kind}{CACHE_SUFFIX}")
+
+
+def invalidate_cache(fname:str) -> bool:
+    """ Removes all cache files of workbook 'fname'; returns True if there was any """
+    dirname, basename = os.path.split(fname)
+    prefix = f".{basename}."
+    try:
+        names = os.listdir(dirname if dirname else ".")
+    except FileNotFoundError:
+        return False
+    found = False
+    for name in names:
+        if name.startswith(prefix) and name.endswith(CACHE_SUFFIX):
+            try:
+                os.remove(os.path.join(dirname, name))
+            except FileNotFoundError:
+                continue
+            found = True
+    return found
+
+
+# Main script
+if __name__ == "__main__":
+    print("Please import me.")
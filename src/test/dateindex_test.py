@@ -0,0 +1,78 @@
+""" Test for dateindex.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import datetime
+import random
+import tempfile
+
+from netstocked import stockfolio
+from synthetic import transaction_row, write_transactions
+
+NUM_ROWS = 600
+FIRST_DAY = datetime.date(2021, 1, 4)
+
+
+def main_test() -> bool:
+    """ As-of holdings and date ranges: same as a linear replay, in both modes """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        rows = write_workbook(fname, NUM_ROWS)
+        trans = stockfolio.Transactions(fname, use_cache=False)
+        columnar = stockfolio.Transactions(fname, columnar=True, use_cache=False)
+    rnd = random.Random(2)
+    for _ in range(200):
+        account = rnd.choice(stockfolio.VALID_IDS)
+        when = FIRST_DAY + datetime.timedelta(days=rnd.randint(-2, NUM_ROWS // 3 + 2))
+        expected = replay(rows, account, when)
+        assert trans.holdings_as_of(account, when.isoformat()) == expected
+        assert columnar.holdings_as_of(account, when) == expected
+    assert trans.holdings_as_of("H", FIRST_DAY - datetime.timedelta(days=1)) == {}
+    first, last = "2021-02-01", "2021-02-10"
+    elems = trans.transactions_between("p", first, last)
+    assert elems and all(first <= elem[2] <= last for elem in elems)
+    indexes = columnar.transactions_between("p", first, last)
+    assert len(indexes) == len(elems)
+    table = columnar.table()
+    assert sorted(table.row(idx)[8] for idx in indexes) == sorted(int(elem[9][5:]) for elem in elems)
+    assert trans.transactions_between("m", last, first) == []
+    assert columnar.holdings_as_of("nobody", last) == {}
+    return True
+
+
+def replay(rows, account, when) -> dict:
+    held = {}
+    for row in rows:
+        if row[0] == account and row[1] <= when:
+            key = row[4] if row[4] else row[3]
+            held[key] = held.get(key, 0) + row[6]
+    return {key: quant for key, quant in held.items() if quant}
+
+
+def write_workbook(fname:str, size:int) -> list:
+    """ Writes a transactions sheet, not sorted by date; returns its rows """
+    rnd = random.Random(1)
+    rows = []
+    for idx in range(size):
+        num = idx % 13
+        rows.append(transaction_row(
+            ID=rnd.choice(stockfolio.VALID_IDS),
+            Data=FIRST_DAY + datetime.timedelta(days=rnd.randint(0, size // 3)),
+            Produto=f"STOCK{num}",
+            ISIN=f"PT{num:010d}" if num % 4 else "",
+            Bolsa="XLIS",
+            Quantidade=rnd.choice((1, -1)) * rnd.randint(1, 50),
+        ))
+    write_transactions(fname, rows)
+    return rows
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
@@ -0,0 +1,66 @@
+""" Test for euronextdiff.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import tempfile
+import time
+
+from mintracker.sindexes import euronextdiff
+from mintracker.sindexes.euronextimport import Importer, MKT_MAP, dump_universe
+from mintracker.sindexes.universe import Universe
+from synthetic import equities_rows, write_equities
+
+NUM_ROWS = 10000
+
+
+def main_test() -> bool:
+    """ Diff of two snapshots; patched universe is the same as the new one """
+    markets = sorted(MKT_MAP.values())
+    old_rows = equities_rows(NUM_ROWS, markets, market_data=False)
+    new_rows = [list(row) for row in old_rows[100:]]	# 100 delisted
+    for idx in range(0, len(new_rows), 1000):
+        new_rows[idx][2] += "X"	# symbol change
+        new_rows[idx + 1][3] = markets[(markets.index(new_rows[idx + 1][3]) + 1) % len(markets)]
+    new_rows += equities_rows(5, markets, start=NUM_ROWS, market_data=False)	# new listings
+    with tempfile.TemporaryDirectory() as tmpdir:
+        names = []
+        for what, rows in (("old", old_rows), ("new", new_rows)):
+            fname = os.path.join(tmpdir, f"{what}.csv")
+            write_equities(fname, rows)
+            names.append(fname)
+            opts = {"filter": None, "pre": ""}
+            dump_universe(Importer(fname), opts, os.path.join(tmpdir, f"{what}.bin"))
+        old, new = [euronextdiff.records_from(fname) for fname in names]
+        start = time.perf_counter()
+        diff = euronextdiff.diff_records(old, new)
+        elapsed = time.perf_counter() - start
+        print(f"diff_records(), {len(old)} stocks: {elapsed * 1000:.1f} ms")
+        assert len(diff.removed) == 100
+        assert len(diff.added) == 5
+        assert len(diff.changed) == 20
+        log = diff.changelog()
+        assert len(log) == len(diff)
+        print("\n".join(log[:3] + log[-2:]))
+        old_bin, new_bin = [os.path.join(tmpdir, f"{what}.bin") for what in ("old", "new")]
+        assert euronextdiff.records_from(old_bin) == old
+        patched = os.path.join(tmpdir, "patched.bin")
+        num = euronextdiff.patch_universe(old_bin, diff, patched)
+        assert num == len(new)
+        assert euronextdiff.records_from(patched) == new
+        with Universe(patched) as there, Universe(new_bin) as ref:
+            assert there.markets() == ref.markets()
+            for mkt in ref.markets():
+                assert sorted(there.stock_names_by_market(mkt)) == sorted(ref.stock_names_by_market(mkt))
+        assert not euronextdiff.diff_records(new, euronextdiff.records_from(patched))
+    return True
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
@@ -0,0 +1,255 @@
+""" Test for euronextimport.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import io
+import contextlib
+import os.path
+import random
+import tempfile
+import time
+
+from mintracker.sindexes import euronextimport
+from mintracker.sindexes.euronextimport import \
+     Importer, MKT_MAP, MarketRegistry, \
+     dump_by_index, short_market_name, market_to_varname, \
+     import_many, merge_by_date, snapshot_date
+from mintracker.sindexes.isin import ISIN, ISIN_checksum
+from mintracker.sindexes.pricehist import PriceHistory
+from synthetic import EQUITIES_PREAMBLE, MARKET_DATA, write_equities
+
+NUM_ROWS = 10000
+
+
+def main_test() -> bool:
+    """ dump_by_index() output is the same as the former (quadratic) one """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "Euronext_Equities_2022-01-03.xlsx")
+        write_synthetic(fname, NUM_ROWS)
+        imp = Importer(fname)
+    assert not imp.get_messages()
+    assert len(imp.content) == NUM_ROWS
+    for filtered in (None, "EUR"):
+        opts = {"filter": filtered, "pre": " " * 4}
+        outs = []
+        for func in (legacy_dump_by_index, dump_by_index):
+            out = io.StringIO()
+            start = time.perf_counter()
+            func(imp, opts, out)
+            elapsed = time.perf_counter() - start
+            print(f"{func.__name__:<22} filter={filtered}: {elapsed * 1000:9.1f} ms")
+            outs.append(out.getvalue())
+        assert outs[0] == outs[1]
+        assert "DUPS_EURONEXT_STOCKS_" in outs[1]
+    return True
+
+
+def batch_test() -> bool:
+    """ import_many() in a process pool, same as one by one; merged by date """
+    assert snapshot_date("/a/Euronext_Equities_2022-01-03.xlsx") == "2022-01-03"
+    assert snapshot_date("Euronext_Equities.xlsx") == ""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = []
+        for idx, date in enumerate(("2022-01-04", "2022-01-03", "2022-01-04")):
+            fname = os.path.join(tmpdir, f"Euronext_Equities_{date}.{idx}.xlsx")
+            write_synthetic(fname, 200 + idx, seed=idx)
+            fnames.append(fname)
+        snaps = import_many(fnames, workers=2)
+        ref = [Importer(fname).content for fname in fnames]
+    assert [snap.content for snap in snaps] == ref
+    assert [snap.fname for snap in snaps] == fnames
+    assert all(snap.elapsed > 0 for snap in snaps)
+    merged = merge_by_date(snaps)
+    assert list(merged) == ["2022-01-03", "2022-01-04"]
+    assert merged["2022-01-04"].content == ref[0] + ref[2]
+    assert merged["2022-01-04"].market_data is None
+    assert len(snaps[0].content) == 200
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = [os.path.join(tmpdir, f"Euronext_Equities_2022-01-04.{idx}.xlsx") for idx in range(2)]
+        for idx, fname in enumerate(fnames):
+            write_synthetic(fname, 100 + idx, seed=idx)
+        snaps = import_many(fnames, workers=1, market_data=True)
+        store = os.path.join(tmpdir, "history")
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert euronextimport.batch_runner([tmpdir, "--history", store] + fnames) == 0
+        with PriceHistory(store) as hist:
+            assert len(hist) == 201
+    data = merge_by_date(snaps)["2022-01-04"].market_data
+    assert data.date == "2022-01-04"
+    assert data.isins == snaps[0].market_data.isins + snaps[1].market_data.isins
+    assert len(data.columns["volume"]) == len(data) == 201
+    assert len(snaps[0].market_data) == 100
+    try:
+        merge_by_date(snaps + [euronextimport.Snapshot("Euronext_Equities.xlsx")])
+    except AssertionError:
+        pass
+    else:
+        assert False, "Expected undated snapshot"
+    return True
+
+
+def undated_test() -> bool:
+    """ batch_runner() rejects snapshots without a date in their name, or a missing output directory """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = [os.path.join(tmpdir, name) for name in ("Euronext_Equities_2022-01-03.xlsx", "Euronext_Equities.xlsx")]
+        for fname in fnames:
+            write_synthetic(fname, 20)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            assert euronextimport.batch_runner([tmpdir] + fnames) == 1
+        assert "No date (YYYY-MM-DD) in snapshot name: " + fnames[1] in out.getvalue()
+        assert sorted(os.listdir(tmpdir)) == sorted(os.path.basename(fname) for fname in fnames)
+        outdir = os.path.join(tmpdir, "missing")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            assert euronextimport.batch_runner([outdir] + fnames[:1]) == 1
+        assert f"Output directory not found: {outdir}" in out.getvalue()
+    return True
+
+
+def text_test() -> bool:
+    """ csv/ txt lists, with lines before the header, same as xlsx """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = os.path.join(tmpdir, "Euronext_Equities_2022-01-03")
+        rows = synthetic_rows(300)
+        write_equities(base + ".xlsx", rows)
+        ref = Importer(base + ".xlsx").content
+        for delimiter, ext in ((",", "csv"), (";", "csv"), ("\t", "txt"), (",", "dat")):
+            fname = f"{base}.{ext}"
+            write_equities(fname, rows, delimiter)
+            imp = Importer(fname)
+            assert imp.content == ref, (delimiter, ext)
+            assert not imp.get_messages()
+        fname = base + ".csv"
+        with open(fname, "w", encoding="utf-8") as fdout:
+            fdout.write(EQUITIES_PREAMBLE + "\n")
+        imp = Importer(fname)
+        assert imp.content == []
+        assert imp.get_messages() == [f"No stocks found: {fname}"]
+    return True
+
+
+def markets_test() -> bool:
+    """ MarketRegistry: exact, encoding-damaged, and unknown market names """
+    reg = MarketRegistry(MKT_MAP)
+    for short, fullname in MKT_MAP.items():
+        assert reg.short_name(fullname) == short, fullname
+    for damaged in ("Oslo B\u00f8rs", "Oslo B?rs", "Oslo B\u00c3\u00b8rs", "Oslo Bors", "OSLO B\ufffdRS"):
+        assert reg.short_name(damaged) == "OSLO", damaged
+    assert reg.short_name("Euronext  lisbon") == "EN.LIS"
+    assert not reg.unknown_markets()
+    unknown = ("Euronext Access Dublin", "Euronext Growth Milan", "Euronext Lisb?n", "Oslo B..........rs", "Oslo B",
+               "Euronext Amsterdamx Brussels", "Euronext Paris; Brussels", "Euronext Paris Brussels")
+    for market in unknown:
+        assert reg.short_name(market) == "?", market
+    assert reg.short_name("Euronext Access Dublin", "") == ""
+    assert dict(reg.unknown_markets())["Euronext Access Dublin"] == 2
+    assert len(reg.unknown_markets()) == len(unknown)
+    return True
+
+
+def write_synthetic(fname:str, size:int, seed:int=1):
+    write_equities(fname, synthetic_rows(size, seed))
+
+
+def synthetic_rows(size:int, seed:int=1) -> list:
+    """ Returns Euronext-like equities list rows, with duplicate ISINs and symbols """
+    rnd = random.Random(seed)
+    markets = list(MKT_MAP.values()) + ["Euronext Nowhere"]
+    rows, isins = [], []
+    for idx in range(size):
+        if isins and idx % 50 == 0:
+            isin = rnd.choice(isins)
+        else:
+            isin = ISIN_checksum(f"FR{idx:09d}")
+            isins.append(isin)
+        symbol = "-" if idx % 40 == 0 else f"S{idx % 3000:04d}"
+        rows.append([
+            f"STOCK {idx}", isin, symbol, rnd.choice(markets), rnd.choice(("EUR", "EUR", "NOK")),
+        ] + list(MARKET_DATA))
+    return rows
+
+
+def legacy_dump_by_index(imp, opts, out):
+    """ Former dump_by_index(), scanning all stocks for each ISIN """
+    dct = legacy_dump_import(imp, opts)
+    avar = {}
+    mkts = sorted(MKT_MAP.keys())
+    shown = ""
+    for mkt in mkts:
+        shown += (" " * 4) + f"'{mkt}',\n"
+    out.write(f"EURONEXT_STOCKS_LIST = (\n{shown}    )\n\n")
+    for mkt in mkts:
+        varname = f"EURONEXT_STOCKS_{market_to_varname(mkt)}"
+        avar[varname] = []
+        isin_list = dct["market-isin"].get(mkt)
+        if isin_list is None:
+            continue
+        for item in isin_list:
+            count, tup = 0, None
+            for stock in dct["list"]:
+                if stock[1] == item:
+                    tup = stock
+                    count += 1
+            assert count > 0
+            if count > 1:
+                continue
+            avar[varname].append(tup)
+    for varname in sorted(avar.keys()):
+        cont = avar[varname]
+        if not cont:
+            continue
+        out.write(f"{varname} = (\n")
+        for tup in cont:
+            shown = tup[:-1]
+            out.write(f"    {shown},\n")
+        out.write("    )\n\n")
+        abbrevs, dups = {}, []
+        for tup in cont:
+            fourplet = tup[:-1]
+            symbol = fourplet[2]
+            assert ISIN(fourplet[1]).is_valid()
+            if symbol == "-":
+                continue
+            if symbol in abbrevs:
+                dups.append(f"'{symbol}'")
+            else:
+                abbrevs[symbol] = fourplet
+        if dups:
+            shown = ", ".join(dups)
+            out.write(f"DUPS_{varname} = ({shown},)\n\n")
+
+
+def legacy_dump_import(imp, opts) -> dict:
+    """ Former grouping of dump_import() """
+    stocks, isins = [], {}
+    for row in imp.content:
+        alist = euronextimport.char_map.simpler_ascii(row)
+        tup = alist[4], alist[1], alist[2], alist[0], alist[3]
+        if tup[1] in isins:
+            continue
+        if opts["filter"] is None or opts["filter"] == tup[0]:
+            stocks.append(tup)
+        isins[tup[1]] = tup
+    res = {"list": stocks, "markets": [], "market-isin": {}}
+    for stock in stocks:
+        if stock[-1] not in res["markets"]:
+            res["markets"].append(stock[-1])
+            res["market-isin"][short_market_name(stock[-1])] = []
+    for stock in stocks:
+        res["market-isin"][short_market_name(stock[-1])].append(stock[1])
+    return res
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert batch_test()
+    assert undated_test()
+    assert text_test()
+    assert markets_test()
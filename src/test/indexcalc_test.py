@@ -0,0 +1,91 @@
+""" Test for indexcalc module (part of 'mintracker')
+
+(c)2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import tempfile
+import numpy
+
+from mintracker import indexcalc
+from mintracker.snamings import StockWeight, RefISIN
+from mintracker.sindexes.stockspt import STK_W_PSI20, STK_ISIN_PSI20
+from mintracker.sindexes.pricehist import MarketData, PriceHistory
+
+NUM_DATES = 250
+
+
+def main_test() -> bool:
+    """ PSI-20 levels, contributions and drift """
+    stk = StockWeight(*STK_W_PSI20)
+    calc = indexcalc.IndexCalculator(stk)
+    num = len(stk.abbrev_list())
+    assert abs(calc.weights.sum() - 1.0) < 1e-12
+    rnd = numpy.random.default_rng(1)
+    prices = numpy.cumprod(1 + rnd.normal(0, 0.01, (NUM_DATES, num)), axis=0) * rnd.uniform(1, 20, num)
+    res = calc.compute(prices)
+    level = res["level"]
+    assert level.shape == (NUM_DATES,)
+    assert abs(level[0] - indexcalc.BASE_LEVEL) < 1e-9
+    assert numpy.allclose(res["contribution"].sum(axis=1), level - level[0])
+    assert numpy.allclose(res["drift"][0], 0.0)
+    assert numpy.allclose(res["drift"].sum(axis=1), 0.0)
+    # EDP (first, 14.01%) doubles, the others stay:
+    flat = numpy.repeat(prices[:1], 3, axis=0)
+    flat[2, 0] *= 2
+    edp = calc.weights[0]
+    assert numpy.allclose(calc.compute(flat)["level"], [1000.0, 1000.0, 1000.0 * (1 + edp)])
+    # Missing prices carry the previous date:
+    holes = prices.copy()
+    holes[5:9, 3] = numpy.nan
+    filled = calc.compute(holes)["level"]
+    assert filled[8] == calc.compute(numpy.where(numpy.isnan(holes), prices[4], holes))["level"][8]
+    # Several indexes at once:
+    many = indexcalc.index_levels([calc, calc], prices)
+    assert many.shape == (NUM_DATES, 2)
+    assert numpy.allclose(many[:, 1], level)
+    # A universe column not at the index, without price (e.g. a new listing):
+    wider = numpy.full((3, num + 1), 10.0)
+    wider[:2, num] = numpy.nan
+    assert numpy.allclose(indexcalc.index_levels([calc], wider)[:, 0], [1000.0] * 3)
+    shifted = indexcalc.IndexCalculator(stk, columns=range(1, num + 1))
+    wider[:2, 0] = numpy.nan
+    levels = indexcalc.index_levels([calc, shifted], wider, base_row=2)
+    assert numpy.isnan(levels[:2, 0]).all() and abs(levels[2, 0] - 1000.0) < 1e-9
+    assert numpy.isnan(levels[:2, 1]).all()
+    wider[:2, num] = 10.0
+    assert numpy.allclose(indexcalc.index_levels([shifted], wider, base_row=2)[:, 0], [1000.0] * 3)
+    return True
+
+
+def history_test() -> bool:
+    """ Price matrix of constituents, from a price history """
+    stk = StockWeight(*STK_W_PSI20)
+    refs = RefISIN()
+    refs.add_ISIN_refs(STK_ISIN_PSI20)
+    isins = indexcalc.constituent_isins(stk, refs.ref_isin)
+    assert isins[0] == "PTEDP0AM0009" and all(isins)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with PriceHistory(tmpdir) as hist:
+            for day, date in enumerate(("2022-01-03", "2022-01-04")):
+                data = MarketData(date)
+                for idx, isin in enumerate(isins[:-1] if day else isins):
+                    data.append(isin, [""] * 8 + [str(10.0 + idx + day)])
+                data.append("XX0000000000", [""] * 8 + ["1.0"])
+                hist.append(data)
+            dates, prices = indexcalc.price_matrix(hist, isins)
+    assert dates == ["2022-01-03", "2022-01-04"]
+    assert prices.shape == (2, len(isins))
+    assert prices[1, 0] == 11.0 and numpy.isnan(prices[1, -1])
+    level = indexcalc.IndexCalculator(stk).compute(prices)["level"]
+    assert level[1] > level[0]
+    return True
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert history_test()
@@ -5,7 +5,8 @@
 
 from mintracker.sindexes.isin import \
      ISIN_checksum_digit, \
-     ISIN, StockDB
+     ISIN, StockDB, \
+     checksum_many, validate_many, checksum_array, validate_array, numpy
 
 from mintracker.sindexes import stockspt
 from mintracker.sindexes import euronext
@@ -48,6 +49,57 @@ def main_test() -> bool:
     return True
 
 
+def batch_test() -> bool:
+    """ Batch checksums match the per-ISIN ones """
+    isins = [isin for _, isin in stockspt.STK_ISIN_PSI20]
+    isins += [fourplet[1] for fourplet in euronext.stock_names_by_market("EN.LIS")]
+    digits = [ISIN_checksum_digit(isin) for isin in isins]
+    assert checksum_many(isins) == digits
+    assert all(validate_many(isins))
+    bogus = ["US0378331004", "US037833100", "us0378331005", None]
+    assert checksum_many(bogus) == [5, -1, -1, -1]
+    assert validate_many(iter(bogus)) == [False] * len(bogus)
+    if numpy is not None:
+        arr = numpy.array(isins + bogus[:3], dtype="S12")
+        assert checksum_array(arr).tolist() == digits + checksum_many(bogus[:3])
+        # Longer strings are not cut to 12 octets:
+        longer = numpy.array([isins[0], isins[0] + "X", isins[0][:11]], dtype="S13")
+        assert checksum_array(longer).tolist() == [digits[0], -1, -1]
+        assert validate_array(longer).tolist() == [True, False, False]
+        assert validate_array(arr).tolist() == validate_many(isins + bogus[:3])
+    return True
+
+
+def stockdb_test() -> bool:
+    """ StockDB secondary indexes """
+    stock_db = StockDB()
+    lisbon = euronext.stock_names_by_market("EN.LIS")
+    stock_db.add_market("EN.LIS", lisbon)
+    stock_db.add_market("X.LIS", lisbon[:3])
+    assert stock_db.get_from_symbol("EDP") == ("PTEDP0AM0009",)
+    assert stock_db.get_from_name(" edp ") == ("PTEDP0AM0009",)
+    assert stock_db.get_from_symbol("?") == ()
+    assert stock_db.isins_in("EN.LIS", "X.LIS") == {fourplet[1] for fourplet in lisbon[:3]}
+    assert len(stock_db.isins_in_any("EN.LIS", "X.LIS")) == len(lisbon)
+    assert stock_db.isins_by_currency("EUR") == {fourplet[1] for fourplet in lisbon}
+    return True
+
+
+def markets_test() -> bool:
+    """ Lazy Euronext markets: all load; only EMPTY_MARKETS have no module """
+    for mkt in euronext.EURONEXT_STOCKS_LIST:
+        stocks = euronext.stock_names_by_market(mkt)
+        assert isinstance(stocks, tuple)
+        assert bool(stocks) == (mkt not in euronext.EMPTY_MARKETS), mkt
+    try:
+        euronext._load_market("EURONEXT_STOCKS_EN_MILAN")	# pylint: disable=protected-access
+    except ModuleNotFoundError:
+        pass
+    else:
+        assert False, "Expected a missing market module"
+    return True
+
+
 def tup_from_stock_weight(tup) -> tuple:
     """ Returns the tuple of stock names as triples:
     1. Official designation
@@ -85,3 +137,6 @@ def tup_from_stock_weight(tup) -> tuple:
 #
 if __name__ == "__main__":
     assert main_test()
+    assert batch_test()
+    assert stockdb_test()
+    assert markets_test()
@@ -0,0 +1,227 @@
+""" Test for IsinCache (netstocked/isin.py)
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import json
+import random
+import tempfile
+import threading
+import time
+
+from netstocked.isin import IsinCache, SharedIsinCache, euronext_stock_db
+from netstocked.stocktrans import load_transactions
+
+THREADS = 16
+NUM_STOCKS = 500
+
+
+def main_test() -> bool:
+    """ Bounded log and bogus lists; stats() counts all calls """
+    cache = IsinCache(log_size=10, bogus_size=2)
+    for idx in range(100):
+        num = idx % 5
+        cache.update_cache(f"STOCK {num}", f"PT{num:010d}")
+    for num in range(3):
+        cache.update_cache("OTHER", f"PT{num:010d}")
+    stocks = cache.stocks()
+    assert len(stocks["log"]) == 10
+    assert stocks["log"][-1] == ("PT0000000002", "OTHER")
+    assert list(stocks["bogus"]) == [
+        "ISIN PT0000000001: is not 'OTHER', but STOCK 1",
+        "ISIN PT0000000002: is not 'OTHER', but STOCK 2",
+    ]
+    stats = cache.stats()
+    assert (stats["calls"], stats["hits"], stats["conflicts"]) == (103, 98, 3)
+    assert stats["per-isin"]["PT0000000000"] == (21, 21 - 1, 1)
+    assert stats["per-isin"]["PT0000000004"] == (20, 19, 0)
+    assert cache.update_cache("STOCK 3", "") == ("STOCK 3", "PT0000000003")
+    counters = IsinCache(0, 0)
+    counters.update_cache("A", "PT0000000001")
+    counters.update_cache("B", "PT0000000001")
+    stats = counters.stats()
+    assert (stats["logged"], stats["bogus"], stats["conflicts"]) == (0, 0, 1)
+    return True
+
+
+def names_test() -> bool:
+    """ Sorted name index: prefix, range and paging """
+    cache = IsinCache()
+    nums = list(range(300))
+    random.Random(1).shuffle(nums)
+    for num in nums:
+        cache.update_cache(f"STOCK {num:03d}", f"PT{num:010d}")
+    cache.update_cache("ALPHA", "PT9999999999")
+    names = cache.stock_names()
+    assert names == sorted(cache.stocks()["by-name"].items())
+    assert cache.num_names() == 301
+    assert cache.names_starting_with("STOCK 12") == [(f"STOCK {num}", f"PT0000000{num}") for num in range(120, 130)]
+    assert cache.names_starting_with("STOCK 1", start=5, count=3) == names[106:109]
+    assert cache.names_starting_with("NONE") == []
+    assert cache.names_starting_with("") == names
+    assert cache.names_range("B", "STOCK 002") == names[1:3]
+    assert cache.names_page(2, 100) == names[200:300]
+    assert cache.names_page(3, 100) == [("STOCK 299", "PT0000000299")]
+    return True
+
+
+def snapshot_test() -> bool:
+    """ Save and load; seeds from a StockDB resolve names without ISIN """
+    stock_db = euronext_stock_db(["EN.LIS"])
+    cache = IsinCache()
+    num = cache.seed(stock_db)
+    assert num > 10
+    fourplet = stock_db.markets["EN.LIS"][0]
+    _, isin, _, name = fourplet
+    assert cache.update_cache(name.lower() + ".", "") == (name.lower() + ".", isin)
+    assert cache.num_names() == 0
+    cache.update_cache("KON.PHILIPS N.V.", "NL0000009538")
+    cache.update_cache("MY STOCK", "PT0000000001")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "isincache.json")
+        assert cache.save(fname)
+        warm = IsinCache()
+        assert warm.load(fname) == 2
+        assert warm.load(os.path.join(tmpdir, "missing.json")) == -1
+        invalid = (
+            [],
+            {"version": 1},
+            {"version": 1, "by-name": {}, "seeds": {}},
+            {"version": 1, "by-name": [], "seeds": {}, "fast-isin": {}},
+            {"version": 1, "by-name": {"X": 1}, "seeds": {}, "fast-isin": {}},
+            {"version": 1, "by-name": {}, "seeds": None, "fast-isin": {}},
+            {"version": 2, "by-name": {}, "seeds": {}, "fast-isin": {}},
+        )
+        bad_name = os.path.join(tmpdir, "bad.json")
+        for snapshot in invalid:
+            with open(bad_name, "w", encoding="utf-8") as fdout:
+                json.dump(snapshot, fdout)
+            assert warm.load(bad_name) == -1, snapshot
+    assert warm.stocks()["by-name"] == cache.stocks()["by-name"]
+    assert warm.stocks()["by-isin"] == cache.stocks()["by-isin"]
+    assert warm.stock_names() == cache.stock_names()
+    assert warm.update_cache(name, "") == (name, isin)
+    assert warm.easier_name("NL0000009538") == "PHILIPS"
+    assert warm.stats()["calls"] == 1
+    return True
+
+
+def stress_test() -> bool:
+    """ Many threads on a SharedIsinCache: same maps as one thread """
+    pairs = [(f"STOCK {num}", f"PT{num:010d}") for num in range(NUM_STOCKS)]
+    ref = IsinCache(0, 0)
+    for name, isin in pairs:
+        ref.update_cache(name, isin)
+    for what, make in (("IsinCache", lambda: IsinCache(0, 0)), ("SharedIsinCache", lambda: SharedIsinCache(0, 0))):
+        cache = make()
+        start = time.perf_counter()
+        run_threads(cache, pairs, 1 if what == "IsinCache" else THREADS)
+        elapsed = time.perf_counter() - start
+        calls = cache.stats()["calls"]
+        print(f"{what:<16} {calls} calls: {calls / elapsed:10.0f} calls/s")
+        assert cache.stocks()["by-name"] == ref.stocks()["by-name"]
+        assert cache.stocks()["by-isin"] == ref.stocks()["by-isin"]
+        assert cache.stock_names() == ref.stock_names()
+    stats = cache.stats()
+    assert stats["conflicts"] == THREADS * NUM_STOCKS
+    assert stats["per-isin"]["PT0000000007"][0] == THREADS * 4
+    assert cache.last_error() == ""
+    # Per call errors:
+    _, _, msg = cache.update("OTHER", "PT0000000001")
+    assert msg == "ISIN PT0000000001: is not 'OTHER', but STOCK 1"
+    return True
+
+
+def readers_test() -> bool:
+    """ stats() and name queries of a SharedIsinCache, while other threads add names """
+    cache = SharedIsinCache(0, 0)
+    done = threading.Event()
+    errors = []
+
+    def write(seed):
+        for num in range(seed, NUM_STOCKS * 10, 4):
+            cache.update_cache(f"STOCK {num}", f"PT{num:010d}")
+
+    def read():
+        try:
+            while not done.is_set():
+                stats = cache.stats()
+                assert sum(counts[0] for counts in stats["per-isin"].values()) == stats["calls"]
+                found = cache.names_starting_with("STOCK 1", count=20)
+                assert [name for name, _ in found] == sorted(name for name, _ in found)
+                assert all(isin == f"PT{int(name[6:]):010d}" for name, isin in found)
+                page = [name for name, _ in cache.names_page(1, 10)]
+                assert len(page) <= 10 and page == sorted(page)
+        except (AssertionError, RuntimeError) as err:
+            errors.append(err)
+    writers = [threading.Thread(target=write, args=(seed,)) for seed in range(4)]
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+    assert not errors, errors[0]
+    assert cache.stats()["calls"] == cache.num_names() == NUM_STOCKS * 10
+    return True
+
+
+def run_threads(cache, pairs:list, num_threads:int):
+    """ Each thread: all pairs (shuffled), name lookups, and conflicting names,
+    the latter only after all pairs are in.
+    """
+    barrier = threading.Barrier(num_threads)
+
+    def work(seed):
+        mine = list(pairs)
+        random.Random(seed).shuffle(mine)
+        for name, isin in mine:
+            cache.update_cache(name, isin)
+            cache.update_cache(name, "")
+            cache.update_cache(name, isin)
+        barrier.wait()
+        for name, isin in mine:
+            cache.update_cache("OTHER " + name, isin)
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if num_threads == 1:
+        for _ in range(THREADS - 1):
+            work(0)
+
+
+def loading_test() -> bool:
+    """ load_transactions() of several accounts, in threads """
+    by_account = {}
+    for acc in range(8):
+        by_account[f"ACC{acc}"] = [
+            ((idx, "*", "2022-01-03", "10.00", f"STOCK {idx % 50}", "buy", 10, 100.0), f"PT{idx % 50:010d}")
+            for idx in range(1000)
+        ]
+    res, cache = load_transactions(by_account, workers=THREADS)
+    assert list(res) == list(by_account)
+    assert all(len(trans) == 1000 for trans in res.values())
+    assert res["ACC3"][7].stock_name() == "STOCK 7"
+    stats = cache.stats()
+    assert (stats["calls"], stats["conflicts"]) == (8000, 0)
+    assert len(cache.stocks()["by-isin"]) == 50
+    return True
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert names_test()
+    assert snapshot_test()
+    assert stress_test()
+    assert readers_test()
+    assert loading_test()
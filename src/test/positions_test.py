@@ -0,0 +1,105 @@
+""" Test for positions.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import datetime
+
+from netstocked import positions
+from netstocked.isin import IsinCache
+from netstocked.stocktrans import AsTransaction
+from netstocked.transtable import TransactionTable
+
+DAY = datetime.date(2021, 1, 4).toordinal()
+
+
+def main_test() -> bool:
+    """ FIFO lots, realized gains, and incremental update() """
+    table = TransactionTable()
+    append(table, "H", 0, "PT0000000001", 10, 5.0)
+    append(table, "H", 1, "PT0000000001", 10, 7.0)
+    append(table, "p", 1, "PT0000000001", 3, 6.0)
+    append(table, "H", 2, "PT0000000001", -15, 8.0)
+    book = positions.from_table(table)
+    there = book.position("H", "PT0000000001")
+    assert there.quant == 5
+    assert [(lot.quant, lot.price) for lot in there.lots] == [(5, 7.0)]
+    assert there.realized == 10 * 3.0 + 5 * 1.0
+    assert book.holdings("H") == {("H", "PT0000000001"): (5, 35.0)}
+    assert book.holdings() == {("H", "PT0000000001"): (5, 35.0), ("p", "PT0000000001"): (3, 18.0)}
+    # Append one day: only the new rows are applied
+    append(table, "H", 3, "PT0000000001", -7, 6.0)	# 5 closed, 2 short
+    append(table, "H", 3, "", 4, 2.5, product="NO ISIN")
+    assert book.update(table) == 2
+    assert book.update(table) == 0
+    there = book.position("H", "PT0000000001")
+    assert [(lot.quant, lot.price) for lot in there.lots] == [(-2, 6.0)]
+    assert book.realized("H") == 35.0 - 5.0
+    assert book.position("H", "NO ISIN").average_price() == 2.5
+    full = positions.from_table(table)
+    assert full.holdings() == book.holdings()
+    assert full.realized() == book.realized()
+    # Cover the short
+    append(table, "H", 4, "PT0000000001", 2, 5.0)
+    book.update(table)
+    assert not book.position("H", "PT0000000001").is_open()
+    assert book.realized("H") == 32.0
+    return True
+
+
+def order_test() -> bool:
+    """ Dates ordered per account; a batch out of order changes nothing """
+    table = TransactionTable()
+    append(table, "H", 5, "PT0000000001", 10, 5.0)
+    book = positions.from_table(table)
+    append(table, "p", 1, "PT0000000001", 3, 6.0)	# older, but another account
+    assert book.update(table) == 1
+    append(table, "H", 6, "PT0000000001", 5, 5.0)
+    append(table, "H", 4, "PT0000000001", 5, 5.0)	# out of order
+    for _ in range(2):
+        try:
+            book.update(table)
+        except AssertionError:
+            pass
+        else:
+            assert False, "Expected a row out of order"
+        assert book.applied == 2
+        assert book.holdings("H") == {("H", "PT0000000001"): (10, 50.0)}
+    try:
+        book.apply([table.row(2), table.row(3)])
+    except AssertionError:
+        pass
+    else:
+        assert False, "Expected a row out of order"
+    assert book.holdings("H") == {("H", "PT0000000001"): (10, 50.0)}
+    assert book.last_dates == {"H": DAY + 5, "p": DAY + 1}
+    return True
+
+
+def transactions_test() -> bool:
+    """ Positions of AsTransaction objects """
+    rows = [
+        (1, "*", "2021-01-04", "50.00", "STOCK A", "buy", 10, 50.0),
+        (2, "*", "2021-01-05", "30.00", "STOCK A", "sell", -4, 30.0),
+    ]
+    trans = AsTransaction.from_rows(rows, ["PT0000000001", ""], IsinCache())
+    book = positions.PositionBook()
+    assert book.apply_transactions("H", trans) == 2
+    assert book.holdings("H") == {("H", "PT0000000001"): (6, 30.0)}
+    assert book.realized() == 10.0
+    return True
+
+
+def append(table, account, day, isin, quant, price, product="STOCK"):
+    table.append(account, DAY + day, product, isin, quant, price, round(quant * price, 2), 0.0, len(table) + 2)
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert transactions_test()
+    assert order_test()
@@ -0,0 +1,101 @@
+""" Test for pricehist.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import datetime
+import math
+import tempfile
+
+from mintracker.sindexes import pricehist
+from mintracker.sindexes.euronextimport import Importer, import_many, store_history
+from mintracker.sindexes.isin import ISIN_checksum
+from synthetic import equities_rows, write_equities
+
+DATES = ("2022-01-03", "2022-01-04", "2022-01-05")
+NUM_ROWS = 300
+
+
+def main_test() -> bool:
+    """ Typed capture at Importer; store, reopen, and time series """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fnames = []
+        for day, date in enumerate(DATES):
+            ext = "csv" if day == 1 else "xlsx"
+            fname = os.path.join(tmpdir, f"Euronext_Equities_{date}.{ext}")
+            write_equities(fname, synthetic_rows(NUM_ROWS - day, day))
+            fnames.append(fname)
+        imp = Importer(fnames[0], market_data=True)
+        assert imp.content == Importer(fnames[0]).content
+        data = imp.market_data
+        assert data.date == DATES[0] and len(data) == NUM_ROWS
+        first = data.row(1)
+        assert (first["open"], first["last"], first["volume"]) == (12.0, 12.5, 1001)
+        assert first["time"] == int((datetime.datetime(2022, 1, 3, 17, 35) - datetime.datetime(1970, 1, 1)).total_seconds())
+        missing = data.row(0)
+        assert math.isnan(missing["open"]) and missing["volume"] == pricehist.MISSING_VOLUME
+        assert missing["time"] == pricehist.MISSING_TIME
+        store = os.path.join(tmpdir, "history")
+        snaps = import_many(fnames[:2], workers=1, market_data=True)
+        assert store_history(snaps, store) == 2 * NUM_ROWS - 1
+        # An interrupted append, left uncommitted:
+        with open(os.path.join(store, pricehist.column_name("last")), "ab") as fdout:
+            fdout.write(b"\0" * 80)
+        snaps = import_many(fnames, workers=1, market_data=True)
+        assert store_history(snaps, store) == NUM_ROWS - 2
+        with pricehist.PriceHistory(store) as hist:
+            assert len(hist) == 3 * NUM_ROWS - 3
+            assert hist.dates() == list(DATES)
+            isin = ISIN_checksum(f"FR{1:09d}")
+            assert hist.series(isin) == [(date, 12.5 + day) for day, date in enumerate(DATES)]
+            assert [vol for _, vol in hist.series(isin, "volume")] == [1001, 1002, 1003]
+            assert hist.series("XX0000000000") == []
+            last = hist.column("last")
+            assert len(last) == len(hist)
+            if pricehist.numpy is not None:
+                assert list(map(repr, hist.numpy_column("last").tolist())) == list(map(repr, last))
+                assert str(hist.numpy_column("time")[1]) == "2022-01-03T17:35:00"
+                assert data.as_numpy()["volume"][1] == 1001
+        for name in pricehist.STORE_COLUMNS:
+            size = os.path.getsize(os.path.join(store, pricehist.column_name(name)))
+            assert size == (3 * NUM_ROWS - 3) * (4 if name in ("date", "isin") else 8), name
+    return True
+
+
+def values_test() -> bool:
+    """ number_of(): thousands separators and decimal commas; volume_of() range """
+    for astr, num in (("1,234", 1234.0), ("1,234,567", 1234567.0), ("-1,000", -1000.0), ("1,5", 1.5),
+                      ("12,25", 12.25), ("1,2345", 1.2345), ("1.234,5", 1234.5), ("1,234.5", 1234.5),
+                      (" 10.5 ", 10.5), (7, 7.0)):
+        assert pricehist.number_of(astr) == num, astr
+    for astr in ("", "-", None, "1,2,3"):
+        assert math.isnan(pricehist.number_of(astr)), astr
+    assert pricehist.volume_of("1,234") == 1234
+    assert pricehist.volume_of(2.0 ** 62) == 2 ** 62
+    for value in ("inf", float("-inf"), "nan", "1e30", -2.0 ** 63, "-"):
+        assert pricehist.volume_of(value) == pricehist.MISSING_VOLUME, value
+    return True
+
+
+def synthetic_rows(size:int, day:int) -> list:
+    """ Equities list rows, with typed market data of 'day' (none for the first stock) """
+    res = equities_rows(size, ("Euronext Paris",), market_data=False)
+    for idx, row in enumerate(res):
+        price = 10 + idx + day
+        if idx == 0:
+            row += ["-", "-", "-", "-", "-", "CET", "-", "-"]
+        else:
+            row += [price + 1.0, price + 2.0, price, price + 1.5,
+                    f"{3 + day:02d}/01/2022 17:35", "CET", 1000 + idx + day, (price + 1.5) * 1000]
+    return res
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert values_test()
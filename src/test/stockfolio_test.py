@@ -0,0 +1,68 @@
+""" Test for stockfolio.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import tempfile
+import openpyxl
+
+from netstocked import stockfolio
+from synthetic import transaction_row, write_transactions
+
+BLANK_ROWS = (5, 6, 12)	# sheet rows left blank
+
+
+def main_test() -> bool:
+    """ Streaming reader: same content as a full workbook read, sheet row numbers kept """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        lines = write_workbook(fname, 20)
+        _, content = stockfolio.read_rows(stockfolio.iter_transactions(fname), fname)
+        wbk = openpyxl.load_workbook(fname)
+        _, ref = stockfolio.read_sheet(wbk[stockfolio.DEFAULT_SHEET_NAME], fname)
+        trans = stockfolio.Transactions(fname, columnar=True, use_cache=False)
+    assert content == ref
+    from_to = content["data"]["from-to"]
+    assert len(from_to) == len(lines)
+    # Listed from the newest (last row): products tell the sheet row
+    for elem in from_to:
+        line = int(elem[-1][len("line="):])
+        assert elem[4] == f"STOCK{line}", elem
+        assert line not in BLANK_ROWS
+    assert sorted(int(elem[-1][len("line="):]) for elem in from_to) == lines
+    table = trans.table()
+    assert list(table.column("line")) == lines
+    assert [table.row(idx)[2] for idx in range(len(table))] == [f"STOCK{line}" for line in lines]
+    return True
+
+
+def write_workbook(fname:str, size:int) -> list:
+    """ Writes 'size' transactions, with blank rows (see BLANK_ROWS);
+    returns the sheet row numbers of transactions.
+    """
+    rows, lines = [], []
+    line = 2
+    while len(lines) < size:
+        if line in BLANK_ROWS:
+            rows.append([])
+        else:
+            rows.append(transaction_row(
+                ID=stockfolio.VALID_IDS[line % len(stockfolio.VALID_IDS)],
+                Data=f"{len(lines) + 1:02d}-01-2022",
+                Produto=f"STOCK{line}",
+                Quantidade=line,
+            ))
+            lines.append(line)
+        line += 1
+    write_transactions(fname, rows)
+    return lines
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
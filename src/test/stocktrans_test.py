@@ -0,0 +1,97 @@
+""" Test for stocktrans.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import os.path
+import json
+import tempfile
+from netstocked.isin import IsinCache
+from netstocked.stocktrans import AsTransaction
+from mintracker.sindexes.isin import StockDB, ISIN_checksum
+from synthetic import transaction_tuples
+
+
+def main_test() -> bool:
+    """ AsTransaction.from_rows() is the same as one by one """
+    rows, isins = transaction_tuples(1000)
+    one_cache, bulk_cache = IsinCache(), IsinCache()
+    ref = [AsTransaction(tup, isin, one_cache) for tup, isin in zip(rows, isins)]
+    res = AsTransaction.from_rows(rows, isins, bulk_cache)
+    assert [trans.json_elem() for trans in res] == [trans.json_elem() for trans in ref]
+    assert [trans.string() for trans in res] == [trans.string() for trans in ref]
+    assert bulk_cache.stocks()["by-name"] == one_cache.stocks()["by-name"]
+    assert list(bulk_cache.stocks()["bogus"]) == list(one_cache.stocks()["bogus"])
+    assert bulk_cache.stats() == one_cache.stats()
+    assert not hasattr(res[0], "__dict__")
+    assert res[3].t_val == -30.0
+    assert AsTransaction.from_rows([]) == []
+    try:
+        AsTransaction.from_rows([(1, "*", "2022-01-03", "1.00", "X", "hold", 1, 1.0)], cache=IsinCache())
+    except AssertionError:
+        pass
+    else:
+        assert False, "Expected wrong 'buy'"
+    try:
+        AsTransaction.from_rows(rows[:2], isins[:1], IsinCache())
+    except AssertionError:
+        pass
+    else:
+        assert False, "Expected one ISIN per row"
+    # A subclass with its own slots:
+    res = Marked.from_rows(rows[:3], isins[:3], IsinCache())
+    assert [trans.string() for trans in res] == [trans.string() for trans in ref[:3]]
+    return True
+
+
+def seeded_test() -> bool:
+    """ from_rows() of names without ISIN, resolved by seeds, same as one by one """
+    rows = [(idx, "*", "2022-01-03", "10.00", "STOCK A", "buy", 1, 10.0) for idx in range(3)]
+    seeded, given = ISIN_checksum("PT000000000"), ISIN_checksum("PT000000001")
+    isins = ["", given, ""]
+    stock_db = StockDB()
+    stock_db.add_market("EN.LIS", [("EUR", seeded, "A", "STOCK A")])
+    names = []
+    for bulk in (False, True):
+        cache = IsinCache()
+        cache.seed(stock_db)
+        if bulk:
+            res = AsTransaction.from_rows(rows, isins, cache)
+        else:
+            res = [AsTransaction(tup, isin, cache) for tup, isin in zip(rows, isins)]
+        names.append([trans.isin() for trans in res])
+    assert names[0] == names[1] == [seeded, given, given], names
+    return True
+
+
+def easier_test() -> bool:
+    """ stock_name() uses the easier names of the cache given """
+    row = (1, "*", "2022-01-03", "10.00", "STOCK E", "buy", 1, 10.0)
+    isin = ISIN_checksum("PT000000009")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "isins.json")
+        with open(fname, "w", encoding="utf-8") as fdout:
+            json.dump({"version": 1, "by-name": {}, "seeds": {}, "fast-isin": {isin: "EASY"}}, fdout)
+        cache = IsinCache()
+        assert cache.load(fname) == 0
+    assert AsTransaction(row, isin, cache).stock_name() == "EASY"
+    assert AsTransaction.from_rows([row], [isin], cache)[0].stock_name() == "EASY"
+    assert AsTransaction(row, isin, IsinCache()).stock_name() == "STOCK E"
+    assert AsTransaction(row, isin, IsinCache()).json_elem()["StockName"] == "STOCK E"
+    return True
+
+
+class Marked(AsTransaction):
+    """ AsTransaction with an extra slot """
+    __slots__ = ("mark",)
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert seeded_test()
+    assert easier_test()
@@ -0,0 +1,109 @@
+""" Synthetic inputs shared by tests (and benchmarks):
+transactions workbooks, Euronext equities lists, and transaction tuples.
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import csv
+import random
+import openpyxl
+
+from netstocked import stockfolio
+from mintracker.sindexes.isin import ISIN_checksum
+
+EQUITIES_HEADER = (
+    "Name", "ISIN", "Symbol", "Market", "Trading Currency",
+    "Open", "High", "Low", "Last", "Last Date/Time", "Time Zone", "Volume", "Turnover",
+)
+EQUITIES_PREAMBLE = "European Equities"
+MARKET_DATA = ("1.00", "1.10", "0.90", "1.05", "03/01/2022 17:35", "CET", "100", "105.00")
+TRANSACTION_DEFAULTS = {
+    "Hora": "10:00",
+    "ISIN": "",
+    "Per": 1.5,
+    "Taxa": None,
+}
+
+
+def transaction_row(**fields) -> list:
+    """ Returns a row of the transactions sheet (see stockfolio.columns()):
+    'fields' by column name, TRANSACTION_DEFAULTS, and zeros elsewhere.
+    """
+    header = transactions_header()
+    row = [0] * len(header)
+    for name, value in dict(TRANSACTION_DEFAULTS, **fields).items():
+        row[header.index(name)] = value
+    return row
+
+
+def transaction_rows(size:int, seed:int=1) -> list:
+    """ Returns 'size' transactions sheet rows, one per day (buys and sells) """
+    rnd = random.Random(seed)
+    res = []
+    for idx in range(size):
+        res.append(transaction_row(
+            ID=stockfolio.VALID_IDS[idx % len(stockfolio.VALID_IDS)],
+            Data=f"{idx % 28 + 1:02d}-{idx // 28 % 12 + 1:02d}-{2010 + idx // 336}",
+            Produto=f"STOCK{idx % 7}",
+            Quantidade=rnd.choice((1, -1)) * rnd.randint(1, 500),
+        ))
+    return res
+
+
+def write_transactions(fname:str, rows):
+    """ Writes a transactions workbook: the header, then 'rows' ([] is a blank row) """
+    wbk = openpyxl.Workbook(write_only=True)
+    sheet = wbk.create_sheet(stockfolio.DEFAULT_SHEET_NAME)
+    sheet.append(transactions_header())
+    for row in rows:
+        sheet.append(row)
+    wbk.save(fname)
+
+
+def transactions_header() -> list:
+    return list(stockfolio.columns()["header"][0])
+
+
+def equities_rows(size:int, markets, start:int=0, market_data:bool=True) -> list:
+    """ Returns Euronext equities list rows (strings), of stocks #start..,
+    spread over 'markets'; with 'market_data', all EQUITIES_HEADER columns.
+    """
+    return [
+        [f"STOCK {idx}", ISIN_checksum(f"FR{idx:09d}"), f"S{idx:05d}",
+         markets[idx % len(markets)], "EUR" if idx % 3 else "NOK"] + (list(MARKET_DATA) if market_data else [])
+        for idx in range(start, start + size)
+    ]
+
+
+def write_equities(fname:str, rows, delimiter:str=";"):
+    """ Writes a Euronext equities list, as xlsx (by extension) or text:
+    a preamble line, the header, then 'rows'.
+    """
+    lines = [[EQUITIES_PREAMBLE], list(EQUITIES_HEADER)] + list(rows)
+    if fname.endswith(".xlsx"):
+        wbk = openpyxl.Workbook(write_only=True)
+        sheet = wbk.create_sheet("Euronext_Equities")
+        for row in lines:
+            sheet.append(row)
+        wbk.save(fname)
+        return
+    with open(fname, "w", encoding="utf-8", newline="") as fdout:
+        csv.writer(fdout, delimiter=delimiter).writerows(lines)
+
+
+def transaction_tuples(size:int) -> tuple:
+    """ Returns (rows, isins) for AsTransaction: rows as its tuples,
+    buys and sells, names without ISIN, and one ISIN conflict (at #500).
+    """
+    rows, isins = [], []
+    for idx in range(size):
+        num = idx % 37
+        quant = -idx if idx % 3 == 0 else idx
+        rows.append((idx, "*", "2022-01-03", "10.00", f"STOCK {num}", "buy" if quant >= 0 else "sell",
+                     quant, float(idx * 10) if idx % 2 else idx * 10))
+        isins.append("" if idx % 5 == 0 else f"PT{num:010d}")
+    if size > 500:
+        isins[500] = "PT0000000001"	# a conflict
+    return rows, isins
@@ -0,0 +1,38 @@
+""" Test for universe.py (part of 'mintracker')
+
+(c) 2022  Henrique Moreira
+"""
+
+import os.path
+import tempfile
+
+from mintracker.sindexes import universe
+
+
+def main_test() -> bool:
+    """ Write the universe of euronext.py, and read it back """
+    markets = universe.markets_from_tables()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "euronext.bin")
+        num = universe.write_universe(fname, markets)
+        assert num == sum(len(stocks) for stocks in markets.values())
+        with universe.Universe(fname) as there:
+            assert there.markets() == list(markets)
+            for mkt, stocks in markets.items():
+                view = there.stock_names_by_market(mkt)
+                assert list(view) == list(stocks), mkt
+                assert view[-1] == stocks[-1]
+                for fourplet in stocks:
+                    assert there.get_from_ISIN(fourplet[1]) == fourplet[2:]
+            assert len(there.stock_names_by_market("OSLO")) == 0
+            stock_db = there.stock_db(mkt_names=["EN.LIS"])
+            print("EN.LIS, EDP:", stock_db.get_from_symbol("EDP"))
+    print(f"Universe: {num} stocks, {len(markets)} markets")
+    return True
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
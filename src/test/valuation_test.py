@@ -0,0 +1,78 @@
+""" Test for valuation.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import math
+import tempfile
+
+from netstocked import valuation
+from mintracker.sindexes.isin import StockDB, ISIN_checksum
+from mintracker.sindexes.pricehist import MarketData, PriceHistory
+
+ISIN_A, ISIN_B, ISIN_C = (ISIN_checksum(f"PT{num:09d}") for num in (1, 2, 3))
+
+
+def main_test() -> bool:
+    """ Values with and without NumPy are the same; StockDB fallback """
+    stock_db = StockDB()
+    stock_db.add_market("EN.LIS", [
+        ("EUR", ISIN_A, "AAA", "Alpha, S.A."),
+        ("EUR", ISIN_B, "BBB", "Beta SGPS"),
+        ("EUR", ISIN_C, "CCC", "Gamma"),
+    ])
+    holdings = {
+        ("H", ISIN_A): (10, 50.0),
+        ("H", "BETA SGPS"): (4, 30.0),	# by name
+        ("p", "CCC"): (2, 10.0),	# by symbol
+        ("p", "UNKNOWN"): (5, 5.0),
+    }
+    prices = {ISIN_A: 6.0, ISIN_B: 5.0, ISIN_C: 4.0}
+    res = valuation.value_book(holdings, prices, stock_db)
+    assert res.isins == [ISIN_A, ISIN_B, ISIN_C, ""]
+    assert res.missing() == [("p", "UNKNOWN")]
+    assert res.totals() == {"H": (80.0, 80.0, 0.0), "p": (8.0, 10.0, -2.0)}
+    rows = res.rows()
+    assert rows[0][:8] == ("H", ISIN_A, ISIN_A, 10, 6.0, 60.0, 50.0, 10.0)
+    assert rows[0][8] == 0.75 and rows[2][8] == 1.0
+    assert math.isnan(rows[3][5])
+    numpy = valuation.numpy
+    valuation.numpy = None
+    try:
+        plain = valuation.value_book(holdings, prices, stock_db)
+    finally:
+        valuation.numpy = numpy
+    assert repr(plain.rows()) == repr(rows)
+    assert valuation.value_book({("H", ISIN_B): (1, 1.0)}, prices).rows()[0][5] == 5.0
+    return True
+
+
+def prices_test() -> bool:
+    """ Price index of a snapshot, and of the newest date of a price history """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with PriceHistory(tmpdir) as hist:
+            for day, date in enumerate(("2022-01-04", "2022-01-03")):
+                data = MarketData(date)
+                data.append(ISIN_A, [""] * 8 + [str(6 + day)])
+                data.append(ISIN_B, [""] * 8 + ["-"])
+                hist.append(data)
+            latest = valuation.latest_prices(hist)
+            assert latest == {ISIN_A: 6.0}
+            numpy = valuation.numpy
+            valuation.numpy = None
+            try:
+                assert valuation.latest_prices(hist) == latest
+            finally:
+                valuation.numpy = numpy
+    assert valuation.price_index(data) == {ISIN_A: 7.0}
+    return True
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert prices_test()
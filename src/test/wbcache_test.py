@@ -0,0 +1,108 @@
+""" Test for wbcache.py (part of 'netstocked')
+
+(c) 2022  Henrique Moreira
+"""
+
+# pylint: disable=missing-function-docstring
+
+import io
+import contextlib
+import os
+import os.path
+import pickle
+import tempfile
+
+from netstocked import stockfolio
+from netstocked import wbcache
+from netstocked.wbcache import WorkbookCache, cache_name, invalidate_cache
+from synthetic import transaction_rows, write_transactions
+
+
+def main_test() -> bool:
+    """ Hits, stale keys, invalidation; content and table caches side by side """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        write_transactions(fname, transaction_rows(30))
+        sheet = stockfolio.DEFAULT_SHEET_NAME
+        content_name = cache_name(fname, sheet, "content")
+        table_name = cache_name(fname, sheet, "table")
+        assert content_name != table_name
+        ref = stockfolio.Transactions(fname)
+        assert os.path.exists(content_name)
+        cols = stockfolio.Transactions(fname, columnar=True)
+        assert os.path.exists(content_name) and os.path.exists(table_name)
+        # Hits: the cached content is used
+        cache = WorkbookCache(fname, sheet)
+        assert cache.load() == ref.content()
+        assert WorkbookCache(fname, sheet, "table").load()[1].row(0) == cols.table().row(0)
+        # Stale: the workbook changed
+        write_transactions(fname, transaction_rows(31))
+        assert WorkbookCache(fname, sheet).load() is None
+        assert len(stockfolio.Transactions(fname).content()["data"]["from-to"]) == 31
+        assert len(WorkbookCache(fname, sheet).load()["data"]["from-to"]) == 31
+        # The key stored is the one before parsing
+        cache = WorkbookCache(fname, sheet)
+        there = cache.load()
+        write_transactions(fname, transaction_rows(32))
+        assert cache.save(there)
+        assert WorkbookCache(fname, sheet).load() is None
+        # Unreadable caches are parsed again
+        for garbage in (b"", b"not a pickle", pickle.dumps(cache.key()) + b"\x80\x04\x95"):
+            with open(content_name, "wb") as fdout:
+                fdout.write(garbage)
+            assert WorkbookCache(fname, sheet).load() is None
+        # ...also of classes meanwhile renamed, or moved
+        data = pickle.dumps(Vanished())
+        module = Vanished.__module__.encode()
+        for renamed in (data.replace(b"Vanished", b"Vanishex"), data.replace(module, b"x" * len(module))):
+            with open(content_name, "wb") as fdout:
+                pickle.dump(cache.key(), fdout)
+                fdout.write(renamed)
+            assert WorkbookCache(fname, sheet).load() is None
+        assert len(stockfolio.Transactions(fname).content()["data"]["from-to"]) == 32
+        # Invalidation
+        assert WorkbookCache(fname, sheet, "table").invalidate()
+        assert not os.path.exists(table_name) and os.path.exists(content_name)
+        assert invalidate_cache(fname)
+        assert not invalidate_cache(fname)
+        assert not os.path.exists(content_name)
+        assert not [name for name in os.listdir(tmpdir) if name.endswith(wbcache.CACHE_SUFFIX)]
+    return True
+
+
+def no_cache_test() -> bool:
+    """ use_cache=False, and '--no-cache', neither read nor write caches """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, stockfolio.DEFAULT_BASENAME)
+        write_transactions(fname, transaction_rows(10))
+        for columnar in (False, True):
+            stockfolio.Transactions(fname, columnar=columnar, use_cache=False)
+        assert os.listdir(tmpdir) == [stockfolio.DEFAULT_BASENAME]
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out):
+            assert stockfolio.run(out, err, ["--no-cache", fname]) == 0
+        assert os.listdir(tmpdir) == [stockfolio.DEFAULT_BASENAME]
+        assert "line=" in out.getvalue() and not err.getvalue()
+        # a cache (here, altered) is not even read
+        trans = stockfolio.Transactions(fname, use_cache=False)
+        content = trans.content()
+        assert len(content["data"]["from-to"]) == 10
+        altered = dict(content, data=dict(content["data"], **{"from-to": []}))
+        with open(cache_name(fname, stockfolio.DEFAULT_SHEET_NAME), "wb") as fdout:
+            pickle.dump(WorkbookCache(fname, stockfolio.DEFAULT_SHEET_NAME).key(), fdout)
+            pickle.dump(altered, fdout)
+        assert stockfolio.Transactions(fname, use_cache=False).content() == content
+        assert not stockfolio.Transactions(fname).content()["data"]["from-to"]
+    return True
+
+
+class Vanished():
+    """ A class pickled, and then renamed """
+
+
+#
+# Test suite
+#
+if __name__ == "__main__":
+    assert main_test()
+    assert no_cache_test()